@@ -31,6 +31,7 @@ from hummingbot.client.ui.style import load_style
 from hummingbot.core.event.events import HummingbotUIEvent
 from hummingbot.core.management.console import start_management_console
 from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.core.utils.trading_pair_fetcher import TradingPairFetcher
 
 
 class CmdlineParser(argparse.ArgumentParser):
@@ -93,6 +94,10 @@ async def quick_start(args: argparse.Namespace, secrets_manager: BaseSecretsMana
 
     AllConnectorSettings.initialize_paper_trade_settings(client_config_map.paper_trade.paper_trade_exchanges)
 
+    if config_file_name is not None:
+        # The strategy is started right away, the trading pairs of the not connected exchanges are fetched once the
+        # start-up completed (the application creates the fetcher as well, this instance is the one it gets)
+        TradingPairFetcher.get_instance(client_config_map, defer_optional_fetches=True)
     hb = HummingbotApplication.main_application(client_config_map=client_config_map)
     # Todo: validate strategy and config_file_name before assinging
 
@@ -3,13 +3,14 @@ import threading
 import time
 from datetime import datetime
 from decimal import Decimal
-from typing import TYPE_CHECKING, List, Optional, Set, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple
 
 import pandas as pd
 
 from hummingbot.client.command.gateway_command import GatewayCommand
 from hummingbot.client.performance import PerformanceMetrics
 from hummingbot.client.settings import MAXIMUM_TRADE_FILLS_DISPLAY_OUTPUT, AllConnectorSettings
+from hummingbot.client.trade_fills_feed import TradeFillsFeed
 from hummingbot.client.ui.interface_utils import format_df_for_printout
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.model.trade_fill import TradeFill
@@ -41,23 +42,35 @@ class HistoryCommand:
             self.notify("\n  Please first import a strategy config file of which to show historical performance.")
             return
         start_time = get_timestamp(days) if days > 0 else self.init_time
-        with self.trade_fill_db.get_new_session() as session:
-            trades: List[TradeFill] = self._get_trades_from_session(
-                int(start_time * 1e3),
-                session=session,
-                config_file_path=self.strategy_file_name)
-            if not trades:
-                self.notify("\n  No past trades to report.")
-                return
-            if verbose:
-                self.list_trades(start_time)
-            safe_ensure_future(self.history_report(start_time, trades, precision))
+        trades_feed = self.trade_fills_feed()
+        market_metrics = None
+        if start_time >= self.init_time:
+            trades_feed.update()
+            trades: List[TradeFill] = trades_feed.trades_since(int(start_time * 1e3))
+            if start_time == self.init_time:
+                market_metrics = trades_feed.market_metrics
+        else:
+            with self.trade_fill_db.get_new_session() as session:
+                trades: List[TradeFill] = self._get_trades_from_session(
+                    int(start_time * 1e3),
+                    session=session,
+                    config_file_path=self.strategy_file_name)
+        if not trades:
+            self.notify("\n  No past trades to report.")
+            return
+        if verbose:
+            self.list_trades(start_time)
+        safe_ensure_future(self.history_report(start_time, trades, precision, market_metrics=market_metrics))
 
     def get_history_trades_json(self,  # type: HummingbotApplication
                                 days: float = 0):
         if self.strategy_file_name is None:
             return
         start_time = get_timestamp(days) if days > 0 else self.init_time
+        if start_time >= self.init_time:
+            trades_feed = self.trade_fills_feed()
+            trades_feed.update()
+            return list([TradeFill.to_bounty_api_json(t) for t in trades_feed.trades_since(int(start_time * 1e3))])
         with self.trade_fill_db.get_new_session() as session:
             trades: List[TradeFill] = self._get_trades_from_session(
                 int(start_time * 1e3),
@@ -65,17 +78,39 @@ class HistoryCommand:
                 config_file_path=self.strategy_file_name)
             return list([TradeFill.to_bounty_api_json(t) for t in trades])
 
+    def trade_fills_feed(self,  # type: HummingbotApplication
+                         ) -> TradeFillsFeed:
+        """
+        The incremental feed of the fills recorded by the current strategy since the application start. A new feed is
+        created when the strategy config file (and so the trade fills database) changes.
+        """
+        start_timestamp = int(self.init_time * 1e3)
+        feed = self._trade_fills_feed
+        if (feed is None
+                or feed.sql_manager is not self.trade_fill_db
+                or feed.config_file_path != self.strategy_file_name
+                or feed.start_timestamp != start_timestamp):
+            feed = TradeFillsFeed(sql_manager=self.trade_fill_db,
+                                  config_file_path=self.strategy_file_name,
+                                  start_timestamp=start_timestamp)
+            self._trade_fills_feed = feed
+        return feed
+
     async def history_report(self,  # type: HummingbotApplication
                              start_time: float,
                              trades: List[TradeFill],
                              precision: Optional[int] = None,
-                             display_report: bool = True) -> Decimal:
+                             display_report: bool = True,
+                             market_metrics: Optional[Dict[Tuple[str, str], PerformanceMetrics]] = None) -> Decimal:
+        """
+        :param market_metrics: running metrics including exactly the given trades (from the trade fills feed), updated
+            instead of being recalculated from the trades
+        """
         market_info: Set[Tuple[str, str]] = set((t.market, t.symbol) for t in trades)
         if display_report:
             self.report_header(start_time)
         return_pcts = []
         for market, symbol in market_info:
-            cur_trades = [t for t in trades if t.market == market and t.symbol == symbol]
             network_timeout = float(self.client_config_map.commands_timeout.other_commands_timeout)
             try:
                 cur_balances = await asyncio.wait_for(self.get_current_balances(market), network_timeout)
@@ -84,7 +119,12 @@ class HistoryCommand:
                     "\nA network error prevented the balances retrieval to complete. See logs for more details."
                 )
                 raise
-            perf = await PerformanceMetrics.create(symbol, cur_trades, cur_balances)
+            if market_metrics is not None and (market, symbol) in market_metrics:
+                perf = market_metrics[(market, symbol)]
+                await perf.update_metrics(symbol, cur_balances)
+            else:
+                cur_trades = [t for t in trades if t.market == market and t.symbol == symbol]
+                perf = await PerformanceMetrics.create(symbol, cur_trades, cur_balances)
             if display_report:
                 self.report_performance_by_market(market, symbol, perf, precision)
             return_pcts.append(perf.return_pct)
@@ -208,12 +248,12 @@ class HistoryCommand:
 
         start_time = self.init_time
 
-        with self.trade_fill_db.get_new_session() as session:
-            trades: List[TradeFill] = self._get_trades_from_session(
-                int(start_time * 1e3),
-                session=session,
-                config_file_path=self.strategy_file_name)
-            avg_return = await self.history_report(start_time, trades, display_report=False)
+        trades_feed = self.trade_fills_feed()
+        trades_feed.update()
+        avg_return = await self.history_report(start_time,
+                                               trades_feed.trades,
+                                               display_report=False,
+                                               market_metrics=trades_feed.market_metrics)
         return avg_return
 
     def list_trades(self,  # type: HummingbotApplication
@@ -0,0 +1,81 @@
+import threading
+from typing import TYPE_CHECKING, Any, Dict, List
+
+import pandas as pd
+
+from hummingbot.client.ui.interface_utils import format_df_for_printout
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.tick_profiler import TickProfiler
+
+if TYPE_CHECKING:
+    from hummingbot.client.hummingbot_application import HummingbotApplication  # noqa: F401
+
+PROFILE_ACTIONS = ["show", "start", "stop", "reset", "sample"]
+
+
+class ProfileCommand:
+    def profile(self,  # type: HummingbotApplication
+                action: str = "show",
+                duration: float = 5.0):
+        if threading.current_thread() != threading.main_thread():
+            self.ev_loop.call_soon_threadsafe(self.profile, action, duration)
+            return
+        profiler = TickProfiler.get_instance()
+        if action == "start":
+            profiler.enable()
+            self.notify("Tick profiler started.")
+        elif action == "stop":
+            profiler.disable()
+            self.notify("Tick profiler stopped.")
+        elif action == "reset":
+            profiler.reset()
+            self.notify("Tick profiler statistics reset.")
+        elif action == "sample":
+            safe_ensure_future(self.show_profiler_samples(duration))
+        else:
+            self.notify(self.profiler_report())
+
+    def profiler_report(self,  # type: HummingbotApplication
+                        ) -> str:
+        snapshot = TickProfiler.get_instance().snapshot()
+        if not snapshot["enabled"] and snapshot["tick_drift"]["count"] == 0:
+            return "\n  Tick profiler is not running. Start it with `profile start`."
+        lines = [f"\n  Tick profiler {'running' if snapshot['enabled'] else 'stopped'}, "
+                 f"collected over {snapshot['duration']:.0f} seconds (durations in milliseconds)."]
+        sections = [
+            ("Clock iterator tick durations", snapshot["tick_durations"]),
+            ("Clock", {"Tick drift": snapshot["tick_drift"], "Event loop lag": snapshot["loop_lag"]}),
+            ("Event listener durations", snapshot["event_durations"]),
+        ]
+        for title, histograms in sections:
+            if len(histograms) == 0:
+                continue
+            lines.extend(["", f"  {title}:", self._profiler_histograms_table(histograms)])
+        return "\n".join(lines)
+
+    def _profiler_histograms_table(self,  # type: HummingbotApplication
+                                   histograms: Dict[str, Dict[str, Any]]) -> str:
+        columns = ["Name", "Count", "Mean", "P50", "P90", "P99", "Max"]
+        data = [
+            [name, h["count"]] + [round(h[key] * 1e3, 3) for key in ("mean", "p50", "p90", "p99", "max")]
+            for name, h in sorted(histograms.items(), key=lambda item: -item[1]["count"] * item[1]["mean"])
+        ]
+        df = pd.DataFrame(data=data, columns=columns)
+        return "\n".join(["    " + line for line in format_df_for_printout(
+            df, self.client_config_map.tables_format).split("\n")])
+
+    async def show_profiler_samples(self,  # type: HummingbotApplication
+                                    duration: float = 5.0):
+        self.notify(f"\n  Sampling the main thread for {duration} seconds...")
+        samples = await TickProfiler.get_instance().sample_stacks(duration)
+        self.notify(self.profiler_samples_report(samples))
+
+    def profiler_samples_report(self,  # type: HummingbotApplication
+                                samples: List) -> str:
+        if len(samples) == 0:
+            return "\n  No samples collected."
+        df = pd.DataFrame(data=[[function, f"{self_share:.1%}", f"{inclusive_share:.1%}"]
+                                for function, self_share, inclusive_share in samples],
+                          columns=["Function", "Self", "Inclusive"])
+        return "\n  Functions by self samples:\n" + format_df_for_printout(
+            df, self.client_config_map.tables_format)
@@ -1,10 +1,12 @@
 import asyncio
+import functools
 import importlib
 import inspect
 import platform
 import sys
 import threading
 import time
+from decimal import Decimal
 from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set
 
 import pandas as pd
@@ -19,9 +21,13 @@ from hummingbot.client.config.config_helpers import get_strategy_starter_file
 from hummingbot.client.config.config_validators import validate_bool
 from hummingbot.client.config.config_var import ConfigVar
 from hummingbot.client.performance import PerformanceMetrics
+from hummingbot.client.ui.interface_utils import format_df_for_printout
+from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.core.clock import Clock, ClockMode
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.startup_pipeline import StartupPipeline
+from hummingbot.core.utils.trading_pair_fetcher import TradingPairFetcher
 from hummingbot.exceptions import InvalidScriptModule, OracleRateUnavailable
 from hummingbot.strategy.directional_strategy_base import DirectionalStrategyBase
 from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
@@ -32,6 +38,7 @@ if TYPE_CHECKING:
 
 
 GATEWAY_READY_TIMEOUT = 300  # seconds
+MARKET_STATUS_CHECK_INTERVAL = 0.5  # seconds
 
 
 class StartCommand(GatewayChainApiManager):
@@ -66,7 +73,9 @@ class StartCommand(GatewayChainApiManager):
         if threading.current_thread() != threading.main_thread():
             self.ev_loop.call_soon_threadsafe(self.start, log_level, script)
             return
-        safe_ensure_future(self.start_check(log_level, script, conf, is_quickstart), loop=self.ev_loop)
+        start_check_task = safe_ensure_future(self.start_check(log_level, script, conf, is_quickstart),
+                                              loop=self.ev_loop)
+        start_check_task.add_done_callback(self._resume_trading_pairs_fetch_if_not_started)
 
     async def start_check(self,  # type: HummingbotApplication
                           log_level: Optional[str] = None,
@@ -182,8 +191,6 @@ class StartCommand(GatewayChainApiManager):
 
         self._in_start_check = False
 
-        # We always start the RateOracle. It is required for PNL calculation.
-        RateOracle.get_instance().start()
         if self._mqtt:
             self._mqtt.patch_loggers()
 
@@ -244,37 +251,121 @@ class StartCommand(GatewayChainApiManager):
         try:
             self.start_time = time.time() * 1e3  # Time in milliseconds
             tick_size = self.client_config_map.tick_size
-            self.logger().info(f"Creating the clock with tick size: {tick_size}")
-            self.clock = Clock(ClockMode.REALTIME, tick_size=tick_size)
-            for market in self.markets.values():
-                if market is not None:
-                    self.clock.add_iterator(market)
-                    self.markets_recorder.restore_market_states(self.strategy_file_name, market)
-                    if len(market.limit_orders) > 0:
-                        self.notify(f"Canceling dangling limit orders on {market.name}...")
-                        await market.cancel_all(10.0)
-            if self.strategy:
-                self.clock.add_iterator(self.strategy)
-            try:
-                self._pmm_script_iterator = self.client_config_map.pmm_script_mode.get_iterator(
-                    self.strategy_name, list(self.markets.values()), self.strategy
-                )
-            except ValueError as e:
-                self.notify(f"Error: {e}")
-            if self._pmm_script_iterator is not None:
-                self.clock.add_iterator(self._pmm_script_iterator)
-                self.notify(f"PMM script ({self.client_config_map.pmm_script_mode.pmm_script_file_path}) started.")
-            self.strategy_task: asyncio.Task = safe_ensure_future(self._run_clock(), loop=self.ev_loop)
-            self.notify(f"\n'{self.strategy_name}' strategy started.\n"
-                        f"Run `status` command to query the progress.")
-            self.logger().info("start command initiated.")
-
-            if self._trading_required:
-                self.kill_switch = self.client_config_map.kill_switch_mode.get_kill_switch(self)
-                await self.wait_till_ready(self.kill_switch.start)
+            early_tick_price_threshold = self.client_config_map.early_tick_price_threshold
+            if early_tick_price_threshold is None:
+                self.logger().info(f"Creating the clock with tick size: {tick_size}")
+                self.clock = Clock(ClockMode.REALTIME, tick_size=tick_size)
+            else:
+                self.logger().info(f"Creating the hybrid clock with tick size: {tick_size} and early ticks on "
+                                   f"{early_tick_price_threshold}% best price moves")
+                self.clock = Clock(ClockMode.HYBRID,
+                                   tick_size=tick_size,
+                                   early_tick_price_threshold=float(early_tick_price_threshold / Decimal("100")))
+            self._startup_pipeline = self._create_startup_pipeline()
+            await self._startup_pipeline.run()
+            self.notify("\nStart-up steps:\n" + "\n".join(
+                "    " + line for line in format_df_for_printout(
+                    self._startup_pipeline.timings_df(),
+                    table_format=self.client_config_map.tables_format).split("\n")))
         except Exception as e:
             self.logger().error(str(e), exc_info=True)
 
+    def _create_startup_pipeline(self,  # type: HummingbotApplication
+                                 ) -> StartupPipeline:
+        """
+        The start-up steps of the connectors are independent, so the market states are restored (and the dangling
+        orders canceled) concurrently. Once the clock runs, the connectors bring up their network, trading rules,
+        balances and order books concurrently, each within its own throttler limits, and the pipeline tracks how long
+        each component takes to be ready. The trading pairs fetch of the not connected exchanges is deferred until the
+        connectors are ready.
+        """
+        pipeline = StartupPipeline()
+        trading_pair_fetcher = TradingPairFetcher.get_instance(self.client_config_map)
+        trading_pair_fetcher.defer_optional_fetches()
+
+        # The rate oracle is required for PNL calculation, it doesn't depend on the strategy connectors
+        pipeline.add_step("rate_oracle", self._start_rate_oracle)
+        markets = [market for market in self.markets.values() if market is not None]
+        restore_steps = []
+        for market in markets:
+            step_name = f"{market.name} restore state"
+            pipeline.add_step(step_name, functools.partial(self._restore_market_state, market))
+            restore_steps.append(step_name)
+        pipeline.add_step("start clock", self._start_clock, depends_on=restore_steps)
+
+        ready_steps = []
+        if self._trading_required:
+            for market in markets:
+                try:
+                    status_keys = list(market.status_dict.keys()) or [None]
+                except NotImplementedError:
+                    status_keys = [None]
+                for status_key in status_keys:
+                    step_name = f"{market.name} {status_key}" if status_key is not None else f"{market.name} ready"
+                    pipeline.add_step(step_name,
+                                      functools.partial(self._wait_for_market_status, market, status_key),
+                                      depends_on=["start clock"])
+                    ready_steps.append(step_name)
+            pipeline.add_step("kill switch", self._start_kill_switch, depends_on=ready_steps)
+        pipeline.add_step("fetch trading pairs",
+                          self._resume_trading_pairs_fetch,
+                          depends_on=ready_steps or ["start clock"],
+                          deferred=True)
+        return pipeline
+
+    async def _start_rate_oracle(self):
+        RateOracle.get_instance().snapshot_enabled = self.client_config_map.warm_start_cache_enabled
+        RateOracle.get_instance().start()
+
+    async def _restore_market_state(self,  # type: HummingbotApplication
+                                    market: ExchangeBase):
+        self.markets_recorder.restore_market_states(self.strategy_file_name, market)
+        if len(market.limit_orders) > 0:
+            self.notify(f"Canceling dangling limit orders on {market.name}...")
+            await market.cancel_all(10.0)
+
+    async def _start_clock(self,  # type: HummingbotApplication
+                           ):
+        for market in self.markets.values():
+            if market is not None:
+                self.clock.add_iterator(market)
+        if self.strategy:
+            self.clock.add_iterator(self.strategy)
+        try:
+            self._pmm_script_iterator = self.client_config_map.pmm_script_mode.get_iterator(
+                self.strategy_name, list(self.markets.values()), self.strategy
+            )
+        except ValueError as e:
+            self.notify(f"Error: {e}")
+        if self._pmm_script_iterator is not None:
+            self.clock.add_iterator(self._pmm_script_iterator)
+            self.notify(f"PMM script ({self.client_config_map.pmm_script_mode.pmm_script_file_path}) started.")
+        self.strategy_task: asyncio.Task = safe_ensure_future(self._run_clock(), loop=self.ev_loop)
+        self.notify(f"\n'{self.strategy_name}' strategy started.\n"
+                    f"Run `status` command to query the progress.")
+        self.logger().info("start command initiated.")
+
+    @staticmethod
+    async def _wait_for_market_status(market: ExchangeBase, status_key: Optional[str]):
+        while not (market.ready if status_key is None else market.status_dict.get(status_key, False)):
+            await asyncio.sleep(MARKET_STATUS_CHECK_INTERVAL)
+
+    async def _start_kill_switch(self,  # type: HummingbotApplication
+                                 ):
+        self.kill_switch = self.client_config_map.kill_switch_mode.get_kill_switch(self)
+        self.kill_switch.start()
+
+    @staticmethod
+    async def _resume_trading_pairs_fetch():
+        TradingPairFetcher.get_instance().resume_optional_fetches()
+
+    def _resume_trading_pairs_fetch_if_not_started(self,  # type: HummingbotApplication
+                                                   _):
+        # The start-up pipeline resumes the deferred fetches once the connectors are ready, or the stop command
+        # when it is canceled. They are resumed here when the start was aborted before the pipeline was created.
+        if self._startup_pipeline is None:
+            TradingPairFetcher.get_instance().resume_optional_fetches()
+
     def _initialize_strategy(self, strategy_name: str):
         if self.is_current_strategy_script_strategy():
             self.start_script_strategy()
@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING
 
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.trading_pair_fetcher import TradingPairFetcher
 from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
 
 if TYPE_CHECKING:
@@ -48,6 +49,11 @@ class StopCommand:
                 # Only erase markets when cancellation has been successful
                 self.markets = {}
 
+        if self._startup_pipeline is not None:
+            self._startup_pipeline.cancel()
+            self._startup_pipeline = None
+            TradingPairFetcher.get_instance().resume_optional_fetches()
+
         if self.strategy_task is not None and not self.strategy_task.cancelled():
             self.strategy_task.cancel()
 
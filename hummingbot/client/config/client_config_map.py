@@ -1151,6 +1151,53 @@ class ClientConfigMap(BaseClientModel):
             ),
         ),
     )
+    early_tick_price_threshold: Optional[Decimal] = Field(
+        default=None,
+        ge=Decimal("0"),
+        description="When set, the clock runs in hybrid mode: on top of the regular ticks, strategies are also ticked"
+                    "\nas soon as the best bid or ask of one of their order books moves by more than this percentage,"
+                    "\nor when one of their orders is filled. Leave empty to only tick every tick_size seconds.",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "By which best bid/ask change (in percent) should strategies be ticked early?"
+                " (Enter 0.1 to indicate 0.1%, leave empty to disable)"
+            ),
+        ),
+    )
+    warm_start_cache_enabled: bool = Field(
+        default=False,
+        description="When enabled, exchange connectors save their trading rules, symbol map, trading fees and order"
+                    "\nbook snapshots locally, and the rate oracle its conversion rates, and restore them on restart"
+                    "\nto be ready sooner. Fresh data is requested in the background right after the restart.",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Do you want to restart connectors from their warm start cache? (Yes/No)"
+            ),
+        ),
+    )
+    order_book_ws_connections: int = Field(
+        default=1,
+        ge=1,
+        description="The number of websocket connections exchange connectors spread the order book and trade"
+                    "\nsubscriptions of their trading pairs across. Each connection reconnects independently, so a"
+                    "\ndisconnection only interrupts the order books of its own trading pairs.",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "How many websocket connections should connectors use for order book data?"
+            ),
+        ),
+    )
+    market_data_process_enabled: bool = Field(
+        default=False,
+        description="When enabled, spot exchange connectors track their order books in a separate process, which"
+                    "\nshares the best 100 levels of each order book and the last trade price through shared memory,"
+                    "\nand forwards the public trades. Perpetual connectors are not affected.",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Do you want connectors to track their order books in a separate process? (Yes/No)"
+            ),
+        ),
+    )
     market_data_collection: MarketDataCollectionConfigMap = Field(default=MarketDataCollectionConfigMap())
 
     class Config:
@@ -1186,7 +1233,13 @@ class ClientConfigMap(BaseClientModel):
             sub_model = TELEGRAM_MODES[v].construct()
         return sub_model
 
-    @validator("send_error_logs", "fetch_pairs_from_all_exchanges", pre=True)
+    @validator(
+        "send_error_logs",
+        "fetch_pairs_from_all_exchanges",
+        "warm_start_cache_enabled",
+        "market_data_process_enabled",
+        pre=True,
+    )
     def validate_bool(cls, v: str):
         """Used for client-friendly error output."""
         if isinstance(v, str):
@@ -23,6 +23,7 @@ from hummingbot.client.config.strategy_config_data_types import BaseStrategyConf
 from hummingbot.client.settings import CLIENT_CONFIG_PATH, AllConnectorSettings, ConnectorType
 from hummingbot.client.tab import __all__ as tab_classes
 from hummingbot.client.tab.data_types import CommandTab
+from hummingbot.client.trade_fills_feed import TradeFillsFeed
 from hummingbot.client.ui.completer import load_completer
 from hummingbot.client.ui.hummingbot_cli import HummingbotCLI
 from hummingbot.client.ui.keybindings import load_key_bindings
@@ -33,6 +34,7 @@ from hummingbot.connector.markets_recorder import MarketsRecorder
 from hummingbot.core.clock import Clock
 from hummingbot.core.gateway.gateway_status_monitor import GatewayStatusMonitor
 from hummingbot.core.utils.kill_switch import KillSwitch
+from hummingbot.core.utils.startup_pipeline import StartupPipeline
 from hummingbot.core.utils.trading_pair_fetcher import TradingPairFetcher
 from hummingbot.data_feed.data_feed_base import DataFeedBase
 from hummingbot.exceptions import ArgumentParserError
@@ -104,6 +106,8 @@ class HummingbotApplication(*commands):
 
         self.trade_fill_db: Optional[SQLConnectionManager] = None
         self.markets_recorder: Optional[MarketsRecorder] = None
+        self._trade_fills_feed: Optional[TradeFillsFeed] = None
+        self._startup_pipeline: Optional[StartupPipeline] = None
         self._pmm_script_iterator = None
         self._binance_connector = None
         self._shared_client = None
@@ -2,6 +2,7 @@ import logging
 from collections import defaultdict
 from dataclasses import dataclass
 from decimal import Decimal
+from types import SimpleNamespace
 from typing import Any, Dict, List, Optional, Tuple
 
 from hummingbot.connector.utils import combine_to_hb_trading_pair, split_hb_trading_pair
@@ -55,6 +56,10 @@ class PerformanceMetrics:
     def __init__(self):
         # fees is a dictionary of token and total fee amount paid in that token.
         self.fees: Dict[str, Decimal] = defaultdict(lambda: s_decimal_0)
+        self._buys: List[Any] = []
+        self._sells: List[Any] = []
+        self._last_trade_price: Decimal = s_decimal_0
+        self._derivatives_trade_pnl: Optional[Tuple[int, Decimal]] = None
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -225,6 +230,10 @@ class PerformanceMetrics:
         return impact
 
     async def _calculate_fees(self, quote: str, trades: List[Any]):
+        self._accumulate_fees(quote, trades)
+        await self._calculate_fee_in_quote(quote)
+
+    def _accumulate_fees(self, quote: str, trades: List[Any]):
         for trade in trades:
             fee_percent = None
             trade_price = None
@@ -248,26 +257,35 @@ class PerformanceMetrics:
             for flat_fee in flat_fees:
                 self.fees[flat_fee.token] += flat_fee.amount
 
-        for fee_token, fee_amount in self.fees.items():
+    async def _calculate_fee_in_quote(self, quote: str):
+        fee_in_quote = s_decimal_0
+        for fee_token, fee_amount in list(self.fees.items()):
             if fee_token == quote:
-                self.fee_in_quote += fee_amount
+                fee_in_quote += fee_amount
             else:
                 rate_pair: str = combine_to_hb_trading_pair(fee_token, quote)
                 last_price = await RateOracle.get_instance().stored_or_live_rate(rate_pair)
                 if last_price is not None:
-                    self.fee_in_quote += fee_amount * last_price
+                    fee_in_quote += fee_amount * last_price
                 else:
                     self.logger().warning(
                         f"Could not find exchange rate for {rate_pair} "
                         f"using {RateOracle.get_instance()}. PNL value will be inconsistent."
                     )
+        self.fee_in_quote = fee_in_quote
 
     def _calculate_trade_pnl(self, buys: list, sells: list):
         self.trade_pnl = self.cur_value - self.hold_value
 
         # Handle trade_pnl differently for derivatives
         if self._are_derivatives(buys) or self._are_derivatives(sells):
-            buys_copy, sells_copy = self.aggregate_position_order(buys.copy(), sells.copy())
+            trades_count = len(buys) + len(sells)
+            if self._derivatives_trade_pnl is not None and self._derivatives_trade_pnl[0] == trades_count:
+                self.trade_pnl = self._derivatives_trade_pnl[1]
+                return
+            # The aggregation updates the first fill of each order, so it works on copies of the fills
+            buys_copy, sells_copy = self.aggregate_position_order(self._position_fills(buys),
+                                                                  self._position_fills(sells))
             long = []
             short = []
 
@@ -283,6 +301,12 @@ class PerformanceMetrics:
                     break
 
             self.trade_pnl = Decimal(str(sum(self.derivative_pnl(long, short))))
+            self._derivatives_trade_pnl = (trades_count, self.trade_pnl)
+
+    @staticmethod
+    def _position_fills(trades: List[Any]) -> List[SimpleNamespace]:
+        return [SimpleNamespace(order_id=trade.order_id, price=trade.price, amount=trade.amount, position=trade.position)
+                for trade in trades]
 
     async def _initialize_metrics(self,
                                   trading_pair: str,
@@ -294,23 +318,46 @@ class PerformanceMetrics:
         :param trades: the list of TradeFill or Trade object
         :param current_balances: current user account balance
         """
+        self.add_trades(trading_pair, trades)
+        await self.update_metrics(trading_pair, current_balances)
 
-        base, quote = split_hb_trading_pair(trading_pair)
+    def add_trades(self, trading_pair: str, trades: List[Any]):
+        """
+        Adds trades to the running volumes, trade counts and fees. Call `update_metrics` afterwards to get the PnL
+        metrics, which also depend on the current balances and price.
+        :param trading_pair: the trading market of the trades
+        :param trades: the new TradeFill or Trade objects, in ascending timestamp order
+        """
+        if len(trades) == 0:
+            return
+        _, quote = split_hb_trading_pair(trading_pair)
         buys, sells = self._preprocess_trades_and_group_by_type(trades)
-
-        self.num_buys = len(buys)
-        self.num_sells = len(sells)
+        if self.num_trades == 0:
+            self.start_price = Decimal(str(trades[0].price))
+        self._buys.extend(buys)
+        self._sells.extend(sells)
+        self.num_buys = len(self._buys)
+        self.num_sells = len(self._sells)
         self.num_trades = self.num_buys + self.num_sells
+        self._last_trade_price = Decimal(str(trades[-1].price))
+        self._accumulate_fees(quote, trades)
+
+    async def update_metrics(self, trading_pair: str, current_balances: Dict[str, Decimal]):
+        """
+        Updates the balances, portfolio values, PnL and Return % from the trades added so far.
+        :param trading_pair: the trading market to get performance metrics
+        :param current_balances: current user account balance
+        """
+        base, quote = split_hb_trading_pair(trading_pair)
 
         self.cur_base_bal = current_balances.get(base, s_decimal_0)
         self.cur_quote_bal = current_balances.get(quote, s_decimal_0)
         self.start_base_bal = self.cur_base_bal - self.tot_vol_base
         self.start_quote_bal = self.cur_quote_bal - self.tot_vol_quote
 
-        self.start_price = Decimal(str(trades[0].price))
         self.cur_price = await RateOracle.get_instance().stored_or_live_rate(trading_pair)
         if self.cur_price is None:
-            self.cur_price = Decimal(str(trades[-1].price))
+            self.cur_price = self._last_trade_price
         self.start_base_ratio_pct = self.divide(self.start_base_bal * self.start_price,
                                                 (self.start_base_bal * self.start_price) + self.start_quote_bal)
         self.cur_base_ratio_pct = self.divide(self.cur_base_bal * self.cur_price,
@@ -318,9 +365,9 @@ class PerformanceMetrics:
 
         self.hold_value = (self.start_base_bal * self.cur_price) + self.start_quote_bal
         self.cur_value = (self.cur_base_bal * self.cur_price) + self.cur_quote_bal
-        self._calculate_trade_pnl(buys, sells)
+        self._calculate_trade_pnl(self._buys, self._sells)
 
-        await self._calculate_fees(quote, trades)
+        await self._calculate_fee_in_quote(quote)
 
         self.total_pnl = self.trade_pnl - self.fee_in_quote
         self.return_pct = self.divide(self.total_pnl, self.hold_value)
@@ -306,9 +306,13 @@ class ConnectorSetting(NamedTuple):
 
     def non_trading_connector_instance_with_default_configuration(
             self,
-            trading_pairs: Optional[List[str]] = None) -> 'ConnectorBase':
+            trading_pairs: Optional[List[str]] = None,
+            client_config_map: Optional["ClientConfigAdapter"] = None) -> 'ConnectorBase':
         from hummingbot.client.config.config_helpers import ClientConfigAdapter
-        from hummingbot.client.hummingbot_application import HummingbotApplication
+
+        if client_config_map is None:
+            from hummingbot.client.hummingbot_application import HummingbotApplication
+            client_config_map = HummingbotApplication.main_application().client_config_map
 
         trading_pairs = trading_pairs or []
         connector_class = getattr(importlib.import_module(self.module_path()), self.class_name())
@@ -328,7 +332,7 @@ class ConnectorSetting(NamedTuple):
             trading_pairs=trading_pairs,
             trading_required=False,
             api_keys=kwargs,
-            client_config_map=HummingbotApplication.main_application().client_config_map,
+            client_config_map=client_config_map,
         )
         kwargs = self.add_domain_parameter(kwargs)
         connector = connector_class(**kwargs)
@@ -0,0 +1,161 @@
+import logging
+from bisect import bisect_left, bisect_right
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from sqlalchemy.orm import Query, Session
+
+from hummingbot.client.performance import PerformanceMetrics
+from hummingbot.logger import HummingbotLogger
+from hummingbot.model.sql_connection_manager import SQLConnectionManager
+from hummingbot.model.trade_fill import TradeFill
+
+TradeFillsSubscriber = Callable[[List[TradeFill]], None]
+
+
+class TradeFillsFeed:
+    """
+    Incremental feed of the trade fills recorded for a strategy config file since a start time.
+
+    Each `update()` only loads the fills recorded since the last loaded one, using the last timestamp as a cursor. A
+    fill can be recorded after fills with later timestamps (e.g. found by an order status update), so the fills of the
+    `LATE_FILLS_WINDOW` before the cursor are scanned again, and the already loaded ones are told apart by their primary
+    key. The new fills are added to the running performance metrics of their market and passed to the subscribers, so
+    consumers like the trade monitor, the `history` command and the MQTT history don't have to reload and reprocess
+    every fill of the session.
+    """
+
+    # Maximum delay (in milliseconds) between the timestamp of a fill and its recording for the fill to be loaded
+    LATE_FILLS_WINDOW = 10 * 60 * 1000
+
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self, sql_manager: SQLConnectionManager, config_file_path: str, start_timestamp: int):
+        """
+        :param sql_manager: the trade fills database
+        :param config_file_path: the strategy config file the fills were recorded for
+        :param start_timestamp: the timestamp (in milliseconds) of the first fills to load
+        """
+        self._sql_manager = sql_manager
+        self._config_file_path = config_file_path
+        self._start_timestamp = start_timestamp
+        self._trades: List[TradeFill] = []
+        self._timestamps: List[int] = []
+        self._cursor_timestamp: int = start_timestamp
+        # Keys of the loaded fills not older than the window before the cursor
+        self._window_keys: Dict[Tuple[str, str, str], int] = {}
+        self._market_metrics: Dict[Tuple[str, str], PerformanceMetrics] = {}
+        self._subscribers: List[TradeFillsSubscriber] = []
+
+    @property
+    def sql_manager(self) -> SQLConnectionManager:
+        return self._sql_manager
+
+    @property
+    def config_file_path(self) -> str:
+        return self._config_file_path
+
+    @property
+    def start_timestamp(self) -> int:
+        return self._start_timestamp
+
+    @property
+    def trades(self) -> List[TradeFill]:
+        """
+        All the fills loaded so far, in ascending timestamp order.
+        """
+        return self._trades
+
+    @property
+    def market_metrics(self) -> Dict[Tuple[str, str], PerformanceMetrics]:
+        """
+        The running performance metrics of each (market, trading pair) with fills. Their volumes, trade counts and
+        fees include all the loaded fills; `PerformanceMetrics.update_metrics` refreshes the PnL metrics.
+        """
+        return self._market_metrics
+
+    def subscribe(self, subscriber: TradeFillsSubscriber):
+        """
+        :param subscriber: called with the new fills after each update loading some
+        """
+        if subscriber not in self._subscribers:
+            self._subscribers.append(subscriber)
+
+    def unsubscribe(self, subscriber: TradeFillsSubscriber):
+        if subscriber in self._subscribers:
+            self._subscribers.remove(subscriber)
+
+    def trades_since(self, start_timestamp: int) -> List[TradeFill]:
+        """
+        :param start_timestamp: timestamp in milliseconds, not before the feed start timestamp
+
+        :return: the loaded fills from the timestamp on
+        """
+        return self._trades[bisect_left(self._timestamps, start_timestamp):]
+
+    def update(self) -> List[TradeFill]:
+        """
+        Loads the fills recorded since the last update.
+
+        :return: the new fills, in ascending timestamp order
+        """
+        with self._sql_manager.get_new_session() as session:
+            new_trades = [trade for trade in self._query_trades_from_cursor(session)
+                          if self._trade_key(trade) not in self._window_keys]
+        if len(new_trades) == 0:
+            return new_trades
+
+        late_markets: Set[Tuple[str, str]] = set()
+        for trade in new_trades:
+            if len(self._timestamps) == 0 or trade.timestamp >= self._timestamps[-1]:
+                self._trades.append(trade)
+                self._timestamps.append(trade.timestamp)
+            else:
+                position = bisect_right(self._timestamps, trade.timestamp)
+                self._trades.insert(position, trade)
+                self._timestamps.insert(position, trade.timestamp)
+                late_markets.add((trade.market, trade.symbol))
+            self._window_keys[self._trade_key(trade)] = trade.timestamp
+        self._cursor_timestamp = max(self._cursor_timestamp, new_trades[-1].timestamp)
+        window_start = self._cursor_timestamp - self.LATE_FILLS_WINDOW
+        self._window_keys = {key: timestamp for key, timestamp in self._window_keys.items()
+                             if timestamp >= window_start}
+
+        trades_by_market: Dict[Tuple[str, str], List[TradeFill]] = {}
+        for trade in new_trades:
+            trades_by_market.setdefault((trade.market, trade.symbol), []).append(trade)
+        for (market, trading_pair), market_trades in trades_by_market.items():
+            metrics = self._market_metrics.get((market, trading_pair))
+            if metrics is None or (market, trading_pair) in late_markets:
+                # The running metrics expect the fills in ascending timestamp order, late fills rebuild them
+                metrics = PerformanceMetrics()
+                self._market_metrics[(market, trading_pair)] = metrics
+                market_trades = [trade for trade in self._trades
+                                 if trade.market == market and trade.symbol == trading_pair]
+            metrics.add_trades(trading_pair, market_trades)
+
+        for subscriber in list(self._subscribers):
+            try:
+                subscriber(new_trades)
+            except Exception:
+                self.logger().error("Unexpected error notifying new trade fills.", exc_info=True)
+
+        return new_trades
+
+    def _query_trades_from_cursor(self, session: Session) -> List[TradeFill]:
+        query: Query = (session
+                        .query(TradeFill)
+                        .filter(TradeFill.timestamp >= max(self._start_timestamp,
+                                                           self._cursor_timestamp - self.LATE_FILLS_WINDOW),
+                                TradeFill.config_file_path.like(f"%{self._config_file_path}%"))
+                        .order_by(TradeFill.timestamp.asc()))
+        return query.all() or []
+
+    @staticmethod
+    def _trade_key(trade: TradeFill) -> Tuple[str, str, str]:
+        return trade.market, trade.order_id, trade.exchange_trade_id
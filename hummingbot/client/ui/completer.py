@@ -12,6 +12,7 @@ from prompt_toolkit.document import Document
 
 from hummingbot.client import settings
 from hummingbot.client.command.connect_command import OPTIONS as CONNECT_OPTIONS
+from hummingbot.client.command.profile_command import PROFILE_ACTIONS
 from hummingbot.client.config.config_data_types import BaseClientModel
 from hummingbot.client.settings import (
     GATEWAY_CONNECTORS,
@@ -100,6 +101,7 @@ class HummingbotCompleter(Completer):
         self._controller_completer = self.get_available_controllers()
         self._rate_oracle_completer = WordCompleter(list(RATE_ORACLE_SOURCES.keys()), ignore_case=True)
         self._mqtt_completer = WordCompleter(["start", "stop", "restart"], ignore_case=True)
+        self._profile_completer = WordCompleter(PROFILE_ACTIONS, ignore_case=True)
         self._gateway_chains = []
         self._gateway_networks = []
         self._list_gateway_wallets_parameters = {"wallets": [], "chain": ""}
@@ -329,6 +331,10 @@ class HummingbotCompleter(Completer):
         text_before_cursor: str = document.text_before_cursor
         return text_before_cursor.startswith("mqtt ")
 
+    def _complete_profile_arguments(self, document: Document) -> bool:
+        text_before_cursor: str = document.text_before_cursor
+        return text_before_cursor.startswith("profile ")
+
     def get_completions(self, document: Document, complete_event: CompleteEvent):
         """
         Get completions for the current scope. This is the defining function for the completer
@@ -489,6 +495,10 @@ class HummingbotCompleter(Completer):
             for c in self._mqtt_completer.get_completions(document, complete_event):
                 yield c
 
+        elif self._complete_profile_arguments(document):
+            for c in self._profile_completer.get_completions(document, complete_event):
+                yield c
+
         else:
             text_before_cursor: str = document.text_before_cursor
             try:
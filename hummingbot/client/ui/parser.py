@@ -2,6 +2,7 @@ import argparse
 from typing import TYPE_CHECKING, Any, List
 
 from hummingbot.client.command.connect_command import OPTIONS as CONNECT_OPTIONS
+from hummingbot.client.command.profile_command import PROFILE_ACTIONS
 from hummingbot.exceptions import ArgumentParserError
 
 if TYPE_CHECKING:
@@ -147,6 +148,13 @@ def load_parser(hummingbot: "HummingbotApplication", command_tabs) -> [ThrowingA
     pmm_script_parser.add_argument("args", nargs="*", default=None, help="Arguments")
     pmm_script_parser.set_defaults(func=hummingbot.pmm_script_command)
 
+    profile_parser = subparsers.add_parser("profile", help="Show or control the clock tick and event profiler")
+    profile_parser.add_argument("action", nargs="?", choices=PROFILE_ACTIONS, default="show",
+                                help="Show the statistics, start/stop/reset the profiler or sample the main thread")
+    profile_parser.add_argument("-d", "--duration", type=float, default=5.0, dest="duration",
+                                help="Sampling duration in seconds")
+    profile_parser.set_defaults(func=hummingbot.profile)
+
     previous_strategy_parser = subparsers.add_parser("previous", help="Imports the last strategy used")
     previous_strategy_parser.add_argument("option", nargs="?", choices=["Yes,No"], default=None)
     previous_strategy_parser.set_defaults(func=hummingbot.previous_strategy)
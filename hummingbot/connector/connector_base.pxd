@@ -17,6 +17,12 @@ cdef class ConnectorBase(NetworkIterator):
         public object _trade_fee_schema
         public object _trade_volume_metric_collector
         public object _client_config
+        public dict _available_balances_cache
+        public dict _balance_aggregates_cache
+        public object _balance_limits_cache
+        public object _balance_cache_key
+        public int _balance_cache_in_flight_orders_count
+        public object _balance_cache_event_forwarder
 
     cdef str c_buy(self, str trading_pair, object amount, object order_type=*, object price=*, dict kwargs=*)
     cdef str c_sell(self, str trading_pair, object amount, object order_type=*, object price=*, dict kwargs=*)
@@ -12,6 +12,7 @@ from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.market_order import MarketOrder
+from hummingbot.core.event.event_forwarder import EventForwarder
 from hummingbot.core.event.event_logger import EventLogger
 from hummingbot.core.event.events import MarketEvent, OrderFilledEvent
 from hummingbot.core.network_iterator import NetworkIterator
@@ -43,6 +44,17 @@ cdef class ConnectorBase(NetworkIterator):
         MarketEvent.RangePositionUpdateFailure,
         MarketEvent.RangePositionFeeCollected,
     ]
+    # Events changing the in flight orders (or the filled amounts) the available balances are derived from
+    BALANCE_CACHE_EVENTS = [
+        MarketEvent.BuyOrderCreated,
+        MarketEvent.SellOrderCreated,
+        MarketEvent.OrderFilled,
+        MarketEvent.OrderCancelled,
+        MarketEvent.OrderFailure,
+        MarketEvent.OrderExpired,
+        MarketEvent.BuyOrderCompleted,
+        MarketEvent.SellOrderCompleted,
+    ]
 
     def __init__(self, client_config_map: "ClientConfigAdapter"):
         super().__init__()
@@ -64,6 +76,16 @@ cdef class ConnectorBase(NetworkIterator):
         self._in_flight_orders_snapshot_timestamp = 0.0
         self._current_trade_fills = set()
         self._exchange_order_ids = dict()
+        # Available balances computed in the current tick: Dict[asset_name:str, (raw available balance, balance)]
+        self._available_balances_cache = {}
+        # Per asset balances of the in flight orders and fills, shared by all the assets computed in the current tick
+        self._balance_aggregates_cache = {}
+        self._balance_limits_cache = None
+        self._balance_cache_key = None
+        self._balance_cache_in_flight_orders_count = -1
+        self._balance_cache_event_forwarder = EventForwarder(to_function=self._process_balance_cache_event)
+        for event_tag in self.BALANCE_CACHE_EVENTS:
+            self.c_add_listener(event_tag.value, self._balance_cache_event_forwarder)
         self._trade_fee_schema = None
         self._trade_volume_metric_collector = client_config_map.anonymized_metrics_mode.get_collector(
             connector=self,
@@ -267,35 +289,38 @@ cdef class ConnectorBase(NetworkIterator):
         raise NotImplementedError
 
     def batch_order_create(
-        self, orders_to_create: List[Union[LimitOrder, MarketOrder]]
+        self,
+        orders_to_create: List[Union[LimitOrder, MarketOrder]],
+        limit_order_type: OrderType = OrderType.LIMIT,
     ) -> List[Union[LimitOrder, MarketOrder]]:
         """
         Issues a batch order creation as a single API request for exchanges that implement this feature. The default
         implementation of this method is to send the requests discretely (one by one).
         :param orders_to_create: A list of LimitOrder or MarketOrder objects representing the orders to create. The
             order IDs can be blanc.
+        :param limit_order_type: The order type used for the LimitOrder objects (LIMIT or LIMIT_MAKER).
         :returns: A list of LimitOrder or MarketOrder objects representing the created orders, complete with the
             generated order IDs.
         """
         creation_results = []
         for order in orders_to_create:
-            order_type = OrderType.LIMIT if isinstance(order, LimitOrder) else OrderType.MARKET
-            size = order.quantity if order_type == OrderType.LIMIT else order.amount
+            order_type = limit_order_type if isinstance(order, LimitOrder) else OrderType.MARKET
+            size = order.quantity if order_type.is_limit_type() else order.amount
             if order.is_buy:
                 client_order_id = self.buy(
                     trading_pair=order.trading_pair,
                     amount=size,
                     order_type=order_type,
-                    price=order.price if order_type == OrderType.LIMIT else s_decimal_NaN
+                    price=order.price if order_type.is_limit_type() else s_decimal_NaN
                 )
             else:
                 client_order_id = self.sell(
                     trading_pair=order.trading_pair,
                     amount=size,
                     order_type=order_type,
-                    price=order.price if order_type == OrderType.LIMIT else s_decimal_NaN,
+                    price=order.price if order_type.is_limit_type() else s_decimal_NaN,
                 )
-            if order_type == OrderType.LIMIT:
+            if order_type.is_limit_type():
                 creation_results.append(
                     LimitOrder(
                         client_order_id=client_order_id,
@@ -415,17 +440,98 @@ cdef class ConnectorBase(NetworkIterator):
         """
         Return available balance for a given currency. The function accounts for balance changes since the last time
         the snapshot was taken if no real time balance update. The function applied limit if configured.
+
+        The balances of the in flight orders and fills, the limits and the resulting available balances are cached for
+        the current tick, so that querying the balances several times per tick doesn't recompute them. The cache is
+        cleared by the order events, when the in flight orders change, and when a new balance snapshot is taken.
         :param currency: The currency (token) name
         :returns: Balance available for trading for the specified currency
         """
         available_balance = self._account_available_balances.get(currency, s_decimal_0)
+        self._check_balance_cache_validity()
+        balance_limits = self._balance_limits()
+        if self._real_time_balance_update and currency not in balance_limits:
+            return available_balance
+        in_flight_orders_count = len(self.in_flight_orders)
+        if in_flight_orders_count != self._balance_cache_in_flight_orders_count:
+            self.invalidate_balance_cache()
+            self._balance_cache_in_flight_orders_count = in_flight_orders_count
+        cached_balance = self._available_balances_cache.get(currency)
+        # The raw available balance is compared as connectors with real time updates change it without events
+        if cached_balance is not None and cached_balance[0] == available_balance:
+            return cached_balance[1]
+
+        balance = available_balance
         if not self._real_time_balance_update:
-            available_balance = self.apply_balance_update_since_snapshot(currency, available_balance)
-        balance_limits = self.get_exchange_limit_config(self.name)
+            balance += (self._snapshot_in_flight_balances().get(currency, s_decimal_0)
+                        - self._in_flight_balances().get(currency, s_decimal_0)
+                        + self._filled_balances_since_snapshot().get(currency, s_decimal_0))
         if currency in balance_limits:
-            balance_limit = Decimal(str(balance_limits[currency]))
-            available_balance = self.apply_balance_limit(currency, available_balance, balance_limit)
-        return available_balance
+            limit = (balance_limits[currency]
+                     - self._in_flight_balances().get(currency, s_decimal_0)
+                     + self._filled_balances().get(currency, s_decimal_0))
+            balance = min(balance, max(limit, s_decimal_0))
+        self._available_balances_cache[currency] = (available_balance, balance)
+        return balance
+
+    def invalidate_balance_cache(self):
+        """
+        Clears the available balances cached for the current tick.
+        """
+        self._available_balances_cache.clear()
+        self._balance_aggregates_cache.clear()
+        self._balance_limits_cache = None
+
+    def _check_balance_cache_validity(self):
+        timestamp = self.current_timestamp
+        if timestamp != timestamp:
+            # The connector did not tick yet (NaN timestamp), there is no tick to cache the balances for
+            self.invalidate_balance_cache()
+            self._balance_cache_key = None
+            return
+        # A new snapshot dictionary is assigned each time the balances are polled
+        cache_key = (timestamp, id(self._in_flight_orders_snapshot), self._in_flight_orders_snapshot_timestamp)
+        if cache_key != self._balance_cache_key:
+            self.invalidate_balance_cache()
+            self._balance_cache_key = cache_key
+
+    def _process_balance_cache_event(self, _):
+        self.invalidate_balance_cache()
+
+    def _balance_limits(self) -> Dict[str, Decimal]:
+        if self._balance_limits_cache is None:
+            self._balance_limits_cache = {
+                asset: Decimal(str(limit)) for asset, limit in self.get_exchange_limit_config(self.name).items()
+            }
+        return self._balance_limits_cache
+
+    def _in_flight_balances(self) -> Dict[str, Decimal]:
+        balances = self._balance_aggregates_cache.get("in_flight")
+        if balances is None:
+            balances = self.in_flight_asset_balances(self.in_flight_orders)
+            self._balance_aggregates_cache["in_flight"] = balances
+        return balances
+
+    def _snapshot_in_flight_balances(self) -> Dict[str, Decimal]:
+        balances = self._balance_aggregates_cache.get("snapshot_in_flight")
+        if balances is None:
+            balances = self.in_flight_asset_balances(self._in_flight_orders_snapshot)
+            self._balance_aggregates_cache["snapshot_in_flight"] = balances
+        return balances
+
+    def _filled_balances(self) -> Dict[str, Decimal]:
+        balances = self._balance_aggregates_cache.get("filled")
+        if balances is None:
+            balances = self.order_filled_balances()
+            self._balance_aggregates_cache["filled"] = balances
+        return balances
+
+    def _filled_balances_since_snapshot(self) -> Dict[str, Decimal]:
+        balances = self._balance_aggregates_cache.get("filled_since_snapshot")
+        if balances is None:
+            balances = self.order_filled_balances(self._in_flight_orders_snapshot_timestamp)
+            self._balance_aggregates_cache["filled_since_snapshot"] = balances
+        return balances
 
     cdef object c_get_price(self, str trading_pair, bint is_buy):
         return self.get_price(trading_pair, is_buy)
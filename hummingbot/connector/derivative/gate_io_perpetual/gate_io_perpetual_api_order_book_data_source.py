@@ -24,6 +24,8 @@ if TYPE_CHECKING:
 
 
 class GateIoPerpetualAPIOrderBookDataSource(PerpetualAPIOrderBookDataSource):
+    CONTIGUOUS_DIFF_UPDATE_IDS = True
+
     def __init__(
             self,
             trading_pairs: List[str],
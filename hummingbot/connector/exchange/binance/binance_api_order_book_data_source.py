@@ -20,6 +20,7 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
     TRADE_STREAM_ID = 1
     DIFF_STREAM_ID = 2
     ONE_HOUR = 60 * 60
+    CONTIGUOUS_DIFF_UPDATE_IDS = True
 
     _logger: Optional[HummingbotLogger] = None
 
@@ -68,10 +69,19 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
         Subscribes to the trade events and diff orders events through the provided websocket connection.
         :param ws: the websocket assistant used to connect to the exchange
         """
+        await self._subscribe_channels_for_trading_pairs(ws=ws, trading_pairs=self._trading_pairs)
+
+    async def _subscribe_channels_for_trading_pairs(self, ws: WSAssistant, trading_pairs: List[str]):
+        """
+        Subscribes to the trade events and diff orders events of the trading pairs through the provided websocket
+        connection.
+        :param ws: the websocket assistant used to connect to the exchange
+        :param trading_pairs: the trading pairs to subscribe to
+        """
         try:
             trade_params = []
             depth_params = []
-            for trading_pair in self._trading_pairs:
+            for trading_pair in trading_pairs:
                 symbol = await self._connector.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
                 trade_params.append(f"{symbol.lower()}@trade")
                 depth_params.append(f"{symbol.lower()}@depth@100ms")
@@ -28,6 +28,7 @@ ORDER_PATH_URL = "/order"
 BINANCE_USER_STREAM_PATH_URL = "/userDataStream"
 
 WS_HEARTBEAT_TIME_INTERVAL = 30
+ALL_MARKET_TICKERS_STREAM = "!ticker@arr"
 
 # Binance params
 
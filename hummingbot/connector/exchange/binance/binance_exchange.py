@@ -1,6 +1,6 @@
 import asyncio
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, AsyncIterable, Dict, List, Optional, Tuple
 
 from bidict import bidict
 
@@ -23,7 +23,7 @@ from hummingbot.core.data_type.trade_fee import DeductedFromReturnsTradeFee, Tok
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
 from hummingbot.core.event.events import MarketEvent, OrderFilledEvent
 from hummingbot.core.utils.async_utils import safe_gather
-from hummingbot.core.web_assistant.connections.data_types import RESTMethod
+from hummingbot.core.web_assistant.connections.data_types import RESTMethod, WSJSONRequest
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 
 if TYPE_CHECKING:
@@ -120,6 +120,23 @@ class BinanceExchange(ExchangePyBase):
         pairs_prices = await self._api_get(path_url=CONSTANTS.TICKER_BOOK_PATH_URL)
         return pairs_prices
 
+    async def iter_all_pairs_tickers(self) -> AsyncIterable[List[Dict[str, Any]]]:
+        """
+        Yields the tickers of the pairs that changed, pushed every second by the all market tickers stream
+        """
+        ws = await self._web_assistants_factory.get_ws_assistant()
+        await ws.connect(ws_url=CONSTANTS.WSS_URL.format(self._domain),
+                         ping_timeout=CONSTANTS.WS_HEARTBEAT_TIME_INTERVAL)
+        try:
+            await ws.send(WSJSONRequest(payload={"method": "SUBSCRIBE",
+                                                 "params": [CONSTANTS.ALL_MARKET_TICKERS_STREAM],
+                                                 "id": 1}))
+            async for ws_response in ws.iter_messages():
+                if isinstance(ws_response.data, list):
+                    yield ws_response.data
+        finally:
+            await ws.disconnect()
+
     def _is_request_exception_related_to_time_synchronizer(self, request_exception: Exception):
         error_description = str(request_exception)
         is_time_synchronizer_related = ("-1021" in error_description
@@ -33,6 +33,10 @@ ORDER_MATCHES_URL = "/v1/order/orders/{}/matchresults"
 PLACE_ORDER_URL = "/v1/order/orders/place"
 CANCEL_ORDER_URL = "/v1/order/orders/{}/submitcancel"
 BATCH_CANCEL_URL = "/v1/order/orders/batchcancel"
+BATCH_PLACE_ORDERS_URL = "/v1/order/batch-orders"
+
+MAX_ORDERS_PER_BATCH_CREATION = 10
+MAX_ORDERS_PER_BATCH_CANCELATION = 50
 
 HTX_ACCOUNT_UPDATE_TOPIC = "accounts.update#2"
 HTX_ORDER_UPDATE_TOPIC = "orders#{}"
@@ -62,6 +66,7 @@ RATE_LIMITS = [
     RateLimit(limit_id=PLACE_ORDER_URL, limit=100, time_interval=2),
     RateLimit(limit_id=CANCEL_URL_LIMIT_ID, limit=100, time_interval=2),
     RateLimit(limit_id=BATCH_CANCEL_URL, limit=50, time_interval=2),
+    RateLimit(limit_id=BATCH_PLACE_ORDERS_URL, limit=50, time_interval=2),
 
 ]
 
@@ -1,6 +1,6 @@
 import asyncio
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, AsyncIterable, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, AsyncIterable, Dict, List, Optional, Tuple, Union
 
 from bidict import bidict
 
@@ -30,6 +30,9 @@ class HtxExchange(ExchangePyBase):
 
     web_utils = web_utils
 
+    BATCH_ORDER_CREATE_MAX_SIZE = CONSTANTS.MAX_ORDERS_PER_BATCH_CREATION
+    BATCH_ORDER_CANCEL_MAX_SIZE = CONSTANTS.MAX_ORDERS_PER_BATCH_CANCELATION
+
     def __init__(
         self,
         client_config_map: "ClientConfigAdapter",
@@ -395,20 +398,14 @@ class HtxExchange(ExchangePyBase):
         **kwargs,
     ):
         path_url = CONSTANTS.PLACE_ORDER_URL
-        side = trade_type.name.lower()
-        order_type_str = "limit" if order_type is OrderType.LIMIT else "limit-maker"
-        if not self._account_id:
-            await self._update_account_id()
-        exchange_symbol = await self.exchange_symbol_associated_to_pair(trading_pair)
-        params = {
-            "account-id": self._account_id,
-            "amount": f"{amount}",
-            "client-order-id": order_id,
-            "symbol": exchange_symbol,
-            "type": f"{side}-{order_type_str}",
-        }
-        if order_type is OrderType.LIMIT or order_type is OrderType.LIMIT_MAKER:
-            params["price"] = f"{price}"
+        params = await self._order_creation_params(
+            order_id=order_id,
+            trading_pair=trading_pair,
+            amount=amount,
+            trade_type=trade_type,
+            order_type=order_type,
+            price=price,
+        )
         creation_response = await self._api_post(path_url=path_url, params=params, data=params, is_auth_required=True)
 
         if (
@@ -433,6 +430,66 @@ class HtxExchange(ExchangePyBase):
             return True
         return False
 
+    async def _place_orders_batch(self, orders: List[InFlightOrder]) -> List[Union[Tuple[str, float], Exception]]:
+        data = [
+            await self._order_creation_params(
+                order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                amount=order.amount,
+                trade_type=order.trade_type,
+                order_type=order.order_type,
+                price=order.price,
+            )
+            for order in orders
+        ]
+        creation_response = await self._api_post(
+            path_url=CONSTANTS.BATCH_PLACE_ORDERS_URL, data=data, is_auth_required=True
+        )
+        if creation_response.get("status") != "ok":
+            raise ValueError(f"Htx rejected the batch order creation ({creation_response})")
+        results_per_order_id = {result.get("client-order-id"): result for result in creation_response["data"]}
+        results = []
+        for order in orders:
+            result = results_per_order_id.get(order.client_order_id)
+            if result is not None and result.get("order-id") is not None:
+                results.append((str(result["order-id"]), self.current_timestamp))
+            else:
+                results.append(ValueError(f"Htx rejected the order {order.client_order_id} ({result})"))
+        return results
+
+    async def _place_cancels_batch(self, orders: List[InFlightOrder]) -> List[Union[bool, Exception]]:
+        data = {"client-order-ids": [order.client_order_id for order in orders]}
+        response = await self._api_post(
+            path_url=CONSTANTS.BATCH_CANCEL_URL, data=data, is_auth_required=True
+        )
+        canceled_order_ids = set(response.get("data", {}).get("success", [])) if response.get("status") == "ok" else set()
+        return [order.client_order_id in canceled_order_ids for order in orders]
+
+    async def _order_creation_params(
+        self,
+        order_id: str,
+        trading_pair: str,
+        amount: Decimal,
+        trade_type: TradeType,
+        order_type: OrderType,
+        price: Decimal,
+    ) -> Dict[str, Any]:
+        side = trade_type.name.lower()
+        order_type_str = "limit" if order_type is OrderType.LIMIT else "limit-maker"
+        if not self._account_id:
+            await self._update_account_id()
+        exchange_symbol = await self.exchange_symbol_associated_to_pair(trading_pair)
+        params = {
+            "account-id": self._account_id,
+            "amount": f"{amount}",
+            "client-order-id": order_id,
+            "symbol": exchange_symbol,
+            "type": f"{side}-{order_type_str}",
+        }
+        if order_type is OrderType.LIMIT or order_type is OrderType.LIMIT_MAKER:
+            params["price"] = f"{price}"
+        return params
+
     def _initialize_trading_pair_symbols_from_exchange_info(self, exchange_info: Dict[str, Any]):
         mapping = bidict()
         for symbol_data in filter(is_exchange_information_valid, exchange_info.get("data", [])):
@@ -1,6 +1,6 @@
 import asyncio
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 from bidict import bidict
 
@@ -32,6 +32,9 @@ if TYPE_CHECKING:
 class KucoinExchange(ExchangePyBase):
     web_utils = web_utils
 
+    # Kucoin has a batch endpoint to create orders, but no endpoint to cancel a list of orders
+    BATCH_ORDER_CREATE_MAX_SIZE = CONSTANTS.MAX_ORDERS_PER_BATCH_REQUEST
+
     def __init__(self,
                  client_config_map: "ClientConfigAdapter",
                  kucoin_api_key: str,
@@ -93,6 +96,10 @@ class KucoinExchange(ExchangePyBase):
     def orders_path_url(self):
         return CONSTANTS.ORDERS_PATH_URL_HFT if self._domain == "hft" else CONSTANTS.ORDERS_PATH_URL
 
+    @property
+    def orders_multi_path_url(self):
+        return CONSTANTS.ORDERS_MULTI_PATH_URL_HFT if self._domain == "hft" else CONSTANTS.ORDERS_MULTI_PATH_URL
+
     @property
     def fills_path_url(self):
         return CONSTANTS.FILLS_PATH_URL_HFT if self.domain == "hft" else CONSTANTS.FILLS_PATH_URL
@@ -195,20 +202,14 @@ class KucoinExchange(ExchangePyBase):
                            order_type: OrderType,
                            price: Decimal,
                            **kwargs) -> Tuple[str, float]:
-        side = trade_type.name.lower()
-        order_type_str = "market" if order_type == OrderType.MARKET else "limit"
-        data = {
-            "size": str(amount),
-            "clientOid": order_id,
-            "side": side,
-            "symbol": await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair),
-            "type": order_type_str,
-        }
-        if order_type is OrderType.LIMIT:
-            data["price"] = str(price)
-        elif order_type is OrderType.LIMIT_MAKER:
-            data["price"] = str(price)
-            data["postOnly"] = True
+        data = await self._order_creation_data(
+            order_id=order_id,
+            trading_pair=trading_pair,
+            amount=amount,
+            trade_type=trade_type,
+            order_type=order_type,
+            price=price,
+        )
         exchange_order_id = await self._api_post(
             path_url=self.orders_path_url,
             data=data,
@@ -237,6 +238,77 @@ class KucoinExchange(ExchangePyBase):
         else:
             raise IOError(f"Error cancelling order on Kucoin: {cancel_result}")
 
+    async def _place_orders_batch(self, orders: List[InFlightOrder]) -> List[Union[Tuple[str, float], Exception]]:
+        order_list = [
+            await self._order_creation_data(
+                order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                amount=order.amount,
+                trade_type=order.trade_type,
+                order_type=order.order_type,
+                price=order.price,
+            )
+            for order in orders
+        ]
+        if self.domain == "hft":
+            data = {"orderList": order_list}
+        else:
+            # The classic endpoint receives the symbol once for all the orders
+            data = {"symbol": order_list[0]["symbol"], "orderList": order_list}
+            for order_data in order_list:
+                del order_data["symbol"]
+        creation_response = await self._api_post(
+            path_url=self.orders_multi_path_url,
+            data=data,
+            is_auth_required=True,
+            limit_id=CONSTANTS.POST_MULTI_ORDER_LIMIT_ID,
+        )
+        if creation_response.get("data") is None:
+            raise IOError(f"Error placing orders on Kucoin: {creation_response}")
+        # The HF endpoint returns the list of results, the classic endpoint returns it in an inner data field
+        response_results = creation_response["data"]
+        if isinstance(response_results, dict):
+            response_results = response_results.get("data", [])
+        if all("clientOid" in result for result in response_results):
+            results_per_order_id = {result["clientOid"]: result for result in response_results}
+            order_results = [results_per_order_id.get(order.client_order_id, {}) for order in orders]
+        else:
+            # The HF endpoint results do not always include the client order id. They follow the order of the request
+            order_results = response_results + [{}] * (len(orders) - len(response_results))
+
+        results = []
+        for order, result in zip(orders, order_results):
+            exchange_order_id = result.get("orderId") or result.get("id")
+            if exchange_order_id is not None and (result.get("success") or result.get("status") == "success"):
+                results.append((str(exchange_order_id), self.current_timestamp))
+            else:
+                results.append(IOError(f"Error placing order {order.client_order_id} on Kucoin: "
+                                       f"{result.get('failMsg', creation_response)}"))
+        return results
+
+    async def _order_creation_data(self,
+                                   order_id: str,
+                                   trading_pair: str,
+                                   amount: Decimal,
+                                   trade_type: TradeType,
+                                   order_type: OrderType,
+                                   price: Decimal) -> Dict[str, Any]:
+        side = trade_type.name.lower()
+        order_type_str = "market" if order_type == OrderType.MARKET else "limit"
+        data = {
+            "size": str(amount),
+            "clientOid": order_id,
+            "side": side,
+            "symbol": await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair),
+            "type": order_type_str,
+        }
+        if order_type is OrderType.LIMIT:
+            data["price"] = str(price)
+        elif order_type is OrderType.LIMIT_MAKER:
+            data["price"] = str(price)
+            data["postOnly"] = True
+        return data
+
     async def _user_stream_event_listener(self):
         """
         This functions runs in background continuously processing the events received from the exchange by the user
@@ -23,12 +23,18 @@ OKX_ORDER_BOOK_PATH = '/api/v5/market/books'
 
 # Auth required
 OKX_PLACE_ORDER_PATH = "/api/v5/trade/order"
+OKX_BATCH_PLACE_ORDERS_PATH = "/api/v5/trade/batch-orders"
 OKX_ORDER_DETAILS_PATH = '/api/v5/trade/order'
 OKX_ORDER_CANCEL_PATH = '/api/v5/trade/cancel-order'
 OKX_BATCH_ORDER_CANCEL_PATH = '/api/v5/trade/cancel-batch-orders'
 OKX_BALANCE_PATH = '/api/v5/account/balance'
 OKX_TRADE_FILLS_PATH = "/api/v5/trade/fills"
 
+MAX_ORDERS_PER_BATCH_REQUEST = 20
+
+# Codes of the order cancelation results considered successful: canceled, does not exist, already canceled
+CANCEL_SUCCESS_CODES = {"0", "51400", "51401"}
+
 # WS
 OKX_WS_URI_PUBLIC = "wss://ws.okx.com:8443/ws/v5/public"
 OKX_WS_URI_PRIVATE = "wss://ws.okx.com:8443/ws/v5/private"
@@ -73,6 +79,7 @@ RATE_LIMITS = [
     RateLimit(limit_id=OKX_TICKER_PATH, limit=20, time_interval=2),
     RateLimit(limit_id=OKX_ORDER_BOOK_PATH, limit=20, time_interval=2),
     RateLimit(limit_id=OKX_PLACE_ORDER_PATH, limit=60, time_interval=2),
+    RateLimit(limit_id=OKX_BATCH_PLACE_ORDERS_PATH, limit=300, time_interval=2),
     RateLimit(limit_id=OKX_ORDER_DETAILS_PATH, limit=60, time_interval=2),
     RateLimit(limit_id=OKX_ORDER_CANCEL_PATH, limit=60, time_interval=2),
     RateLimit(limit_id=OKX_BATCH_ORDER_CANCEL_PATH, limit=300, time_interval=2),
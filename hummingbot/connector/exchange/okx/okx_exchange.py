@@ -1,6 +1,6 @@
 import asyncio
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 from bidict import bidict
 
@@ -29,6 +29,9 @@ class OkxExchange(ExchangePyBase):
 
     web_utils = web_utils
 
+    BATCH_ORDER_CREATE_MAX_SIZE = CONSTANTS.MAX_ORDERS_PER_BATCH_REQUEST
+    BATCH_ORDER_CANCEL_MAX_SIZE = CONSTANTS.MAX_ORDERS_PER_BATCH_REQUEST
+
     def __init__(self,
                  client_config_map: "ClientConfigAdapter",
                  okx_api_key: str,
@@ -185,17 +188,14 @@ class OkxExchange(ExchangePyBase):
                            price: Decimal,
                            **kwargs) -> Tuple[str, float]:
 
-        data = {
-            "clOrdId": order_id,
-            "tdMode": "cash",
-            "ordType": CONSTANTS.ORDER_TYPE_MAP[order_type],
-            "side": trade_type.name.lower(),
-            "instId": await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair),
-            "sz": str(amount),
-        }
-        if order_type.is_limit_type():
-            data["px"] = str(price)
-
+        data = await self._order_creation_data(
+            order_id=order_id,
+            trading_pair=trading_pair,
+            amount=amount,
+            trade_type=trade_type,
+            order_type=order_type,
+            price=price,
+        )
         exchange_order_id = await self._api_request(
             path_url=CONSTANTS.OKX_PLACE_ORDER_PATH,
             method=RESTMethod.POST,
@@ -221,19 +221,79 @@ class OkxExchange(ExchangePyBase):
             data=params,
             is_auth_required=True,
         )
-        if cancel_result["data"][0]["sCode"] == "0":
-            final_result = True
-        elif cancel_result["data"][0]["sCode"] == "51400":
-            # Cancelation failed because the order does not exist
-            final_result = True
-        elif cancel_result["data"][0]["sCode"] == "51401":
-            # Cancelation failed because order has been cancelled
+        if cancel_result["data"][0]["sCode"] in CONSTANTS.CANCEL_SUCCESS_CODES:
             final_result = True
         else:
             raise IOError(f"Error cancelling order {order_id}: {cancel_result}")
 
         return final_result
 
+    async def _place_orders_batch(self, orders: List[InFlightOrder]) -> List[Union[Tuple[str, float], Exception]]:
+        data = [
+            await self._order_creation_data(
+                order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                amount=order.amount,
+                trade_type=order.trade_type,
+                order_type=order.order_type,
+                price=order.price,
+            )
+            for order in orders
+        ]
+        creation_response = await self._api_request(
+            path_url=CONSTANTS.OKX_BATCH_PLACE_ORDERS_PATH,
+            method=RESTMethod.POST,
+            data=data,
+            is_auth_required=True,
+            limit_id=CONSTANTS.OKX_BATCH_PLACE_ORDERS_PATH,
+        )
+        results_per_order_id = {result["clOrdId"]: result for result in creation_response.get("data", [])}
+        results = []
+        for order in orders:
+            result = results_per_order_id.get(order.client_order_id)
+            if result is not None and result["sCode"] == "0":
+                results.append((str(result["ordId"]), self.current_timestamp))
+            else:
+                error_message = result["sMsg"] if result is not None else creation_response
+                results.append(IOError(f"Error submitting order {order.client_order_id}: {error_message}"))
+        return results
+
+    async def _place_cancels_batch(self, orders: List[InFlightOrder]) -> List[Union[bool, Exception]]:
+        data = [{"clOrdId": order.client_order_id, "instId": order.trading_pair} for order in orders]
+        cancel_response = await self._api_post(
+            path_url=CONSTANTS.OKX_BATCH_ORDER_CANCEL_PATH,
+            data=data,
+            is_auth_required=True,
+        )
+        results_per_order_id = {result["clOrdId"]: result for result in cancel_response.get("data", [])}
+        results = []
+        for order in orders:
+            result = results_per_order_id.get(order.client_order_id)
+            if result is not None and result["sCode"] in CONSTANTS.CANCEL_SUCCESS_CODES:
+                results.append(True)
+            else:
+                results.append(IOError(f"Error cancelling order {order.client_order_id}: {result or cancel_response}"))
+        return results
+
+    async def _order_creation_data(self,
+                                   order_id: str,
+                                   trading_pair: str,
+                                   amount: Decimal,
+                                   trade_type: TradeType,
+                                   order_type: OrderType,
+                                   price: Decimal) -> Dict[str, Any]:
+        data = {
+            "clOrdId": order_id,
+            "tdMode": "cash",
+            "ordType": CONSTANTS.ORDER_TYPE_MAP[order_type],
+            "side": trade_type.name.lower(),
+            "instId": await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair),
+            "sz": str(amount),
+        }
+        if order_type.is_limit_type():
+            data["px"] = str(price)
+        return data
+
     async def _get_last_traded_price(self, trading_pair: str) -> float:
         params = {"instId": await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair)}
 
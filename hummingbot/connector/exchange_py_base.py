@@ -3,23 +3,28 @@ import copy
 import logging
 import math
 from abc import ABC, abstractmethod
+from collections import defaultdict
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, AsyncIterable, Callable, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, AsyncIterable, Awaitable, Callable, Dict, List, Mapping, Optional, Tuple, Union
 
 from async_timeout import timeout
+from bidict import bidict
 
 from hummingbot.connector.client_order_tracker import ClientOrderTracker
 from hummingbot.connector.constants import MINUTE, TWELVE_HOURS, s_decimal_0, s_decimal_NaN
 from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.connector.time_synchronizer import TimeSynchronizer
+from hummingbot.connector.trading_pair_metadata_cache import TradingPairMetadataCache
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
+from hummingbot.connector.warm_start_cache import WarmStartCache
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
 from hummingbot.core.api_throttler.data_types import RateLimit
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
 from hummingbot.core.data_type.limit_order import LimitOrder
+from hummingbot.core.data_type.market_data_process import MarketDataProcessOrderBookTracker
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
@@ -45,6 +50,12 @@ class ExchangePyBase(ExchangeBase, ABC):
     TRADING_RULES_INTERVAL = 30 * MINUTE
     TRADING_FEES_INTERVAL = TWELVE_HOURS
     TICK_INTERVAL_LIMIT = 60.0
+    WARM_START_CACHE_INTERVAL = MINUTE
+    # Maximum number of orders in a single batch creation/cancelation request. 0 when the exchange has no batch endpoint
+    BATCH_ORDER_CREATE_MAX_SIZE = 0
+    BATCH_ORDER_CANCEL_MAX_SIZE = 0
+    # Whether the order books can be tracked by a market data process (only the order books are shared with it)
+    MARKET_DATA_PROCESS_SUPPORTED = True
 
     def __init__(self, client_config_map: "ClientConfigAdapter"):
         super().__init__(client_config_map)
@@ -53,6 +64,7 @@ class ExchangePyBase(ExchangeBase, ABC):
         self._last_timestamp = 0
         self._trading_rules = {}
         self._trading_fees = {}
+        self._trading_pair_metadata = TradingPairMetadataCache()
 
         self._status_polling_task: Optional[asyncio.Task] = None
         self._user_stream_tracker_task: Optional[asyncio.Task] = None
@@ -60,6 +72,10 @@ class ExchangePyBase(ExchangeBase, ABC):
         self._trading_rules_polling_task: Optional[asyncio.Task] = None
         self._trading_fees_polling_task: Optional[asyncio.Task] = None
         self._lost_orders_update_task: Optional[asyncio.Task] = None
+        self._warm_start_cache_task: Optional[asyncio.Task] = None
+        self._warm_start_cache: Optional[WarmStartCache] = None
+        self._orders_queued_to_create: List[Tuple[InFlightOrder, asyncio.Future]] = []
+        self._orders_queued_to_cancel: List[Tuple[InFlightOrder, asyncio.Future]] = []
 
         self._time_synchronizer = TimeSynchronizer()
         self._throttler = AsyncThrottler(
@@ -73,10 +89,19 @@ class ExchangePyBase(ExchangeBase, ABC):
 
         # init OrderBook Data Source and Tracker
         self._orderbook_ds: OrderBookTrackerDataSource = self._create_order_book_data_source()
-        self._set_order_book_tracker(OrderBookTracker(
-            data_source=self._orderbook_ds,
-            trading_pairs=self.trading_pairs,
-            domain=self.domain))
+        self._orderbook_ds.ws_connections_count = client_config_map.order_book_ws_connections
+        if client_config_map.market_data_process_enabled and self.MARKET_DATA_PROCESS_SUPPORTED:
+            self._set_order_book_tracker(MarketDataProcessOrderBookTracker(
+                data_source=self._orderbook_ds,
+                trading_pairs=self.trading_pairs,
+                connector_name=self.name,
+                client_config_map=client_config_map.hb_config,
+                domain=self.domain))
+        else:
+            self._set_order_book_tracker(OrderBookTracker(
+                data_source=self._orderbook_ds,
+                trading_pairs=self.trading_pairs,
+                domain=self.domain))
 
         # init UserStream Data Source and Tracker
         self._user_stream_tracker = self._create_user_stream_tracker()
@@ -161,6 +186,13 @@ class ExchangePyBase(ExchangeBase, ABC):
     def trading_rules(self) -> Dict[str, TradingRule]:
         return self._trading_rules
 
+    @property
+    def trading_pair_metadata(self) -> TradingPairMetadataCache:
+        """
+        Synchronous lookups of the trading pair symbols and order quanta, refreshed with the trading rules
+        """
+        return self._trading_pair_metadata
+
     @property
     def limit_orders(self) -> List[LimitOrder]:
         return [in_flight_order.to_limit_order() for in_flight_order in self.in_flight_orders.values()]
@@ -210,6 +242,18 @@ class ExchangePyBase(ExchangeBase, ABC):
     def _is_order_not_found_during_cancelation_error(self, cancelation_exception: Exception) -> bool:
         raise NotImplementedError
 
+    async def exchange_symbol_associated_to_pair(self, trading_pair: str) -> str:
+        symbol = self._trading_pair_metadata.exchange_symbol(trading_pair)
+        if symbol is None:
+            symbol = await super().exchange_symbol_associated_to_pair(trading_pair=trading_pair)
+        return symbol
+
+    async def trading_pair_associated_to_exchange_symbol(self, symbol: str) -> str:
+        trading_pair = self._trading_pair_metadata.trading_pair(symbol)
+        if trading_pair is None:
+            trading_pair = await super().trading_pair_associated_to_exchange_symbol(symbol=symbol)
+        return trading_pair
+
     # === Price logic ===
 
     def get_order_price_quantum(self, trading_pair: str, price: Decimal) -> Decimal:
@@ -220,8 +264,7 @@ class ExchangePyBase(ExchangeBase, ABC):
         :param trading_pair: the trading pair to check for market conditions
         :param price: the starting point price
         """
-        trading_rule = self._trading_rules[trading_pair]
-        return Decimal(trading_rule.min_price_increment)
+        return self._trading_pair_metadata.quanta(self._trading_rules[trading_pair]).price_quantum
 
     def get_order_size_quantum(self, trading_pair: str, order_size: Decimal) -> Decimal:
         """
@@ -231,8 +274,7 @@ class ExchangePyBase(ExchangeBase, ABC):
         :param trading_pair: the trading pair to check for market conditions
         :param order_size: the starting point order price
         """
-        trading_rule = self._trading_rules[trading_pair]
-        return Decimal(trading_rule.min_base_amount_increment)
+        return self._trading_pair_metadata.quanta(self._trading_rules[trading_pair]).size_quantum
 
     def get_order_book(self, trading_pair: str) -> OrderBook:
         """
@@ -466,15 +508,23 @@ class ExchangePyBase(ExchangeBase, ABC):
             )
 
     async def _place_order_and_process_update(self, order: InFlightOrder, **kwargs) -> str:
-        exchange_order_id, update_timestamp = await self._place_order(
-            order_id=order.client_order_id,
-            trading_pair=order.trading_pair,
-            amount=order.amount,
-            trade_type=order.trade_type,
-            order_type=order.order_type,
-            price=order.price,
-            **kwargs,
-        )
+        # The batch requests only carry the orders, the orders with extra parameters are sent individually
+        if self.BATCH_ORDER_CREATE_MAX_SIZE > 1 and order.order_type.is_limit_type() and len(kwargs) == 0:
+            exchange_order_id, update_timestamp = await self._queue_for_batch_request(
+                queue=self._orders_queued_to_create,
+                order=order,
+                process_queue_function=self._process_queued_order_creations,
+            )
+        else:
+            exchange_order_id, update_timestamp = await self._place_order(
+                order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                amount=order.amount,
+                trade_type=order.trade_type,
+                order_type=order.order_type,
+                price=order.price,
+                **kwargs,
+            )
 
         order_update: OrderUpdate = OrderUpdate(
             client_order_id=order.client_order_id,
@@ -537,7 +587,14 @@ class ExchangePyBase(ExchangeBase, ABC):
                 self.logger().error(f"Failed to cancel order {order.client_order_id}", exc_info=True)
 
     async def _execute_order_cancel_and_process_update(self, order: InFlightOrder) -> bool:
-        cancelled = await self._place_cancel(order.client_order_id, order)
+        if self.BATCH_ORDER_CANCEL_MAX_SIZE > 1:
+            cancelled = await self._queue_for_batch_request(
+                queue=self._orders_queued_to_cancel,
+                order=order,
+                process_queue_function=self._process_queued_order_cancelations,
+            )
+        else:
+            cancelled = await self._place_cancel(order.client_order_id, order)
         if cancelled:
             update_timestamp = self.current_timestamp
             if update_timestamp is None or math.isnan(update_timestamp):
@@ -567,6 +624,106 @@ class ExchangePyBase(ExchangeBase, ABC):
 
         return result
 
+    # === Batch orders placing ===
+
+    def _queue_for_batch_request(
+        self,
+        queue: List[Tuple[InFlightOrder, asyncio.Future]],
+        order: InFlightOrder,
+        process_queue_function: Callable[[], Awaitable],
+    ) -> asyncio.Future:
+        """
+        Queues the order to be sent in a batch request, and returns a future resolved with the order result.
+
+        The queue is processed once all the tasks already scheduled in the event loop have run. This way all the orders
+        created or canceled in the same tick (e.g. a strategy refreshing all its levels) are sent together.
+        """
+        future = asyncio.get_event_loop().create_future()
+        queue.append((order, future))
+        if len(queue) == 1:
+            safe_ensure_future(process_queue_function())
+        return future
+
+    async def _process_queued_order_creations(self):
+        queued_orders = self._orders_queued_to_create
+        self._orders_queued_to_create = []
+        await self._execute_batch_requests(
+            queued_orders=queued_orders,
+            max_batch_size=self.BATCH_ORDER_CREATE_MAX_SIZE,
+            single_order_function=lambda order: self._place_order(
+                order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                amount=order.amount,
+                trade_type=order.trade_type,
+                order_type=order.order_type,
+                price=order.price,
+            ),
+            batch_function=self._place_orders_batch,
+        )
+
+    async def _process_queued_order_cancelations(self):
+        queued_orders = self._orders_queued_to_cancel
+        self._orders_queued_to_cancel = []
+        await self._execute_batch_requests(
+            queued_orders=queued_orders,
+            max_batch_size=self.BATCH_ORDER_CANCEL_MAX_SIZE,
+            single_order_function=lambda order: self._place_cancel(order.client_order_id, order),
+            batch_function=self._place_cancels_batch,
+        )
+
+    async def _execute_batch_requests(
+        self,
+        queued_orders: List[Tuple[InFlightOrder, asyncio.Future]],
+        max_batch_size: int,
+        single_order_function: Callable[[InFlightOrder], Awaitable],
+        batch_function: Callable[[List[InFlightOrder]], Awaitable[List[Any]]],
+    ):
+        """
+        Splits the queued orders in batches of orders for the same trading pair (most exchanges do not accept batches
+        with orders for different markets), and sends the batches in parallel. A batch with a single order is sent
+        with the regular single order request.
+        """
+        orders_per_trading_pair = defaultdict(list)
+        for order, future in queued_orders:
+            orders_per_trading_pair[order.trading_pair].append((order, future))
+        batches = [
+            trading_pair_orders[index:index + max_batch_size]
+            for trading_pair_orders in orders_per_trading_pair.values()
+            for index in range(0, len(trading_pair_orders), max_batch_size)
+        ]
+        await safe_gather(*[
+            self._execute_batch_request(
+                batch=batch, single_order_function=single_order_function, batch_function=batch_function)
+            for batch in batches
+        ])
+
+    async def _execute_batch_request(
+        self,
+        batch: List[Tuple[InFlightOrder, asyncio.Future]],
+        single_order_function: Callable[[InFlightOrder], Awaitable],
+        batch_function: Callable[[List[InFlightOrder]], Awaitable[List[Any]]],
+    ):
+        orders = [order for order, _ in batch]
+        try:
+            if len(orders) == 1:
+                results = [await single_order_function(orders[0])]
+            else:
+                results = await batch_function(orders)
+        except asyncio.CancelledError:
+            for _, future in batch:
+                future.cancel()
+            raise
+        except Exception as request_exception:
+            results = [request_exception] * len(orders)
+
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
     # === Order Tracking ===
 
     def restore_tracking_states(self, saved_states: Dict[str, Any]):
@@ -640,6 +797,28 @@ class ExchangePyBase(ExchangeBase, ABC):
                            ) -> Tuple[str, float]:
         raise NotImplementedError
 
+    async def _place_orders_batch(self, orders: List[InFlightOrder]) -> List[Union[Tuple[str, float], Exception]]:
+        """
+        Sends a single request to create all the orders. Only used when BATCH_ORDER_CREATE_MAX_SIZE is greater than 1.
+
+        :param orders: the limit orders to create, all for the same trading pair
+
+        :return: for each order (in the same order), a tuple with the exchange order id and the update timestamp if the
+        order was created, or the exception describing why the order was rejected
+        """
+        raise NotImplementedError
+
+    async def _place_cancels_batch(self, orders: List[InFlightOrder]) -> List[Union[bool, Exception]]:
+        """
+        Sends a single request to cancel all the orders. Only used when BATCH_ORDER_CANCEL_MAX_SIZE is greater than 1.
+
+        :param orders: the orders to cancel, all for the same trading pair
+
+        :return: for each order (in the same order), the result `_place_cancel` would have returned for the order or
+        the exception it would have raised
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def _get_fee(self,
                  base_currency: str,
@@ -664,8 +843,13 @@ class ExchangePyBase(ExchangeBase, ABC):
         - The polling loops to update the trading rules and trading fees
         - The polling loop to update order status and balance status using REST API (backup for main update process)
         - The background task to process the events received through the user stream tracker (websocket connection)
+        - The loop saving the warm start cache, if enabled. The cached state is restored before starting the tasks
         """
         self._stop_network()
+        if self._client_config.warm_start_cache_enabled:
+            self._warm_start_cache = WarmStartCache(connector_name=self.name)
+            self._restore_warm_start_state()
+            self._warm_start_cache_task = safe_ensure_future(self._warm_start_cache_loop())
         self.order_book_tracker.start()
         if self.is_trading_required:
             self._trading_rules_polling_task = safe_ensure_future(self._trading_rules_polling_loop())
@@ -680,6 +864,7 @@ class ExchangePyBase(ExchangeBase, ABC):
         This function is executed when the connector is stopped. It perform a general cleanup and stops all background
         tasks that require the connection with the exchange to work.
         """
+        await self._save_warm_start_state()
         self._stop_network()
 
     async def check_network(self) -> NetworkStatus:
@@ -719,6 +904,9 @@ class ExchangePyBase(ExchangeBase, ABC):
         if self._lost_orders_update_task is not None:
             self._lost_orders_update_task.cancel()
             self._lost_orders_update_task = None
+        if self._warm_start_cache_task is not None:
+            self._warm_start_cache_task.cancel()
+            self._warm_start_cache_task = None
 
     # === loops and sync related methods ===
     #
@@ -762,6 +950,50 @@ class ExchangePyBase(ExchangeBase, ABC):
                                     " Check network connection.")
                 await self._sleep(0.5)
 
+    async def _warm_start_cache_loop(self):
+        """
+        Saves the warm start cache regularly, so that a bot that was not stopped cleanly can also restart from it.
+        """
+        while True:
+            await self._sleep(self.WARM_START_CACHE_INTERVAL)
+            await self._save_warm_start_state()
+
+    async def _save_warm_start_state(self):
+        if self._warm_start_cache is None or not self.trading_pair_symbol_map_ready():
+            return
+        self._warm_start_cache.save(
+            trading_pair_symbol_map=await self.trading_pair_symbol_map(),
+            trading_rules=self._trading_rules,
+            trading_fees=self._trading_fees,
+            order_books=self.order_books if self.order_book_tracker.ready else {},
+        )
+
+    def _restore_warm_start_state(self):
+        """
+        Restores the exchange metadata and the order books saved in the warm start cache. They are replaced by fresh
+        data as soon as it is received by the polling loops and the order book tracker.
+        """
+        state = self._warm_start_cache.load()
+        if state is None:
+            return
+        if not self.trading_pair_symbol_map_ready() and len(state.trading_pair_symbol_map) > 0:
+            self._set_trading_pair_symbol_map(bidict(state.trading_pair_symbol_map))
+        if len(self._trading_rules) == 0:
+            self._trading_rules.update(state.trading_rules)
+            self._trading_pair_metadata.update_trading_rules(self._trading_rules)
+        if len(self._trading_fees) == 0:
+            self._trading_fees.update(state.trading_fees)
+        order_books = {}
+        for trading_pair in self.trading_pairs:
+            snapshot_data = state.order_book_snapshots.get(trading_pair)
+            if snapshot_data is not None:
+                order_book = self._orderbook_ds.order_book_create_function()
+                WarmStartCache.restore_order_book(order_book, snapshot_data)
+                order_books[trading_pair] = order_book
+        self.order_book_tracker.restore_order_books(order_books)
+        self.logger().info(f"Restored {len(state.trading_rules)} trading rules and {len(order_books)} order books "
+                           f"from the warm start cache.")
+
     async def _status_polling_loop(self):
         """
         Performs all required operation to keep the connector updated and synchronized with the exchange.
@@ -856,6 +1088,7 @@ class ExchangePyBase(ExchangeBase, ABC):
         self._trading_rules.clear()
         for trading_rule in trading_rules_list:
             self._trading_rules[trading_rule.trading_pair] = trading_rule
+        self._trading_pair_metadata.update_trading_rules(self._trading_rules)
         self._initialize_trading_pair_symbols_from_exchange_info(exchange_info=exchange_info)
 
     async def _api_get(self, *args, **kwargs):
@@ -1076,6 +1309,10 @@ class ExchangePyBase(ExchangeBase, ABC):
         except Exception:
             self.logger().exception("There was an error requesting exchange info.")
 
+    def _set_trading_pair_symbol_map(self, trading_pair_and_symbol_map: Optional[Mapping[str, str]]):
+        super()._set_trading_pair_symbol_map(trading_pair_and_symbol_map)
+        self._trading_pair_metadata.update_symbol_map(trading_pair_and_symbol_map)
+
     async def _make_network_check_request(self):
         await self._api_get(path_url=self.check_network_request_path)
 
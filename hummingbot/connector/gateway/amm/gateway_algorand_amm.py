@@ -2,7 +2,7 @@ import asyncio
 import itertools as it
 import logging
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Union, cast
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple, Union, cast
 
 from hummingbot.connector.gateway.amm.gateway_evm_amm import GatewayEVMAMM
 from hummingbot.connector.gateway.gateway_in_flight_order import GatewayInFlightOrder
@@ -11,7 +11,6 @@ from hummingbot.core.data_type.in_flight_order import OrderState, OrderUpdate
 from hummingbot.core.data_type.trade_fee import TokenAmount
 from hummingbot.core.event.events import TradeType
 from hummingbot.core.gateway.gateway_http_client import GatewayHttpClient
-from hummingbot.core.utils import async_ttl_cache
 from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.core.utils.tracking_nonce import NonceCreator
 from hummingbot.logger import HummingbotLogger
@@ -142,7 +141,8 @@ class GatewayAlgorandAMM(GatewayEVMAMM):
                 await self._poll_notifier.wait()
                 await safe_gather(
                     self.update_balances(on_interval=True),
-                    self.update_order_status(self.amm_orders)
+                    self.update_order_status(self.amm_orders),
+                    self._update_block_number(),
                 )
                 self._last_poll_timestamp = self.current_timestamp
             except asyncio.CancelledError:
@@ -205,8 +205,7 @@ class GatewayAlgorandAMM(GatewayEVMAMM):
                 )
                 await self._order_tracker.process_order_not_found(tracked_order.client_order_id)
 
-    @async_ttl_cache(ttl=5, maxsize=10)
-    async def get_quote_price(
+    async def _fetch_quote_price(
             self,
             trading_pair: str,
             is_buy: bool,
@@ -214,7 +213,7 @@ class GatewayAlgorandAMM(GatewayEVMAMM):
             ignore_shim: bool = False
     ) -> Optional[Decimal]:
         """
-        Retrieves a quote price.
+        Requests a quote price from Gateway, bypassing the quote cache.
 
         :param trading_pair: The market trading pair
         :param is_buy: True for an intention to buy, False for an intention to sell
@@ -241,6 +240,19 @@ class GatewayAlgorandAMM(GatewayEVMAMM):
                 app_warning_msg=str(e)
             )
 
+    async def _fetch_quote_prices(
+            self,
+            quote_requests: List[Tuple[str, bool, Decimal]],
+            ignore_shim: bool = False
+    ) -> List[Optional[Decimal]]:
+        """
+        Quote responses are parsed without the allowance checks here, so quotes are requested one by one.
+        """
+        return await safe_gather(*[
+            self._fetch_quote_price(trading_pair, is_buy, amount, ignore_shim=ignore_shim)
+            for trading_pair, is_buy, amount in quote_requests
+        ])
+
     async def cancel_all(self, timeout_seconds: float) -> List[CancellationResult]:
         """
         This is intentionally left blank, because cancellation is not supported for algorand blockchains.
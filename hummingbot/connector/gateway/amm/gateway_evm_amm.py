@@ -5,7 +5,7 @@ import logging
 import re
 import time
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Union, cast
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple, Union, cast
 
 from async_timeout import timeout
 
@@ -14,6 +14,7 @@ from hummingbot.connector.client_order_tracker import ClientOrderTracker
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.connector.gateway.gateway_in_flight_order import GatewayInFlightOrder
 from hummingbot.connector.gateway.gateway_price_shim import GatewayPriceShim
+from hummingbot.connector.gateway.gateway_quote_cache import GatewayQuoteCache
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.in_flight_order import OrderState, OrderUpdate, TradeUpdate
 from hummingbot.core.data_type.limit_order import LimitOrder
@@ -27,9 +28,8 @@ from hummingbot.core.event.events import (
     TradeType,
 )
 from hummingbot.core.gateway import check_transaction_exceptions
-from hummingbot.core.gateway.gateway_http_client import GatewayHttpClient
+from hummingbot.core.gateway.gateway_http_client import GatewayHttpClient, GatewayPriceRequest
 from hummingbot.core.network_iterator import NetworkStatus
-from hummingbot.core.utils import async_ttl_cache
 from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
 from hummingbot.logger import HummingbotLogger
@@ -50,6 +50,7 @@ class GatewayEVMAMM(ConnectorBase):
     API_CALL_TIMEOUT = 10.0
     POLL_INTERVAL = 1.0
     UPDATE_BALANCE_INTERVAL = 30.0
+    QUOTE_CACHE_TTL = 5.0
     APPROVAL_ORDER_ID_PATTERN = re.compile(r"approve-(\w+)-(\w+)")
 
     _connector_name: str
@@ -72,6 +73,7 @@ class GatewayEVMAMM(ConnectorBase):
     _poll_notifier: Optional[asyncio.Event]
     _native_currency: str
     _amount_quantum_dict: Dict[str, Decimal]
+    _quote_cache: GatewayQuoteCache
 
     def __init__(self,
                  client_config_map: "ClientConfigAdapter",
@@ -115,6 +117,7 @@ class GatewayEVMAMM(ConnectorBase):
         self._network_transaction_fee: Optional[TokenAmount] = None
         self._order_tracker: ClientOrderTracker = ClientOrderTracker(connector=self, lost_order_count_limit=10)
         self._amount_quantum_dict = {}
+        self._quote_cache = GatewayQuoteCache(ttl=self.QUOTE_CACHE_TTL)
         safe_ensure_future(self.load_token_data())
 
     @classmethod
@@ -408,7 +411,6 @@ class GatewayEVMAMM(ConnectorBase):
             return Decimal(str(price))
         return None
 
-    @async_ttl_cache(ttl=5, maxsize=10)
     async def get_quote_price(
             self,
             trading_pair: str,
@@ -417,7 +419,8 @@ class GatewayEVMAMM(ConnectorBase):
             ignore_shim: bool = False
     ) -> Optional[Decimal]:
         """
-        Retrieves a quote price.
+        Retrieves a quote price. Quotes are served from the quote cache while fresh, and concurrent requests for the
+        same quote share a single request to Gateway.
 
         :param trading_pair: The market trading pair
         :param is_buy: True for an intention to buy, False for an intention to sell
@@ -425,6 +428,21 @@ class GatewayEVMAMM(ConnectorBase):
         :param ignore_shim: Ignore the price shim, and return the real price on the network
         :return: The quote price.
         """
+        return await self._quote_cache.get_or_fetch(
+            key=self._quote_cache.key(self.connector_name, trading_pair, is_buy, amount, ignore_shim),
+            fetch=lambda: self._fetch_quote_price(trading_pair, is_buy, amount, ignore_shim=ignore_shim),
+        )
+
+    async def _fetch_quote_price(
+            self,
+            trading_pair: str,
+            is_buy: bool,
+            amount: Decimal,
+            ignore_shim: bool = False
+    ) -> Optional[Decimal]:
+        """
+        Requests a quote price from Gateway, bypassing the quote cache.
+        """
         pool_id = None
 
         try:
@@ -474,6 +492,73 @@ class GatewayEVMAMM(ConnectorBase):
                 app_warning_msg=str(e)
             )
 
+    async def get_quote_prices(
+            self,
+            quote_requests: List[Tuple[str, bool, Decimal]],
+            ignore_shim: bool = False
+    ) -> List[Optional[Decimal]]:
+        """
+        Retrieves many quote prices with a single batched request to Gateway. Quotes still fresh in the quote cache
+        are not requested again.
+
+        :param quote_requests: (trading pair, is buy, amount) tuples
+        :param ignore_shim: Ignore the price shim, and return the real prices on the network
+        :return: The quote prices, in the order of the requests.
+        """
+        keys = [
+            self._quote_cache.key(self.connector_name, trading_pair, is_buy, amount, ignore_shim)
+            for trading_pair, is_buy, amount in quote_requests
+        ]
+        requests_by_key = dict(zip(keys, quote_requests))
+        return await self._quote_cache.get_or_fetch_many(
+            keys=keys,
+            fetch_many=lambda missing_keys: self._fetch_quote_prices(
+                [requests_by_key[key] for key in missing_keys], ignore_shim=ignore_shim
+            ),
+        )
+
+    async def _fetch_quote_prices(
+            self,
+            quote_requests: List[Tuple[str, bool, Decimal]],
+            ignore_shim: bool = False
+    ) -> List[Optional[Decimal]]:
+        """
+        Requests many quote prices from Gateway in one batch, bypassing the quote cache.
+        """
+        results: List[Optional[Decimal]] = [None] * len(quote_requests)
+        if not ignore_shim:
+            results = await safe_gather(*[
+                GatewayPriceShim.get_instance().get_connector_price(
+                    self.connector_name, self.chain, self.network, trading_pair.split("_")[0], is_buy, amount
+                )
+                for trading_pair, is_buy, amount in quote_requests
+            ])
+
+        pending: List[Tuple[int, str, str, Decimal, TradeType]] = []
+        price_requests: List[GatewayPriceRequest] = []
+        for index, (trading_pair, is_buy, amount) in enumerate(quote_requests):
+            if results[index] is not None:
+                continue
+            trading_pair, _, pool_id = trading_pair.partition("_")
+            base, quote = trading_pair.split("-")
+            side: TradeType = TradeType.BUY if is_buy else TradeType.SELL
+            pending.append((index, base, quote, amount, side))
+            price_requests.append(GatewayPriceRequest(base, quote, amount, side, pool_id=pool_id or None))
+
+        responses: List[Union[Dict[str, Any], Exception]] = await self._get_gateway_instance().get_prices(
+            self.chain, self.network, self.connector_name, price_requests
+        )
+        for (index, base, quote, amount, side), resp in zip(pending, responses):
+            if isinstance(resp, Exception):
+                self.logger().network(
+                    f"Error getting quote price for {base}-{quote} {side} order for {amount} amount.",
+                    exc_info=resp,
+                    app_warning_msg=str(resp)
+                )
+                continue
+            results[index] = self.parse_price_response(base, quote, amount, side, price_response=resp)
+        return results
+
     async def get_order_price(
             self,
             trading_pair: str,
@@ -777,6 +862,8 @@ class GatewayEVMAMM(ConnectorBase):
         )
 
         self._order_tracker.process_trade_update(trade_update)
+        # Our own swap moved the pool price
+        self._quote_cache.invalidate(tracked_order.trading_pair)
 
     async def update_order_status(self, tracked_orders: List[GatewayInFlightOrder]):
         """
@@ -919,6 +1006,19 @@ class GatewayEVMAMM(ConnectorBase):
 
         self._nonce = new_nonce
 
+    async def _update_block_number(self):
+        """
+        Checks the latest block on the chain, so that cached quotes are dropped once a new block is mined. This is
+        skipped while there are no cached quotes.
+        """
+        if len(self._quote_cache) == 0:
+            return
+        resp_json: Dict[str, Any] = await self._get_gateway_instance().get_network_status(
+            chain=self.chain, network=self.network, fail_silently=True
+        )
+        if type(resp_json) is dict:
+            self._quote_cache.process_block_number(resp_json.get("currentBlockNumber"))
+
     async def _status_polling_loop(self):
         await self.update_balances(on_interval=False)
         while True:
@@ -929,7 +1029,8 @@ class GatewayEVMAMM(ConnectorBase):
                     self.update_balances(on_interval=True),
                     self.update_canceling_transactions(self.canceling_orders),
                     self.update_token_approval_status(self.approval_orders),
-                    self.update_order_status(self.amm_orders)
+                    self.update_order_status(self.amm_orders),
+                    self._update_block_number(),
                 )
                 self._last_poll_timestamp = self.current_timestamp
             except asyncio.CancelledError:
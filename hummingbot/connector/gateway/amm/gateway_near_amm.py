@@ -1,7 +1,7 @@
 import asyncio
 import logging
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union, cast
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union, cast
 
 from hummingbot.connector.gateway.amm.gateway_evm_amm import GatewayEVMAMM
 from hummingbot.connector.gateway.gateway_in_flight_order import GatewayInFlightOrder
@@ -10,7 +10,6 @@ from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.in_flight_order import OrderState, OrderUpdate
 from hummingbot.core.data_type.trade_fee import TokenAmount
-from hummingbot.core.utils import async_ttl_cache
 from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.logger import HummingbotLogger
 
@@ -163,8 +162,7 @@ class GatewayNearAMM(GatewayEVMAMM):
         """
         pass
 
-    @async_ttl_cache(ttl=5, maxsize=10)
-    async def get_quote_price(
+    async def _fetch_quote_price(
             self,
             trading_pair: str,
             is_buy: bool,
@@ -172,7 +170,7 @@ class GatewayNearAMM(GatewayEVMAMM):
             ignore_shim: bool = False
     ) -> Optional[Decimal]:
         """
-        Retrieves a quote price.
+        Requests a quote price from Gateway, bypassing the quote cache.
 
         :param trading_pair: The market trading pair
         :param is_buy: True for an intention to buy, False for an intention to sell
@@ -223,3 +221,16 @@ class GatewayNearAMM(GatewayEVMAMM):
                 exc_info=True,
                 app_warning_msg=str(e)
             )
+
+    async def _fetch_quote_prices(
+            self,
+            quote_requests: List[Tuple[str, bool, Decimal]],
+            ignore_shim: bool = False
+    ) -> List[Optional[Decimal]]:
+        """
+        Quote responses are parsed without the allowance checks here, so quotes are requested one by one.
+        """
+        return await safe_gather(*[
+            self._fetch_quote_price(trading_pair, is_buy, amount, ignore_shim=ignore_shim)
+            for trading_pair, is_buy, amount in quote_requests
+        ])
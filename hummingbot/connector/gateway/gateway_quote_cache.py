@@ -0,0 +1,195 @@
+import asyncio
+import time
+from decimal import Decimal
+from typing import Awaitable, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+
+class GatewayQuoteCacheKey(NamedTuple):
+    connector_name: str
+    trading_pair: str
+    is_buy: bool
+    amount_bucket: Decimal
+    ignore_shim: bool
+
+
+class GatewayQuoteCache:
+    """
+    Short lived cache for AMM quote prices fetched through Gateway.
+
+    Quotes are keyed by connector, trading pair, side and an amount bucket (the amount rounded to a fixed number of
+    significant digits), and expire after `ttl` seconds. Concurrent requests for the same key are coalesced, so only
+    one HTTP request to Gateway is in flight per key at any time.
+
+    The cache is invalidated entirely when a new block is observed, and per trading pair when one of our swaps is
+    filled, because both change the pool reserves the quotes were computed from. Requests that were in flight when
+    the cache got invalidated still resolve for their callers, but their results are not stored.
+    """
+
+    def __init__(self, ttl: float = 5.0, amount_significant_digits: int = 6, time_func: Callable[[], float] = time.time):
+        self._ttl = ttl
+        self._amount_significant_digits = amount_significant_digits
+        self._time_func = time_func
+        self._entries: Dict[GatewayQuoteCacheKey, Tuple[float, Optional[Decimal]]] = {}
+        self._in_flight: Dict[GatewayQuoteCacheKey, asyncio.Future] = {}
+        self._last_block_number: Optional[int] = None
+
+    @property
+    def ttl(self) -> float:
+        return self._ttl
+
+    @property
+    def last_block_number(self) -> Optional[int]:
+        return self._last_block_number
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def amount_bucket(self, amount: Decimal) -> Decimal:
+        amount = Decimal(str(amount))
+        if not amount.is_finite() or amount.is_zero():
+            return amount
+        exponent = amount.adjusted() - self._amount_significant_digits + 1
+        return amount.quantize(Decimal(1).scaleb(exponent)).normalize()
+
+    def key(
+            self,
+            connector_name: str,
+            trading_pair: str,
+            is_buy: bool,
+            amount: Decimal,
+            ignore_shim: bool = False
+    ) -> GatewayQuoteCacheKey:
+        return GatewayQuoteCacheKey(
+            connector_name=connector_name,
+            trading_pair=trading_pair,
+            is_buy=is_buy,
+            amount_bucket=self.amount_bucket(amount),
+            ignore_shim=ignore_shim,
+        )
+
+    def get(self, key: GatewayQuoteCacheKey) -> Optional[Decimal]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        timestamp, price = entry
+        if self._time_func() - timestamp > self._ttl:
+            del self._entries[key]
+            return None
+        return price
+
+    async def get_or_fetch(
+            self,
+            key: GatewayQuoteCacheKey,
+            fetch: Callable[[], Awaitable[Optional[Decimal]]]
+    ) -> Optional[Decimal]:
+        """
+        Returns the cached quote for the key if it is still fresh. Otherwise joins the in-flight request for the same
+        key, or starts a new one using `fetch`. Failed requests (None results or exceptions) are not cached.
+        """
+        price = self.get(key)
+        if price is not None:
+            return price
+
+        future = self._in_flight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._fetch_and_store(key, fetch))
+            self._in_flight[key] = future
+        # Shielded, so that a cancelled caller doesn't cancel the request the other callers are waiting on.
+        return await asyncio.shield(future)
+
+    async def _fetch_and_store(
+            self,
+            key: GatewayQuoteCacheKey,
+            fetch: Callable[[], Awaitable[Optional[Decimal]]]
+    ) -> Optional[Decimal]:
+        try:
+            price = await fetch()
+            # The in-flight entry is dropped on invalidation, in which case the result is already stale.
+            if price is not None and self._in_flight.get(key) is asyncio.current_task():
+                self._entries[key] = (self._time_func(), price)
+            return price
+        finally:
+            if self._in_flight.get(key) is asyncio.current_task():
+                del self._in_flight[key]
+
+    async def get_or_fetch_many(
+            self,
+            keys: List[GatewayQuoteCacheKey],
+            fetch_many: Callable[[List[GatewayQuoteCacheKey]], Awaitable[List[Optional[Decimal]]]]
+    ) -> List[Optional[Decimal]]:
+        """
+        Batch version of `get_or_fetch`. Fresh quotes are served from the cache and in-flight requests are joined,
+        the remaining keys are fetched with a single call to `fetch_many`, which must return the quotes in the order
+        of the keys it was given. The results are returned in the order of `keys`.
+        """
+        loop = asyncio.get_event_loop()
+        futures: List[asyncio.Future] = []
+        missing_keys: List[GatewayQuoteCacheKey] = []
+        missing_futures: List[asyncio.Future] = []
+        for key in keys:
+            future = self._in_flight.get(key)
+            if future is None:
+                future = loop.create_future()
+                price = self.get(key)
+                if price is not None:
+                    future.set_result(price)
+                else:
+                    self._in_flight[key] = future
+                    missing_keys.append(key)
+                    missing_futures.append(future)
+            futures.append(future)
+
+        if len(missing_keys) > 0:
+            asyncio.ensure_future(self._fetch_many_and_store(missing_keys, missing_futures, fetch_many))
+        return list(await asyncio.gather(*[asyncio.shield(future) for future in futures]))
+
+    async def _fetch_many_and_store(
+            self,
+            keys: List[GatewayQuoteCacheKey],
+            futures: List[asyncio.Future],
+            fetch_many: Callable[[List[GatewayQuoteCacheKey]], Awaitable[List[Optional[Decimal]]]]
+    ):
+        try:
+            prices = await fetch_many(keys)
+            for key, future, price in zip(keys, futures, prices):
+                if price is not None and self._in_flight.get(key) is future:
+                    self._entries[key] = (self._time_func(), price)
+                future.set_result(price)
+        except Exception as e:
+            for future in futures:
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            for key, future in zip(keys, futures):
+                if self._in_flight.get(key) is future:
+                    del self._in_flight[key]
+                if not future.done():
+                    future.set_result(None)
+
+    def invalidate(self, trading_pair: Optional[str] = None):
+        """
+        Drops the cached quotes, either all of them or only those of the given trading pair.
+        """
+        if trading_pair is None:
+            self._entries.clear()
+            self._in_flight.clear()
+        else:
+            for key in [k for k in self._entries if self._matches_trading_pair(k, trading_pair)]:
+                del self._entries[key]
+            for key in [k for k in self._in_flight if self._matches_trading_pair(k, trading_pair)]:
+                del self._in_flight[key]
+
+    @staticmethod
+    def _matches_trading_pair(key: GatewayQuoteCacheKey, trading_pair: str) -> bool:
+        # Quotes can be requested for a specific pool, e.g. "WETH-DAI_<pool id>"
+        return key.trading_pair.split("_")[0] == trading_pair.split("_")[0]
+
+    def process_block_number(self, block_number: Optional[int]):
+        """
+        Invalidates the whole cache when the chain advanced to a block newer than the last one seen.
+        """
+        if block_number is None:
+            return
+        if self._last_block_number is not None and block_number > self._last_block_number:
+            self.invalidate()
+        self._last_block_number = max(block_number, self._last_block_number or block_number)
@@ -4,11 +4,12 @@ import logging
 import os.path
 import threading
 import time
-from decimal import Decimal
+from decimal import ROUND_DOWN, Decimal
 from shutil import move
 from typing import Dict, List, Optional, Tuple, Union
 
 import pandas as pd
+from sqlalchemy import or_
 from sqlalchemy.orm import Query, Session
 
 from hummingbot import data_path
@@ -35,6 +36,7 @@ from hummingbot.core.event.events import (
     SellOrderCreatedEvent,
 )
 from hummingbot.logger import HummingbotLogger
+from hummingbot.model.controller_performance import ControllerPerformance
 from hummingbot.model.controllers import Controllers
 from hummingbot.model.executors import Executors
 from hummingbot.model.funding_payment import FundingPayment
@@ -47,6 +49,7 @@ from hummingbot.model.range_position_update import RangePositionUpdate
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
 from hummingbot.model.trade_fill import TradeFill
 from hummingbot.strategy_v2.controllers.controller_base import ControllerConfigBase
+from hummingbot.strategy_v2.models.executors import CloseType
 from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
 
 
@@ -197,14 +200,22 @@ class MarketsRecorder:
             existing_executor = session.query(Executors).filter(Executors.id == executor.config.id).one_or_none()
 
             if existing_executor:
+                previous_contribution = self._performance_contribution(existing_executor)
                 # Update existing executor
                 for attr, value in vars(executor).items():
                     setattr(existing_executor, attr, value)
+                stored_executor = existing_executor
             else:
+                previous_contribution = None
                 # Insert new executor
                 serialized_config = executor.executor_info.json()
-                new_executor = Executors(**json.loads(serialized_config))
-                session.add(new_executor)
+                stored_executor = Executors(**json.loads(serialized_config))
+                session.add(stored_executor)
+            session.flush()
+            self._update_controller_performance(session=session,
+                                                controller_id=stored_executor.controller_id,
+                                                previous_contribution=previous_contribution,
+                                                contribution=self._performance_contribution(stored_executor))
             session.commit()
 
     def store_controller_config(self, controller_config: ControllerConfigBase):
@@ -228,6 +239,124 @@ class MarketsRecorder:
             executors = session.query(Executors).filter(Executors.controller_id == controller_id).all()
             return [executor.to_executor_info() for executor in executors]
 
+    def get_active_executors_by_controller(self, controller_id: str) -> List[ExecutorInfo]:
+        """
+        Returns the stored executors of the controller that are still active, the others being summarized in the
+        controller performance.
+        """
+        with self._sql_manager.get_new_session() as session:
+            executors = (session.query(Executors)
+                         .filter(Executors.controller_id == controller_id, Executors.is_active.is_(True))
+                         .order_by(Executors.timestamp)
+                         .all())
+            return [executor.to_executor_info() for executor in executors]
+
+    def get_controller_performance(self, controller_id: str) -> ControllerPerformance:
+        """
+        Returns the aggregates of the stored executors of the controller that are not active anymore. They are
+        computed from the stored executors the first time, and then updated as the executors are stored.
+        """
+        with self._sql_manager.get_new_session() as session:
+            performance = session.query(ControllerPerformance).filter(
+                ControllerPerformance.controller_id == controller_id).one_or_none()
+            if performance is None:
+                performance = self._aggregate_controller_performance(session, controller_id)
+                session.add(performance)
+                session.commit()
+                session.refresh(performance)
+            session.expunge(performance)
+            return performance
+
+    def get_performance_contributions(self,
+                                      executor_ids: List[str]) -> Dict[str, Tuple[Optional[int], Decimal, Decimal]]:
+        """
+        Returns the (close type, realized PnL, volume) counted in the controller performance for the stored
+        executors with the ids, the executors not counted being left out.
+        """
+        if len(executor_ids) == 0:
+            return {}
+        with self._sql_manager.get_new_session() as session:
+            executors = session.query(Executors).filter(Executors.id.in_(executor_ids)).all()
+            contributions = {executor.id: self._performance_contribution(executor) for executor in executors}
+            return {executor_id: contribution
+                    for executor_id, contribution in contributions.items()
+                    if contribution is not None}
+
+    @classmethod
+    def _performance_contribution(cls, executor: Executors) -> Optional[Tuple[Optional[int], Decimal, Decimal]]:
+        """
+        :return: the (close type, realized PnL, volume) the stored executor adds to the performance of its
+        controller, None if it is not counted
+        """
+        if executor.is_active or executor.close_type == CloseType.FAILED.value:
+            return None
+        return (executor.close_type or None,
+                cls._performance_value(executor.net_pnl_quote),
+                cls._performance_value(executor.filled_amount_quote))
+
+    @staticmethod
+    def _performance_value(value: Union[float, Decimal]) -> Decimal:
+        """
+        Converts an executor value to the stored precision of the controller performance. The value is taken as it is
+        stored in the float column, so an executor contributes the same amount when it is added and when it is
+        removed, and the sums are exact.
+        """
+        quantum = Decimal(1).scaleb(-ControllerPerformance.DECIMAL_SCALE)
+        return Decimal(str(float(value))).quantize(quantum, rounding=ROUND_DOWN)
+
+    def _update_controller_performance(self,
+                                       session: Session,
+                                       controller_id: Optional[str],
+                                       previous_contribution: Optional[Tuple[Optional[int], Decimal, Decimal]],
+                                       contribution: Optional[Tuple[Optional[int], Decimal, Decimal]]):
+        if controller_id is None or previous_contribution == contribution:
+            return
+        performance = session.query(ControllerPerformance).filter(
+            ControllerPerformance.controller_id == controller_id).one_or_none()
+        if performance is None:
+            # The aggregates are computed from the stored executors, this one included
+            session.add(self._aggregate_controller_performance(session, controller_id))
+            return
+        close_type_counts = dict(performance.close_type_counts)
+        for stored_contribution, sign in ((previous_contribution, -1), (contribution, 1)):
+            if stored_contribution is None:
+                continue
+            close_type, realized_pnl_quote, volume_traded = stored_contribution
+            performance.executors_count += sign
+            performance.realized_pnl_quote += sign * realized_pnl_quote
+            performance.volume_traded += sign * volume_traded
+            if close_type is not None:
+                key = str(close_type)
+                close_type_counts[key] = close_type_counts.get(key, 0) + sign
+                if close_type_counts[key] == 0:
+                    del close_type_counts[key]
+        # The JSON column is only saved when the attribute is assigned
+        performance.close_type_counts = close_type_counts
+        performance.timestamp = time.time()
+
+    @classmethod
+    def _aggregate_controller_performance(cls, session: Session, controller_id: str) -> ControllerPerformance:
+        rows = (session.query(Executors.close_type, Executors.net_pnl_quote, Executors.filled_amount_quote)
+                .filter(Executors.controller_id == controller_id,
+                        Executors.is_active.is_(False),
+                        or_(Executors.close_type.is_(None), Executors.close_type != CloseType.FAILED.value))
+                .all())
+        # Summed in Python with the same conversion as the incremental updates
+        close_type_counts = {}
+        for close_type, _, _ in rows:
+            if close_type:
+                close_type_counts[str(close_type)] = close_type_counts.get(str(close_type), 0) + 1
+        return ControllerPerformance(
+            controller_id=controller_id,
+            timestamp=time.time(),
+            executors_count=len(rows),
+            realized_pnl_quote=sum((cls._performance_value(net_pnl_quote) for _, net_pnl_quote, _ in rows),
+                                   Decimal(0)),
+            volume_traded=sum((cls._performance_value(filled_amount_quote) for _, _, filled_amount_quote in rows),
+                              Decimal(0)),
+            close_type_counts=close_type_counts,
+        )
+
     def get_orders_for_config_and_market(self, config_file_path: str, market: ConnectorBase,
                                          with_exchange_order_id_present: Optional[bool] = False,
                                          number_of_rows: Optional[int] = None) -> List[Order]:
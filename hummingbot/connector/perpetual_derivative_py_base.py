@@ -27,6 +27,8 @@ if TYPE_CHECKING:
 
 class PerpetualDerivativePyBase(ExchangePyBase, ABC):
     VALID_POSITION_ACTIONS = [PositionAction.OPEN, PositionAction.CLOSE]
+    # The funding info is received by the order book data source, so it has to run in the main process
+    MARKET_DATA_PROCESS_SUPPORTED = False
 
     def __init__(self, client_config_map: "ClientConfigAdapter"):
         super().__init__(client_config_map)
@@ -0,0 +1,82 @@
+import sys
+from decimal import Decimal
+from typing import Dict, Mapping, NamedTuple, Optional
+
+from hummingbot.connector.trading_rule import TradingRule
+
+
+class TradingPairQuanta(NamedTuple):
+    """
+    The order price and amount increments of a trading pair, as Decimal for the quantization of the orders and as
+    float for the vectorized computations.
+    """
+    trading_rule: TradingRule
+    price_quantum: Decimal
+    size_quantum: Decimal
+    price_quantum_float: float
+    size_quantum_float: float
+
+    @classmethod
+    def from_trading_rule(cls, trading_rule: TradingRule) -> "TradingPairQuanta":
+        price_quantum = Decimal(trading_rule.min_price_increment)
+        size_quantum = Decimal(trading_rule.min_base_amount_increment)
+        return cls(trading_rule=trading_rule,
+                   price_quantum=price_quantum,
+                   size_quantum=size_quantum,
+                   price_quantum_float=float(price_quantum),
+                   size_quantum_float=float(size_quantum))
+
+
+class TradingPairMetadataCache:
+    """
+    Synchronous lookups of the trading pair symbols and of the order quanta of a connector, for the code parsing every
+    exchange message and quantizing every order.
+
+    The symbol maps are plain dicts in both directions with interned strings, and the quanta are computed once per
+    trading rule. Each refresh builds new dicts and replaces the previous ones in a single assignment, so the lookups
+    never see a partially updated cache.
+    """
+
+    def __init__(self):
+        self._trading_pair_by_symbol: Dict[str, str] = {}
+        self._symbol_by_trading_pair: Dict[str, str] = {}
+        self._quanta: Dict[str, TradingPairQuanta] = {}
+
+    @property
+    def symbols_ready(self) -> bool:
+        return len(self._trading_pair_by_symbol) > 0
+
+    def update_symbol_map(self, symbol_map: Optional[Mapping[str, str]]):
+        """
+        :param symbol_map: the association of the exchange symbols to the trading pairs in client notation
+        """
+        trading_pair_by_symbol = {sys.intern(symbol): sys.intern(trading_pair)
+                                  for symbol, trading_pair in (symbol_map or {}).items()}
+        symbol_by_trading_pair = {trading_pair: symbol for symbol, trading_pair in trading_pair_by_symbol.items()}
+        self._trading_pair_by_symbol, self._symbol_by_trading_pair = trading_pair_by_symbol, symbol_by_trading_pair
+
+    def update_trading_rules(self, trading_rules: Mapping[str, TradingRule]):
+        self._quanta = {sys.intern(trading_pair): TradingPairQuanta.from_trading_rule(trading_rule)
+                        for trading_pair, trading_rule in trading_rules.items()}
+
+    def trading_pair(self, symbol: str) -> Optional[str]:
+        """
+        :return: the trading pair in client notation of the exchange symbol, or None if the symbol is unknown
+        """
+        return self._trading_pair_by_symbol.get(symbol)
+
+    def exchange_symbol(self, trading_pair: str) -> Optional[str]:
+        """
+        :return: the exchange symbol of the trading pair in client notation, or None if the trading pair is unknown
+        """
+        return self._symbol_by_trading_pair.get(trading_pair)
+
+    def quanta(self, trading_rule: TradingRule) -> TradingPairQuanta:
+        """
+        Returns the quanta of the trading rule, computing them only when the rule was replaced since the last refresh.
+        """
+        quanta = self._quanta.get(trading_rule.trading_pair)
+        if quanta is None or quanta.trading_rule is not trading_rule:
+            quanta = TradingPairQuanta.from_trading_rule(trading_rule)
+            self._quanta[trading_rule.trading_pair] = quanta
+        return quanta
@@ -0,0 +1,120 @@
+import logging
+import os
+import pickle
+import time
+from os.path import join, realpath
+from typing import Any, Dict, NamedTuple, Optional
+
+import numpy as np
+
+from hummingbot import data_path
+from hummingbot.connector.trading_rule import TradingRule
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.logger import HummingbotLogger
+
+
+class OrderBookSnapshotData(NamedTuple):
+    bids: np.ndarray
+    asks: np.ndarray
+    update_id: int
+
+
+class WarmStartState(NamedTuple):
+    timestamp: float
+    trading_pair_symbol_map: Dict[str, str]
+    trading_rules: Dict[str, TradingRule]
+    trading_fees: Dict[str, Any]
+    order_book_snapshots: Dict[str, OrderBookSnapshotData]
+
+
+class WarmStartCache:
+    """
+    Persists the exchange metadata a connector downloads before becoming ready (trading pair symbol map, trading
+    rules, trading fees) and recent order book snapshots to a local file, so that a restarted bot can start
+    operating with them while fresh data is requested in the background.
+
+    Order book snapshots are only used when they are younger than `ORDER_BOOK_MAX_AGE`, the metadata when it is
+    younger than `METADATA_MAX_AGE`. A missing, unreadable or outdated cache file is ignored.
+    """
+
+    METADATA_MAX_AGE = 24 * 60 * 60
+    ORDER_BOOK_MAX_AGE = 60.0
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self, connector_name: str, cache_dir: Optional[str] = None):
+        self._connector_name = connector_name
+        self._cache_dir = cache_dir or realpath(join(data_path(), "warm_start"))
+
+    @property
+    def file_path(self) -> str:
+        return join(self._cache_dir, f"{self._connector_name}.pickle")
+
+    @staticmethod
+    def order_book_snapshot_data(order_book: OrderBook) -> OrderBookSnapshotData:
+        bids_df, asks_df = order_book.snapshot
+        # The levels include the diffs applied after the last snapshot, the diffs up to the last one are not replayed
+        update_id = max(order_book.snapshot_uid, order_book.last_diff_uid)
+        return OrderBookSnapshotData(bids=bids_df.values, asks=asks_df.values, update_id=update_id)
+
+    @staticmethod
+    def restore_order_book(order_book: OrderBook, snapshot_data: OrderBookSnapshotData):
+        order_book.apply_snapshot([OrderBookRow(*row) for row in snapshot_data.bids.tolist()],
+                                  [OrderBookRow(*row) for row in snapshot_data.asks.tolist()],
+                                  snapshot_data.update_id)
+
+    def save(self,
+             trading_pair_symbol_map: Optional[Dict[str, str]],
+             trading_rules: Dict[str, TradingRule],
+             trading_fees: Dict[str, Any],
+             order_books: Dict[str, OrderBook]):
+        state = WarmStartState(
+            timestamp=time.time(),
+            trading_pair_symbol_map=dict(trading_pair_symbol_map or {}),
+            trading_rules=dict(trading_rules),
+            trading_fees=dict(trading_fees),
+            order_book_snapshots={
+                trading_pair: self.order_book_snapshot_data(order_book)
+                for trading_pair, order_book in order_books.items()
+            },
+        )
+        try:
+            os.makedirs(self._cache_dir, exist_ok=True)
+            # Written to a temporary file first, so that a crash while saving never leaves a truncated cache.
+            temp_file_path = f"{self.file_path}.tmp"
+            with open(temp_file_path, "wb") as file:
+                pickle.dump(state, file)
+            os.replace(temp_file_path, self.file_path)
+        except Exception:
+            self.logger().warning(f"Could not save the warm start cache of {self._connector_name}.", exc_info=True)
+
+    def load(self) -> Optional[WarmStartState]:
+        """
+        Returns the cached state, without the order book snapshots if they are outdated, or None if there is no
+        usable cache.
+        """
+        if not os.path.exists(self.file_path):
+            return None
+        try:
+            with open(self.file_path, "rb") as file:
+                state: WarmStartState = pickle.load(file)
+        except Exception:
+            self.logger().warning(f"Could not read the warm start cache of {self._connector_name}. Ignoring it.",
+                                  exc_info=True)
+            return None
+        age = time.time() - state.timestamp
+        if age > self.METADATA_MAX_AGE:
+            return None
+        if age > self.ORDER_BOOK_MAX_AGE:
+            state = state._replace(order_book_snapshots={})
+        return state
+
+    def clear(self):
+        if os.path.exists(self.file_path):
+            os.remove(self.file_path)
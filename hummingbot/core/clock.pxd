@@ -10,3 +10,13 @@ cdef class Clock:
         list _current_context
         double _current_tick
         bint _started
+        double _early_tick_price_threshold
+        double _min_early_tick_interval
+        dict _pending_early_ticks
+        dict _early_tick_dependencies
+        dict _last_iterator_ticks
+        object _early_tick_event
+        object _early_tick_latencies
+
+    cdef c_run_early_ticks(self)
+    cdef double c_next_early_tick_time(self)
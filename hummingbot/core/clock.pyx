@@ -3,14 +3,17 @@
 import asyncio
 import logging
 import time
-from typing import List
+from collections import deque
+from typing import Iterable, List
 
 from hummingbot.core.time_iterator import TimeIterator
 from hummingbot.core.time_iterator cimport TimeIterator
 from hummingbot.core.clock_mode import ClockMode
+from hummingbot.core.utils.tick_profiler import TickProfiler
 from hummingbot.logger import HummingbotLogger
 
 s_logger = None
+NaN = float("nan")
 
 
 cdef class Clock:
@@ -21,12 +24,24 @@ cdef class Clock:
             s_logger = logging.getLogger(__name__)
         return s_logger
 
-    def __init__(self, clock_mode: ClockMode, tick_size: float = 1.0, start_time: float = 0.0, end_time: float = 0.0):
+    EARLY_TICK_LATENCY_SAMPLES = 1000
+
+    def __init__(self,
+                 clock_mode: ClockMode,
+                 tick_size: float = 1.0,
+                 start_time: float = 0.0,
+                 end_time: float = 0.0,
+                 early_tick_price_threshold: float = NaN,
+                 min_early_tick_interval: float = 0.1):
         """
-        :param clock_mode: either real time mode or back testing mode
+        :param clock_mode: either real time mode, hybrid mode or back testing mode
         :param tick_size: time interval of each tick
         :param start_time: (back testing mode only) start of simulation in UNIX timestamp
         :param end_time: (back testing mode only) end of simulation in UNIX timestamp. NaN to simulate to end of data.
+        :param early_tick_price_threshold: (hybrid mode only) relative best bid/ask move (e.g. 0.001 for 0.1%) that
+        makes an iterator request an early tick
+        :param min_early_tick_interval: (hybrid mode only) minimum time in seconds between two ticks of an iterator
+        caused by early tick requests, used to debounce bursts of order book updates
         """
         self._clock_mode = clock_mode
         self._tick_size = tick_size
@@ -36,6 +51,13 @@ cdef class Clock:
         self._child_iterators = []
         self._current_context = None
         self._started = False
+        self._early_tick_price_threshold = early_tick_price_threshold
+        self._min_early_tick_interval = min_early_tick_interval
+        self._pending_early_ticks = {}
+        self._early_tick_dependencies = {}
+        self._last_iterator_ticks = {}
+        self._early_tick_event = None
+        self._early_tick_latencies = deque(maxlen=self.EARLY_TICK_LATENCY_SAMPLES)
 
     @property
     def clock_mode(self) -> ClockMode:
@@ -57,6 +79,122 @@ cdef class Clock:
     def current_timestamp(self) -> float:
         return self._current_tick
 
+    @property
+    def early_tick_price_threshold(self) -> float:
+        return self._early_tick_price_threshold
+
+    @property
+    def early_tick_latencies(self) -> List[float]:
+        """
+        The most recent latencies (in seconds) between an early tick request, e.g. an order book update, and the
+        `c_tick()` call that served it.
+        """
+        return list(self._early_tick_latencies)
+
+    def request_early_tick(self,
+                           iterator: TimeIterator,
+                           request_time: float = NaN,
+                           dependencies: Iterable[TimeIterator] = ()):
+        """
+        Asks the clock to tick the iterator before the next periodic tick. Only used in hybrid mode. Requests are
+        debounced: an iterator is not ticked more often than every `min_early_tick_interval` seconds.
+
+        :param iterator: the iterator to tick
+        :param request_time: `time.perf_counter()` value of the event causing the request, for latency tracking
+        :param dependencies: iterators ticked with the same timestamp right before the iterator (e.g. the markets of a
+        strategy), so that they don't lag behind it
+        """
+        if self._clock_mode is not ClockMode.HYBRID or self._current_context is None:
+            return
+        if iterator not in self._current_context:
+            return
+        if request_time != request_time:
+            request_time = time.perf_counter()
+        # Keep the earliest request, the latency is measured from it.
+        if iterator not in self._pending_early_ticks:
+            self._pending_early_ticks[iterator] = request_time
+        self._early_tick_dependencies[iterator] = dependencies
+        if self._early_tick_event is not None:
+            self._early_tick_event.set()
+
+    cdef double c_next_early_tick_time(self):
+        cdef:
+            double next_time = NaN
+            double allowed_time
+        for iterator in self._pending_early_ticks:
+            allowed_time = self._last_iterator_ticks.get(iterator, 0.0) + self._min_early_tick_interval
+            if not (allowed_time >= next_time):
+                next_time = allowed_time
+        return next_time
+
+    cdef c_run_early_ticks(self):
+        """
+        Ticks the iterators whose early tick is due, after their dependencies. Like in a periodic tick, all of them
+        are ticked with the same timestamp, in the order of the clock context, and the clock timestamp moves to it.
+        """
+        cdef:
+            TimeIterator child_iterator
+            double now = time.time()
+            double tick_start_time
+            object profiler = TickProfiler.get_instance()
+            bint profiling = profiler.enabled
+            list due_iterators = []
+            set iterators_to_tick = set()
+
+        for ci in self._current_context:
+            if ci not in self._pending_early_ticks:
+                continue
+            if self._last_iterator_ticks.get(ci, 0.0) + self._min_early_tick_interval > now:
+                continue
+            due_iterators.append(ci)
+            iterators_to_tick.add(ci)
+            iterators_to_tick.update(self._early_tick_dependencies.pop(ci, ()))
+        if len(due_iterators) == 0:
+            return
+
+        self._current_tick = now
+        for ci in due_iterators:
+            self._early_tick_latencies.append(time.perf_counter() - self._pending_early_ticks.pop(ci))
+        for ci in self._current_context:
+            if ci not in iterators_to_tick:
+                continue
+            child_iterator = ci
+            self._last_iterator_ticks[ci] = now
+            if profiling:
+                tick_start_time = time.perf_counter()
+            try:
+                child_iterator.c_tick(now)
+            except Exception:
+                self.logger().error("Unexpected error running early clock tick.", exc_info=True)
+            if profiling:
+                profiler.record_tick(type(ci).__name__, time.perf_counter() - tick_start_time)
+
+    async def _wait_for_early_ticks(self, double next_tick_time) -> bool:
+        """
+        Waits until the next periodic tick time, or until an early tick is due.
+
+        :returns True if an early tick is due before the next periodic tick
+        """
+        cdef:
+            double now
+            double wake_up_time
+            double early_tick_time
+        while True:
+            now = time.time()
+            if now >= next_tick_time:
+                return False
+            wake_up_time = next_tick_time
+            early_tick_time = self.c_next_early_tick_time()
+            if early_tick_time <= now:
+                return True
+            if early_tick_time < wake_up_time:
+                wake_up_time = early_tick_time
+            self._early_tick_event.clear()
+            try:
+                await asyncio.wait_for(self._early_tick_event.wait(), timeout=wake_up_time - now)
+            except asyncio.TimeoutError:
+                pass
+
     def __enter__(self) -> Clock:
         if self._current_context is not None:
             raise EnvironmentError("Clock context is not re-entrant.")
@@ -90,11 +228,16 @@ cdef class Clock:
             TimeIterator child_iterator
             double now = time.time()
             double next_tick_time
+            double tick_start_time
+            object profiler = TickProfiler.get_instance()
+            bint profiling
 
         if self._current_context is None:
             raise EnvironmentError("run() and run_til() can only be used within the context of a `with...` statement.")
 
         self._current_tick = (now // self._tick_size) * self._tick_size
+        if self._clock_mode is ClockMode.HYBRID:
+            self._early_tick_event = asyncio.Event()
         if not self._started:
             for ci in self._current_context:
                 child_iterator = ci
@@ -109,12 +252,30 @@ cdef class Clock:
 
                 # Sleep until the next tick
                 next_tick_time = ((now // self._tick_size) + 1) * self._tick_size
-                await asyncio.sleep(next_tick_time - now)
+                if self._clock_mode is ClockMode.HYBRID:
+                    if await self._wait_for_early_ticks(next_tick_time):
+                        self.c_run_early_ticks()
+                        continue
+                else:
+                    await asyncio.sleep(next_tick_time - now)
                 self._current_tick = next_tick_time
+                profiling = profiler.enabled
+                if profiling:
+                    profiler.record_tick_drift(time.time() - next_tick_time)
+
+                if self._clock_mode is ClockMode.HYBRID:
+                    # The periodic tick serves the pending early tick requests as well.
+                    for ci in self._current_context:
+                        if ci in self._pending_early_ticks:
+                            self._early_tick_latencies.append(time.perf_counter() - self._pending_early_ticks.pop(ci))
+                            self._early_tick_dependencies.pop(ci, None)
+                        self._last_iterator_ticks[ci] = next_tick_time
 
                 # Run through all the child iterators.
                 for ci in self._current_context:
                     child_iterator = ci
+                    if profiling:
+                        tick_start_time = time.perf_counter()
                     try:
                         child_iterator.c_tick(self._current_tick)
                     except StopIteration:
@@ -122,7 +283,12 @@ cdef class Clock:
                         return
                     except Exception:
                         self.logger().error("Unexpected error running clock tick.", exc_info=True)
+                    if profiling:
+                        profiler.record_tick(type(ci).__name__, time.perf_counter() - tick_start_time)
         finally:
+            self._early_tick_event = None
+            self._pending_early_ticks.clear()
+            self._early_tick_dependencies.clear()
             for ci in self._current_context:
                 child_iterator = ci
                 child_iterator._clock = None
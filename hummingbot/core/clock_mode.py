@@ -6,3 +6,5 @@ from enum import Enum
 class ClockMode(Enum):
     REALTIME = 1
     BACKTEST = 2
+    # Real time ticks, plus early ticks requested by the iterators (e.g. on order book moves or fills)
+    HYBRID = 3
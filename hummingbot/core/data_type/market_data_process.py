@@ -0,0 +1,327 @@
+import asyncio
+import logging
+import multiprocessing
+import os
+import time
+from multiprocessing.connection import Connection
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.data_type.shared_memory_order_book import SharedMemoryOrderBook
+from hummingbot.core.data_type.shared_order_book_buffer import SharedOrderBookBuffer
+from hummingbot.core.event.event_forwarder import EventForwarder
+from hummingbot.core.event.events import OrderBookEvent, OrderBookTradeEvent
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.logger import HummingbotLogger
+
+if TYPE_CHECKING:
+    from hummingbot.client.config.client_config_map import ClientConfigMap
+
+# Number of price levels of each side shared by the market data process
+DEFAULT_SHARED_DEPTH = 100
+PUBLISH_INTERVAL = 0.01
+NOTIFICATION_READ_SIZE = 4096
+
+
+def notify_order_books_published(connection: Connection):
+    """
+    Wakes up the main process after a publication. The write end of the pipe is non-blocking: when the pipe is full,
+    notifications the main process has not read yet are already pending, and this one is dropped.
+    """
+    try:
+        os.write(connection.fileno(), b"\x00")
+    except BlockingIOError:
+        pass
+
+
+class OrderBookPublisher:
+    """
+    Publishes the order books of a tracker into their shared memory buffers, skipping the order books that did not
+    change since their last publication.
+    """
+
+    def __init__(self, buffers: Dict[str, SharedOrderBookBuffer]):
+        self._buffers = buffers
+        self._published_versions: Dict[str, tuple] = {}
+
+    def publish(self, order_books: Dict[str, OrderBook]) -> int:
+        """
+        :return: the number of order books published
+        """
+        published_count = 0
+        for trading_pair, buffer in self._buffers.items():
+            order_book = order_books.get(trading_pair)
+            if order_book is None:
+                continue
+            last_trade_price = order_book.last_trade_price
+            version = (order_book.snapshot_uid,
+                       order_book.last_diff_uid,
+                       # NaN (no trade yet) never compares equal to itself
+                       last_trade_price if last_trade_price == last_trade_price else None,
+                       order_book.last_applied_trade)
+            if self._published_versions.get(trading_pair) == version:
+                continue
+            buffer.publish_order_book(order_book, timestamp=time.time())
+            self._published_versions[trading_pair] = version
+            published_count += 1
+        return published_count
+
+
+class OrderBookTradeForwarder:
+    """
+    Sends the trade events of the order books of a tracker to the main process. Unlike the publication
+    notifications, none of them is dropped.
+    """
+
+    def __init__(self, trade_connection: Connection):
+        self._trade_connection = trade_connection
+        self._trade_forwarder = EventForwarder(self._trade_connection.send)
+        self._listened_order_books: Dict[str, OrderBook] = {}
+
+    def listen(self, order_books: Dict[str, OrderBook]):
+        """
+        Listens to the order books not listened yet. The tracker creates them once their first snapshot is received,
+        and replaces them if it resynchronizes them.
+        """
+        for trading_pair, order_book in order_books.items():
+            if self._listened_order_books.get(trading_pair) is not order_book:
+                order_book.add_listener(OrderBookEvent.TradeEvent, self._trade_forwarder)
+                self._listened_order_books[trading_pair] = order_book
+
+
+def run_market_data_process(connector_name: str,
+                            trading_pairs: List[str],
+                            buffer_names: Dict[str, str],
+                            depth: int,
+                            client_config_map: "ClientConfigMap",
+                            stop_event: multiprocessing.Event,
+                            notification_connection: Connection,
+                            trade_connection: Connection):
+    """
+    Entry point of the market data process: tracks the order books of the connector and publishes them into the
+    shared memory buffers until the stop event is set, notifying the main process through `notification_connection`
+    after each publication and sending it the public trades through `trade_connection`.
+    """
+    asyncio.run(_track_and_publish_order_books(
+        connector_name=connector_name,
+        trading_pairs=trading_pairs,
+        buffer_names=buffer_names,
+        depth=depth,
+        client_config_map=client_config_map,
+        stop_event=stop_event,
+        notification_connection=notification_connection,
+        trade_connection=trade_connection,
+    ))
+
+
+async def _track_and_publish_order_books(connector_name: str,
+                                         trading_pairs: List[str],
+                                         buffer_names: Dict[str, str],
+                                         depth: int,
+                                         client_config_map: "ClientConfigMap",
+                                         stop_event: multiprocessing.Event,
+                                         notification_connection: Connection,
+                                         trade_connection: Connection):
+    from hummingbot.client.config.config_helpers import ClientConfigAdapter
+    from hummingbot.client.settings import AllConnectorSettings
+
+    buffers = {trading_pair: SharedOrderBookBuffer.attach(name=name, depth=depth)
+               for trading_pair, name in buffer_names.items()}
+    connector_setting = AllConnectorSettings.get_connector_settings()[connector_name]
+    # The worker connector tracks its order books itself
+    worker_config_map = client_config_map.copy(update={"market_data_process_enabled": False})
+    connector = connector_setting.non_trading_connector_instance_with_default_configuration(
+        trading_pairs=trading_pairs,
+        client_config_map=ClientConfigAdapter(worker_config_map),
+    )
+    tracker = connector.order_book_tracker
+    publisher = OrderBookPublisher(buffers)
+    trade_forwarder = OrderBookTradeForwarder(trade_connection)
+    os.set_blocking(notification_connection.fileno(), False)
+    tracker.start()
+    try:
+        while not stop_event.is_set():
+            trade_forwarder.listen(tracker.order_books)
+            if publisher.publish(tracker.order_books) > 0:
+                notify_order_books_published(notification_connection)
+            await asyncio.sleep(PUBLISH_INTERVAL)
+    finally:
+        tracker.stop()
+        for buffer in buffers.values():
+            buffer.close()
+        notification_connection.close()
+        trade_connection.close()
+
+
+class MarketDataProcessOrderBookTracker(OrderBookTracker):
+    """
+    Order book tracker delegating the order book tracking of a connector to a separate process, so the websocket
+    messages parsing and the order book updates don't compete with the strategies for the main process CPU time.
+
+    The process publishes the best `depth` levels of each order book and its last trade price into shared memory
+    buffers, and writes to a pipe after each publication. The order books of the tracker are read-only views of the
+    buffers (`SharedMemoryOrderBook`), limited to the published depth: nothing is copied when a publication is
+    notified, the views only take the new best prices and emit the best price update events. The public trades are
+    sent through a second pipe and applied to the views, which emit the trade events. The end of the notification
+    pipe tells that the process exited.
+    """
+
+    PROCESS_STOP_TIMEOUT = 5.0
+    PROCESS_EXIT_CHECK_INTERVAL = 0.1
+    _mdpobt_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._mdpobt_logger is None:
+            cls._mdpobt_logger = logging.getLogger(__name__)
+        return cls._mdpobt_logger
+
+    def __init__(self,
+                 data_source: OrderBookTrackerDataSource,
+                 trading_pairs: List[str],
+                 connector_name: str,
+                 client_config_map: "ClientConfigMap",
+                 domain: Optional[str] = None,
+                 depth: int = DEFAULT_SHARED_DEPTH):
+        super().__init__(data_source=data_source, trading_pairs=trading_pairs, domain=domain)
+        self._connector_name = connector_name
+        self._client_config_map = client_config_map
+        self._depth = depth
+        self._buffers: Dict[str, SharedOrderBookBuffer] = {}
+        self._shared_order_books: Dict[str, SharedMemoryOrderBook] = {}
+        self._process: Optional[multiprocessing.Process] = None
+        self._process_stop_event: Optional[multiprocessing.Event] = None
+        self._notification_connection: Optional[Connection] = None
+        self._trade_connection: Optional[Connection] = None
+
+    def start(self):
+        self.stop()
+        for trading_pair in self._trading_pairs:
+            buffer = SharedOrderBookBuffer.create(depth=self._depth)
+            self._buffers[trading_pair] = buffer
+            self._shared_order_books[trading_pair] = SharedMemoryOrderBook(trading_pair, buffer)
+        self._start_process()
+
+    def stop(self):
+        super().stop()
+        self._stop_listening_to_process()
+        self._stop_process()
+        # The views are released before their buffers are closed
+        for order_book in self._shared_order_books.values():
+            order_book.release()
+        self._shared_order_books.clear()
+        self._order_books.clear()
+        for buffer in self._buffers.values():
+            buffer.close()
+        self._buffers.clear()
+
+    def _start_process(self):
+        context = multiprocessing.get_context("spawn")
+        notification_reader, notification_writer = context.Pipe(duplex=False)
+        trade_reader, trade_writer = context.Pipe(duplex=False)
+        self._process_stop_event = context.Event()
+        self._process = context.Process(
+            target=run_market_data_process,
+            kwargs={
+                "connector_name": self._connector_name,
+                "trading_pairs": list(self._trading_pairs),
+                "buffer_names": {trading_pair: buffer.name for trading_pair, buffer in self._buffers.items()},
+                "depth": self._depth,
+                "client_config_map": self._client_config_map,
+                "stop_event": self._process_stop_event,
+                "notification_connection": notification_writer,
+                "trade_connection": trade_writer,
+            },
+            name=f"{self._connector_name}_market_data",
+            daemon=True,
+        )
+        self._process.start()
+        # The process now holds the only write ends, so the pipes reach their end when the process exits
+        notification_writer.close()
+        trade_writer.close()
+        self._listen_to_process(notification_reader, trade_reader)
+
+    def _stop_process(self):
+        if self._process is None:
+            return
+        self._process_stop_event.set()
+        safe_ensure_future(self._wait_for_process_exit(self._process))
+        self._process = None
+        self._process_stop_event = None
+
+    async def _wait_for_process_exit(self, process: multiprocessing.Process):
+        waiting_time = 0.0
+        while process.is_alive() and waiting_time < self.PROCESS_STOP_TIMEOUT:
+            await self._sleep(self.PROCESS_EXIT_CHECK_INTERVAL)
+            waiting_time += self.PROCESS_EXIT_CHECK_INTERVAL
+        if process.is_alive():
+            process.terminate()
+            while process.is_alive():
+                await self._sleep(self.PROCESS_EXIT_CHECK_INTERVAL)
+
+    def _listen_to_process(self, notification_connection: Connection, trade_connection: Connection):
+        self._notification_connection = notification_connection
+        self._trade_connection = trade_connection
+        os.set_blocking(notification_connection.fileno(), False)
+        event_loop = asyncio.get_event_loop()
+        event_loop.add_reader(notification_connection.fileno(), self._process_notifications)
+        event_loop.add_reader(trade_connection.fileno(), self._process_trades)
+
+    def _stop_listening_to_process(self):
+        event_loop = asyncio.get_event_loop()
+        if self._notification_connection is not None:
+            event_loop.remove_reader(self._notification_connection.fileno())
+            self._notification_connection.close()
+            self._notification_connection = None
+        if self._trade_connection is not None:
+            event_loop.remove_reader(self._trade_connection.fileno())
+            self._trade_connection.close()
+            self._trade_connection = None
+
+    def _process_notifications(self):
+        try:
+            # All the pending notifications are consumed at once, a single refresh covers them
+            notifications = os.read(self._notification_connection.fileno(), NOTIFICATION_READ_SIZE)
+        except BlockingIOError:
+            return
+        if len(notifications) == 0:
+            self._restart_process()
+            return
+        try:
+            self._refresh_order_books()
+        except Exception:
+            self.logger().network("Unexpected error refreshing the shared order books.", exc_info=True)
+
+    def _process_trades(self):
+        try:
+            while self._trade_connection.poll():
+                trade_event: OrderBookTradeEvent = self._trade_connection.recv()
+                order_book = self._order_books.get(trade_event.trading_pair)
+                if order_book is not None:
+                    order_book.apply_trade(trade_event)
+        except EOFError:
+            # The end of the notification pipe restarts the process
+            event_loop = asyncio.get_event_loop()
+            event_loop.remove_reader(self._trade_connection.fileno())
+        except Exception:
+            self.logger().network("Unexpected error forwarding the public trades.", exc_info=True)
+
+    def _restart_process(self):
+        exit_code = self._process.exitcode if self._process is not None else None
+        self.logger().error(f"The {self._connector_name} market data process stopped unexpectedly "
+                            f"(exit code {exit_code}). Restarting it.")
+        self._stop_listening_to_process()
+        self._stop_process()
+        self._start_process()
+
+    def _refresh_order_books(self):
+        for trading_pair, order_book in self._shared_order_books.items():
+            # A view is tracked from its first publication on
+            if order_book.refresh() and trading_pair not in self._order_books:
+                self._order_books[trading_pair] = order_book
+        if not self._order_books_initialized.is_set() and len(self._order_books) == len(self._shared_order_books):
+            self._order_books_initialized.set()
+            self.logger().info(f"Initialized {len(self._order_books)} order books from the "
+                               f"{self._connector_name} market data process.")
@@ -14,6 +14,7 @@ from typing import (
 import numpy as np
 import pandas as pd
 
+from libc.math cimport ceil, floor
 from cython.operator cimport(
     address as ref,
     dereference as deref,
@@ -26,6 +27,7 @@ from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.data_type.OrderBookEntry cimport truncateOverlapEntries
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.event.events import (
+    OrderBookBestPriceUpdateEvent,
     OrderBookEvent,
     OrderBookTradeEvent
 )
@@ -34,10 +36,13 @@ cimport numpy as np
 
 ob_logger = None
 NaN = float("nan")
+# Tolerance (in number of buckets) absorbing the floating point error of the price / bucket size division
+cdef double BUCKET_EPSILON = 1e-9
 
 
 cdef class OrderBook(PubSub):
     ORDER_BOOK_TRADE_EVENT_TAG = OrderBookEvent.TradeEvent.value
+    ORDER_BOOK_BEST_PRICE_UPDATE_EVENT_TAG = OrderBookEvent.BestPriceUpdateEvent.value
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -65,6 +70,8 @@ cdef class OrderBook(PubSub):
             set[OrderBookEntry].iterator result
             OrderBookEntry top_bid
             OrderBookEntry top_ask
+            double previous_best_bid = self._best_bid
+            double previous_best_ask = self._best_ask
 
         # Apply the diffs. Diffs with 0 amounts mean deletion.
         for bid in bids:
@@ -96,6 +103,8 @@ cdef class OrderBook(PubSub):
         # Remember the last diff update ID.
         self._last_diff_uid = update_id
 
+        self.c_notify_best_price_update(previous_best_bid, previous_best_ask)
+
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
             double best_bid_price = float("NaN")
@@ -104,6 +113,8 @@ cdef class OrderBook(PubSub):
             set[OrderBookEntry].iterator ask_iterator
             OrderBookEntry top_bid
             OrderBookEntry top_ask
+            double previous_best_bid = self._best_bid
+            double previous_best_ask = self._best_ask
 
         # Start with an empty order book, and then insert all entries.
         self._bid_book.clear()
@@ -136,6 +147,22 @@ cdef class OrderBook(PubSub):
         # Remember the last snapshot update ID.
         self._snapshot_uid = update_id
 
+        self.c_notify_best_price_update(previous_best_bid, previous_best_ask)
+
+    cdef c_notify_best_price_update(self, double previous_best_bid, double previous_best_ask):
+        # The event is only built when somebody listens to it, since this runs for every diff (NaN means no price).
+        cdef:
+            bint bid_unchanged = previous_best_bid == self._best_bid or (previous_best_bid != previous_best_bid and
+                                                                         self._best_bid != self._best_bid)
+            bint ask_unchanged = previous_best_ask == self._best_ask or (previous_best_ask != previous_best_ask and
+                                                                         self._best_ask != self._best_ask)
+        if bid_unchanged and ask_unchanged:
+            return
+        if self._events.count(self.ORDER_BOOK_BEST_PRICE_UPDATE_EVENT_TAG) == 0:
+            return
+        self.c_trigger_event(self.ORDER_BOOK_BEST_PRICE_UPDATE_EVENT_TAG,
+                             OrderBookBestPriceUpdateEvent(self._best_bid, self._best_ask))
+
     cdef c_apply_trade(self, object trade_event):
         self._last_trade_price = trade_event.price
         self._last_applied_trade = time.perf_counter()
@@ -171,12 +198,87 @@ cdef class OrderBook(PubSub):
 
     @property
     def snapshot(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
-        bids_rows = list(self.bid_entries())
-        asks_rows = list(self.ask_entries())
-        bids_df = pd.DataFrame(data=bids_rows, columns=OrderBookRow._fields, dtype="float64")
-        asks_df = pd.DataFrame(data=asks_rows, columns=OrderBookRow._fields, dtype="float64")
+        bids_array, asks_array = self.to_numpy()
+        bids_df = pd.DataFrame(data=bids_array, columns=OrderBookRow._fields, dtype="float64")
+        asks_df = pd.DataFrame(data=asks_array, columns=OrderBookRow._fields, dtype="float64")
         return bids_df, asks_df
 
+    def to_numpy(self, depth: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Copies the levels of the order book into arrays, without building a row object per level.
+
+        :param depth: the maximum number of levels of each side, all the levels if None
+
+        :return: the bids and asks (n, 3) float64 arrays of [price, amount, update_id] rows, best price first
+        """
+        cdef int64_t max_depth = -1 if depth is None else depth
+        return self.c_bids_to_numpy(max_depth, 0), self.c_asks_to_numpy(max_depth, 0)
+
+    def get_top_levels(self, n: int, bucket_size: float = 0) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        :param n: the number of levels of each side
+        :param bucket_size: when positive, the levels are aggregated into price buckets of this size (the bids are
+            rounded down and the asks up to a bucket price) and `n` is the number of buckets
+
+        :return: the bids and asks (n, 3) float64 arrays of [price, amount, update_id] rows, best price first. The
+            update id of a bucket is the highest one of its levels.
+        """
+        if bucket_size < 0:
+            raise ValueError(f"The bucket size must be positive (got {bucket_size}).")
+        return self.c_bids_to_numpy(n, bucket_size), self.c_asks_to_numpy(n, bucket_size)
+
+    cdef np.ndarray c_bids_to_numpy(self, int64_t depth, double bucket_size):
+        cdef:
+            set[OrderBookEntry].reverse_iterator it = self._bid_book.rbegin()
+            int64_t size = self._bid_book.size() if depth < 0 else min(<int64_t>self._bid_book.size(), depth)
+            np.ndarray[np.float64_t, ndim=2] levels = np.empty((size, 3), dtype=np.float64)
+            double[:, ::1] view = levels
+            int64_t count = 0
+            double price
+        while it != self._bid_book.rend():
+            price = deref(it).getPrice()
+            if bucket_size > 0:
+                price = floor(price / bucket_size + BUCKET_EPSILON) * bucket_size
+                if count > 0 and view[count - 1, 0] == price:
+                    view[count - 1, 1] += deref(it).getAmount()
+                    view[count - 1, 2] = max(view[count - 1, 2], <double>deref(it).getUpdateId())
+                    inc(it)
+                    continue
+            if count == size:
+                break
+            view[count, 0] = price
+            view[count, 1] = deref(it).getAmount()
+            view[count, 2] = deref(it).getUpdateId()
+            count += 1
+            inc(it)
+        return levels[:count]
+
+    cdef np.ndarray c_asks_to_numpy(self, int64_t depth, double bucket_size):
+        cdef:
+            set[OrderBookEntry].iterator it = self._ask_book.begin()
+            int64_t size = self._ask_book.size() if depth < 0 else min(<int64_t>self._ask_book.size(), depth)
+            np.ndarray[np.float64_t, ndim=2] levels = np.empty((size, 3), dtype=np.float64)
+            double[:, ::1] view = levels
+            int64_t count = 0
+            double price
+        while it != self._ask_book.end():
+            price = deref(it).getPrice()
+            if bucket_size > 0:
+                price = ceil(price / bucket_size - BUCKET_EPSILON) * bucket_size
+                if count > 0 and view[count - 1, 0] == price:
+                    view[count - 1, 1] += deref(it).getAmount()
+                    view[count - 1, 2] = max(view[count - 1, 2], <double>deref(it).getUpdateId())
+                    inc(it)
+                    continue
+            if count == size:
+                break
+            view[count, 0] = price
+            view[count, 1] = deref(it).getAmount()
+            view[count, 2] = deref(it).getUpdateId()
+            count += 1
+            inc(it)
+        return levels[:count]
+
     def apply_diffs(self, bids: List[OrderBookRow], asks: List[OrderBookRow], update_id: int):
         cdef:
             vector[OrderBookEntry] cpp_bids
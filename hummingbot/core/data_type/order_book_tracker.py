@@ -12,7 +12,7 @@ from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.event.events import OrderBookTradeEvent
-from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.logger import HummingbotLogger
 
 
@@ -21,8 +21,33 @@ class OrderBookTrackerDataSourceType(Enum):
     EXCHANGE_API = 3
 
 
+class OrderBookSyncMetrics:
+    """
+    Sequence validation statistics of an order book: detected gaps between diffs, completed resynchronizations and
+    their duration, and stale diffs (already included in the order book) that were skipped.
+    """
+
+    def __init__(self):
+        self.gaps = 0
+        self.resyncs = 0
+        self.stale_diffs = 0
+        self.last_resync_duration = 0.0
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            "gaps": self.gaps,
+            "resyncs": self.resyncs,
+            "stale_diffs": self.stale_diffs,
+            "last_resync_duration": self.last_resync_duration,
+        }
+
+
 class OrderBookTracker:
     PAST_DIFF_WINDOW_SIZE: int = 32
+    # Maximum number of diffs buffered for an order book while its snapshot is being requested
+    RESYNC_BUFFER_SIZE: int = 5000
+    # Minimum delay between two snapshot requests to resynchronize the same order book
+    RESYNC_MIN_INTERVAL: float = 1.0
     _obt_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -45,6 +70,13 @@ class OrderBookTracker:
         self._order_book_trade_stream: asyncio.Queue = asyncio.Queue()
         self._ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
         self._saved_message_queues: Dict[str, Deque[OrderBookMessage]] = defaultdict(lambda: deque(maxlen=1000))
+        self._restored_order_books: Dict[str, OrderBook] = {}
+        self._last_update_ids: Dict[str, int] = {}
+        self._resync_buffers: Dict[str, Deque[OrderBookMessage]] = {}
+        self._resync_start_timestamps: Dict[str, float] = {}
+        self._last_resync_request_timestamps: Dict[str, float] = {}
+        self._resync_tasks: Dict[str, asyncio.Task] = {}
+        self._sync_metrics: Dict[str, OrderBookSyncMetrics] = defaultdict(OrderBookSyncMetrics)
 
         self._emit_trade_event_task: Optional[asyncio.Task] = None
         self._init_order_books_task: Optional[asyncio.Task] = None
@@ -68,6 +100,14 @@ class OrderBookTracker:
     def ready(self) -> bool:
         return self._order_books_initialized.is_set()
 
+    @property
+    def sync_metrics(self) -> Dict[str, OrderBookSyncMetrics]:
+        return self._sync_metrics
+
+    @property
+    def validates_diff_sequences(self) -> bool:
+        return self._data_source.CONTIGUOUS_DIFF_UPDATE_IDS
+
     @property
     def snapshot(self) -> Dict[str, Tuple[pd.DataFrame, pd.DataFrame]]:
         return {
@@ -137,8 +177,22 @@ class OrderBookTracker:
             for _, task in self._tracking_tasks.items():
                 task.cancel()
             self._tracking_tasks.clear()
+        for task in self._resync_tasks.values():
+            task.cancel()
+        self._resync_tasks.clear()
+        self._resync_buffers.clear()
+        self._last_update_ids.clear()
         self._order_books_initialized.clear()
 
+    def restore_order_books(self, order_books: Dict[str, OrderBook]):
+        """
+        Seeds the tracker with order books restored from a local cache, to be called before `start()`. If all the
+        trading pairs have a restored order book, the tracker is ready right away: the restored books are tracked
+        immediately, and fresh snapshots are requested concurrently in the background and applied through the regular
+        snapshot processing, replacing the restored content.
+        """
+        self._restored_order_books = dict(order_books)
+
     async def wait_ready(self):
         await self._order_books_initialized.wait()
 
@@ -176,6 +230,11 @@ class OrderBookTracker:
         """
         Initialize order books
         """
+        restored_order_books = self._restored_order_books
+        self._restored_order_books = {}
+        if len(self._trading_pairs) > 0 and all(pair in restored_order_books for pair in self._trading_pairs):
+            await self._init_restored_order_books(restored_order_books)
+            return
         for index, trading_pair in enumerate(self._trading_pairs):
             self._order_books[trading_pair] = await self._initial_order_book_for_trading_pair(trading_pair)
             self._tracking_message_queues[trading_pair] = asyncio.Queue()
@@ -185,6 +244,28 @@ class OrderBookTracker:
             await self._sleep(delay=1)
         self._order_books_initialized.set()
 
+    async def _init_restored_order_books(self, restored_order_books: Dict[str, OrderBook]):
+        for trading_pair in self._trading_pairs:
+            self._order_books[trading_pair] = restored_order_books[trading_pair]
+            self._tracking_message_queues[trading_pair] = asyncio.Queue()
+            self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
+        self._order_books_initialized.set()
+        self.logger().info(f"Initialized {len(self._trading_pairs)} order books from the warm start cache.")
+
+        await safe_gather(*[self._refresh_restored_order_book(trading_pair) for trading_pair in self._trading_pairs])
+
+    async def _refresh_restored_order_book(self, trading_pair: str):
+        try:
+            snapshot_message = await self._data_source._order_book_snapshot(trading_pair=trading_pair)
+            await self._tracking_message_queues[trading_pair].put(snapshot_message)
+            self.logger().info(f"Refreshed the cached order book for {trading_pair}.")
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # The order book keeps being updated by the diffs, and the periodic snapshots if any.
+            self.logger().network(f"Unexpected error refreshing the cached order book for {trading_pair}.",
+                                  exc_info=True)
+
     async def _order_book_diff_router(self):
         """
         Routes the real-time order book diff messages to the correct order book.
@@ -272,8 +353,11 @@ class OrderBookTracker:
                     message = await message_queue.get()
 
                 if message.type is OrderBookMessageType.DIFF:
-                    order_book.apply_diffs(message.bids, message.asks, message.update_id)
-                    past_diffs_window.append(message)
+                    if self.validates_diff_sequences:
+                        self._process_sequenced_diff(trading_pair, order_book, message)
+                    else:
+                        order_book.apply_diffs(message.bids, message.asks, message.update_id)
+                        past_diffs_window.append(message)
                     diff_messages_accepted += 1
 
                     # Output some statistics periodically.
@@ -283,8 +367,11 @@ class OrderBookTracker:
                         diff_messages_accepted = 0
                     last_message_timestamp = now
                 elif message.type is OrderBookMessageType.SNAPSHOT:
-                    past_diffs: List[OrderBookMessage] = list(past_diffs_window)
-                    order_book.restore_from_snapshot_and_diffs(message, past_diffs)
+                    if self.validates_diff_sequences:
+                        self._process_sequenced_snapshot(trading_pair, order_book, message)
+                    else:
+                        past_diffs: List[OrderBookMessage] = list(past_diffs_window)
+                        order_book.restore_from_snapshot_and_diffs(message, past_diffs)
             except asyncio.CancelledError:
                 raise
             except Exception:
@@ -295,6 +382,73 @@ class OrderBookTracker:
                 )
                 await asyncio.sleep(5.0)
 
+    def _process_sequenced_diff(self, trading_pair: str, order_book: OrderBook, message: OrderBookMessage):
+        """
+        Applies a diff only if it continues the update ids sequence of the order book. When a gap is detected, the
+        diffs are buffered while a new snapshot is requested for the order book, and replayed once it arrives.
+        """
+        resync_buffer = self._resync_buffers.get(trading_pair)
+        if resync_buffer is not None:
+            resync_buffer.append(message)
+            return
+        last_update_id = self._last_update_ids.get(trading_pair, order_book.snapshot_uid)
+        if message.update_id <= last_update_id:
+            self._sync_metrics[trading_pair].stale_diffs += 1
+            return
+        if message.first_update_id > last_update_id + 1:
+            self._sync_metrics[trading_pair].gaps += 1
+            self.logger().warning(f"Gap detected in the {trading_pair} order book diffs (last update id "
+                                  f"{last_update_id}, next diff from {message.first_update_id}). Resynchronizing.")
+            self._start_order_book_resync(trading_pair=trading_pair, first_buffered_diff=message)
+            return
+        order_book.apply_diffs(message.bids, message.asks, message.update_id)
+        self._last_update_ids[trading_pair] = message.update_id
+        self._past_diffs_windows[trading_pair].append(message)
+
+    def _process_sequenced_snapshot(self, trading_pair: str, order_book: OrderBook, message: OrderBookMessage):
+        resync_buffer = self._resync_buffers.pop(trading_pair, None)
+        last_update_id = self._last_update_ids.get(trading_pair, order_book.snapshot_uid)
+        if resync_buffer is None and message.update_id <= last_update_id:
+            # The order book is in sync and already more recent than the snapshot
+            return
+        order_book.apply_snapshot(message.bids, message.asks, message.update_id)
+        self._last_update_ids[trading_pair] = message.update_id
+        self._past_diffs_windows[trading_pair].clear()
+        if resync_buffer is not None:
+            metrics = self._sync_metrics[trading_pair]
+            metrics.resyncs += 1
+            metrics.last_resync_duration = time.perf_counter() - self._resync_start_timestamps.pop(trading_pair)
+            for diff_message in resync_buffer:
+                self._process_sequenced_diff(trading_pair, order_book, diff_message)
+
+    def _start_order_book_resync(self, trading_pair: str, first_buffered_diff: OrderBookMessage):
+        self._resync_buffers[trading_pair] = deque([first_buffered_diff], maxlen=self.RESYNC_BUFFER_SIZE)
+        self._resync_start_timestamps.setdefault(trading_pair, time.perf_counter())
+        resync_task = self._resync_tasks.get(trading_pair)
+        if resync_task is None or resync_task.done():
+            self._resync_tasks[trading_pair] = safe_ensure_future(self._request_resync_snapshot(trading_pair))
+
+    async def _request_resync_snapshot(self, trading_pair: str):
+        """
+        Requests the snapshot of a single order book and adds it to its tracking queue, retrying until it succeeds.
+        Consecutive requests for the same order book are spaced by at least `RESYNC_MIN_INTERVAL` seconds.
+        """
+        while True:
+            try:
+                last_request_timestamp = self._last_resync_request_timestamps.get(trading_pair, float("-inf"))
+                delay = last_request_timestamp + self.RESYNC_MIN_INTERVAL - time.perf_counter()
+                if delay > 0:
+                    await self._sleep(delay=delay)
+                self._last_resync_request_timestamps[trading_pair] = time.perf_counter()
+                snapshot_message = await self._data_source._order_book_snapshot(trading_pair=trading_pair)
+                await self._tracking_message_queues[trading_pair].put(snapshot_message)
+                return
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().network(f"Unexpected error requesting the {trading_pair} order book snapshot to "
+                                      f"resynchronize it.", exc_info=True)
+
     async def _emit_trade_event_loop(self):
         last_message_timestamp: float = time.time()
         messages_accepted: int = 0
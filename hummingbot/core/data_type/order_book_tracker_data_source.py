@@ -11,8 +11,75 @@ from hummingbot.core.web_assistant.ws_assistant import WSAssistant
 from hummingbot.logger import HummingbotLogger
 
 
+class OrderBookWebsocketShard:
+    """
+    One of the websocket connections used by a data source when its trading pairs are sharded across several
+    connections. Keeps the trading pairs subscribed through the connection and its message rate metrics.
+    """
+
+    MESSAGE_RATE_WINDOW = 10.0
+
+    def __init__(self, index: int, trading_pairs: List[str]):
+        self.index = index
+        self.trading_pairs = trading_pairs
+        self.connected = False
+        self.connections_count = 0
+        self.message_count = 0
+        self.last_message_timestamp = 0.0
+        self._message_rate = 0.0
+        self._window_start_timestamp = 0.0
+        self._window_message_count = 0
+
+    @property
+    def reconnections_count(self) -> int:
+        return max(self.connections_count - 1, 0)
+
+    @property
+    def message_rate(self) -> float:
+        """
+        Messages per second received during the last complete `MESSAGE_RATE_WINDOW` seconds window
+        """
+        return self._message_rate
+
+    def record_connection(self, timestamp: float):
+        self.connected = True
+        self.connections_count += 1
+        self._window_start_timestamp = timestamp
+        self._window_message_count = 0
+
+    def record_disconnection(self):
+        self.connected = False
+        self._message_rate = 0.0
+
+    def record_message(self, timestamp: float):
+        self.message_count += 1
+        self.last_message_timestamp = timestamp
+        self._window_message_count += 1
+        elapsed = timestamp - self._window_start_timestamp
+        if elapsed >= self.MESSAGE_RATE_WINDOW:
+            self._message_rate = self._window_message_count / elapsed
+            self._window_start_timestamp = timestamp
+            self._window_message_count = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "index": self.index,
+            "trading_pairs": self.trading_pairs,
+            "connected": self.connected,
+            "reconnections": self.reconnections_count,
+            "messages": self.message_count,
+            "message_rate": self._message_rate,
+            "last_message_timestamp": self.last_message_timestamp,
+        }
+
+
 class OrderBookTrackerDataSource(metaclass=ABCMeta):
     FULL_ORDER_BOOK_RESET_DELTA_SECONDS = 60 * 60
+    # Delay between the (re)connections of consecutive websocket shards, to avoid connection bursts
+    WS_SHARD_CONNECTION_STAGGER_SECONDS = 1.0
+    # True when each diff message carries the range of update ids it covers (`first_update_id` to `update_id`), and
+    # the ranges of consecutive diffs are contiguous. The order book tracker then detects gaps and resynchronizes.
+    CONTIGUOUS_DIFF_UPDATE_IDS = False
 
     _logger: Optional[HummingbotLogger] = None
 
@@ -24,6 +91,9 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
         self._trading_pairs: List[str] = trading_pairs
         self._order_book_create_function = lambda: OrderBook()
         self._message_queue: Dict[str, asyncio.Queue] = defaultdict(asyncio.Queue)
+        self._ws_connections_count: int = 1
+        self._ws_shards: List[OrderBookWebsocketShard] = []
+        self._ws_shards_by_assistant: Dict[WSAssistant, OrderBookWebsocketShard] = {}
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -39,6 +109,23 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
     def order_book_create_function(self, func: Callable[[], OrderBook]):
         self._order_book_create_function = func
 
+    @property
+    def ws_connections_count(self) -> int:
+        return self._ws_connections_count
+
+    @ws_connections_count.setter
+    def ws_connections_count(self, count: int):
+        """
+        Sets the number of websocket connections the trading pairs are sharded across. Only used by data sources
+        implementing `_subscribe_channels_for_trading_pairs`, and it takes effect the next time
+        `listen_for_subscriptions` is started.
+        """
+        self._ws_connections_count = max(count, 1)
+
+    @property
+    def ws_shards(self) -> List[OrderBookWebsocketShard]:
+        return self._ws_shards
+
     @abstractmethod
     async def get_last_traded_prices(self, trading_pairs: List[str], domain: Optional[str] = None) -> Dict[str, float]:
         """
@@ -71,7 +158,13 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
         """
         Connects to the trade events and order diffs websocket endpoints and listens to the messages sent by the
         exchange. Each message is stored in its own queue.
+
+        When configured with more than one websocket connection, and if the data source supports it, the trading
+        pairs are sharded across several connections that reconnect independently of each other.
         """
+        if self._ws_sharding_enabled():
+            await self._listen_for_sharded_subscriptions()
+            return
         ws: Optional[WSAssistant] = None
         while True:
             try:
@@ -90,6 +183,54 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
             finally:
                 await self._on_order_stream_interruption(websocket_assistant=ws)
 
+    def _ws_sharding_enabled(self) -> bool:
+        subscribes_by_trading_pairs = (type(self)._subscribe_channels_for_trading_pairs
+                                       is not OrderBookTrackerDataSource._subscribe_channels_for_trading_pairs)
+        return subscribes_by_trading_pairs and min(self._ws_connections_count, len(self._trading_pairs)) > 1
+
+    async def _listen_for_sharded_subscriptions(self):
+        shards_count = min(self._ws_connections_count, len(self._trading_pairs))
+        self._ws_shards = [
+            OrderBookWebsocketShard(index=index, trading_pairs=self._trading_pairs[index::shards_count])
+            for index in range(shards_count)
+        ]
+        try:
+            await asyncio.gather(*[self._listen_for_shard_subscriptions(shard) for shard in self._ws_shards])
+        finally:
+            self._ws_shards_by_assistant.clear()
+
+    async def _listen_for_shard_subscriptions(self, shard: OrderBookWebsocketShard):
+        """
+        Keeps the websocket connection of one shard alive. Each shard waits for its own stagger delay before
+        connecting and before every reconnection, so that shards dropped together are not resubscribed all at once.
+        """
+        ws: Optional[WSAssistant] = None
+        while True:
+            try:
+                await self._sleep(shard.index * self.WS_SHARD_CONNECTION_STAGGER_SECONDS)
+                ws = await self._connected_websocket_assistant()
+                self._ws_shards_by_assistant[ws] = shard
+                await self._subscribe_channels_for_trading_pairs(ws, shard.trading_pairs)
+                shard.record_connection(self._time())
+                await self._process_websocket_messages(websocket_assistant=ws)
+            except asyncio.CancelledError:
+                raise
+            except ConnectionError as connection_exception:
+                self.logger().warning(
+                    f"The websocket connection of shard {shard.index} was closed ({connection_exception})")
+            except Exception:
+                self.logger().exception(
+                    f"Unexpected error occurred when listening to order book streams of shard {shard.index}. "
+                    f"Retrying...",
+                )
+                await self._sleep(1.0)
+            finally:
+                shard.record_disconnection()
+                if ws is not None:
+                    self._ws_shards_by_assistant.pop(ws, None)
+                await self._on_order_stream_interruption(websocket_assistant=ws)
+                ws = None
+
     async def listen_for_order_book_diffs(self, ev_loop: asyncio.AbstractEventLoop, output: asyncio.Queue):
         """
         Reads the order diffs events queue. For each event creates a diff message instance and adds it to the
@@ -207,6 +348,17 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
         """
         raise NotImplementedError
 
+    async def _subscribe_channels_for_trading_pairs(self, ws: WSAssistant, trading_pairs: List[str]):
+        """
+        Subscribes to the trade events and diff orders events of the given trading pairs through the provided
+        websocket connection. Data sources implementing it support sharding their trading pairs across several
+        websocket connections.
+
+        :param ws: the websocket assistant used to connect to the exchange
+        :param trading_pairs: the trading pairs to subscribe to
+        """
+        raise NotImplementedError
+
     def _channel_originating_message(self, event_message: Dict[str, Any]) -> str:
         """
         Identifies the channel for a particular event message. Used to find the correct queue to add the message in
@@ -230,9 +382,12 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
         pass
 
     async def _process_websocket_messages(self, websocket_assistant: WSAssistant):
+        shard = self._ws_shards_by_assistant.get(websocket_assistant)
         async for ws_response in websocket_assistant.iter_messages():
             data: Dict[str, Any] = ws_response.data
             if data is not None:  # data will be None when the websocket is disconnected
+                if shard is not None:
+                    shard.record_message(self._time())
                 channel: str = self._channel_originating_message(event_message=data)
                 valid_channels = self._get_messages_queue_keys()
                 if channel in valid_channels:
@@ -0,0 +1,22 @@
+# distutils: language=c++
+
+from libc.stdint cimport int64_t
+from libcpp.vector cimport vector
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+from hummingbot.core.data_type.order_book cimport OrderBook
+from hummingbot.core.data_type.order_book_query_result cimport OrderBookQueryResult
+cimport numpy as np
+
+
+cdef class SharedMemoryOrderBook(OrderBook):
+    cdef:
+        str _trading_pair
+        object _buffer
+        int64_t _sequence
+
+    cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
+    cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
+    cdef np.ndarray c_bids_to_numpy(self, int64_t depth, double bucket_size)
+    cdef np.ndarray c_asks_to_numpy(self, int64_t depth, double bucket_size)
+    cdef double c_get_price(self, bint is_buy) except? -1
+    cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume)
@@ -0,0 +1,155 @@
+# distutils: language=c++
+# distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
+from typing import Iterator, Optional, Tuple
+
+import numpy as np
+
+from libc.math cimport ceil, floor
+
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+
+cimport numpy as np
+
+NaN = float("nan")
+# Tolerance (in number of buckets) absorbing the floating point error of the price / bucket size division
+cdef double BUCKET_EPSILON = 1e-9
+EMPTY_LADDER = np.empty((0, 3), dtype=np.float64)
+
+
+cdef class SharedMemoryOrderBook(OrderBook):
+    """
+    Read-only view of an order book published in a `SharedOrderBookBuffer` by another process. It is an `OrderBook`
+    for its consumers (connectors, strategies), limited to the published depth: the ladders are read from the shared
+    memory on each query instead of being copied into the view.
+
+    `refresh()` takes the update id, best prices and last trade price of the last publication, and emits the best
+    price update event. Trades are forwarded through `apply_trade()`, which emits the trade event as usual. Applying
+    diffs or snapshots raises, the order book is only updated by the publishing process.
+    """
+
+    def __init__(self, trading_pair: str, buffer):
+        super().__init__()
+        self._trading_pair = trading_pair
+        self._buffer = buffer
+        self._sequence = 0
+
+    @property
+    def trading_pair(self) -> str:
+        return self._trading_pair
+
+    def refresh(self) -> bool:
+        """
+        :return: False if nothing was published since the last refresh
+        """
+        cdef:
+            double previous_best_bid = self._best_bid
+            double previous_best_ask = self._best_ask
+        if self._buffer is None:
+            return False
+        sequence = self._buffer.sequence
+        if sequence == 0 or sequence == self._sequence:
+            return False
+        top = self._buffer.top()
+        self._sequence = sequence
+        self._snapshot_uid = self._last_diff_uid = top.update_id
+        self._best_bid = top.best_bid
+        self._best_ask = top.best_ask
+        # NaN means no trade was published yet
+        if top.last_trade_price == top.last_trade_price:
+            self._last_trade_price = top.last_trade_price
+        self.c_notify_best_price_update(previous_best_bid, previous_best_ask)
+        return True
+
+    def release(self):
+        """
+        Detaches the view from its buffer, which can then be closed. The view is empty afterwards.
+        """
+        self._buffer = None
+
+    def _ladders(self) -> Tuple[np.ndarray, np.ndarray]:
+        if self._buffer is None:
+            return EMPTY_LADDER, EMPTY_LADDER
+        snapshot = self._buffer.snapshot()
+        return snapshot.bids, snapshot.asks
+
+    cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
+        raise NotImplementedError("Order books shared by the market data process are read-only.")
+
+    cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
+        raise NotImplementedError("Order books shared by the market data process are read-only.")
+
+    def to_numpy(self, depth: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        bids, asks = self._ladders()
+        return bids[:depth], asks[:depth]
+
+    def get_top_levels(self, n: int, bucket_size: float = 0) -> Tuple[np.ndarray, np.ndarray]:
+        if bucket_size < 0:
+            raise ValueError(f"The bucket size must be positive (got {bucket_size}).")
+        # Both sides come from the same publication
+        bids, asks = self._ladders()
+        return bucket_levels(bids, n, bucket_size, True), bucket_levels(asks, n, bucket_size, False)
+
+    cdef np.ndarray c_bids_to_numpy(self, int64_t depth, double bucket_size):
+        return bucket_levels(self._ladders()[0], depth, bucket_size, True)
+
+    cdef np.ndarray c_asks_to_numpy(self, int64_t depth, double bucket_size):
+        return bucket_levels(self._ladders()[1], depth, bucket_size, False)
+
+    def bid_entries(self) -> Iterator[OrderBookRow]:
+        for price, amount, update_id in self._ladders()[0]:
+            yield OrderBookRow(float(price), float(amount), int(update_id))
+
+    def ask_entries(self) -> Iterator[OrderBookRow]:
+        for price, amount, update_id in self._ladders()[1]:
+            yield OrderBookRow(float(price), float(amount), int(update_id))
+
+    cdef double c_get_price(self, bint is_buy) except? -1:
+        cdef double price = NaN
+        if self._buffer is not None:
+            top = self._buffer.top()
+            price = top.best_ask if is_buy else top.best_bid
+        if price != price:
+            raise EnvironmentError("Order book is empty - no price quote is possible.")
+        return price
+
+    cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume):
+        # The VWAP of no volume is undefined
+        if volume <= 0:
+            return OrderBookQueryResult(NaN, volume, NaN, 0)
+        return OrderBook.c_get_vwap_for_volume(self, is_buy, volume)
+
+
+cdef np.ndarray bucket_levels(np.ndarray levels, int64_t depth, double bucket_size, bint is_bid):
+    """
+    Aggregates [price, amount, update_id] levels (best first) into price buckets like `OrderBook.get_top_levels()`,
+    keeping at most `depth` buckets (all of them if negative). The levels are only truncated if `bucket_size` is 0.
+    """
+    cdef:
+        double[:, ::1] source
+        np.ndarray[np.float64_t, ndim=2] result
+        double[:, ::1] view
+        int64_t count = 0
+        int64_t index
+        double price
+    if bucket_size <= 0:
+        return levels if depth < 0 else levels[:depth]
+    source = np.ascontiguousarray(levels)
+    result = np.empty((source.shape[0], 3), dtype=np.float64)
+    view = result
+    for index in range(source.shape[0]):
+        price = source[index, 0]
+        if is_bid:
+            price = floor(price / bucket_size + BUCKET_EPSILON) * bucket_size
+        else:
+            price = ceil(price / bucket_size - BUCKET_EPSILON) * bucket_size
+        if count > 0 and view[count - 1, 0] == price:
+            view[count - 1, 1] += source[index, 1]
+            view[count - 1, 2] = max(view[count - 1, 2], source[index, 2])
+            continue
+        if count == depth:
+            break
+        view[count, 0] = price
+        view[count, 1] = source[index, 1]
+        view[count, 2] = source[index, 2]
+        count += 1
+    return result[:count]
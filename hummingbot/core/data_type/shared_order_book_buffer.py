@@ -0,0 +1,177 @@
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import Callable, NamedTuple, TypeVar
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book import OrderBook
+
+T = TypeVar("T")
+
+NaN = float("nan")
+
+
+class SharedOrderBookSnapshot(NamedTuple):
+    bids: np.ndarray
+    asks: np.ndarray
+    update_id: int
+    last_trade_price: float
+    timestamp: float
+
+
+class SharedOrderBookTop(NamedTuple):
+    update_id: int
+    best_bid: float
+    best_ask: float
+    last_trade_price: float
+
+
+class SharedOrderBookBuffer:
+    """
+    Top of an order book (best `depth` levels of each side, update id, last trade price) stored in a shared memory
+    segment, written by a single process and read by any number of processes.
+
+    Consistency is ensured with a seqlock: the writer increments the sequence number before (making it odd) and after
+    (making it even again) updating the content, and the readers retry when the sequence number was odd or changed
+    while they were reading. Readers never block the writer, and read the content in place without copying it.
+
+    Layout: int64 header [sequence, update_id, bids count, asks count], float64 [last trade price, timestamp], then
+    the bids and the asks ladders as float64 [price, amount, update_id] rows.
+    """
+
+    INT_HEADER_SIZE = 4
+    FLOAT_HEADER_SIZE = 2
+    ROW_SIZE = 3
+    MAX_READ_ATTEMPTS = 10000
+
+    def __init__(self, shared_memory: SharedMemory, depth: int, owner: bool):
+        self._shared_memory = shared_memory
+        self._depth = depth
+        self._owner = owner
+        buffer = shared_memory.buf
+        self._ints = np.ndarray((self.INT_HEADER_SIZE,), dtype=np.int64, buffer=buffer, offset=0)
+        offset = self.INT_HEADER_SIZE * 8
+        self._floats = np.ndarray((self.FLOAT_HEADER_SIZE,), dtype=np.float64, buffer=buffer, offset=offset)
+        offset += self.FLOAT_HEADER_SIZE * 8
+        self._bids = np.ndarray((depth, self.ROW_SIZE), dtype=np.float64, buffer=buffer, offset=offset)
+        offset += depth * self.ROW_SIZE * 8
+        self._asks = np.ndarray((depth, self.ROW_SIZE), dtype=np.float64, buffer=buffer, offset=offset)
+
+    @classmethod
+    def size_for_depth(cls, depth: int) -> int:
+        return (cls.INT_HEADER_SIZE + cls.FLOAT_HEADER_SIZE + 2 * depth * cls.ROW_SIZE) * 8
+
+    @classmethod
+    def create(cls, depth: int) -> "SharedOrderBookBuffer":
+        shared_memory = SharedMemory(create=True, size=cls.size_for_depth(depth))
+        buffer = cls(shared_memory=shared_memory, depth=depth, owner=True)
+        buffer._ints[:] = 0
+        buffer._floats[:] = NaN
+        return buffer
+
+    @classmethod
+    def attach(cls, name: str, depth: int) -> "SharedOrderBookBuffer":
+        """
+        Attaches to a segment created by another process. The creating process is the only one unlinking it.
+        """
+        shared_memory = SharedMemory(name=name)
+        # The resource tracker would otherwise unlink the segment when the attaching process exits
+        resource_tracker.unregister(shared_memory._name, "shared_memory")
+        return cls(shared_memory=shared_memory, depth=depth, owner=False)
+
+    @property
+    def name(self) -> str:
+        return self._shared_memory.name
+
+    @property
+    def depth(self) -> int:
+        return self._depth
+
+    @property
+    def sequence(self) -> int:
+        """
+        Even number, incremented by 2 on each publication. 0 means nothing was published yet.
+        """
+        return int(self._ints[0])
+
+    @property
+    def update_id(self) -> int:
+        return self.read(lambda bids, asks, bids_count, asks_count: int(self._ints[1]))
+
+    @property
+    def last_trade_price(self) -> float:
+        return self.read(lambda bids, asks, bids_count, asks_count: float(self._floats[0]))
+
+    def top(self) -> SharedOrderBookTop:
+        """
+        Reads the header and the best prices (NaN for an empty side) without copying the ladders.
+        """
+        ints = self._ints
+        floats = self._floats
+        return self.read(lambda bids, asks, bids_count, asks_count: SharedOrderBookTop(
+            update_id=int(ints[1]),
+            best_bid=float(bids[0, 0]) if bids_count > 0 else NaN,
+            best_ask=float(asks[0, 0]) if asks_count > 0 else NaN,
+            last_trade_price=float(floats[0]),
+        ))
+
+    def publish(self, bids: np.ndarray, asks: np.ndarray, update_id: int, last_trade_price: float, timestamp: float):
+        """
+        :param bids: [price, amount, update_id] rows, best first. Rows after `depth` are ignored.
+        :param asks: [price, amount, update_id] rows, best first. Rows after `depth` are ignored.
+        """
+        bids_count = min(len(bids), self._depth)
+        asks_count = min(len(asks), self._depth)
+        ints = self._ints
+        ints[0] += 1
+        if bids_count > 0:
+            self._bids[:bids_count] = bids[:bids_count]
+        if asks_count > 0:
+            self._asks[:asks_count] = asks[:asks_count]
+        ints[1] = update_id
+        ints[2] = bids_count
+        ints[3] = asks_count
+        self._floats[0] = last_trade_price
+        self._floats[1] = timestamp
+        ints[0] += 1
+
+    def publish_order_book(self, order_book: OrderBook, timestamp: float):
+        bids, asks = order_book.to_numpy(self._depth)
+        self.publish(bids=bids,
+                     asks=asks,
+                     update_id=max(order_book.snapshot_uid, order_book.last_diff_uid),
+                     last_trade_price=order_book.last_trade_price,
+                     timestamp=timestamp)
+
+    def read(self, function: Callable[[np.ndarray, np.ndarray, int, int], T]) -> T:
+        """
+        Calls `function(bids, asks, bids_count, asks_count)` with views of the ladders, until it ran on a consistent
+        content. The function must not keep references to the views.
+        """
+        ints = self._ints
+        for _ in range(self.MAX_READ_ATTEMPTS):
+            sequence = ints[0]
+            if sequence & 1:
+                continue
+            result = function(self._bids, self._asks, int(ints[2]), int(ints[3]))
+            if ints[0] == sequence:
+                return result
+        raise BlockingIOError(f"Could not read a consistent order book from the shared memory segment {self.name}.")
+
+    def snapshot(self) -> SharedOrderBookSnapshot:
+        ints = self._ints
+        floats = self._floats
+        return self.read(lambda bids, asks, bids_count, asks_count: SharedOrderBookSnapshot(
+            bids=bids[:bids_count].copy(),
+            asks=asks[:asks_count].copy(),
+            update_id=int(ints[1]),
+            last_trade_price=float(floats[0]),
+            timestamp=float(floats[1]),
+        ))
+
+    def close(self):
+        # Views have to be released before the shared memory can be closed
+        self._ints = self._floats = self._bids = self._asks = None
+        self._shared_memory.close()
+        if self._owner:
+            self._shared_memory.unlink()
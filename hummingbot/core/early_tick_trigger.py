@@ -0,0 +1,93 @@
+import time
+from typing import TYPE_CHECKING, Dict, Iterable, Set, Tuple
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.event.event_forwarder import EventForwarder, SourceInfoEventForwarder
+from hummingbot.core.event.events import MarketEvent, OrderBookBestPriceUpdateEvent, OrderBookEvent
+from hummingbot.core.pubsub import PubSub
+from hummingbot.core.time_iterator import TimeIterator
+
+if TYPE_CHECKING:
+    from hummingbot.connector.connector_base import ConnectorBase
+
+
+class EarlyTickTrigger:
+    """
+    Requests early ticks for a time iterator (usually a strategy) from a clock running in hybrid mode.
+
+    An early tick is requested when the best bid or ask of one of the watched order books moved by more than
+    `price_threshold` (relative) since the last request, or when an order is filled on one of the watched markets.
+    The clock debounces the requests, and keeps ticking the iterator periodically as well.
+    """
+
+    def __init__(self, iterator: TimeIterator, price_threshold: float):
+        self._iterator = iterator
+        self._price_threshold = price_threshold
+        self._markets: Set["ConnectorBase"] = set()
+        self._order_books: Set[OrderBook] = set()
+        self._reference_prices: Dict[OrderBook, Tuple[float, float]] = {}
+        self._best_price_update_forwarder = SourceInfoEventForwarder(self._did_update_best_price)
+        self._order_filled_forwarder = EventForwarder(self._did_fill_order)
+
+    @property
+    def price_threshold(self) -> float:
+        return self._price_threshold
+
+    @property
+    def order_books(self) -> Set[OrderBook]:
+        return self._order_books
+
+    def watch_markets(self, markets: Iterable["ConnectorBase"]):
+        """
+        Watches the fills and all the order books of the markets. Order books created after the call (e.g. when the
+        order book tracker finishes initializing) are picked up by `update_order_books()`.
+        """
+        for market in markets:
+            if market in self._markets:
+                continue
+            self._markets.add(market)
+            market.add_listener(MarketEvent.OrderFilled, self._order_filled_forwarder)
+        self.update_order_books()
+
+    def update_order_books(self):
+        for market in self._markets:
+            try:
+                order_books = market.order_books
+            except (AttributeError, NotImplementedError):
+                # AMM connectors don't have order books
+                continue
+            for order_book in order_books.values():
+                if order_book not in self._order_books:
+                    self._order_books.add(order_book)
+                    order_book.add_listener(OrderBookEvent.BestPriceUpdateEvent, self._best_price_update_forwarder)
+
+    def stop(self):
+        for market in self._markets:
+            market.remove_listener(MarketEvent.OrderFilled, self._order_filled_forwarder)
+        for order_book in self._order_books:
+            order_book.remove_listener(OrderBookEvent.BestPriceUpdateEvent, self._best_price_update_forwarder)
+        self._markets.clear()
+        self._order_books.clear()
+        self._reference_prices.clear()
+
+    def _request_early_tick(self):
+        clock = self._iterator.clock
+        if clock is not None:
+            # The markets are ticked first, so that their timestamp is not behind the iterator one
+            clock.request_early_tick(self._iterator, time.perf_counter(), tuple(self._markets))
+
+    def _did_update_best_price(self, event_tag: int, order_book: PubSub, event: OrderBookBestPriceUpdateEvent):
+        reference_bid, reference_ask = self._reference_prices.get(order_book, (float("nan"), float("nan")))
+        if self._moved(reference_bid, event.best_bid) or self._moved(reference_ask, event.best_ask):
+            self._reference_prices[order_book] = (event.best_bid, event.best_ask)
+            if reference_bid == reference_bid or reference_ask == reference_ask:
+                self._request_early_tick()
+
+    def _did_fill_order(self, _):
+        self._request_early_tick()
+
+    def _moved(self, reference_price: float, price: float) -> bool:
+        if reference_price != reference_price or reference_price == 0:
+            # No reference yet (NaN)
+            return price == price
+        return abs(price - reference_price) / reference_price > self._price_threshold
@@ -37,6 +37,7 @@ class MarketEvent(Enum):
 
 class OrderBookEvent(int, Enum):
     TradeEvent = 901
+    BestPriceUpdateEvent = 902
     OrderBookDataSourceUpdateEvent = 904
 
 
@@ -156,6 +157,11 @@ class OrderBookTradeEvent(NamedTuple):
     is_taker: bool = True  # CEXs deliver trade events from the taker's perspective
 
 
+class OrderBookBestPriceUpdateEvent(NamedTuple):
+    best_bid: float
+    best_ask: float
+
+
 class OrderFilledEvent(NamedTuple):
     timestamp: float
     order_id: str
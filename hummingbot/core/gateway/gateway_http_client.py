@@ -1,9 +1,10 @@
+import asyncio
 import logging
 import re
 import ssl
 from decimal import Decimal
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Tuple, Union
 
 import aiohttp
 from aiohttp import ContentTypeError
@@ -12,6 +13,7 @@ from hummingbot.client.config.security import Security
 from hummingbot.core.data_type.common import OrderType, PositionSide
 from hummingbot.core.data_type.in_flight_order import InFlightOrder
 from hummingbot.core.event.events import TradeType
+from hummingbot.core.utils.async_utils import safe_gather
 from hummingbot.logger import HummingbotLogger
 
 if TYPE_CHECKING:
@@ -39,6 +41,14 @@ class GatewayError(Enum):
     UnknownError = 1099
 
 
+class GatewayPriceRequest(NamedTuple):
+    base_asset: str
+    quote_asset: str
+    amount: Decimal
+    side: TradeType
+    pool_id: Optional[str] = None
+
+
 class GatewayHttpClient:
     """
     An HTTP client for making requests to the gateway API.
@@ -47,6 +57,7 @@ class GatewayHttpClient:
     _ghc_logger: Optional[HummingbotLogger] = None
     _shared_client: Optional[aiohttp.ClientSession] = None
     _base_url: str
+    _batch_price_supported: Optional[bool] = None
 
     __instance = None
 
@@ -391,24 +402,12 @@ class GatewayHttpClient:
             fail_silently: bool = False,
             pool_id: Optional[str] = None
     ) -> Dict[str, Any]:
-        if side not in [TradeType.BUY, TradeType.SELL]:
-            raise ValueError("Only BUY and SELL prices are supported.")
-
         request_payload = {
             "chain": chain,
             "network": network,
             "connector": connector,
-            "base": base_asset,
-            "quote": quote_asset,
-            "amount": f"{amount:.18f}",
-            "side": side.name,
-            "allowedSlippage": "0/1",  # hummingbot applies slippage itself
+            **self._price_request_payload(GatewayPriceRequest(base_asset, quote_asset, amount, side, pool_id)),
         }
-
-        if pool_id not in ["", None]:
-            request_payload["poolId"] = pool_id
-
-        # XXX(martin_kou): The amount is always output with 18 decimal places.
         return await self.api_request(
             "post",
             "amm/price",
@@ -416,6 +415,82 @@ class GatewayHttpClient:
             fail_silently=fail_silently,
         )
 
+    async def get_prices(
+            self,
+            chain: str,
+            network: str,
+            connector: str,
+            price_requests: List[GatewayPriceRequest],
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Fetches the prices for many (pair, side, amount) requests at once, using the batched amm/prices endpoint.
+        Falls back to concurrent amm/price requests when the batch request fails. Only a 404 Not Found answer, from a
+        Gateway instance without the batched endpoint, is remembered for the following calls.
+        :returns The price responses in the order of the requests. A failed request is returned as its exception.
+        """
+        if len(price_requests) == 0:
+            return []
+        payloads: List[Dict[str, Any]] = [self._price_request_payload(request) for request in price_requests]
+
+        if self._batch_price_supported is not False:
+            status, response = await self._request_batch_prices(
+                {"chain": chain, "network": network, "connector": connector, "requests": payloads}
+            )
+            prices: Optional[List[Dict[str, Any]]] = (
+                response.get("prices") if status == 200 and isinstance(response, dict) else None
+            )
+            if isinstance(prices, list) and len(prices) == len(price_requests):
+                self._batch_price_supported = True
+                return [
+                    ValueError(f"Error on POST amm/prices Error: {price['error']}") if "error" in price else price
+                    for price in prices
+                ]
+            if status == 404:
+                self.logger().info("Gateway does not support batched price requests. Requesting prices one by one.")
+                self._batch_price_supported = False
+            # Any other failure (e.g. a transient server error) only falls back for this call
+
+        return await safe_gather(*[
+            self.api_request("post", "amm/price", {"chain": chain, "network": network, "connector": connector, **payload})
+            for payload in payloads
+        ], return_exceptions=True)
+
+    async def _request_batch_prices(self, request_payload: Dict[str, Any]) -> Tuple[Optional[int], Any]:
+        """
+        Posts the batched price requests without raising errors.
+        :returns The response status and the parsed response, or (None, None) if Gateway could not be reached.
+        """
+        client = self._http_client(self._client_config_map)
+        try:
+            response = await client.post(f"{self.base_url}/amm/prices", json=request_payload)
+            try:
+                return response.status, await response.json()
+            except ContentTypeError:
+                return response.status, await response.text()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            return None, None
+
+    @staticmethod
+    def _price_request_payload(price_request: GatewayPriceRequest) -> Dict[str, Any]:
+        if price_request.side not in [TradeType.BUY, TradeType.SELL]:
+            raise ValueError("Only BUY and SELL prices are supported.")
+
+        # XXX(martin_kou): The amount is always output with 18 decimal places.
+        request_payload = {
+            "base": price_request.base_asset,
+            "quote": price_request.quote_asset,
+            "amount": f"{price_request.amount:.18f}",
+            "side": price_request.side.name,
+            "allowedSlippage": "0/1",  # hummingbot applies slippage itself
+        }
+
+        if price_request.pool_id not in ["", None]:
+            request_payload["poolId"] = price_request.pool_id
+
+        return request_payload
+
     async def get_transaction_status(
             self,
             chain: str,
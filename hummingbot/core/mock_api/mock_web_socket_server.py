@@ -1,6 +1,6 @@
 import asyncio
 from threading import Event, Thread
-from typing import Optional
+from typing import List, Optional
 import socket
 import errno
 from urllib.parse import urlparse
@@ -158,7 +158,8 @@ class MockWebSocketServer:
     _started : if started indicator
     host : host
     port : port
-    websocket : websocket
+    websocket : the last connected websocket
+    websockets : all the connected websockets, in connection order
     _stock_responses : stocked web response
     host : host
 
@@ -174,6 +175,7 @@ class MockWebSocketServer:
         self.host = host
         self.port = port
         self.websocket: Optional[web.WebSocketResponse] = None
+        self.websockets: List[web.WebSocketResponse] = []
         self._websocket_initialized_event = Event()
         self.stock_responses = {}
         self._app: Optional[web.Application] = None
@@ -195,14 +197,16 @@ class MockWebSocketServer:
         """
         Stock the json response
         """
-        self.websocket = web.WebSocketResponse()
-        await self.websocket.prepare(request)
+        websocket = web.WebSocketResponse()
+        self.websocket = websocket
+        self.websockets.append(websocket)
+        await websocket.prepare(request)
         self._websocket_initialized_event.set()
-        async for msg in self.websocket:
+        async for msg in websocket:
             stock_responses = [v for k, v in self.stock_responses.items() if k in msg]
             if len(stock_responses) > 0:
-                await self.websocket.send_json(stock_responses[0])
-        return self.websocket
+                await websocket.send_json(stock_responses[0])
+        return websocket
 
     @property
     def started(self) -> bool:
@@ -246,7 +250,8 @@ class MockWebSocketServer:
         self._thread.start()
 
     async def _on_shutdown(self, _: web.Application):
-        await self.websocket.close()
+        for websocket in self.websockets:
+            await websocket.close()
 
     def stop(self):
         """
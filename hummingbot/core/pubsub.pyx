@@ -15,6 +15,7 @@ from libcpp.vector cimport vector
 from enum import Enum
 import logging
 import random
+import time
 from typing import List
 
 from hummingbot.logger import HummingbotLogger
@@ -22,6 +23,16 @@ from hummingbot.core.event.event_listener import EventListener
 from hummingbot.core.event.event_listener cimport EventListener
 
 class_logger = None
+cdef object event_profiler = None
+
+
+def set_event_profiler(profiler: object):
+    """
+    Sets the profiler recording the time spent in the listeners of each event type (see `TickProfiler`), or None to
+    stop profiling the events.
+    """
+    global event_profiler
+    event_profiler = profiler
 
 
 cdef class PubSub:
@@ -151,9 +162,13 @@ cdef class PubSub:
             EventListenersCollection listeners
             object listener_weafref
             EventListener typed_listener
+            object profiler = event_profiler
+            double start_time = 0
         if it == self._events.end():
             return
 
+        if profiler is not None:
+            start_time = time.perf_counter()
         # It is extremely important that this set of listeners is a C++ copy - because listeners are allowed to call
         # c_remove_listener(), which breaks the iterator if we're using the underlying set.
         listeners = deref(it).second
@@ -167,3 +182,5 @@ cdef class PubSub:
                 self.c_log_exception(event_tag, arg)
             finally:
                 typed_listener.c_set_event_info(0, None)
+        if profiler is not None:
+            profiler.record_event(event_tag, time.perf_counter() - start_time)
@@ -0,0 +1,176 @@
+import logging
+import os
+import pickle
+import time
+from collections import deque
+from decimal import Decimal
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from hummingbot.connector.utils import split_hb_trading_pair
+from hummingbot.core.gateway.utils import unwrap_token_symbol
+from hummingbot.logger import HummingbotLogger
+
+# A conversion step: the pair whose price is used, and whether the price is inverted
+RouteStep = Tuple[str, bool]
+
+
+class RateCacheEntry(NamedTuple):
+    price: Decimal
+    timestamp: float
+
+
+class RateCacheSnapshot(NamedTuple):
+    timestamp: float
+    prices: Dict[str, Decimal]
+
+
+class RateCache:
+    """
+    In-memory store of the prices fetched or pushed by a rate source, answering the rate lookups synchronously.
+
+    Each price expires `ttl` seconds after its own last update, so the pairs a source stops reporting are not used
+    anymore while the others remain available. The rates of pairs without a price of their own are computed over a
+    conversion graph whose nodes are the tokens and whose edges are the priced pairs, through the route with the
+    fewest conversions. The routes are kept until pairs are added to the graph, so price updates don't recompute them.
+    """
+
+    DEFAULT_TTL = 5 * 60.0
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self, ttl: float = DEFAULT_TTL, time_provider: Callable[[], float] = time.time):
+        self._ttl = ttl
+        self._time_provider = time_provider
+        self._entries: Dict[str, RateCacheEntry] = {}
+        self._edges: Dict[str, Dict[str, RouteStep]] = {}
+        self._routes: Dict[Tuple[str, str], Optional[List[RouteStep]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def prices(self) -> Dict[str, Decimal]:
+        """
+        The prices that have not expired
+        """
+        now = self._time_provider()
+        return {pair: entry.price for pair, entry in self._entries.items() if now - entry.timestamp <= self._ttl}
+
+    def update(self, prices: Dict[str, Decimal], timestamp: Optional[float] = None):
+        timestamp = self._time_provider() if timestamp is None else timestamp
+        for pair, price in prices.items():
+            if pair not in self._entries:
+                self._add_edges(pair)
+            self._entries[pair] = RateCacheEntry(price=price, timestamp=timestamp)
+
+    def clear(self):
+        self._entries.clear()
+        self._edges.clear()
+        self._routes.clear()
+
+    def rate(self, pair: str) -> Optional[Decimal]:
+        """
+        Finds the conversion rate of a trading pair from its own price, from the price of the reverse pair, or from
+        the prices along the shortest route between its tokens.
+
+        :param pair: A trading pair, e.g. BTC-USDT
+        :return: the conversion rate, or None if there is no route with prices that have not expired
+        """
+        now = self._time_provider()
+        entry = self._entries.get(pair)
+        if entry is not None and now - entry.timestamp <= self._ttl:
+            return entry.price
+        base, quote = split_hb_trading_pair(trading_pair=pair)
+        if unwrap_token_symbol(base) == unwrap_token_symbol(quote):
+            return Decimal("1")
+        rate = self._rate_through_graph(base, quote, now)
+        if rate is None:
+            rate = self._rate_through_graph(unwrap_token_symbol(base), unwrap_token_symbol(quote), now)
+        return rate
+
+    def save(self, file_path: str):
+        snapshot = RateCacheSnapshot(timestamp=self._time_provider(), prices=self.prices)
+        try:
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            # Written to a temporary file first, so that a crash while saving never leaves a truncated snapshot.
+            temp_file_path = f"{file_path}.tmp"
+            with open(temp_file_path, "wb") as file:
+                pickle.dump(snapshot, file)
+            os.replace(temp_file_path, file_path)
+        except Exception:
+            self.logger().warning(f"Could not save the rates snapshot {file_path}.", exc_info=True)
+
+    def load(self, file_path: str, max_age: float) -> int:
+        """
+        Restores the prices of a snapshot younger than `max_age` seconds. They are considered as updated now, and are
+        replaced by the next prices received from the source.
+
+        :return: the number of restored prices
+        """
+        if not os.path.exists(file_path):
+            return 0
+        try:
+            with open(file_path, "rb") as file:
+                snapshot: RateCacheSnapshot = pickle.load(file)
+        except Exception:
+            self.logger().warning(f"Could not read the rates snapshot {file_path}. Ignoring it.", exc_info=True)
+            return 0
+        if self._time_provider() - snapshot.timestamp > max_age:
+            return 0
+        self.update({pair: price for pair, price in snapshot.prices.items() if pair not in self._entries})
+        return len(snapshot.prices)
+
+    def _add_edges(self, pair: str):
+        base, quote = split_hb_trading_pair(trading_pair=pair)
+        self._edges.setdefault(base, {})[quote] = (pair, False)
+        self._edges.setdefault(quote, {}).setdefault(base, (pair, True))
+        # A new pair can shorten the known routes or create the missing ones
+        self._routes.clear()
+
+    def _rate_through_graph(self, base: str, quote: str, now: float) -> Optional[Decimal]:
+        route_key = (base, quote)
+        if route_key not in self._routes:
+            self._routes[route_key] = self._shortest_route(base, quote)
+        route = self._routes[route_key]
+        if route is None:
+            return None
+        if any(now - self._entries[pair].timestamp > self._ttl for pair, _ in route):
+            # Some prices of the usual route expired, looking for another one made of prices still valid
+            route = self._shortest_route(base, quote, now=now)
+            if route is None:
+                return None
+        rate = Decimal("1")
+        for pair, inverted in route:
+            price = self._entries[pair].price
+            rate = rate / price if inverted else rate * price
+        return rate
+
+    def _shortest_route(self, base: str, quote: str, now: Optional[float] = None) -> Optional[List[RouteStep]]:
+        """
+        Breadth-first search of the route with the fewest conversions, only through the prices that have not expired
+        at `now` if it is set.
+        """
+        if base not in self._edges or quote not in self._edges:
+            return None
+        previous_steps: Dict[str, Optional[Tuple[str, RouteStep]]] = {base: None}
+        tokens_to_visit = deque([base])
+        while len(tokens_to_visit) > 0:
+            token = tokens_to_visit.popleft()
+            if token == quote:
+                route = []
+                while previous_steps[token] is not None:
+                    token, step = previous_steps[token]
+                    route.append(step)
+                return list(reversed(route))
+            for next_token, step in self._edges[token].items():
+                if next_token in previous_steps:
+                    continue
+                if now is None or now - self._entries[step[0]].timestamp <= self._ttl:
+                    previous_steps[next_token] = (token, step)
+                    tokens_to_visit.append(next_token)
+        return None
@@ -1,12 +1,16 @@
 import asyncio
 import logging
+import time
 from decimal import Decimal
+from os.path import join, realpath
 from typing import Dict, Optional
 
 import hummingbot.client.settings  # noqa
+from hummingbot import data_path
 from hummingbot.connector.utils import combine_to_hb_trading_pair
 from hummingbot.core.network_base import NetworkBase
 from hummingbot.core.network_iterator import NetworkStatus
+from hummingbot.core.rate_oracle.rate_cache import RateCache
 from hummingbot.core.rate_oracle.sources.ascend_ex_rate_source import AscendExRateSource
 from hummingbot.core.rate_oracle.sources.binance_rate_source import BinanceRateSource
 from hummingbot.core.rate_oracle.sources.binance_us_rate_source import BinanceUSRateSource
@@ -37,12 +41,20 @@ RATE_ORACLE_SOURCES = {
 class RateOracle(NetworkBase):
     """
     RateOracle provides conversion rates for any given pair token symbols in both async and sync fashions.
-    It achieves this by query URL on a given source for prices and store them, either in cache or as an object member.
-    The find_rate is then used on these prices to find a rate on a given pair.
+    It achieves this by query URL on a given source for prices and store them in a RateCache, which finds the rate of
+    a given pair from the stored prices, directly or through a route of conversions between them.
+    When the source supports it, the prices are also pushed by the source as they change, and the polling interval is
+    only used to refresh the prices of the whole market universe.
+    When snapshot_enabled is set, the prices are saved locally while the oracle runs and restored when it starts.
     """
     _logger: Optional[HummingbotLogger] = None
     _shared_instance: "RateOracle" = None
 
+    POLL_INTERVAL = 1.0
+    STREAMING_POLL_INTERVAL = 60.0
+    SNAPSHOT_INTERVAL = 60.0
+    SNAPSHOT_MAX_AGE = 24 * 60 * 60
+
     @classmethod
     def get_instance(cls) -> "RateOracle":
         if cls._shared_instance is None:
@@ -58,10 +70,13 @@ class RateOracle(NetworkBase):
     def __init__(self, source: Optional[RateSourceBase] = None, quote_token: Optional[str] = None):
         super().__init__()
         self._source: RateSourceBase = source if source is not None else BinanceRateSource()
-        self._prices: Dict[str, Decimal] = {}
+        self._rate_cache = RateCache()
         self._fetch_price_task: Optional[asyncio.Task] = None
+        self._price_stream_task: Optional[asyncio.Task] = None
         self._ready_event = asyncio.Event()
         self._quote_token = quote_token if quote_token is not None else "USD"
+        self._snapshot_enabled = False
+        self._last_snapshot_timestamp = 0.0
 
     def __str__(self):
         return f"{self._source.name} rate oracle"
@@ -99,25 +114,46 @@ class RateOracle(NetworkBase):
     def quote_token(self, new_token: str):
         if new_token != self._quote_token:
             self._quote_token = new_token
-            self._prices = {}
+            self._rate_cache.clear()
+
+    @property
+    def snapshot_enabled(self) -> bool:
+        return self._snapshot_enabled
+
+    @snapshot_enabled.setter
+    def snapshot_enabled(self, enabled: bool):
+        self._snapshot_enabled = enabled
+
+    @property
+    def snapshot_file_path(self) -> str:
+        return realpath(join(data_path(), "rate_oracle", f"{self._source.name}_{self._quote_token}.pickle"))
 
     @property
     def prices(self) -> Dict[str, Decimal]:
         """
-        Actual prices retrieved from URL
+        Actual prices retrieved from URL, or pushed by the source, that have not expired
         """
-        return self._prices.copy()
+        return self._rate_cache.prices
 
     async def start_network(self):
         await self.stop_network()
+        if self._snapshot_enabled and self._rate_cache.load(self.snapshot_file_path, self.SNAPSHOT_MAX_AGE) > 0:
+            self._ready_event.set()
         self._fetch_price_task = safe_ensure_future(self._fetch_price_loop())
+        if self._source.supports_price_stream:
+            self._price_stream_task = safe_ensure_future(self._price_stream_loop())
 
     async def stop_network(self):
         if self._fetch_price_task is not None:
             self._fetch_price_task.cancel()
             self._fetch_price_task = None
+        if self._price_stream_task is not None:
+            self._price_stream_task.cancel()
+            self._price_stream_task = None
+        if self._snapshot_enabled and len(self._rate_cache) > 0:
+            self._rate_cache.save(self.snapshot_file_path)
         # Reset stored prices so that they are not used if they are not being updated
-        self._prices = {}
+        self._rate_cache.clear()
 
     async def check_network(self) -> NetworkStatus:
         try:
@@ -161,23 +197,20 @@ class RateOracle(NetworkBase):
         :param pair: A trading pair, e.g. BTC-USDT
         :return A conversion rate
         """
-        return find_rate(self._prices, pair)
+        return self._rate_cache.rate(pair)
 
     async def stored_or_live_rate(self, pair: str) -> Decimal:
         """
         Finds a conversion rate for a given symbol trying to use the local prices. If local prices are not initialized
-            uses the async rate finder (directly from the exchange)
+            fetches them once from the source (directly from the exchange) and stores them
 
         :param pair: A trading pair, e.g. BTC-USDT
 
         :return A conversion rate
         """
-        if self._prices:
-            rate = self.get_pair_rate(pair)
-        else:
-            rate = await self.rate_async(pair)
-
-        return rate
+        if len(self._rate_cache) == 0:
+            self._rate_cache.update(await self._source.get_prices(quote_token=self._quote_token))
+        return self.get_pair_rate(pair)
 
     async def rate_async(self, pair: str) -> Decimal:
         """
@@ -191,21 +224,39 @@ class RateOracle(NetworkBase):
 
     def set_price(self, pair: str, price: Decimal):
         """
-        Update keys in self._prices with new prices
+        Update keys in the rate cache with new prices
         """
-        self._prices[pair] = price
+        self._rate_cache.update({pair: price})
+
+    def _update_prices(self, new_prices: Dict[str, Decimal]):
+        self._rate_cache.update(new_prices)
+        if len(self._rate_cache) > 0:
+            self._ready_event.set()
+        now = time.time()
+        if self._snapshot_enabled and now - self._last_snapshot_timestamp >= self.SNAPSHOT_INTERVAL:
+            self._rate_cache.save(self.snapshot_file_path)
+            self._last_snapshot_timestamp = now
 
     async def _fetch_price_loop(self):
         while True:
             try:
-                new_prices = await self._source.get_prices(quote_token=self._quote_token)
-                self._prices.update(new_prices)
-
-                if self._prices:
-                    self._ready_event.set()
+                self._update_prices(await self._source.get_prices(quote_token=self._quote_token))
             except asyncio.CancelledError:
                 raise
             except Exception:
                 self.logger().network(f"Error fetching new prices from {self.source.name}.", exc_info=True,
                                       app_warning_msg=f"Couldn't fetch newest prices from {self.source.name}.")
-            await asyncio.sleep(1)
+            poll_interval = self.STREAMING_POLL_INTERVAL if self._price_stream_task is not None else self.POLL_INTERVAL
+            await asyncio.sleep(poll_interval)
+
+    async def _price_stream_loop(self):
+        while True:
+            try:
+                async for new_prices in self._source.stream_prices(quote_token=self._quote_token):
+                    self._update_prices(new_prices)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().network(f"Error receiving the prices pushed by {self.source.name}.", exc_info=True,
+                                      app_warning_msg=f"Couldn't receive the prices pushed by {self.source.name}.")
+            await asyncio.sleep(self.POLL_INTERVAL)
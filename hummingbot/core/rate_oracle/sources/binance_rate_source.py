@@ -1,5 +1,5 @@
 from decimal import Decimal
-from typing import TYPE_CHECKING, Dict, Optional
+from typing import TYPE_CHECKING, Any, AsyncIterable, Dict, List, Optional
 
 from hummingbot.connector.utils import split_hb_trading_pair
 from hummingbot.core.rate_oracle.sources.rate_source_base import RateSourceBase
@@ -19,6 +19,10 @@ class BinanceRateSource(RateSourceBase):
     def name(self) -> str:
         return "binance"
 
+    @property
+    def supports_price_stream(self) -> bool:
+        return True
+
     @async_ttl_cache(ttl=30, maxsize=1)
     async def get_prices(self, quote_token: Optional[str] = None) -> Dict[str, Decimal]:
         self._ensure_exchanges()
@@ -38,6 +42,12 @@ class BinanceRateSource(RateSourceBase):
                 results.update(task_result)
         return results
 
+    async def stream_prices(self, quote_token: Optional[str] = None) -> AsyncIterable[Dict[str, Decimal]]:
+        self._ensure_exchanges()
+        await self._binance_exchange.trading_pair_symbol_map()
+        async for tickers in self._binance_exchange.iter_all_pairs_tickers():
+            yield self._get_binance_prices_from_tickers(exchange=self._binance_exchange, tickers=tickers)
+
     def _ensure_exchanges(self):
         if self._binance_exchange is None:
             self._binance_exchange = self._build_binance_connector_without_private_keys(domain="com")
@@ -69,6 +79,25 @@ class BinanceRateSource(RateSourceBase):
 
         return results
 
+    @staticmethod
+    def _get_binance_prices_from_tickers(exchange: 'BinanceExchange',
+                                         tickers: List[Dict[str, Any]]) -> Dict[str, Decimal]:
+        """
+        :param exchange: The exchange instance that received the tickers.
+        :param tickers: The tickers of the all market tickers stream
+        :return: A dictionary of trading pairs and prices
+        """
+        results = {}
+        for ticker in tickers:
+            trading_pair = exchange.trading_pair_metadata.trading_pair(ticker.get("s"))
+            if trading_pair is None:
+                continue  # skip pairs that we don't track
+            bid_price = ticker.get("b")
+            ask_price = ticker.get("a")
+            if bid_price is not None and ask_price is not None and 0 < Decimal(bid_price) <= Decimal(ask_price):
+                results[trading_pair] = (Decimal(bid_price) + Decimal(ask_price)) / Decimal("2")
+        return results
+
     @staticmethod
     def _build_binance_connector_without_private_keys(domain: str) -> 'BinanceExchange':
         from hummingbot.client.hummingbot_application import HummingbotApplication
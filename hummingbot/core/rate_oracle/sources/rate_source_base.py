@@ -1,7 +1,7 @@
 import logging
 from abc import ABC, abstractmethod
 from decimal import Decimal
-from typing import Dict, Optional
+from typing import AsyncIterable, Dict, Optional
 
 from hummingbot.logger import HummingbotLogger
 
@@ -20,6 +20,20 @@ class RateSourceBase(ABC):
             cls._logger = logging.getLogger(__name__)
         return cls._logger
 
+    @property
+    def supports_price_stream(self) -> bool:
+        """
+        True if the source pushes the price updates through stream_prices, in addition to get_prices
+        """
+        return False
+
     @abstractmethod
     async def get_prices(self, quote_token: Optional[str] = None) -> Dict[str, Decimal]:
         ...
+
+    def stream_prices(self, quote_token: Optional[str] = None) -> AsyncIterable[Dict[str, Decimal]]:
+        """
+        Yields the prices that changed, as they are pushed by the source. The iteration ends when the connection is
+        lost.
+        """
+        raise NotImplementedError
@@ -0,0 +1,188 @@
+import asyncio
+import logging
+import time
+from enum import Enum
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import pandas as pd
+
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.logger import HummingbotLogger
+
+
+class StartupStepStatus(Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+    SKIPPED = "skipped"
+    CANCELLED = "cancelled"
+
+
+class StartupStep:
+    def __init__(self,
+                 name: str,
+                 function: Callable[[], Awaitable[Any]],
+                 depends_on: List[str],
+                 deferred: bool):
+        self.name = name
+        self.function = function
+        self.depends_on = depends_on
+        self.deferred = deferred
+        self.status = StartupStepStatus.PENDING
+        self.start_timestamp: Optional[float] = None
+        self.end_timestamp: Optional[float] = None
+        self.finished = asyncio.Event()
+
+    @property
+    def duration(self) -> Optional[float]:
+        if self.start_timestamp is None:
+            return None
+        end_timestamp = self.end_timestamp if self.end_timestamp is not None else time.perf_counter()
+        return end_timestamp - self.start_timestamp
+
+
+class StartupPipeline:
+    """
+    Runs the start-up steps of the bot as soon as the steps they depend on are done, so independent steps (e.g. the
+    initialization of the different connectors) run concurrently instead of one after the other.
+
+    A step failing is logged and its dependents are skipped, the other steps keep running. Deferred steps are optional
+    steps run in the background once all the regular steps are done, so they don't compete with the trading start-up.
+    The duration of each step is kept for the start-up timing breakdown.
+    """
+
+    _sp_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._sp_logger is None:
+            cls._sp_logger = logging.getLogger(__name__)
+        return cls._sp_logger
+
+    def __init__(self):
+        self._steps: Dict[str, StartupStep] = {}
+        self._start_timestamp: Optional[float] = None
+        self._regular_steps_task: Optional[asyncio.Task] = None
+        self._deferred_steps_task: Optional[asyncio.Task] = None
+
+    @property
+    def steps(self) -> List[StartupStep]:
+        return list(self._steps.values())
+
+    def add_step(self,
+                 name: str,
+                 function: Callable[[], Awaitable[Any]],
+                 depends_on: Optional[List[str]] = None,
+                 deferred: bool = False):
+        """
+        :param name: the step name, unique in the pipeline
+        :param function: the coroutine function running the step
+        :param depends_on: the names of the steps that have to be done before the step starts
+        :param deferred: True for the optional steps to run once all the other steps are done
+        """
+        if name in self._steps:
+            raise ValueError(f"The start-up step {name} is already defined.")
+        self._steps[name] = StartupStep(name=name, function=function, depends_on=list(depends_on or []),
+                                        deferred=deferred)
+
+    async def run(self) -> bool:
+        """
+        Runs the regular steps and schedules the deferred ones.
+
+        :return: True if all the regular steps are done, False if some failed, were skipped or the pipeline was
+            cancelled
+        """
+        self._validate_dependencies()
+        self._start_timestamp = time.perf_counter()
+        regular_steps = [step for step in self._steps.values() if not step.deferred]
+        self._regular_steps_task = safe_ensure_future(asyncio.gather(*[self._run_step(step) for step in regular_steps]))
+        # Waiting (instead of awaiting) the task doesn't raise when the pipeline is cancelled
+        await asyncio.wait([self._regular_steps_task])
+        if self._regular_steps_task is None or self._regular_steps_task.cancelled():
+            return False
+        self._regular_steps_task = None
+        deferred_steps = [step for step in self._steps.values() if step.deferred]
+        if len(deferred_steps) > 0:
+            self._deferred_steps_task = safe_ensure_future(
+                asyncio.gather(*[self._run_step(step) for step in deferred_steps]))
+        return all(step.status == StartupStepStatus.DONE for step in regular_steps)
+
+    async def wait_for_deferred_steps(self):
+        if self._deferred_steps_task is not None:
+            await self._deferred_steps_task
+
+    def cancel(self):
+        if self._regular_steps_task is not None:
+            self._regular_steps_task.cancel()
+            self._regular_steps_task = None
+        if self._deferred_steps_task is not None:
+            self._deferred_steps_task.cancel()
+            self._deferred_steps_task = None
+
+    def timings_df(self) -> pd.DataFrame:
+        """
+        :return: the start-up timing breakdown, with the time each step started at (relative to the pipeline start)
+            and its duration in seconds
+        """
+        data = []
+        for step in self._steps.values():
+            started_at = (step.start_timestamp - self._start_timestamp
+                          if step.start_timestamp is not None and self._start_timestamp is not None
+                          else None)
+            data.append([
+                step.name,
+                step.status.value,
+                f"{started_at:.3f}" if started_at is not None else "",
+                f"{step.duration:.3f}" if step.duration is not None else "",
+            ])
+        return pd.DataFrame(data=data, columns=["Step", "Status", "Started (s)", "Duration (s)"])
+
+    def _validate_dependencies(self):
+        for step in self._steps.values():
+            for dependency in step.depends_on:
+                if dependency not in self._steps:
+                    raise ValueError(f"The start-up step {step.name} depends on the undefined step {dependency}.")
+                if self._steps[dependency].deferred and not step.deferred:
+                    raise ValueError(f"The start-up step {step.name} can't depend on the deferred step {dependency}.")
+        visited: Dict[str, bool] = {}
+
+        def visit(name: str, path: List[str]):
+            if visited.get(name):
+                return
+            if name in path:
+                raise ValueError(f"Circular start-up steps dependency: {' -> '.join(path + [name])}.")
+            for dependency in self._steps[name].depends_on:
+                visit(dependency, path + [name])
+            visited[name] = True
+
+        for step_name in self._steps:
+            visit(step_name, [])
+
+    async def _run_step(self, step: StartupStep):
+        try:
+            dependencies = [self._steps[name] for name in step.depends_on]
+            for dependency in dependencies:
+                await dependency.finished.wait()
+            failed_dependencies = [dependency.name for dependency in dependencies
+                                   if dependency.status != StartupStepStatus.DONE]
+            if len(failed_dependencies) > 0:
+                step.status = StartupStepStatus.SKIPPED
+                self.logger().warning(f"Skipping the start-up step {step.name}, as {', '.join(failed_dependencies)} "
+                                      f"did not complete.")
+                return
+            step.status = StartupStepStatus.RUNNING
+            step.start_timestamp = time.perf_counter()
+            try:
+                await step.function()
+                step.status = StartupStepStatus.DONE
+            except asyncio.CancelledError:
+                step.status = StartupStepStatus.CANCELLED
+                raise
+            except Exception:
+                step.status = StartupStepStatus.FAILED
+                self.logger().error(f"The start-up step {step.name} failed.", exc_info=True)
+            finally:
+                step.end_timestamp = time.perf_counter()
+        finally:
+            step.finished.set()
@@ -0,0 +1,258 @@
+import asyncio
+import math
+import sys
+import threading
+import time
+from collections import Counter
+from enum import Enum
+from typing import Any, Dict, List, Optional, Tuple
+
+from hummingbot.core.event import events
+from hummingbot.core.pubsub import set_event_profiler
+from hummingbot.core.utils.async_utils import safe_ensure_future
+
+
+class LatencyHistogram:
+    """
+    Fixed memory histogram of durations in seconds, with power of 2 buckets from 1 microsecond up to ~1 hour.
+
+    Recording a value is O(1) and allocation free, percentiles are estimated from the bucket upper bounds.
+    """
+
+    MIN_VALUE = 1e-6
+    NUM_BUCKETS = 32
+
+    def __init__(self):
+        self._buckets: List[int] = [0] * self.NUM_BUCKETS
+        self._count = 0
+        self._total = 0.0
+        self._max = 0.0
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def total(self) -> float:
+        return self._total
+
+    @property
+    def max(self) -> float:
+        return self._max
+
+    @property
+    def mean(self) -> float:
+        return self._total / self._count if self._count > 0 else 0.0
+
+    def record(self, value: float):
+        if value > self._max:
+            self._max = value
+        self._count += 1
+        self._total += value
+        if value <= self.MIN_VALUE:
+            index = 0
+        else:
+            index = min(math.frexp(value / self.MIN_VALUE)[1], self.NUM_BUCKETS - 1)
+        self._buckets[index] += 1
+
+    def bucket_upper_bound(self, index: int) -> float:
+        return self.MIN_VALUE * (2 ** index)
+
+    def percentile(self, percentile: float) -> float:
+        """
+        Returns an upper estimate of the given percentile (0 - 100), capped at the maximum recorded value.
+        """
+        if self._count == 0:
+            return 0.0
+        threshold = self._count * percentile / 100
+        cumulative = 0
+        for index, bucket_count in enumerate(self._buckets):
+            cumulative += bucket_count
+            if cumulative >= threshold and bucket_count > 0:
+                return min(self.bucket_upper_bound(index), self._max)
+        return self._max
+
+    def reset(self):
+        self._buckets = [0] * self.NUM_BUCKETS
+        self._count = 0
+        self._total = 0.0
+        self._max = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self._count,
+            "mean": self.mean,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "max": self._max,
+        }
+
+
+class TickProfiler:
+    """
+    Collects hot path timings of the bot: how long each clock iterator takes per tick, how late the clock ticks
+    compared to their schedule (tick drift), how late the event loop wakes up (event loop lag), and how long the
+    listeners of each event type take in `PubSub.c_trigger_event()`.
+
+    The profiler is disabled by default. When disabled the clock only checks the `enabled` flag once per tick, and
+    `PubSub` only compares a module level reference against None per triggered event.
+    """
+
+    LOOP_LAG_CHECK_INTERVAL = 0.1
+    _shared_instance: "TickProfiler" = None
+
+    @classmethod
+    def get_instance(cls) -> "TickProfiler":
+        if cls._shared_instance is None:
+            cls._shared_instance = TickProfiler()
+        return cls._shared_instance
+
+    def __init__(self):
+        self._enabled = False
+        self._started_at: Optional[float] = None
+        self._tick_durations: Dict[str, LatencyHistogram] = {}
+        self._tick_drift = LatencyHistogram()
+        self._loop_lag = LatencyHistogram()
+        self._event_durations: Dict[int, LatencyHistogram] = {}
+        self._loop_lag_task: Optional[asyncio.Task] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    def enable(self):
+        if self._enabled:
+            return
+        self._enabled = True
+        self._started_at = time.time()
+        set_event_profiler(self)
+        try:
+            asyncio.get_running_loop()
+            self._loop_lag_task = safe_ensure_future(self._loop_lag_loop())
+        except RuntimeError:
+            # No running event loop, e.g. in tests or backtesting. The loop lag is not measured.
+            self._loop_lag_task = None
+
+    def disable(self):
+        if not self._enabled:
+            return
+        self._enabled = False
+        set_event_profiler(None)
+        if self._loop_lag_task is not None:
+            self._loop_lag_task.cancel()
+            self._loop_lag_task = None
+
+    def reset(self):
+        self._started_at = time.time() if self._enabled else None
+        self._tick_durations.clear()
+        self._tick_drift.reset()
+        self._loop_lag.reset()
+        self._event_durations.clear()
+
+    def record_tick(self, iterator_name: str, duration: float):
+        histogram = self._tick_durations.get(iterator_name)
+        if histogram is None:
+            histogram = self._tick_durations[iterator_name] = LatencyHistogram()
+        histogram.record(duration)
+
+    def record_tick_drift(self, drift: float):
+        self._tick_drift.record(max(drift, 0.0))
+
+    def record_loop_lag(self, lag: float):
+        self._loop_lag.record(max(lag, 0.0))
+
+    def record_event(self, event_tag: int, duration: float):
+        histogram = self._event_durations.get(event_tag)
+        if histogram is None:
+            histogram = self._event_durations[event_tag] = LatencyHistogram()
+        histogram.record(duration)
+
+    async def _loop_lag_loop(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            start_time = loop.time()
+            await asyncio.sleep(self.LOOP_LAG_CHECK_INTERVAL)
+            self.record_loop_lag(loop.time() - start_time - self.LOOP_LAG_CHECK_INTERVAL)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Returns all the collected statistics as a JSON serializable dictionary. Durations are in seconds.
+        """
+        return {
+            "enabled": self._enabled,
+            "duration": time.time() - self._started_at if self._started_at is not None else 0.0,
+            "tick_durations": {name: h.to_dict() for name, h in self._tick_durations.items()},
+            "tick_drift": self._tick_drift.to_dict(),
+            "loop_lag": self._loop_lag.to_dict(),
+            "event_durations": {event_name(tag): h.to_dict() for tag, h in self._event_durations.items()},
+        }
+
+    async def sample_stacks(self,
+                            duration: float = 5.0,
+                            interval: float = 0.005,
+                            top: int = 20) -> List[Tuple[str, float, float]]:
+        """
+        Runs a sampling profiler on the main thread for `duration` seconds. The stack of the main thread is sampled
+        every `interval` seconds from a background thread, so the event loop keeps running undisturbed.
+
+        :returns the `top` functions by self samples (the function was running Python code when sampled), as
+        (function, share of self samples, share of inclusive samples) tuples
+        """
+        thread_id = threading.main_thread().ident
+        self_counts: Counter = Counter()
+        inclusive_counts: Counter = Counter()
+        num_samples = 0
+        stop_event = threading.Event()
+
+        def sample():
+            nonlocal num_samples
+            while not stop_event.wait(interval):
+                frame = sys._current_frames().get(thread_id)
+                if frame is None:
+                    continue
+                num_samples += 1
+                self_counts[self._frame_function(frame)] += 1
+                seen = set()
+                while frame is not None:
+                    function = self._frame_function(frame)
+                    if function not in seen:
+                        seen.add(function)
+                        inclusive_counts[function] += 1
+                    frame = frame.f_back
+
+        sampler = threading.Thread(target=sample, name="tick-profiler-sampler", daemon=True)
+        sampler.start()
+        try:
+            await asyncio.sleep(duration)
+        finally:
+            stop_event.set()
+            sampler.join()
+        return [
+            (function, count / num_samples, inclusive_counts[function] / num_samples)
+            for function, count in self_counts.most_common(top)
+        ]
+
+    @staticmethod
+    def _frame_function(frame) -> str:
+        code = frame.f_code
+        return f"{code.co_name} ({code.co_filename}:{code.co_firstlineno})"
+
+
+def event_name(event_tag: int) -> str:
+    """
+    Returns the name of the event enum member with the given value, e.g. "MarketEvent.OrderFilled".
+    """
+    for member in _event_enum_members():
+        if member.value == event_tag:
+            return f"{type(member).__name__}.{member.name}"
+    return str(event_tag)
+
+
+def _event_enum_members() -> List[Enum]:
+    return [
+        member
+        for attribute in vars(events).values()
+        if isinstance(attribute, type) and issubclass(attribute, Enum) and attribute.__name__.endswith("Event")
+        for member in attribute
+    ]
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from typing import Any, Awaitable, Callable, Dict, List, Optional
 
@@ -20,16 +21,26 @@ class TradingPairFetcher:
         return cls._tpf_logger
 
     @classmethod
-    def get_instance(cls, client_config_map: Optional["ClientConfigAdapter"] = None) -> "TradingPairFetcher":
+    def get_instance(cls,
+                     client_config_map: Optional["ClientConfigAdapter"] = None,
+                     defer_optional_fetches: bool = False) -> "TradingPairFetcher":
+        """
+        :param defer_optional_fetches: when the instance is created, whether the optional fetches are held until
+            `resume_optional_fetches` is called (see `defer_optional_fetches`)
+        """
         if cls._sf_shared_instance is None:
             client_config_map = client_config_map or cls._get_client_config_map()
-            cls._sf_shared_instance = TradingPairFetcher(client_config_map)
+            cls._sf_shared_instance = TradingPairFetcher(client_config_map,
+                                                         defer_optional_fetches=defer_optional_fetches)
         return cls._sf_shared_instance
 
-    def __init__(self, client_config_map: ClientConfigAdapter):
+    def __init__(self, client_config_map: ClientConfigAdapter, defer_optional_fetches: bool = False):
         self.ready = False
         self.trading_pairs: Dict[str, Any] = {}
         self.fetch_pairs_from_all_exchanges = client_config_map.fetch_pairs_from_all_exchanges
+        self._deferred_fetches_allowed = asyncio.Event()
+        if not defer_optional_fetches:
+            self._deferred_fetches_allowed.set()
         self._fetch_task = safe_ensure_future(self.fetch_all(client_config_map))
 
     def _fetch_pairs_from_connector_setting(
@@ -40,9 +51,21 @@ class TradingPairFetcher:
         connector = connector_setting.non_trading_connector_instance_with_default_configuration()
         safe_ensure_future(self.call_fetch_pairs(connector.all_trading_pairs(), connector_name))
 
+    def defer_optional_fetches(self):
+        """
+        Holds the fetches of the trading pairs of the not connected exchanges (only fetched when
+        `fetch_pairs_from_all_exchanges` is enabled) until `resume_optional_fetches` is called, so they don't compete
+        with a strategy start-up for the network and the exchanges rate limits.
+        """
+        self._deferred_fetches_allowed.clear()
+
+    def resume_optional_fetches(self):
+        self._deferred_fetches_allowed.set()
+
     async def fetch_all(self, client_config_map: ClientConfigAdapter):
         await Security.wait_til_decryption_done()
         connector_settings = self._all_connector_settings()
+        optional_settings: List[ConnectorSetting] = []
         for conn_setting in connector_settings.values():
             # XXX(martin_kou): Some connectors, e.g. uniswap v3, aren't completed yet. Ignore if you can't find the
             # data source module for them.
@@ -52,11 +75,10 @@ class TradingPairFetcher:
                         connector_setting=connector_settings[conn_setting.parent_name],
                         connector_name=conn_setting.name
                     )
-                elif not self.fetch_pairs_from_all_exchanges:
-                    if conn_setting.connector_connected():
-                        self._fetch_pairs_from_connector_setting(connector_setting=conn_setting)
-                else:
+                elif conn_setting.connector_connected():
                     self._fetch_pairs_from_connector_setting(connector_setting=conn_setting)
+                elif self.fetch_pairs_from_all_exchanges:
+                    optional_settings.append(conn_setting)
             except ModuleNotFoundError:
                 continue
             except Exception:
@@ -64,6 +86,16 @@ class TradingPairFetcher:
                                         "Please check the logs")
         self.ready = True
 
+        await self._deferred_fetches_allowed.wait()
+        for conn_setting in optional_settings:
+            try:
+                self._fetch_pairs_from_connector_setting(connector_setting=conn_setting)
+            except ModuleNotFoundError:
+                continue
+            except Exception:
+                self.logger().exception(f"An error occurred when fetching trading pairs for {conn_setting.name}."
+                                        "Please check the logs")
+
     async def call_fetch_pairs(self, fetch_fn: Callable[[], Awaitable[List[str]]], exchange_name: str):
         try:
             pairs = await fetch_fn
@@ -4,6 +4,7 @@ import aiohttp
 
 from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
 from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
+from hummingbot.core.web_assistant.json_decoders import JSONDecoder
 
 
 class ConnectionsFactory:
@@ -18,20 +19,21 @@ class ConnectionsFactory:
     `aiohttp` and `WSConnection`s using `signalr_aio`.
     """
 
-    def __init__(self):
+    def __init__(self, json_decoder: Optional[JSONDecoder] = None):
         # _ws_independent_session is intended to be used only in unit tests
         self._ws_independent_session: Optional[aiohttp.ClientSession] = None
 
         self._shared_client: Optional[aiohttp.ClientSession] = None
+        self._json_decoder = json_decoder
 
     async def get_rest_connection(self) -> RESTConnection:
         shared_client = await self._get_shared_client()
-        connection = RESTConnection(aiohttp_client_session=shared_client)
+        connection = RESTConnection(aiohttp_client_session=shared_client, json_decoder=self._json_decoder)
         return connection
 
     async def get_ws_connection(self) -> WSConnection:
         shared_client = self._ws_independent_session or await self._get_shared_client()
-        connection = WSConnection(aiohttp_client_session=shared_client)
+        connection = WSConnection(aiohttp_client_session=shared_client, json_decoder=self._json_decoder)
         return connection
 
     async def _get_shared_client(self) -> aiohttp.ClientSession:
@@ -1,16 +1,17 @@
 import asyncio
 import time
-from json import JSONDecodeError
 from typing import Any, Dict, Mapping, Optional
 
 import aiohttp
 
 from hummingbot.core.web_assistant.connections.data_types import WSRequest, WSResponse
+from hummingbot.core.web_assistant.json_decoders import DEFAULT_JSON_DECODER, JSONDecoder
 
 
 class WSConnection:
-    def __init__(self, aiohttp_client_session: aiohttp.ClientSession):
+    def __init__(self, aiohttp_client_session: aiohttp.ClientSession, json_decoder: Optional[JSONDecoder] = None):
         self._client_session = aiohttp_client_session
+        self._json_decoder = json_decoder or DEFAULT_JSON_DECODER
         self._connection: Optional[aiohttp.ClientWebSocketResponse] = None
         self._connected = False
         self._message_timeout: Optional[float] = None
@@ -125,14 +126,14 @@ class WSConnection:
     async def _send_binary(self, payload: bytes):
         await self._connection.send_bytes(payload)
 
-    @staticmethod
-    def _build_resp(msg: aiohttp.WSMessage) -> WSResponse:
+    def _build_resp(self, msg: aiohttp.WSMessage) -> WSResponse:
         if msg.type == aiohttp.WSMsgType.BINARY:
+            # Binary payloads (e.g. protobuf or compressed feeds) are passed through for the data sources to decode
             data = msg.data
         else:
             try:
-                data = msg.json()
-            except JSONDecodeError:
+                data = self._json_decoder.decode(msg.data)
+            except ValueError:
                 data = msg.data
         response = WSResponse(data)
         return response
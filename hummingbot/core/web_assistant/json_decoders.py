@@ -0,0 +1,82 @@
+import json
+from dataclasses import MISSING, fields, is_dataclass
+from typing import Any, Optional, Type, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+class JSONDecoder:
+    """
+    Decodes the JSON payloads received through websocket connections and REST responses.
+
+    Uses orjson when it is installed, and the standard library `json` module otherwise. Payloads orjson rejects but
+    the standard library accepts (NaN and Infinity literals, integers over 64 bits) are decoded with the standard
+    library, so the decoded values never depend on the installed libraries.
+    """
+
+    def decode(self, payload: Union[str, bytes]) -> Any:
+        """
+        :param payload: the JSON document, as text or UTF-8 encoded bytes
+
+        :return: the decoded document
+        :raises ValueError: if the payload is not valid JSON
+        """
+        if orjson is not None:
+            try:
+                return orjson.loads(payload)
+            except orjson.JSONDecodeError:
+                pass
+        return json.loads(payload)
+
+
+class StructJSONDecoder(JSONDecoder):
+    """
+    Decodes the messages matching a known shape straight into a typed struct, and any other message as generic JSON.
+
+    The struct type can be a `msgspec.Struct` (or a tagged union of them), decoded by msgspec without building the
+    intermediate dictionaries, or a dataclass, built from the generic decoding result when all its required fields
+    are present.
+    """
+
+    def __init__(self, struct_type: Type):
+        self._struct_type = struct_type
+        self._msgspec_decoder: Optional[Any] = None
+        if msgspec is not None and not is_dataclass(struct_type):
+            self._msgspec_decoder = msgspec.json.Decoder(struct_type)
+        elif is_dataclass(struct_type):
+            self._field_names = [field.name for field in fields(struct_type)]
+            self._required_field_names = [
+                field.name for field in fields(struct_type)
+                if field.default is MISSING and field.default_factory is MISSING
+            ]
+        else:
+            raise ValueError(f"{struct_type} can't be decoded. It has to be a dataclass or a msgspec struct "
+                             f"(msgspec is not installed).")
+
+    @property
+    def struct_type(self) -> Type:
+        return self._struct_type
+
+    def decode(self, payload: Union[str, bytes]) -> Any:
+        if self._msgspec_decoder is not None:
+            try:
+                return self._msgspec_decoder.decode(payload)
+            except msgspec.ValidationError:
+                return super().decode(payload)
+            except msgspec.DecodeError as decode_error:
+                raise ValueError(str(decode_error)) from decode_error
+        data = super().decode(payload)
+        if isinstance(data, dict) and all(name in data for name in self._required_field_names):
+            return self._struct_type(**{name: data[name] for name in self._field_names if name in data})
+        return data
+
+
+DEFAULT_JSON_DECODER = JSONDecoder()
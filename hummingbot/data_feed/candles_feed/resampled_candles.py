@@ -0,0 +1,141 @@
+from collections import deque
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+
+# Candle timestamps above this value are in milliseconds
+MILLISECONDS_TIMESTAMP_THRESHOLD = 1e11
+
+
+class ResampledCandles:
+    """
+    Candles of an interval derived from the candles of a finer interval feed of the same trading pair, so several
+    consumers of the same trading pair don't need a websocket connection and a history download per interval.
+
+    The coarse candles are updated incrementally when they are read: only the source candles of the last coarse
+    candle and the newer ones are aggregated again. The first coarse candle is dropped if the source history starts
+    in the middle of it.
+    """
+
+    def __init__(self, source: CandlesBase, interval: str, max_records: int):
+        """
+        :param source: the finer interval candles feed, with an interval dividing the interval
+        :param interval: the interval of the derived candles, dividing one day (so they are aligned with the
+            exchanges candles)
+        :param max_records: the number of derived candles to keep
+        """
+        if not self.can_resample(source.interval, interval):
+            raise ValueError(f"{interval} candles can't be derived from {source.interval} candles.")
+        self._source = source
+        self.interval = interval
+        self.max_records = max_records
+        self._interval_seconds = CandlesBase.interval_to_seconds[interval]
+        self._candles = deque(maxlen=max_records)
+        self._first_source_timestamp: Optional[float] = None
+
+    @staticmethod
+    def can_resample(source_interval: str, interval: str) -> bool:
+        source_seconds = CandlesBase.interval_to_seconds.get(source_interval)
+        seconds = CandlesBase.interval_to_seconds.get(interval)
+        if source_seconds is None or seconds is None or seconds <= source_seconds:
+            return False
+        return seconds % source_seconds == 0 and CandlesBase.interval_to_seconds["1d"] % seconds == 0
+
+    @staticmethod
+    def required_source_records(source_interval: str, interval: str, max_records: int) -> int:
+        """
+        :return: the number of source candles needed to derive `max_records` candles (plus one, as the first one can
+            be incomplete)
+        """
+        ratio = CandlesBase.interval_to_seconds[interval] // CandlesBase.interval_to_seconds[source_interval]
+        return (max_records + 1) * ratio
+
+    @property
+    def source(self) -> CandlesBase:
+        return self._source
+
+    @source.setter
+    def source(self, source: CandlesBase):
+        self._source = source
+        self._candles.clear()
+        self._first_source_timestamp = None
+
+    @property
+    def name(self) -> str:
+        return f"{self._source.name}_{self.interval}"
+
+    @property
+    def ready(self) -> bool:
+        if not self._source.ready:
+            return False
+        self._update()
+        return len(self._candles) == self._candles.maxlen
+
+    @property
+    def candles_df(self) -> pd.DataFrame:
+        self._update()
+        return pd.DataFrame(self._candles, columns=CandlesBase.columns, dtype=float)
+
+    def start(self):
+        """
+        The source feed is started and stopped by its owner.
+        """
+        pass
+
+    def stop(self):
+        pass
+
+    def _update(self):
+        source_candles = self._source._candles
+        if len(source_candles) == 0:
+            self._candles.clear()
+            self._first_source_timestamp = None
+            return
+
+        first_source_timestamp = float(source_candles[0][0])
+        scale = 1000 if first_source_timestamp > MILLISECONDS_TIMESTAMP_THRESHOLD else 1
+        bucket_size = self._interval_seconds * scale
+        rebuild = (self._first_source_timestamp is None
+                   or first_source_timestamp < self._first_source_timestamp
+                   or len(self._candles) == 0)
+        self._first_source_timestamp = first_source_timestamp
+
+        if rebuild:
+            self._candles.clear()
+            rows = list(source_candles)
+            # The first bucket is incomplete when the source history starts after its beginning
+            if first_source_timestamp % bucket_size != 0:
+                first_complete_bucket = (first_source_timestamp // bucket_size + 1) * bucket_size
+                rows = [row for row in rows if row[0] >= first_complete_bucket]
+        else:
+            last_bucket_start = self._candles.pop()[0]
+            rows = []
+            for row in reversed(source_candles):
+                if row[0] < last_bucket_start:
+                    break
+                rows.append(row)
+            rows.reverse()
+
+        bucket_rows: List[np.ndarray] = []
+        bucket_start = None
+        for row in rows:
+            row_bucket_start = (float(row[0]) // bucket_size) * bucket_size
+            if row_bucket_start != bucket_start and len(bucket_rows) > 0:
+                self._candles.append(self._aggregate(bucket_start, bucket_rows))
+                bucket_rows = []
+            bucket_start = row_bucket_start
+            bucket_rows.append(row)
+        if len(bucket_rows) > 0:
+            self._candles.append(self._aggregate(bucket_start, bucket_rows))
+
+    @staticmethod
+    def _aggregate(bucket_start: float, rows: List[np.ndarray]) -> np.ndarray:
+        rows_array = np.asarray(rows, dtype=float)
+        volumes = rows_array[:, 5:].sum(axis=0)
+        return np.concatenate((
+            [bucket_start, rows_array[0, 1], rows_array[:, 2].max(), rows_array[:, 3].min(), rows_array[-1, 4]],
+            volumes,
+        ))
@@ -1,24 +1,35 @@
 import time
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import pandas as pd
 
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.core.data_type.common import PriceType
 from hummingbot.core.data_type.order_book_query_result import OrderBookQueryResult
+from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
 from hummingbot.data_feed.candles_feed.candles_factory import CandlesFactory
 from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
+from hummingbot.data_feed.candles_feed.resampled_candles import ResampledCandles
 
 
 class MarketDataProvider:
+    # Maximum number of candles a feed keeps to derive the candles of coarser intervals. The intervals needing more
+    # history from the finest feed of their trading pair get their own feed.
+    MAX_RESAMPLING_SOURCE_RECORDS = 5000
+
     def __init__(self, connectors: Dict[str, ConnectorBase]):
         self.candles_feeds = {}  # Stores instances of candle feeds
         self.connectors = connectors  # Stores instances of connectors
+        # The configs requested by the consumers, a feed keeps more candles when coarser candles are derived from it
+        self._candles_configs: Dict[str, CandlesConfig] = {}
+        self._candles_feeds_consumers: Dict[str, int] = {}
 
     def stop(self):
         for candle_feed in self.candles_feeds.values():
             candle_feed.stop()
         self.candles_feeds.clear()
+        self._candles_configs.clear()
+        self._candles_feeds_consumers.clear()
 
     @property
     def ready(self) -> bool:
@@ -32,10 +43,13 @@ class MarketDataProvider:
 
     def initialize_candles_feed(self, config: CandlesConfig):
         """
-        Initializes a candle feed based on the given configuration.
+        Initializes a candle feed based on the given configuration, and registers a consumer of the feed. The feed is
+        stopped when all its consumers called `stop_candle_feed`.
         :param config: CandlesConfig
         """
         self.get_candles_feed(config)
+        key = self._generate_candle_feed_key(config)
+        self._candles_feeds_consumers[key] = self._candles_feeds_consumers.get(key, 0) + 1
 
     def initialize_candles_feed_list(self, config_list: List[CandlesConfig]):
         """
@@ -43,12 +57,15 @@ class MarketDataProvider:
         :param config_list: List[CandlesConfig]
         """
         for config in config_list:
-            self.get_candles_feed(config)
+            self.initialize_candles_feed(config)
 
     def get_candles_feed(self, config: CandlesConfig):
         """
         Retrieves or creates and starts a candle feed based on the given configuration.
         If an existing feed has a higher or equal max_records, it is reused.
+        The candles of a trading pair are derived from the feed of its finest interval when the interval allows it:
+        the finer feed keeps the history the coarser candles need (up to `MAX_RESAMPLING_SOURCE_RECORDS` candles), so
+        a trading pair only has one websocket subscription and one history download whatever the intervals requested.
         :param config: CandlesConfig
         :return: Candle feed instance.
         """
@@ -58,14 +75,42 @@ class MarketDataProvider:
         if existing_feed and existing_feed.max_records >= config.max_records:
             # Existing feed is sufficient, return it
             return existing_feed
-        else:
-            # Create a new feed or restart the existing one with updated max_records
-            candle_feed = CandlesFactory.get_candle(config)
-            self.candles_feeds[key] = candle_feed
-            if hasattr(candle_feed, 'start'):
-                candle_feed.start()
+
+        # A feed other feeds are derived from keeps being a regular feed
+        source_key = None if self._has_derived_feeds(existing_feed) else self._resampling_source_key(config)
+        if source_key is not None:
+            source_config = self._candles_configs[source_key]
+            source_feed = self._ensure_source_records(
+                source_key,
+                ResampledCandles.required_source_records(source_config.interval, config.interval, config.max_records))
+            candle_feed = ResampledCandles(source=source_feed, interval=config.interval,
+                                           max_records=config.max_records)
+            self._replace_candle_feed(key, config, candle_feed)
             return candle_feed
 
+        derived_keys = self._derivable_feed_keys(config)
+        # The feeds already derived from the existing feed are moved to the new one
+        max_records = max([config.max_records] + [
+            ResampledCandles.required_source_records(config.interval, self._candles_configs[derived_key].interval,
+                                                     self._candles_configs[derived_key].max_records)
+            for derived_key in derived_keys + self._derived_feed_keys(existing_feed)])
+        # Create a new feed or restart the existing one with updated max_records
+        candle_feed = self._start_candle_feed(config.copy(update={"max_records": max_records}))
+        self._replace_candle_feed(key, config, candle_feed)
+        for derived_key in derived_keys:
+            derived_config = self._candles_configs[derived_key]
+            derived_feed = ResampledCandles(source=candle_feed, interval=derived_config.interval,
+                                            max_records=derived_config.max_records)
+            self._replace_candle_feed(derived_key, derived_config, derived_feed)
+        return candle_feed
+
+    @staticmethod
+    def _start_candle_feed(config: CandlesConfig):
+        candle_feed = CandlesFactory.get_candle(config)
+        if hasattr(candle_feed, 'start'):
+            candle_feed.start()
+        return candle_feed
+
     @staticmethod
     def _generate_candle_feed_key(config: CandlesConfig) -> str:
         """
@@ -77,14 +122,121 @@ class MarketDataProvider:
 
     def stop_candle_feed(self, config: CandlesConfig):
         """
-        Stops a candle feed based on the given configuration.
+        Unregisters a consumer of a candle feed, and stops the feed if no consumer remains. A feed other feeds are
+        derived from is stopped with the last of them.
         :param config: CandlesConfig
         """
         key = self._generate_candle_feed_key(config)
+        consumers = self._candles_feeds_consumers.get(key, 1) - 1
+        if consumers > 0:
+            self._candles_feeds_consumers[key] = consumers
+            return
+        self._candles_feeds_consumers.pop(key, None)
+        candle_feed = self.candles_feeds.get(key)
+        if candle_feed is None:
+            return
+        if isinstance(candle_feed, ResampledCandles):
+            del self.candles_feeds[key]
+            self._candles_configs.pop(key, None)
+            source_key = self._feed_key(candle_feed.source)
+            if source_key is not None and source_key not in self._candles_feeds_consumers:
+                self._stop_unused_candle_feed(source_key)
+        else:
+            self._stop_unused_candle_feed(key)
+
+    def _stop_unused_candle_feed(self, key: str):
         candle_feed = self.candles_feeds.get(key)
-        if candle_feed and hasattr(candle_feed, 'stop'):
+        if candle_feed is not None and not self._has_derived_feeds(candle_feed) and hasattr(candle_feed, 'stop'):
             candle_feed.stop()
             del self.candles_feeds[key]
+            self._candles_configs.pop(key, None)
+
+    def _has_derived_feeds(self, candle_feed) -> bool:
+        return len(self._derived_feed_keys(candle_feed)) > 0
+
+    def _derived_feed_keys(self, candle_feed) -> List[str]:
+        if candle_feed is None:
+            return []
+        return [key for key, feed in self.candles_feeds.items()
+                if isinstance(feed, ResampledCandles) and feed.source is candle_feed]
+
+    def _feed_key(self, candle_feed) -> Optional[str]:
+        return next((key for key, feed in self.candles_feeds.items() if feed is candle_feed), None)
+
+    def _replace_candle_feed(self, key: str, config: CandlesConfig, candle_feed):
+        previous_feed = self.candles_feeds.get(key)
+        self.candles_feeds[key] = candle_feed
+        self._candles_configs[key] = config
+        if previous_feed is None:
+            return
+        for feed in self.candles_feeds.values():
+            if isinstance(feed, ResampledCandles) and feed.source is previous_feed:
+                if isinstance(candle_feed, ResampledCandles):
+                    feed.source = candle_feed.source
+                else:
+                    feed.source = candle_feed
+        if hasattr(previous_feed, 'stop'):
+            previous_feed.stop()
+
+    def _resampling_source_key(self, config: CandlesConfig) -> Optional[str]:
+        """
+        :return: the key of the regular feed of the same trading pair with the coarsest interval the candles can be
+            derived from, without keeping more than `MAX_RESAMPLING_SOURCE_RECORDS` candles
+        """
+        source_keys = [
+            key for key, feed_config in self._candles_configs.items()
+            if (feed_config.connector == config.connector
+                and feed_config.trading_pair == config.trading_pair
+                and not isinstance(self.candles_feeds.get(key), ResampledCandles)
+                and ResampledCandles.can_resample(feed_config.interval, config.interval)
+                and ResampledCandles.required_source_records(
+                    feed_config.interval, config.interval, config.max_records) <= max(
+                    self.MAX_RESAMPLING_SOURCE_RECORDS, self.candles_feeds[key].max_records))
+        ]
+        if len(source_keys) == 0:
+            return None
+        return max(source_keys, key=lambda key: CandlesBase.interval_to_seconds[self._candles_configs[key].interval])
+
+    def _ensure_source_records(self, source_key: str, records: int):
+        """
+        Restarts the source feed with more history if it doesn't keep `records` candles. The feeds derived from it
+        are moved to the new feed.
+        """
+        source_feed = self.candles_feeds[source_key]
+        if source_feed.max_records >= records:
+            return source_feed
+        source_config = self._candles_configs[source_key]
+        source_feed = self._start_candle_feed(source_config.copy(update={"max_records": records}))
+        self._replace_candle_feed(source_key, source_config, source_feed)
+        return source_feed
+
+    def _derivable_feed_keys(self, config: CandlesConfig) -> List[str]:
+        """
+        :return: the keys of the feeds of coarser intervals of the same trading pair that a feed of the config
+            interval can replace, with the feeds derived from them. A feed is only replaced if all the feeds derived
+            from it can be derived from the new feed as well.
+        """
+        key = self._generate_candle_feed_key(config)
+
+        def derivable(feed_key: str) -> bool:
+            feed_config = self._candles_configs[feed_key]
+            return (feed_key != key
+                    and feed_config.connector == config.connector
+                    and feed_config.trading_pair == config.trading_pair
+                    and ResampledCandles.can_resample(config.interval, feed_config.interval)
+                    and ResampledCandles.required_source_records(
+                        config.interval, feed_config.interval,
+                        feed_config.max_records) <= self.MAX_RESAMPLING_SOURCE_RECORDS)
+
+        derivable_keys = []
+        for feed_key, feed in self.candles_feeds.items():
+            if feed_key == key or isinstance(feed, ResampledCandles) or not derivable(feed_key):
+                continue
+            dependent_keys = self._derived_feed_keys(feed)
+            if all(derivable(dependent_key) for dependent_key in dependent_keys):
+                derivable_keys.append(feed_key)
+                derivable_keys.extend(dependent_keys)
+        return derivable_keys
 
     def get_connector(self, connector_name: str) -> ConnectorBase:
         """
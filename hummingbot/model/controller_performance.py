@@ -0,0 +1,25 @@
+from sqlalchemy import JSON, Column, Float, Integer, Text
+
+from hummingbot.model import HummingbotBase
+from hummingbot.model.decimal_type_decorator import SqliteDecimal
+
+
+class ControllerPerformance(HummingbotBase):
+    """
+    Aggregates of the stored executors of a controller that are not active anymore, updated as the executors are
+    stored, so the performance report of the controller doesn't load its executors history. The failed executors are
+    left out, and the close type counts are keyed by the close type value.
+
+    The sums are stored as integers with DECIMAL_SCALE decimals, so the incremental updates don't accumulate float
+    rounding errors.
+    """
+    __tablename__ = "ControllerPerformance"
+
+    DECIMAL_SCALE = 6
+
+    controller_id = Column(Text, primary_key=True)
+    timestamp = Column(Float, nullable=False)
+    executors_count = Column(Integer, nullable=False)
+    realized_pnl_quote = Column(SqliteDecimal(DECIMAL_SCALE), nullable=False)
+    volume_traded = Column(SqliteDecimal(DECIMAL_SCALE), nullable=False)
+    close_type_counts = Column(JSON, nullable=False)
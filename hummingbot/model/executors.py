@@ -17,6 +17,7 @@ class Executors(HummingbotBase):
         Index("ex_close_timestamp", "close_timestamp"),
         Index("ex_status", "status"),
         Index("ex_type_status", "type", "status"),
+        Index("ex_controller_active_timestamp", "controller_id", "is_active", "timestamp"),
     )
     id = Column(Text, primary_key=True)
     timestamp = Column(Float, nullable=False)
@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, Optional
 
 from sqlalchemy import MetaData, create_engine, inspect
 from sqlalchemy.engine.base import Engine
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Query, Session, sessionmaker
 from sqlalchemy.schema import DropConstraint, ForeignKeyConstraint, Table
 
@@ -75,6 +76,7 @@ class SQLConnectionManager(TransactionBase):
             self._engine: Engine = create_engine(client_config_map.db_mode.get_url(self.db_path))
             self._metadata: MetaData = self.get_declarative_base().metadata
             self._metadata.create_all(self._engine)
+            self._create_missing_indexes()
 
             # SQLite does not enforce foreign key constraint, but for others engines, we need to drop it.
             # See: `hummingbot/market/markets_recorder.py`, at line 213.
@@ -96,6 +98,22 @@ class SQLConnectionManager(TransactionBase):
         if connection_type is SQLConnectionType.TRADE_FILLS and (not called_from_migrator):
             self.check_and_migrate_db(client_config_map)
 
+    def _create_missing_indexes(self):
+        """
+        create_all only creates the indexes of the tables it creates. The indexes added to the models of tables that
+        already exist in the database are created here.
+        """
+        existing_tables = set(inspect(self._engine).get_table_names())
+        for table in self._metadata.sorted_tables:
+            if table.name not in existing_tables:
+                continue
+            for index in table.indexes:
+                try:
+                    index.create(self._engine, checkfirst=True)
+                except SQLAlchemyError:
+                    self.logger().warning(f"Could not create the index {index.name} of the {table.name} table.",
+                                          exc_info=True)
+
     @property
     def engine(self) -> Engine:
         return self._engine
@@ -0,0 +1,299 @@
+import asyncio
+import copy
+import os
+import pickle
+import struct
+from decimal import Decimal
+from multiprocessing import Pipe, resource_tracker
+from multiprocessing.connection import Connection
+from multiprocessing.shared_memory import SharedMemory
+from queue import Empty
+from typing import Any, Optional, Tuple
+
+import numpy as np
+
+from hummingbot.pmm_script.pmm_script_interface import OnTick
+
+INT64_MIN = -(2 ** 63)
+INT64_MAX = 2 ** 63 - 1
+
+
+class SharedMemoryRingBuffer:
+    """
+    Single producer single consumer ring buffer of variable length records, stored in a shared memory segment.
+
+    Layout: int64 header [write position, read position], then the records area. The positions only grow, the
+    offset of a record is its position modulo the capacity. A record is a uint32 payload length and a uint8 kind,
+    followed by the payload, and is never split: when it doesn't fit before the end of the area, the writer marks the
+    end as unused (with a zero length when there is room for it) and writes the record at the beginning. Records are
+    limited to half the capacity, so that they always fit once the reader caught up.
+    The writer only moves the write position and the reader only the read position, so they never lock each other.
+    """
+
+    HEADER_SIZE = 2
+    RECORD_HEADER = struct.Struct("<IB")
+
+    def __init__(self, shared_memory: SharedMemory, owner: bool):
+        self._shared_memory = shared_memory
+        self._owner = owner
+        header_bytes = self.HEADER_SIZE * 8
+        self._positions = np.ndarray((self.HEADER_SIZE,), dtype=np.int64, buffer=shared_memory.buf, offset=0)
+        self._capacity = shared_memory.size - header_bytes
+        self._records = shared_memory.buf[header_bytes:header_bytes + self._capacity]
+
+    @classmethod
+    def create(cls, capacity: int) -> "SharedMemoryRingBuffer":
+        shared_memory = SharedMemory(create=True, size=cls.HEADER_SIZE * 8 + capacity)
+        ring_buffer = cls(shared_memory=shared_memory, owner=True)
+        ring_buffer._positions[:] = 0
+        return ring_buffer
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedMemoryRingBuffer":
+        """
+        Attaches to a segment created by another process. The creating process is the only one unlinking it.
+        """
+        shared_memory = SharedMemory(name=name)
+        # The resource tracker would otherwise unlink the segment when the attaching process exits
+        resource_tracker.unregister(shared_memory._name, "shared_memory")
+        return cls(shared_memory=shared_memory, owner=False)
+
+    @property
+    def name(self) -> str:
+        return self._shared_memory.name
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def empty(self) -> bool:
+        return self._positions[0] == self._positions[1]
+
+    def write(self, kind: int, payload: bytes) -> bool:
+        """
+        :return: False if there is not enough free space for the record, which is then not written
+        """
+        record_size = self.RECORD_HEADER.size + len(payload)
+        if record_size > self._capacity // 2:
+            raise ValueError(f"The {record_size} bytes record is larger than half the {self._capacity} bytes ring "
+                             f"buffer.")
+        write_position = int(self._positions[0])
+        offset = write_position % self._capacity
+        contiguous_size = self._capacity - offset
+        required_size = record_size if record_size <= contiguous_size else contiguous_size + record_size
+        if write_position + required_size - int(self._positions[1]) > self._capacity:
+            return False
+        if record_size > contiguous_size:
+            if contiguous_size >= self.RECORD_HEADER.size:
+                self.RECORD_HEADER.pack_into(self._records, offset, 0, kind)
+            write_position += contiguous_size
+            offset = 0
+        self.RECORD_HEADER.pack_into(self._records, offset, len(payload), kind)
+        payload_offset = offset + self.RECORD_HEADER.size
+        self._records[payload_offset:payload_offset + len(payload)] = payload
+        # The record is published to the reader once it is complete
+        self._positions[0] = write_position + record_size
+        return True
+
+    def read(self) -> Optional[Tuple[int, bytes]]:
+        """
+        :return: the kind and the payload of the next record, None if there is none
+        """
+        read_position = int(self._positions[1])
+        write_position = int(self._positions[0])
+        while read_position < write_position:
+            offset = read_position % self._capacity
+            contiguous_size = self._capacity - offset
+            if contiguous_size < self.RECORD_HEADER.size:
+                read_position += contiguous_size
+                continue
+            length, kind = self.RECORD_HEADER.unpack_from(self._records, offset)
+            if length == 0:
+                read_position += contiguous_size
+                continue
+            payload_offset = offset + self.RECORD_HEADER.size
+            payload = bytes(self._records[payload_offset:payload_offset + length])
+            self._positions[1] = read_position + self.RECORD_HEADER.size + length
+            return kind, payload
+        self._positions[1] = read_position
+        return None
+
+    def close(self):
+        # Views have to be released before the shared memory can be closed
+        self._positions = None
+        self._records.release()
+        self._shared_memory.close()
+        if self._owner:
+            self._shared_memory.unlink()
+
+
+class PMMScriptChannel:
+    """
+    One way channel between the strategy process and a PMM script process, with the `put`, `get` and `empty`
+    methods of the multiprocessing queue it replaces.
+
+    The messages are written into a shared memory ring buffer, and the reader is woken up through a pipe, so it can
+    wait for messages in its event loop (`wait`) instead of polling the channel. Ticks are sent as fixed layout records
+    carrying the mid price only, as long as the strategy parameters and the balances didn't change since the last
+    tick; the other messages, and the ticks when they changed, are pickled.
+    Messages that don't fit in the ring buffer while the reader is behind are kept by the writer, and written before
+    the next message.
+    """
+
+    DEFAULT_CAPACITY = 1024 * 1024
+    # Safety net in case the reader missed the pipe notification, the messages are normally handled right away
+    WAIT_TIMEOUT = 1.0
+
+    PICKLED_MESSAGE = 1
+    TICK_MESSAGE = 2
+    TICK_RECORD = struct.Struct("<qi")
+
+    def __init__(self, ring_buffer: SharedMemoryRingBuffer, notify_reader: Connection, notify_writer: Connection):
+        self._ring_buffer = ring_buffer
+        self._notify_reader = notify_reader
+        self._notify_writer = notify_writer
+        self._pending_records = []
+        self._last_sent_tick: Optional[OnTick] = None
+        self._last_received_tick: Optional[OnTick] = None
+        self._messages_available: Optional[asyncio.Event] = None
+        self._ev_loop: Optional[asyncio.AbstractEventLoop] = None
+        # The writer never blocks on the notifications, the reader consumes them all at once
+        os.set_blocking(notify_reader.fileno(), False)
+        os.set_blocking(notify_writer.fileno(), False)
+
+    @classmethod
+    def create(cls, capacity: int = DEFAULT_CAPACITY) -> "PMMScriptChannel":
+        notify_reader, notify_writer = Pipe(duplex=False)
+        return cls(SharedMemoryRingBuffer.create(capacity), notify_reader, notify_writer)
+
+    def __getstate__(self):
+        # The other process attaches to the shared memory segment, and gets its own copy of the pipe
+        return {"name": self._ring_buffer.name,
+                "notify_reader": self._notify_reader,
+                "notify_writer": self._notify_writer}
+
+    def __setstate__(self, state):
+        self.__init__(SharedMemoryRingBuffer.attach(state["name"]), state["notify_reader"], state["notify_writer"])
+
+    def put(self, item: Any):
+        record = self._encode(item)
+        if len(self._pending_records) > 0 and not self._write_pending_records():
+            self._pending_records.append(record)
+            return
+        if not self._ring_buffer.write(*record):
+            self._pending_records.append(record)
+            return
+        self._notify()
+
+    def empty(self) -> bool:
+        return self._ring_buffer.empty()
+
+    def get(self) -> Any:
+        """
+        :return: the next message, raising `queue.Empty` if there is none
+        """
+        record = self._ring_buffer.read()
+        if record is None:
+            raise Empty()
+        return self._decode(*record)
+
+    async def wait(self, timeout: float = WAIT_TIMEOUT):
+        """
+        Waits until the channel has messages, or the timeout is reached.
+        """
+        if self._messages_available is None:
+            self._messages_available = asyncio.Event()
+            self._ev_loop = asyncio.get_event_loop()
+            self._ev_loop.add_reader(self._notify_reader.fileno(), self._on_notification)
+        while self.empty():
+            self._messages_available.clear()
+            # Messages written after this check notify the reader, so they can't be missed
+            if not self.empty():
+                break
+            try:
+                await asyncio.wait_for(self._messages_available.wait(), timeout)
+            except asyncio.TimeoutError:
+                return
+
+    def flush(self) -> bool:
+        """
+        Writes the messages that didn't fit in the ring buffer yet.
+        :return: True if there is no message left to write
+        """
+        return len(self._pending_records) == 0 or self._write_pending_records()
+
+    def close(self):
+        if self._ev_loop is not None:
+            if not self._ev_loop.is_closed():
+                self._ev_loop.remove_reader(self._notify_reader.fileno())
+            self._ev_loop = None
+            self._messages_available = None
+        self._notify_reader.close()
+        self._notify_writer.close()
+        self._ring_buffer.close()
+
+    def _write_pending_records(self) -> bool:
+        written_count = 0
+        for record in self._pending_records:
+            if not self._ring_buffer.write(*record):
+                break
+            written_count += 1
+        if written_count > 0:
+            del self._pending_records[:written_count]
+            self._notify()
+        return len(self._pending_records) == 0
+
+    def _notify(self):
+        try:
+            os.write(self._notify_writer.fileno(), b"\0")
+        except BlockingIOError:
+            # The pipe is full of notifications the reader did not consume yet
+            pass
+
+    def _on_notification(self):
+        try:
+            while os.read(self._notify_reader.fileno(), 4096):
+                pass
+        except BlockingIOError:
+            pass
+        self._messages_available.set()
+
+    def _encode(self, item: Any) -> Tuple[int, bytes]:
+        if isinstance(item, OnTick):
+            tick_record = self._tick_record(item)
+            if tick_record is not None:
+                return self.TICK_MESSAGE, tick_record
+            self._last_sent_tick = item
+        return self.PICKLED_MESSAGE, pickle.dumps(item, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def _decode(self, kind: int, payload: bytes) -> Any:
+        if kind == self.TICK_MESSAGE:
+            mantissa, exponent = self.TICK_RECORD.unpack(payload)
+            last_tick = self._last_received_tick
+            # Each tick gets its own parameters, as scripts change them to update the strategy
+            return OnTick(Decimal(mantissa).scaleb(exponent),
+                          copy.copy(last_tick.pmm_parameters),
+                          last_tick.all_total_balances,
+                          last_tick.all_available_balances)
+        item = pickle.loads(payload)
+        if isinstance(item, OnTick):
+            self._last_received_tick = item
+        return item
+
+    def _tick_record(self, tick: OnTick) -> Optional[bytes]:
+        """
+        :return: the fixed layout record of the tick, None if it has to be pickled
+        """
+        last_tick = self._last_sent_tick
+        if (last_tick is None
+                or vars(tick.pmm_parameters) != vars(last_tick.pmm_parameters)
+                or tick.all_total_balances != last_tick.all_total_balances
+                or tick.all_available_balances != last_tick.all_available_balances
+                or not isinstance(tick.mid_price, Decimal)
+                or not tick.mid_price.is_finite()):
+            return None
+        exponent = tick.mid_price.as_tuple().exponent
+        mantissa = int(tick.mid_price.scaleb(-exponent))
+        if not INT64_MIN <= mantissa <= INT64_MAX:
+            return None
+        return self.TICK_RECORD.pack(mantissa, exponent)
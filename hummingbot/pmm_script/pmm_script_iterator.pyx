@@ -2,7 +2,7 @@
 
 import asyncio
 import logging
-from multiprocessing import Process, Queue
+from multiprocessing import Process
 from pathlib import Path
 from typing import List
 
@@ -16,6 +16,7 @@ from hummingbot.core.event.events import (
 )
 from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.pmm_script.pmm_script_channel import PMMScriptChannel
 from hummingbot.pmm_script.pmm_script_interface import (
     CallLog,
     CallNotify,
@@ -59,8 +60,8 @@ cdef class PMMScriptIterator(TimeIterator):
             (MarketEvent.SellOrderCompleted, self._did_complete_sell_order_forwarder)
         ]
         self._ev_loop = asyncio.get_event_loop()
-        self._parent_queue = Queue()
-        self._child_queue = Queue()
+        self._parent_queue = PMMScriptChannel.create()
+        self._child_queue = PMMScriptChannel.create()
         self._listen_to_child_task = safe_ensure_future(self.listen_to_child_queue(), loop=self._ev_loop)
 
         self._script_process = Process(
@@ -85,10 +86,12 @@ cdef class PMMScriptIterator(TimeIterator):
     cdef c_stop(self, Clock clock):
         TimeIterator.c_stop(self, clock)
         self._parent_queue.put(None)
-        self._child_queue.put(None)
         self._script_process.join()
         if self._listen_to_child_task is not None:
             self._listen_to_child_task.cancel()
+            self._listen_to_child_task = None
+        self._parent_queue.close()
+        self._child_queue.close()
 
     cdef c_tick(self, double timestamp):
         TimeIterator.c_tick(self, timestamp)
@@ -119,7 +122,7 @@ cdef class PMMScriptIterator(TimeIterator):
         while True:
             try:
                 if self._child_queue.empty():
-                    await asyncio.sleep(self._queue_check_interval)
+                    await self._child_queue.wait()
                     continue
                 item = self._child_queue.get()
                 if item is None:
@@ -138,3 +138,14 @@ class BalancePaperCommandMessage(RPCMessage):
         status: Optional[int] = MQTT_STATUS_CODE.SUCCESS
         msg: Optional[str] = ''
         data: Optional[str] = ''
+
+
+class ProfileCommandMessage(RPCMessage):
+    class Request(RPCMessage.Request):
+        action: Optional[str] = 'show'
+        duration: Optional[float] = 5.0
+
+    class Response(RPCMessage.Response):
+        status: Optional[int] = MQTT_STATUS_CODE.SUCCESS
+        msg: Optional[str] = ''
+        data: Optional[Dict[str, Any]] = {}
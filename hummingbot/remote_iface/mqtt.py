@@ -29,6 +29,7 @@ from hummingbot.core.event import events
 from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
 from hummingbot.core.pubsub import PubSub
 from hummingbot.core.utils.async_utils import call_sync, safe_ensure_future
+from hummingbot.core.utils.tick_profiler import TickProfiler
 from hummingbot.notifier.notifier_base import NotifierBase
 from hummingbot.remote_iface.messages import (
     MQTT_STATUS_CODE,
@@ -42,6 +43,7 @@ from hummingbot.remote_iface.messages import (
     InternalEventMessage,
     LogMessage,
     NotifyMessage,
+    ProfileCommandMessage,
     StartCommandMessage,
     StatusCommandMessage,
     StatusUpdateMessage,
@@ -61,6 +63,7 @@ class CommandTopicSpecs:
     BALANCE_LIMIT: str = '/balance/limit'
     BALANCE_PAPER: str = '/balance/paper'
     COMMAND_SHORTCUT: str = '/command_shortcuts'
+    PROFILE: str = '/profile'
 
 
 class TopicSpecs:
@@ -100,6 +103,7 @@ class MQTTCommands:
         self._balance_limit_uri = f'{topic_prefix}{TopicSpecs.COMMANDS.BALANCE_LIMIT}'
         self._balance_paper_uri = f'{topic_prefix}{TopicSpecs.COMMANDS.BALANCE_PAPER}'
         self._shortcuts_uri = f'{topic_prefix}{TopicSpecs.COMMANDS.COMMAND_SHORTCUT}'
+        self._profile_uri = f'{topic_prefix}{TopicSpecs.COMMANDS.PROFILE}'
 
         self._init_commands()
 
@@ -149,6 +153,11 @@ class MQTTCommands:
             msg_type=CommandShortcutMessage,
             on_request=self._on_cmd_command_shortcut
         )
+        self._node.create_rpc(
+            rpc_name=self._profile_uri,
+            msg_type=ProfileCommandMessage,
+            on_request=self._on_cmd_profile
+        )
 
     def _on_cmd_start(self, msg: StartCommandMessage.Request):
         response = StartCommandMessage.Response()
@@ -359,6 +368,38 @@ class MQTTCommands:
             response.msg = str(e)
         return response
 
+    def _on_cmd_profile(self, msg: ProfileCommandMessage.Request):
+        response = ProfileCommandMessage.Response()
+        profiler = TickProfiler.get_instance()
+        try:
+            if msg.action == 'start':
+                self._ev_loop.call_soon_threadsafe(profiler.enable)
+            elif msg.action == 'stop':
+                self._ev_loop.call_soon_threadsafe(profiler.disable)
+            elif msg.action == 'reset':
+                self._ev_loop.call_soon_threadsafe(profiler.reset)
+            elif msg.action == 'sample':
+                samples = call_sync(
+                    profiler.sample_stacks(msg.duration),
+                    loop=self._ev_loop,
+                    timeout=msg.duration + 10
+                )
+                response.data = {
+                    'samples': [
+                        {'function': function, 'self': self_share, 'inclusive': inclusive_share}
+                        for function, self_share, inclusive_share in samples
+                    ]
+                }
+            elif msg.action == 'show':
+                response.data = profiler.snapshot()
+            else:
+                response.status = MQTT_STATUS_CODE.ERROR
+                response.msg = f'Invalid profile action: {msg.action}'
+        except Exception as e:
+            response.status = MQTT_STATUS_CODE.ERROR
+            response.msg = str(e)
+        return response
+
 
 class MQTTMarketEventForwarder:
     @classmethod
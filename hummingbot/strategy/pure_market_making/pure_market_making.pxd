@@ -61,6 +61,11 @@ cdef class PureMarketMakingStrategy(StrategyBase):
 
     cdef object c_get_mid_price(self)
     cdef object c_create_base_proposal(self)
+    cdef tuple c_build_order_levels(self,
+                                    object buy_reference_price,
+                                    object sell_reference_price,
+                                    int buy_levels_count,
+                                    int sell_levels_count)
     cdef tuple c_get_adjusted_available_balance(self, list orders)
     cdef c_apply_order_levels_modifiers(self, object proposal)
     cdef c_apply_price_band(self, object proposal)
@@ -77,6 +82,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
     cdef c_cancel_active_orders(self, object proposal)
     cdef c_cancel_orders_below_min_spread(self)
     cdef c_cancel_active_orders_on_max_age_limit(self)
+    cdef c_batch_cancel_orders(self, list orders)
     cdef bint c_to_create_orders(self, object proposal)
     cdef c_execute_orders_proposal(self, object proposal)
     cdef set_timers(self)
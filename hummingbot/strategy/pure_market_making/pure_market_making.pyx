@@ -1,5 +1,6 @@
 import logging
 from decimal import Decimal
+from functools import partial
 from math import ceil, floor
 from typing import Dict, List, Optional
 
@@ -21,6 +22,7 @@ from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.strategy.order_book_asset_price_delegate cimport OrderBookAssetPriceDelegate
 from hummingbot.strategy.strategy_base import StrategyBase
 from hummingbot.strategy.utils import order_age
+from hummingbot.strategy_v2.utils.order_level_arrays import OrderLevelArrayBuilder
 from .data_types import PriceSize, Proposal
 from .inventory_cost_price_delegate import InventoryCostPriceDelegate
 from .inventory_skew_calculator cimport c_calculate_bid_ask_ratios_from_base_asset_ratio
@@ -801,25 +803,51 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                         if size > 0 and price > 0:
                             sells.append(PriceSize(price, size))
         else:
-            if not buy_reference_price.is_nan():
-                for level in range(0, self._buy_levels):
-                    price = buy_reference_price * (Decimal("1") - self._bid_spread - (level * self._order_level_spread))
-                    price = market.c_quantize_order_price(self.trading_pair, price)
-                    size = self._order_amount + (self._order_level_amount * level)
-                    size = market.c_quantize_order_amount(self.trading_pair, size)
-                    if size > 0:
-                        buys.append(PriceSize(price, size))
-            if not sell_reference_price.is_nan():
-                for level in range(0, self._sell_levels):
-                    price = sell_reference_price * (Decimal("1") + self._ask_spread + (level * self._order_level_spread))
-                    price = market.c_quantize_order_price(self.trading_pair, price)
-                    size = self._order_amount + (self._order_level_amount * level)
-                    size = market.c_quantize_order_amount(self.trading_pair, size)
-                    if size > 0:
-                        sells.append(PriceSize(price, size))
+            buy_levels_count = self._buy_levels if not buy_reference_price.is_nan() else 0
+            sell_levels_count = self._sell_levels if not sell_reference_price.is_nan() else 0
+            if buy_levels_count + sell_levels_count > 0:
+                buy_levels, sell_levels = self.c_build_order_levels(buy_reference_price,
+                                                                    sell_reference_price,
+                                                                    buy_levels_count,
+                                                                    sell_levels_count)
+                for levels, proposals in ((buy_levels, buys), (sell_levels, sells)):
+                    # Each level is truncated to its own increments, they can depend on the price or the size
+                    prices = OrderLevelArrayBuilder.quantize_values(
+                        levels.prices, partial(market.get_order_price_quantum, self.trading_pair))
+                    sizes = OrderLevelArrayBuilder.quantize_values(
+                        levels.amounts, partial(market.get_order_size_quantum, self.trading_pair))
+                    for price, size in zip(prices, sizes):
+                        # The connector still applies its own order rules
+                        price = market.c_quantize_order_price(self.trading_pair, price)
+                        size = market.c_quantize_order_amount(self.trading_pair, size)
+                        if size > 0:
+                            proposals.append(PriceSize(price, size))
 
         return Proposal(buys, sells)
 
+    cdef tuple c_build_order_levels(self,
+                                    object buy_reference_price,
+                                    object sell_reference_price,
+                                    int buy_levels_count,
+                                    int sell_levels_count):
+        """
+        Computes the prices and sizes of all the order levels in one vectorized pass. They are not quantized, the
+        increments of each level depend on its own price and size.
+        :return: (buy levels, sell levels) as OrderLevels
+        """
+        builder = OrderLevelArrayBuilder()
+        order_level_spread = float(self._order_level_spread)
+        order_level_amount = float(self._order_level_amount)
+        buy_indexes = np.arange(buy_levels_count, dtype=np.float64)
+        sell_indexes = np.arange(sell_levels_count, dtype=np.float64)
+        return builder.build(
+            buy_reference_price=buy_reference_price if buy_levels_count > 0 else 0,
+            sell_reference_price=sell_reference_price if sell_levels_count > 0 else 0,
+            buy_spreads=float(self._bid_spread) + buy_indexes * order_level_spread,
+            sell_spreads=float(self._ask_spread) + sell_indexes * order_level_spread,
+            buy_amounts=float(self._order_amount) + buy_indexes * order_level_amount,
+            sell_amounts=float(self._order_amount) + sell_indexes * order_level_amount)
+
     cdef tuple c_get_adjusted_available_balance(self, list orders):
         """
         Calculates the available balance, plus the amount attributed to orders.
@@ -1181,8 +1209,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
             list active_orders = self.active_non_hanging_orders
 
         if active_orders and any(order_age(o, self._current_timestamp) > self._max_order_age for o in active_orders):
-            for order in active_orders:
-                self.c_cancel_order(self._market_info, order.client_order_id)
+            self.c_batch_cancel_orders(active_orders)
 
     cdef c_cancel_active_orders(self, object proposal):
         """
@@ -1212,13 +1239,28 @@ cdef class PureMarketMakingStrategy(StrategyBase):
 
         if not to_defer_canceling:
             self._hanging_orders_tracker.update_strategy_orders_with_equivalent_orders()
-            for order in self.active_non_hanging_orders:
-                # If is about to be added to hanging_orders then don't cancel
-                if not self._hanging_orders_tracker.is_potential_hanging_order(order):
-                    self.c_cancel_order(self._market_info, order.client_order_id)
+            # If is about to be added to hanging_orders then don't cancel
+            self.c_batch_cancel_orders([order for order in self.active_non_hanging_orders
+                                        if not self._hanging_orders_tracker.is_potential_hanging_order(order)])
         # else:
         #     self.set_timers()
 
+    cdef c_batch_cancel_orders(self, list orders):
+        """
+        Cancels the orders with a single batch cancelation, sent in one request by the exchanges supporting it
+        """
+        cdef:
+            list orders_to_cancel = []
+        for order in orders:
+            if self._sb_order_tracker.c_check_and_track_cancel(order.client_order_id):
+                self.log_with_clock(
+                    logging.INFO,
+                    f"({self.trading_pair}) Canceling the limit order {order.client_order_id}."
+                )
+                orders_to_cancel.append(order)
+        if len(orders_to_cancel) > 0:
+            self._market_info.market.batch_order_cancel(orders_to_cancel)
+
     # Cancel Non-Hanging, Active Orders if Spreads are below minimum_spread
     cdef c_cancel_orders_below_min_spread(self):
         cdef:
@@ -1245,9 +1287,10 @@ cdef class PureMarketMakingStrategy(StrategyBase):
 
     cdef c_execute_orders_proposal(self, object proposal):
         cdef:
-            double expiration_seconds = NaN
-            str bid_order_id, ask_order_id
-            bint orders_created = False
+            list orders_to_create = []
+            list created_orders
+            list created_buys
+            list created_sells
         # Number of pair of orders to track for hanging orders
         number_of_pairs = min((len(proposal.buys), len(proposal.sells))) if self._hanging_orders_enabled else 0
 
@@ -1260,20 +1303,6 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                     f"({self.trading_pair}) Creating {len(proposal.buys)} bid orders "
                     f"at (Size, Price): {price_quote_str}"
                 )
-            for idx, buy in enumerate(proposal.buys):
-                bid_order_id = self.c_buy_with_specific_market(
-                    self._market_info,
-                    buy.size,
-                    order_type=self._limit_order_type,
-                    price=buy.price,
-                    expiration_seconds=expiration_seconds
-                )
-                orders_created = True
-                if idx < number_of_pairs:
-                    order = next((o for o in self.active_orders if o.client_order_id == bid_order_id))
-                    if order:
-                        self._hanging_orders_tracker.add_current_pairs_of_proposal_orders_executed_by_strategy(
-                            CreatedPairOfOrders(order, None))
         if len(proposal.sells) > 0:
             if self._logging_options & self.OPTION_LOG_CREATE_ORDER:
                 price_quote_str = [f"{sell.size.normalize()} {self.base_asset}, "
@@ -1283,21 +1312,35 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                     f"({self.trading_pair}) Creating {len(proposal.sells)} ask "
                     f"orders at (Size, Price): {price_quote_str}"
                 )
-            for idx, sell in enumerate(proposal.sells):
-                ask_order_id = self.c_sell_with_specific_market(
-                    self._market_info,
-                    sell.size,
-                    order_type=self._limit_order_type,
-                    price=sell.price,
-                    expiration_seconds=expiration_seconds
-                )
-                orders_created = True
-                if idx < number_of_pairs:
-                    order = next((o for o in self.active_orders if o.client_order_id == ask_order_id))
-                    if order:
-                        self._hanging_orders_tracker.current_created_pairs_of_orders[idx].sell_order = order
-        if orders_created:
-            self.set_timers()
+        for is_buy, price_sizes in ((True, proposal.buys), (False, proposal.sells)):
+            for price_size in price_sizes:
+                orders_to_create.append(LimitOrder(client_order_id="",
+                                                   trading_pair=self.trading_pair,
+                                                   is_buy=is_buy,
+                                                   base_currency=self.base_asset,
+                                                   quote_currency=self.quote_asset,
+                                                   price=price_size.price,
+                                                   quantity=price_size.size))
+        if len(orders_to_create) == 0:
+            return
+
+        # All the levels are created together, in a single request by the exchanges supporting batch orders
+        created_orders = self._market_info.market.batch_order_create(orders_to_create,
+                                                                     limit_order_type=self._limit_order_type)
+        for order in created_orders:
+            self.c_start_tracking_limit_order(self._market_info,
+                                              order.client_order_id,
+                                              order.is_buy,
+                                              order.price,
+                                              order.quantity)
+        if number_of_pairs > 0:
+            active_orders = {o.client_order_id: o for o in self.active_orders}
+            created_buys = [order for order in created_orders if order.is_buy]
+            created_sells = [order for order in created_orders if not order.is_buy]
+            for buy, sell in zip(created_buys[:number_of_pairs], created_sells[:number_of_pairs]):
+                self._hanging_orders_tracker.add_current_pairs_of_proposal_orders_executed_by_strategy(
+                    CreatedPairOfOrders(active_orders[buy.client_order_id], active_orders[sell.client_order_id]))
+        self.set_timers()
 
     cdef set_timers(self):
         cdef double next_cycle = self._current_timestamp + self._order_refresh_time
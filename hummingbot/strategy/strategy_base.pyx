@@ -5,6 +5,8 @@ from typing import (
     List)
 
 from hummingbot.core.clock cimport Clock
+from hummingbot.core.clock_mode import ClockMode
+from hummingbot.core.early_tick_trigger import EarlyTickTrigger
 from hummingbot.core.event.events import MarketEvent, AccountEvent
 from hummingbot.core.event.event_listener cimport EventListener
 from hummingbot.core.network_iterator import NetworkStatus
@@ -162,6 +164,7 @@ cdef class StrategyBase(TimeIterator):
         self._sb_delegate_lock = False
 
         self._sb_order_tracker = OrderTracker()
+        self._sb_early_tick_trigger = None
 
     def init_params(self, *args, **kwargs):
         """
@@ -300,14 +303,22 @@ cdef class StrategyBase(TimeIterator):
     cdef c_start(self, Clock clock, double timestamp):
         TimeIterator.c_start(self, clock, timestamp)
         self._sb_order_tracker.c_start(clock, timestamp)
+        if clock.clock_mode is ClockMode.HYBRID and clock.early_tick_price_threshold == clock.early_tick_price_threshold:
+            self._sb_early_tick_trigger = EarlyTickTrigger(self, clock.early_tick_price_threshold)
+            self._sb_early_tick_trigger.watch_markets(self._sb_markets)
 
     cdef c_tick(self, double timestamp):
         TimeIterator.c_tick(self, timestamp)
         self._sb_order_tracker.c_tick(timestamp)
+        if self._sb_early_tick_trigger is not None:
+            self._sb_early_tick_trigger.update_order_books()
 
     cdef c_stop(self, Clock clock):
         TimeIterator.c_stop(self, clock)
         self._sb_order_tracker.c_stop(clock)
+        if self._sb_early_tick_trigger is not None:
+            self._sb_early_tick_trigger.stop()
+            self._sb_early_tick_trigger = None
         self.c_remove_markets(list(self._sb_markets))
 
     cdef c_add_markets(self, list markets):
@@ -334,6 +345,8 @@ cdef class StrategyBase(TimeIterator):
             typed_market.c_add_listener(self.RANGE_POSITION_FEE_COLLECTED_EVENT_TAG, self._sb_range_position_fee_collected_listener)
             typed_market.c_add_listener(self.RANGE_POSITION_CLOSED_EVENT_TAG, self._sb_range_position_closed_listener)
             self._sb_markets.add(typed_market)
+        if self._sb_early_tick_trigger is not None:
+            self._sb_early_tick_trigger.watch_markets(markets)
 
     def add_markets(self, markets: List[ConnectorBase]):
         self.c_add_markets(markets)
@@ -33,6 +33,7 @@ from hummingbot.strategy_v2.models.executor_actions import (
     StoreExecutorAction,
 )
 from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
+from hummingbot.strategy_v2.utils.file_watcher import FileWatcher
 
 
 class StrategyV2ConfigBase(BaseClientModel):
@@ -86,32 +87,35 @@ class StrategyV2ConfigBase(BaseClientModel):
         return v
 
     def load_controller_configs(self):
-        loaded_configs = []
-        for config_path in self.controllers_config:
-            full_path = os.path.join(settings.CONTROLLERS_CONF_DIR_PATH, config_path)
-            with open(full_path, 'r') as file:
-                config_data = yaml.safe_load(file)
+        return [self.load_controller_config(config_path) for config_path in self.controllers_config]
 
-            controller_type = config_data.get('controller_type')
-            controller_name = config_data.get('controller_name')
+    @staticmethod
+    def controller_config_full_path(config_path: str) -> str:
+        return os.path.join(settings.CONTROLLERS_CONF_DIR_PATH, config_path)
+
+    def load_controller_config(self, config_path: str) -> ControllerConfigBase:
+        full_path = self.controller_config_full_path(config_path)
+        with open(full_path, 'r') as file:
+            config_data = yaml.safe_load(file)
 
-            if not controller_type or not controller_name:
-                raise ValueError(f"Missing controller_type or controller_name in {config_path}")
+        controller_type = config_data.get('controller_type')
+        controller_name = config_data.get('controller_name')
 
-            module_path = f"{settings.CONTROLLERS_MODULE}.{controller_type}.{controller_name}"
-            module = importlib.import_module(module_path)
+        if not controller_type or not controller_name:
+            raise ValueError(f"Missing controller_type or controller_name in {config_path}")
 
-            config_class = next((member for member_name, member in inspect.getmembers(module)
-                                 if inspect.isclass(member) and member not in [ControllerConfigBase,
-                                                                               MarketMakingControllerConfigBase,
-                                                                               DirectionalTradingControllerConfigBase]
-                                 and (issubclass(member, ControllerConfigBase))), None)
-            if not config_class:
-                raise InvalidController(f"No configuration class found in the module {controller_name}.")
+        module_path = f"{settings.CONTROLLERS_MODULE}.{controller_type}.{controller_name}"
+        module = importlib.import_module(module_path)
 
-            loaded_configs.append(config_class(**config_data))
+        config_class = next((member for member_name, member in inspect.getmembers(module)
+                             if inspect.isclass(member) and member not in [ControllerConfigBase,
+                                                                           MarketMakingControllerConfigBase,
+                                                                           DirectionalTradingControllerConfigBase]
+                             and (issubclass(member, ControllerConfigBase))), None)
+        if not config_class:
+            raise InvalidController(f"No configuration class found in the module {controller_name}.")
 
-        return loaded_configs
+        return config_class(**config_data)
 
     @validator('markets', pre=True)
     def parse_markets(cls, v) -> Dict[str, Set[str]]:
@@ -205,12 +209,16 @@ class StrategyV2Base(ScriptStrategyBase):
         self.market_data_provider = MarketDataProvider(connectors)
         self.market_data_provider.initialize_candles_feed_list(config.candles_config)
         self.controllers: Dict[str, ControllerBase] = {}
+        self._controller_config_files_watcher = FileWatcher()
         self.initialize_controllers()
 
     def initialize_controllers(self):
         """
         Initialize the controllers based on the provided configuration.
         """
+        # The config files are checked first, so the periodic updates only reload the files changed after this point
+        self._controller_config_files_watcher.changed_files(
+            [self.config.controller_config_full_path(config_path) for config_path in self.config.controllers_config])
         controllers_configs = self.config.load_controller_configs()
         for controller_config in controllers_configs:
             self.add_controller(controller_config)
@@ -227,15 +235,32 @@ class StrategyV2Base(ScriptStrategyBase):
     def update_controllers_configs(self):
         """
         Update the controllers configurations based on the provided configuration.
+        Only the config files that changed since they were last loaded are parsed again, and only the controllers
+        whose updatable fields changed are updated.
         """
         if self._last_config_update_ts + self.config.config_update_interval < self.current_timestamp:
             self._last_config_update_ts = self.current_timestamp
-            controllers_configs = self.config.load_controller_configs()
-            for controller_config in controllers_configs:
-                if controller_config.id in self.controllers:
-                    self.controllers[controller_config.id].update_config(controller_config)
-                else:
+            config_paths = {self.config.controller_config_full_path(config_path): config_path
+                            for config_path in self.config.controllers_config}
+            for full_path in self._controller_config_files_watcher.changed_files(config_paths):
+                try:
+                    controller_config = self.config.load_controller_config(config_paths[full_path])
+                except Exception as e:
+                    # Loaded again on the next update, even if the file doesn't change in the meantime. The other
+                    # changed files are still loaded.
+                    self._controller_config_files_watcher.forget(full_path)
+                    self.logger().error(f"Error loading the controller config {config_paths[full_path]}: {e}",
+                                        exc_info=True)
+                    continue
+                controller = self.controllers.get(controller_config.id)
+                if controller is None:
                     self.add_controller(controller_config)
+                    continue
+                config_updates = controller.get_config_updates(controller_config)
+                if len(config_updates) > 0:
+                    controller.update_config(controller_config)
+                    self.logger().info(f"Updated the {', '.join(config_updates)} config of the controller "
+                                       f"{controller_config.id}.")
 
     async def listen_to_executor_actions(self):
         """
@@ -274,10 +299,13 @@ class StrategyV2Base(ScriptStrategyBase):
 
     def on_stop(self):
         self.executor_orchestrator.stop()
-        self.market_data_provider.stop()
         self.listen_to_executor_actions_task.cancel()
+        # The controllers and the strategy release their candle feeds before the remaining feeds are stopped
         for controller in self.controllers.values():
             controller.stop()
+        for candles_config in self.config.candles_config:
+            self.market_data_provider.stop_candle_feed(candles_config)
+        self.market_data_provider.stop()
 
     def on_tick(self):
         self.update_executors_info()
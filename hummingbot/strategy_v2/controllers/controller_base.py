@@ -3,7 +3,7 @@ from __future__ import annotations
 import asyncio
 import importlib
 import inspect
-from typing import Callable, Dict, List, Set
+from typing import Any, Callable, Dict, List, Set
 
 from pydantic import Field, validator
 
@@ -124,6 +124,7 @@ class ControllerBase(RunnableBase):
         self.processed_data = {}
         self.executors_update_event = asyncio.Event()
         self.executors_info_queue = asyncio.Queue()
+        self._candles_initialized = False
 
     def start(self):
         """
@@ -136,9 +137,40 @@ class ControllerBase(RunnableBase):
             safe_ensure_future(self.control_loop())
         self.initialize_candles()
 
+    def stop(self):
+        super().stop()
+        self.release_candles()
+
     def initialize_candles(self):
+        # The feeds are shared with the other consumers, the controller is counted once as long as it runs
+        if self._candles_initialized:
+            return
         for candles_config in self.config.candles_config:
             self.market_data_provider.initialize_candles_feed(candles_config)
+        self._candles_initialized = True
+
+    def release_candles(self):
+        """
+        Unregisters the controller from its candle feeds, which are stopped if no other consumer uses them.
+        """
+        if not self._candles_initialized:
+            return
+        for candles_config in self.config.candles_config:
+            self.market_data_provider.stop_candle_feed(candles_config)
+        self._candles_initialized = False
+
+    def get_config_updates(self, new_config: ControllerConfigBase) -> Dict[str, Any]:
+        """
+        Returns the values of the updatable variables that differ in the new configuration, by variable name.
+        """
+        config_updates = {}
+        for field in self.config.__fields__.values():
+            client_data = field.field_info.extra.get("client_data")
+            if client_data and client_data.is_updatable:
+                new_value = getattr(new_config, field.name)
+                if getattr(self.config, field.name) != new_value:
+                    config_updates[field.name] = new_value
+        return config_updates
 
     def update_config(self, new_config: ControllerConfigBase):
         """
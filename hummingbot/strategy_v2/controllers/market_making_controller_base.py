@@ -227,6 +227,8 @@ class MarketMakingControllerBase(ControllerBase):
     def __init__(self, config: MarketMakingControllerConfigBase, *args, **kwargs):
         super().__init__(config, *args, **kwargs)
         self.config = config
+        self._order_levels_key: Optional[tuple] = None
+        self._order_levels: Optional[Tuple[List[Tuple[Decimal, Decimal]], List[Tuple[Decimal, Decimal]]]] = None
 
     def determine_executor_actions(self) -> List[ExecutorAction]:
         """
@@ -308,12 +310,33 @@ class MarketMakingControllerBase(ControllerBase):
         """
         level = self.get_level_from_level_id(level_id)
         trade_type = self.get_trade_type_from_level_id(level_id)
-        spreads, amounts_quote = self.config.get_spreads_and_amounts_in_quote(trade_type)
+        buy_levels, sell_levels = self.get_order_levels()
+        levels = buy_levels if trade_type == TradeType.BUY else sell_levels
+        return levels[level]
+
+    def get_order_levels(self) -> Tuple[List[Tuple[Decimal, Decimal]], List[Tuple[Decimal, Decimal]]]:
+        """
+        Get the price and base amount of each buy and sell level. They are computed for all the levels at once, and
+        reused until the reference price, the spread multiplier or the levels configuration change.
+        """
         reference_price = self.processed_data["reference_price"]
-        spread_in_pct = Decimal(spreads[int(level)]) * self.processed_data["spread_multiplier"]
-        side_multiplier = Decimal("-1") if trade_type == TradeType.BUY else Decimal("1")
-        order_price = reference_price * (1 + side_multiplier * spread_in_pct)
-        return order_price, Decimal(amounts_quote[int(level)]) / order_price
+        spread_multiplier = self.processed_data["spread_multiplier"]
+        key = (reference_price, spread_multiplier,
+               tuple(self.config.buy_spreads), tuple(self.config.sell_spreads),
+               tuple(self.config.buy_amounts_pct), tuple(self.config.sell_amounts_pct),
+               self.config.total_amount_quote)
+        if key != self._order_levels_key:
+            order_levels = []
+            for trade_type, side_multiplier in ((TradeType.BUY, Decimal("-1")), (TradeType.SELL, Decimal("1"))):
+                spreads, amounts_quote = self.config.get_spreads_and_amounts_in_quote(trade_type)
+                levels = []
+                for spread, amount_quote in zip(spreads, amounts_quote):
+                    order_price = reference_price * (1 + side_multiplier * Decimal(spread) * spread_multiplier)
+                    levels.append((order_price, Decimal(amount_quote) / order_price))
+                order_levels.append(levels)
+            self._order_levels = tuple(order_levels)
+            self._order_levels_key = key
+        return self._order_levels
 
     def get_level_id_from_side(self, trade_type: TradeType, level: int) -> str:
         """
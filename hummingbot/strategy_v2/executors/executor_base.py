@@ -1,6 +1,6 @@
 from decimal import Decimal
 from functools import lru_cache
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from hummingbot.client.settings import AllConnectorSettings
 from hummingbot.connector.connector_base import ConnectorBase
@@ -47,14 +47,25 @@ class ExecutorBase(RunnableBase):
         self.connectors = {connector_name: connector for connector_name, connector in strategy.connectors.items() if
                            connector_name in connectors}
 
+        # Set when the executor info changes (order events, status changes), so the executors report only rebuilds
+        # the info of the executors that changed
+        self._executor_info_dirty: bool = True
+
         # Event forwarders for different order events
-        self._create_buy_order_forwarder = SourceInfoEventForwarder(self.process_order_created_event)
-        self._create_sell_order_forwarder = SourceInfoEventForwarder(self.process_order_created_event)
-        self._fill_order_forwarder = SourceInfoEventForwarder(self.process_order_filled_event)
-        self._complete_buy_order_forwarder = SourceInfoEventForwarder(self.process_order_completed_event)
-        self._complete_sell_order_forwarder = SourceInfoEventForwarder(self.process_order_completed_event)
-        self._cancel_order_forwarder = SourceInfoEventForwarder(self.process_order_canceled_event)
-        self._failed_order_forwarder = SourceInfoEventForwarder(self.process_order_failed_event)
+        self._create_buy_order_forwarder = SourceInfoEventForwarder(
+            self._dirty_marking_handler(self.process_order_created_event))
+        self._create_sell_order_forwarder = SourceInfoEventForwarder(
+            self._dirty_marking_handler(self.process_order_created_event))
+        self._fill_order_forwarder = SourceInfoEventForwarder(
+            self._dirty_marking_handler(self.process_order_filled_event))
+        self._complete_buy_order_forwarder = SourceInfoEventForwarder(
+            self._dirty_marking_handler(self.process_order_completed_event))
+        self._complete_sell_order_forwarder = SourceInfoEventForwarder(
+            self._dirty_marking_handler(self.process_order_completed_event))
+        self._cancel_order_forwarder = SourceInfoEventForwarder(
+            self._dirty_marking_handler(self.process_order_canceled_event))
+        self._failed_order_forwarder = SourceInfoEventForwarder(
+            self._dirty_marking_handler(self.process_order_failed_event))
 
         # Pairs of market events and their corresponding event forwarders
         self._event_pairs: List[Tuple[MarketEvent, SourceInfoEventForwarder]] = [
@@ -125,6 +136,26 @@ class ExecutorBase(RunnableBase):
             controller_id=self.config.controller_id,
         )
 
+    @property
+    def executor_info_dirty(self) -> bool:
+        """
+        Returns whether the executor info changed since it was last reported.
+        """
+        return self._executor_info_dirty
+
+    def mark_executor_info_dirty(self):
+        """
+        Flags the executor info as changed, so it is rebuilt in the next executors report.
+        """
+        self._executor_info_dirty = True
+
+    def report_executor_info(self) -> ExecutorInfo:
+        """
+        Returns the executor info for the executors report, and clears the dirty flag.
+        """
+        self._executor_info_dirty = False
+        return self.executor_info
+
     def get_custom_info(self) -> Dict:
         """
         Returns the custom info of the executor. Returns an empty dictionary by default, and can be reimplemented
@@ -162,6 +193,7 @@ class ExecutorBase(RunnableBase):
         """
         super().stop()
         self.unregister_events()
+        self.mark_executor_info_dirty()
 
     def on_start(self):
         """
@@ -254,6 +286,15 @@ class ExecutorBase(RunnableBase):
             for event_pair in self._event_pairs:
                 connector.remove_listener(event_pair[0], event_pair[1])
 
+    def _dirty_marking_handler(self, handler: Callable[[int, ConnectorBase, Any], None]):
+        """
+        Wraps an order event handler to flag the executor info as changed before processing the event.
+        """
+        def process_event(event_tag: int, market: ConnectorBase, event: Any):
+            self._executor_info_dirty = True
+            handler(event_tag, market, event)
+        return process_event
+
     def adjust_order_candidates(self, exchange: str, order_candidates: List[OrderCandidate]) -> List[OrderCandidate]:
         """
         Adjusts the order candidates based on the budget checker of the specified exchange.
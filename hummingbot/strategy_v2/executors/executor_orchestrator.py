@@ -1,6 +1,6 @@
 import logging
 from decimal import Decimal
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from hummingbot.connector.markets_recorder import MarketsRecorder
 from hummingbot.core.data_type.common import TradeType
@@ -10,6 +10,7 @@ from hummingbot.strategy_v2.executors.arbitrage_executor.arbitrage_executor impo
 from hummingbot.strategy_v2.executors.arbitrage_executor.data_types import ArbitrageExecutorConfig
 from hummingbot.strategy_v2.executors.dca_executor.data_types import DCAExecutorConfig
 from hummingbot.strategy_v2.executors.dca_executor.dca_executor import DCAExecutor
+from hummingbot.strategy_v2.executors.executor_base import ExecutorBase
 from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig
 from hummingbot.strategy_v2.executors.position_executor.position_executor import PositionExecutor
 from hummingbot.strategy_v2.executors.twap_executor.data_types import TWAPExecutorConfig
@@ -42,6 +43,11 @@ class ExecutorOrchestrator:
         self.strategy = strategy
         self.executors_update_interval = executors_update_interval
         self.executors = {}
+        # Executors report, updated incrementally: the info of the executors by controller and executor id, and the
+        # executors whose info can still change (the terminated ones are left out)
+        self._executors_info: Dict[str, Dict[str, ExecutorInfo]] = {}
+        self._reported_executors: Dict[str, List[ExecutorBase]] = {}
+        self._executors_report_timestamp: Optional[float] = None
 
     def stop(self):
         """
@@ -120,6 +126,7 @@ class ExecutorOrchestrator:
             self.logger().error(f"Executor ID {executor_id} not found for controller {controller_id}.")
             return
         executor.early_stop()
+        executor.mark_executor_info_dirty()
 
     def store_executor(self, action: StoreExecutorAction):
         """
@@ -142,27 +149,85 @@ class ExecutorOrchestrator:
     def get_executors_report(self) -> Dict[str, List[ExecutorInfo]]:
         """
         Generate a report of all executors.
+
+        The report is updated incrementally. The info of the active executors is rebuilt once per tick (their PnL
+        follows the market), and again within the tick only for the executors that changed (order events, status
+        changes). Once an executor is terminated its last info is kept as its summary and never rebuilt, so the cost
+        of the report doesn't grow with the executors history.
         """
+        timestamp = self.strategy.current_timestamp
+        new_tick = timestamp != self._executors_report_timestamp
+        self._executors_report_timestamp = timestamp
         report = {}
         for controller_id, executors_list in self.executors.items():
-            report[controller_id] = [executor.executor_info for executor in executors_list if executor]
+            executors_info = self._executors_info.get(controller_id, {})
+            # Executors are appended when created, so checking the last one catches a creation along with a removal
+            if (len(executors_list) != len(executors_info)
+                    or (len(executors_list) > 0 and executors_list[-1].config.id not in executors_info)):
+                self._sync_reported_executors(controller_id)
+            executors_info = self._executors_info[controller_id]
+            still_reported = []
+            for executor in self._reported_executors.get(controller_id, []):
+                executor_info = executors_info.get(executor.config.id)
+                if (executor_info is None
+                        or new_tick
+                        or executor.executor_info_dirty
+                        or executor.status != executor_info.status
+                        or executor.close_type != executor_info.close_type):
+                    executor_info = executor.report_executor_info()
+                    executors_info[executor.config.id] = executor_info
+                if not executor_info.is_done:
+                    still_reported.append(executor)
+            self._reported_executors[controller_id] = still_reported
+            report[controller_id] = list(executors_info.values())
         return report
 
+    def _sync_reported_executors(self, controller_id: str):
+        """
+        Keeps the report in line with the executors list when executors were created or stored.
+        """
+        previous_info = self._executors_info.get(controller_id, {})
+        reported_ids = {executor.config.id for executor in self._reported_executors.get(controller_id, [])}
+        executors_list = self.executors[controller_id]
+        self._executors_info[controller_id] = {executor.config.id: previous_info[executor.config.id]
+                                               for executor in executors_list
+                                               if executor.config.id in previous_info}
+        self._reported_executors[controller_id] = [
+            executor for executor in executors_list
+            if executor.config.id in reported_ids or executor.config.id not in previous_info]
+
     def generate_performance_report(self, controller_id: str) -> PerformanceReport:
-        # Fetch executors from database and active in-memory executors
-        db_executors = MarketsRecorder.get_instance().get_executors_by_controller(controller_id)
-        active_executor_ids = [executor.executor_info.id for executor in self.executors.get(controller_id, [])]
-        filtered_db_executors = [executor for executor in db_executors if executor.id not in active_executor_ids]
+        """
+        Generate the performance report of a controller.
+
+        The stored executors that are not active anymore are summarized by the controller performance aggregates, so
+        only the in-memory executors and the stored executors that are still active are loaded.
+        """
+        markets_recorder = MarketsRecorder.get_instance()
+        stored_performance = markets_recorder.get_controller_performance(controller_id)
         active_executors = [executor.executor_info for executor in self.executors.get(controller_id, [])]
-        combined_executors = active_executors + filtered_db_executors
+        active_executor_ids = [executor.id for executor in active_executors]
+        stored_active_executors = [executor for executor in markets_recorder.get_active_executors_by_controller(controller_id)
+                                   if executor.id not in active_executor_ids]
+        combined_executors = active_executors + stored_active_executors
 
-        # Initialize performance metrics
-        realized_pnl_quote = Decimal(0)
+        # Initialize performance metrics with the stored executors, without the ones still in memory
+        realized_pnl_quote = Decimal(stored_performance.realized_pnl_quote)
         unrealized_pnl_quote = Decimal(0)
-        volume_traded = Decimal(0)
+        volume_traded = Decimal(stored_performance.volume_traded)
         open_order_volume = Decimal(0)
         inventory_imbalance = Decimal(0)
-        close_type_counts = {}
+        close_type_counts = {CloseType(int(close_type)): count
+                             for close_type, count in stored_performance.close_type_counts.items()}
+        in_memory_contributions = markets_recorder.get_performance_contributions(active_executor_ids)
+        for close_type, stored_realized_pnl_quote, stored_volume_traded in in_memory_contributions.values():
+            realized_pnl_quote -= Decimal(stored_realized_pnl_quote)
+            volume_traded -= Decimal(stored_volume_traded)
+            if close_type is not None:
+                close_type = CloseType(close_type)
+                close_type_counts[close_type] = close_type_counts.get(close_type, 0) - 1
+                if close_type_counts[close_type] <= 0:
+                    del close_type_counts[close_type]
 
         for executor in combined_executors:
             close_type = executor.close_type
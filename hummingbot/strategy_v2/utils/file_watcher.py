@@ -0,0 +1,48 @@
+import hashlib
+import os
+from typing import Dict, Iterable, List, Tuple
+
+
+class FileWatcher:
+    """
+    Detects the files that changed since they were last checked.
+
+    The modification time and size of each file are checked first, and the file is only read to compare its content
+    hash when they changed, so checking unchanged files costs a stat call and files saved again with the same content
+    are not reported. Files that can't be accessed are always reported, for the caller to surface the error.
+    """
+
+    def __init__(self):
+        self._stats: Dict[str, Tuple[int, int]] = {}
+        self._digests: Dict[str, str] = {}
+
+    def changed_files(self, paths: Iterable[str]) -> List[str]:
+        """
+        :param paths: the paths of the files to check
+        :return: the paths of the files that changed, all of them the first time they are checked
+        """
+        changed_paths = []
+        for path in paths:
+            try:
+                stat = os.stat(path)
+                file_stat = (stat.st_mtime_ns, stat.st_size)
+                if self._stats.get(path) == file_stat:
+                    continue
+                with open(path, "rb") as file:
+                    digest = hashlib.sha256(file.read()).hexdigest()
+            except OSError:
+                self.forget(path)
+                changed_paths.append(path)
+                continue
+            self._stats[path] = file_stat
+            if self._digests.get(path) != digest:
+                self._digests[path] = digest
+                changed_paths.append(path)
+        return changed_paths
+
+    def forget(self, path: str):
+        """
+        Stops tracking the file, so it is reported as changed on the next check (e.g. when it couldn't be processed).
+        """
+        self._stats.pop(path, None)
+        self._digests.pop(path, None)
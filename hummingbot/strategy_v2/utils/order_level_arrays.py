@@ -0,0 +1,153 @@
+import math
+from decimal import Decimal
+from typing import Callable, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from hummingbot.connector.trading_rule import TradingRule
+
+Numbers = Union[Sequence[Union[Decimal, float, int]], np.ndarray]
+
+
+class OrderLevels(NamedTuple):
+    """
+    Prices and base amounts of the order levels of one side, as float64 arrays indexed by level.
+
+    When the builder quantized them, the values are multiples of the quantums, and are converted back to the exact
+    Decimal multiples when the orders are submitted.
+    """
+    prices: np.ndarray
+    amounts: np.ndarray
+    price_quantum: Optional[Decimal] = None
+    amount_quantum: Optional[Decimal] = None
+
+    @property
+    def levels_count(self) -> int:
+        return len(self.prices)
+
+    def price_at(self, level: int) -> Decimal:
+        return OrderLevelArrayBuilder.to_decimals(self.prices[level:level + 1], self.price_quantum)[0]
+
+    def amount_at(self, level: int) -> Decimal:
+        return OrderLevelArrayBuilder.to_decimals(self.amounts[level:level + 1], self.amount_quantum)[0]
+
+    def to_decimals(self) -> List[Tuple[Decimal, Decimal]]:
+        """
+        :return: the (price, amount) of each level
+        """
+        return list(zip(OrderLevelArrayBuilder.to_decimals(self.prices, self.price_quantum),
+                        OrderLevelArrayBuilder.to_decimals(self.amounts, self.amount_quantum)))
+
+
+class OrderLevelArrayBuilder:
+    """
+    Computes the prices and amounts of the order levels of both sides in one NumPy pass, instead of one Decimal
+    computation per level, for grids with many levels refreshed every tick.
+
+    The buy levels are placed at reference_price * (1 - spread) and the sell levels at reference_price * (1 + spread).
+    The prices and amounts are truncated to the quantums of the trading rule like the connectors do, within a relative
+    QUANTIZATION_TOLERANCE, so the float rounding of values on a step (e.g. 98.99999999999999 for 99) doesn't move
+    them one step down.
+    """
+
+    QUANTIZATION_TOLERANCE = 1e-12
+
+    def __init__(self, price_quantum: Optional[Decimal] = None, amount_quantum: Optional[Decimal] = None):
+        """
+        :param price_quantum: the price increment, the prices are not quantized if None
+        :param amount_quantum: the base amount increment, the amounts are not quantized if None
+        """
+        self._price_quantum = price_quantum
+        self._amount_quantum = amount_quantum
+
+    @classmethod
+    def from_trading_rule(cls, trading_rule: TradingRule) -> "OrderLevelArrayBuilder":
+        return cls(price_quantum=Decimal(trading_rule.min_price_increment),
+                   amount_quantum=Decimal(trading_rule.min_base_amount_increment))
+
+    @staticmethod
+    def to_decimals(values: np.ndarray, quantum: Optional[Decimal] = None) -> List[Decimal]:
+        """
+        Converts the values to Decimal, as the exact multiples of the quantum when it is set.
+        """
+        if quantum is None:
+            return [Decimal(str(value)) for value in values.tolist()]
+        steps = np.rint(values / float(quantum)).astype(np.int64)
+        return [Decimal(step) * quantum for step in steps.tolist()]
+
+    @classmethod
+    def quantize_values(cls, values: np.ndarray, quantum_for: Callable[[Decimal], Decimal]) -> List[Decimal]:
+        """
+        Truncates each value to its own quantum, for the markets whose increments depend on the value (e.g. a number
+        of significant digits). The quantum is looked up with the value corrected from the float rounding, the same
+        way `build` truncates.
+        :param values: the unquantized values
+        :param quantum_for: returns the quantum of a value
+        :return: the exact Decimal multiples of the quantums
+        """
+        quantized_values = []
+        for value in (np.asarray(values, dtype=np.float64) * (1 + cls.QUANTIZATION_TOLERANCE)).tolist():
+            quantum = quantum_for(Decimal(str(value)))
+            quantized_values.append(Decimal(math.trunc(value / float(quantum))) * quantum)
+        return quantized_values
+
+    @staticmethod
+    def budget_amounts(buy_weights: Numbers,
+                       sell_weights: Numbers,
+                       total_amount_quote: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Splits the budget between the levels of both sides proportionally to their weights.
+        :return: the buy and sell amounts in quote
+        """
+        buy_weights = np.asarray(buy_weights, dtype=np.float64)
+        sell_weights = np.asarray(sell_weights, dtype=np.float64)
+        total_weight = buy_weights.sum() + sell_weights.sum()
+        scale = float(total_amount_quote) / total_weight if total_weight > 0 else 0.0
+        return buy_weights * scale, sell_weights * scale
+
+    def build(self,
+              buy_reference_price: Union[Decimal, float],
+              sell_reference_price: Union[Decimal, float],
+              buy_spreads: Numbers,
+              sell_spreads: Numbers,
+              buy_amounts: Numbers,
+              sell_amounts: Numbers,
+              amounts_in_quote: bool = False) -> Tuple[OrderLevels, OrderLevels]:
+        """
+        :param buy_reference_price: the price the buy spreads are applied to
+        :param sell_reference_price: the price the sell spreads are applied to
+        :param buy_spreads: the spread of each buy level, as a fraction of the reference price
+        :param sell_spreads: the spread of each sell level
+        :param buy_amounts: the amount of each buy level
+        :param sell_amounts: the amount of each sell level
+        :param amounts_in_quote: True if the amounts are in quote, to be converted at the price of their level
+        :return: the buy and sell levels
+        """
+        buy_spreads = np.asarray(buy_spreads, dtype=np.float64)
+        sell_spreads = np.asarray(sell_spreads, dtype=np.float64)
+        buy_count = len(buy_spreads)
+        if len(buy_amounts) != buy_count or len(sell_amounts) != len(sell_spreads):
+            raise ValueError("Each level needs a spread and an amount.")
+
+        # Both sides are computed together: the buy levels first, then the sell levels
+        signed_spreads = np.concatenate((-buy_spreads, sell_spreads))
+        reference_prices = np.concatenate((np.full(buy_count, float(buy_reference_price)),
+                                           np.full(len(sell_spreads), float(sell_reference_price))))
+        prices = self._quantize(reference_prices * (1 + signed_spreads), self._price_quantum)
+        amounts = np.concatenate((np.asarray(buy_amounts, dtype=np.float64),
+                                  np.asarray(sell_amounts, dtype=np.float64)))
+        if amounts_in_quote:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                amounts = np.where(prices > 0, amounts / prices, 0.0)
+        amounts = self._quantize(amounts, self._amount_quantum)
+
+        return (OrderLevels(prices[:buy_count], amounts[:buy_count], self._price_quantum, self._amount_quantum),
+                OrderLevels(prices[buy_count:], amounts[buy_count:], self._price_quantum, self._amount_quantum))
+
+    def _quantize(self, values: np.ndarray, quantum: Optional[Decimal]) -> np.ndarray:
+        if quantum is None:
+            return values
+        quantum = float(quantum)
+        # Truncated towards zero like the Decimal floor division used by the connectors
+        steps = np.trunc(values / quantum * (1 + self.QUANTIZATION_TOLERANCE))
+        return steps * quantum
@@ -0,0 +1,79 @@
+import asyncio
+import unittest
+from typing import Awaitable
+from unittest.mock import MagicMock, patch
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter, read_system_configs_from_yml
+from hummingbot.client.hummingbot_application import HummingbotApplication
+from hummingbot.core.utils.tick_profiler import TickProfiler
+
+
+class ProfileCommandTest(unittest.TestCase):
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher")
+    def setUp(self, _: MagicMock) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.get_event_loop()
+
+        self.async_run_with_timeout(read_system_configs_from_yml())
+        self.client_config_map = ClientConfigAdapter(ClientConfigMap())
+
+        self.app = HummingbotApplication(client_config_map=self.client_config_map)
+        self.profiler = TickProfiler.get_instance()
+        self.profiler.reset()
+
+    def tearDown(self) -> None:
+        self.profiler.disable()
+        self.profiler.reset()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    @patch("hummingbot.client.hummingbot_application.HummingbotApplication.notify")
+    def test_profile_start_and_stop(self, notify_mock):
+        captures = []
+        notify_mock.side_effect = lambda s: captures.append(s)
+
+        self.app.profile("start")
+        self.assertTrue(self.profiler.enabled)
+        self.app.profile("stop")
+        self.assertFalse(self.profiler.enabled)
+
+        self.assertEqual(["Tick profiler started.", "Tick profiler stopped."], captures)
+
+    @patch("hummingbot.client.hummingbot_application.HummingbotApplication.notify")
+    def test_profile_show_when_not_running(self, notify_mock):
+        captures = []
+        notify_mock.side_effect = lambda s: captures.append(s)
+
+        self.app.profile("show")
+
+        self.assertEqual(["\n  Tick profiler is not running. Start it with `profile start`."], captures)
+
+    @patch("hummingbot.client.hummingbot_application.HummingbotApplication.notify")
+    def test_profile_show(self, notify_mock):
+        captures = []
+        notify_mock.side_effect = lambda s: captures.append(s)
+        self.profiler.enable()
+        self.profiler.record_tick("PureMarketMakingStrategy", 0.002)
+        self.profiler.record_tick_drift(0.001)
+
+        self.app.profile("show")
+
+        self.assertEqual(1, len(captures))
+        self.assertIn("Clock iterator tick durations:", captures[0])
+        self.assertIn("PureMarketMakingStrategy", captures[0])
+        self.assertIn("Tick drift", captures[0])
+        self.assertNotIn("Event listener durations:", captures[0])
+
+    @patch("hummingbot.client.hummingbot_application.HummingbotApplication.notify")
+    def test_show_profiler_samples(self, notify_mock):
+        captures = []
+        notify_mock.side_effect = lambda s: captures.append(s)
+
+        self.async_run_with_timeout(self.app.show_profiler_samples(0.1))
+
+        self.assertEqual(2, len(captures))
+        self.assertIn("Functions by self samples:", captures[1])
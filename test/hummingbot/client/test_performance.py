@@ -125,7 +125,7 @@ class PerformanceMetricsUnitTest(unittest.TestCase):
 
     def test_performance_metrics(self):
         rate_oracle = RateOracle()
-        rate_oracle._prices["USDT-HBOT"] = Decimal("5")
+        rate_oracle.set_price("USDT-HBOT", Decimal("5"))
         RateOracle._shared_instance = rate_oracle
 
         trade_fee = AddedToCostTradeFee(flat_fees=[TokenAmount(quote, Decimal("0"))])
@@ -174,7 +174,7 @@ class PerformanceMetricsUnitTest(unittest.TestCase):
     @patch('hummingbot.client.performance.PerformanceMetrics._is_trade_fill')
     def test_performance_metrics_for_derivatives(self, is_trade_fill_mock):
         rate_oracle = RateOracle()
-        rate_oracle._prices["USDT-HBOT"] = Decimal("5")
+        rate_oracle.set_price("USDT-HBOT", Decimal("5"))
         RateOracle._shared_instance = rate_oracle
 
         is_trade_fill_mock.return_value = True
@@ -256,8 +256,8 @@ class PerformanceMetricsUnitTest(unittest.TestCase):
 
     def test_calculate_fees_in_quote_for_one_trade_with_fees_different_tokens(self):
         rate_oracle = RateOracle()
-        rate_oracle._prices["DAI-COINALPHA"] = Decimal("2")
-        rate_oracle._prices["USDT-DAI"] = Decimal("0.9")
+        rate_oracle.set_price("DAI-COINALPHA", Decimal("2"))
+        rate_oracle.set_price("USDT-DAI", Decimal("0.9"))
         RateOracle._shared_instance = rate_oracle
 
         performance_metric = PerformanceMetrics()
@@ -289,8 +289,8 @@ class PerformanceMetricsUnitTest(unittest.TestCase):
 
     def test_calculate_fees_in_quote_for_one_trade_fill_with_fees_different_tokens(self):
         rate_oracle = RateOracle()
-        rate_oracle._prices["DAI-COINALPHA"] = Decimal("2")
-        rate_oracle._prices["USDT-DAI"] = Decimal("0.9")
+        rate_oracle.set_price("DAI-COINALPHA", Decimal("2"))
+        rate_oracle.set_price("USDT-DAI", Decimal("0.9"))
         RateOracle._shared_instance = rate_oracle
 
         performance_metric = PerformanceMetrics()
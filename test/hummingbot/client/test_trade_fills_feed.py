@@ -0,0 +1,163 @@
+import asyncio
+from decimal import Decimal
+from typing import Awaitable
+from unittest import TestCase
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from sqlalchemy import create_engine
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.client.performance import PerformanceMetrics
+from hummingbot.client.trade_fills_feed import TradeFillsFeed
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
+from hummingbot.model.trade_fill import TradeFill
+
+
+class TradeFillsFeedTests(TestCase):
+    config_file_path = "test_strategy.yml"
+
+    @staticmethod
+    def async_run_with_timeout(coroutine: Awaitable, timeout: int = 1):
+        ret = asyncio.get_event_loop().run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    @patch("hummingbot.model.sql_connection_manager.create_engine")
+    def setUp(self, engine_mock) -> None:
+        super().setUp()
+        engine_mock.return_value = create_engine("sqlite:///:memory:")
+        self.manager = SQLConnectionManager(
+            ClientConfigAdapter(ClientConfigMap()), SQLConnectionType.TRADE_FILLS, db_name="test_DB"
+        )
+        self.feed = TradeFillsFeed(sql_manager=self.manager, config_file_path=self.config_file_path,
+                                   start_timestamp=1000)
+        self.rate_oracle_patch = patch("hummingbot.client.performance.RateOracle")
+        rate_oracle_mock = self.rate_oracle_patch.start()
+        rate_oracle_mock.get_instance.return_value.stored_or_live_rate = AsyncMock(return_value=None)
+
+    def tearDown(self) -> None:
+        self.rate_oracle_patch.stop()
+        super().tearDown()
+
+    def _add_trade_fills(self, *fills):
+        with self.manager.get_new_session() as session:
+            for timestamp, trade_id, trade_type, price, amount, symbol, config_file_path in fills:
+                session.add(TradeFill(
+                    config_file_path=config_file_path,
+                    strategy="pure_market_making",
+                    market="binance",
+                    symbol=symbol,
+                    base_asset=symbol.split("-")[0],
+                    quote_asset=symbol.split("-")[1],
+                    timestamp=timestamp,
+                    order_id=f"OID{trade_id}",
+                    trade_type=trade_type,
+                    order_type="LIMIT",
+                    price=Decimal(price),
+                    amount=Decimal(amount),
+                    leverage=1,
+                    trade_fee=AddedToCostTradeFee(percent=Decimal("0.01")).to_json(),
+                    exchange_trade_id=f"EOID{trade_id}",
+                ))
+            session.commit()
+
+    def test_update_loads_only_new_fills(self):
+        self._add_trade_fills(
+            (999, 1, "BUY", "100", "1", "BTC-USDT", self.config_file_path),
+            (1000, 2, "BUY", "100", "1", "BTC-USDT", self.config_file_path),
+            (1001, 3, "SELL", "110", "1", "BTC-USDT", "other_strategy.yml"),
+            (1002, 4, "SELL", "110", "0.5", "BTC-USDT", self.config_file_path),
+        )
+
+        new_trades = self.feed.update()
+
+        self.assertEqual(["EOID2", "EOID4"], [trade.exchange_trade_id for trade in new_trades])
+        self.assertEqual([], self.feed.update())
+
+        # A fill recorded with the same timestamp as the last loaded one is loaded once
+        self._add_trade_fills(
+            (1002, 5, "SELL", "111", "0.5", "BTC-USDT", self.config_file_path),
+            (1003, 6, "BUY", "105", "0.2", "BTC-USDT", self.config_file_path),
+        )
+
+        new_trades = self.feed.update()
+
+        self.assertEqual(["EOID5", "EOID6"], [trade.exchange_trade_id for trade in new_trades])
+        self.assertEqual(["EOID2", "EOID4", "EOID5", "EOID6"],
+                         [trade.exchange_trade_id for trade in self.feed.trades])
+        self.assertEqual(["EOID5", "EOID6"], [trade.exchange_trade_id for trade in self.feed.trades_since(1002)[1:]])
+        self.assertEqual(4, len(self.feed.trades_since(0)))
+
+    def test_update_loads_fills_recorded_late(self):
+        self._add_trade_fills(
+            (1001, 1, "BUY", "100", "1", "BTC-USDT", self.config_file_path),
+            (1005, 2, "SELL", "110", "1", "BTC-USDT", self.config_file_path),
+        )
+        self.feed.update()
+
+        # Recorded after the fill of timestamp 1005
+        self._add_trade_fills((1003, 3, "BUY", "90", "2", "BTC-USDT", self.config_file_path))
+        new_trades = self.feed.update()
+
+        self.assertEqual(["EOID3"], [trade.exchange_trade_id for trade in new_trades])
+        self.assertEqual(["EOID1", "EOID3", "EOID2"], [trade.exchange_trade_id for trade in self.feed.trades])
+        self.assertEqual(["EOID3", "EOID2"], [trade.exchange_trade_id for trade in self.feed.trades_since(1002)])
+        self.assertEqual([], self.feed.update())
+        running_metrics = self.feed.market_metrics[("binance", "BTC-USDT")]
+        self.assertEqual(2, running_metrics.num_buys)
+        self.assertEqual(Decimal("3"), running_metrics.b_vol_base)
+
+        # Fills older than the window before the last loaded one are not loaded anymore
+        self._add_trade_fills((1005 + TradeFillsFeed.LATE_FILLS_WINDOW, 4, "BUY", "100", "1", "BTC-USDT",
+                               self.config_file_path))
+        self.feed.update()
+        self._add_trade_fills((1004, 5, "BUY", "100", "1", "BTC-USDT", self.config_file_path))
+        self.assertEqual([], self.feed.update())
+
+    def test_subscribers_receive_new_fills(self):
+        subscriber = MagicMock()
+        self.feed.subscribe(subscriber)
+        self.feed.subscribe(subscriber)
+
+        self.feed.update()
+        self._add_trade_fills((1001, 1, "BUY", "100", "1", "BTC-USDT", self.config_file_path))
+        self.feed.update()
+
+        subscriber.assert_called_once()
+        self.assertEqual(["EOID1"], [trade.exchange_trade_id for trade in subscriber.call_args.args[0]])
+
+        self.feed.unsubscribe(subscriber)
+        self._add_trade_fills((1002, 2, "BUY", "100", "1", "BTC-USDT", self.config_file_path))
+        self.feed.update()
+
+        subscriber.assert_called_once()
+
+    def test_running_metrics_match_metrics_calculated_from_all_fills(self):
+        balances = {"BTC": Decimal("1.3"), "USDT": Decimal("500"), "ETH": Decimal("2")}
+        self._add_trade_fills(
+            (1001, 1, "BUY", "100", "1", "BTC-USDT", self.config_file_path),
+            (1002, 2, "BUY", "10", "1", "ETH-USDT", self.config_file_path),
+        )
+        self.feed.update()
+        self._add_trade_fills(
+            (1003, 3, "SELL", "110", "0.5", "BTC-USDT", self.config_file_path),
+            (1004, 4, "BUY", "105", "0.8", "BTC-USDT", self.config_file_path),
+        )
+        self.feed.update()
+
+        self.assertEqual({("binance", "BTC-USDT"), ("binance", "ETH-USDT")}, set(self.feed.market_metrics.keys()))
+        running_metrics = self.feed.market_metrics[("binance", "BTC-USDT")]
+        self.async_run_with_timeout(running_metrics.update_metrics("BTC-USDT", balances))
+        btc_trades = [trade for trade in self.feed.trades if trade.symbol == "BTC-USDT"]
+        expected_metrics = self.async_run_with_timeout(PerformanceMetrics.create("BTC-USDT", btc_trades, balances))
+
+        for attribute in ("num_buys", "num_sells", "num_trades", "b_vol_base", "s_vol_base", "tot_vol_quote",
+                          "avg_tot_price", "start_price", "cur_price", "start_base_bal", "hold_value", "cur_value",
+                          "trade_pnl", "fee_in_quote", "total_pnl", "return_pct"):
+            self.assertEqual(getattr(expected_metrics, attribute), getattr(running_metrics, attribute), attribute)
+        self.assertEqual(dict(expected_metrics.fees), dict(running_metrics.fees))
+
+        # Updating again with the same fills doesn't count the fees twice
+        self.async_run_with_timeout(running_metrics.update_metrics("BTC-USDT", balances))
+        self.assertEqual(expected_metrics.fee_in_quote, running_metrics.fee_in_quote)
@@ -67,18 +67,29 @@ class InterfaceUtilsTest(unittest.TestCase):
             "CPU:    30%, Mem:   512.00 B (1.00 KB), Threads:   2, ",
             mock_monitor.log.call_args_list[0].args[0])
 
+    @staticmethod
+    def _performance_metrics_mock(*return_pcts_and_pnls):
+        perf = MagicMock()
+        results = list(return_pcts_and_pnls)
+
+        async def update_metrics(trading_pair, current_balances):
+            perf.return_pct, perf.total_pnl = results.pop(0)
+
+        perf.update_metrics = AsyncMock(side_effect=update_metrics)
+        return perf
+
     @patch("hummingbot.client.ui.interface_utils._sleep", new_callable=AsyncMock)
-    @patch("hummingbot.client.ui.interface_utils.PerformanceMetrics.create", new_callable=AsyncMock)
     @patch("hummingbot.client.hummingbot_application.HummingbotApplication")
-    def test_start_trade_monitor_multi_loops(self, mock_hb_app, mock_perf, mock_sleep):
+    def test_start_trade_monitor_multi_loops(self, mock_hb_app, mock_sleep):
         mock_result = MagicMock()
         mock_app = mock_hb_app.main_application()
         mock_app.strategy_task.done.return_value = False
         mock_app.markets.return_values = {"a": MagicMock(ready=True)}
-        mock_app._get_trades_from_session.return_value = [MagicMock(market="ExchangeA", symbol="HBOT-USDT")]
+        mock_feed = mock_app.trade_fills_feed()
+        mock_feed.trades = [MagicMock(market="ExchangeA", symbol="HBOT-USDT")]
+        perf = self._performance_metrics_mock((Decimal("0.01"), Decimal("2")), (Decimal("0.02"), Decimal("2")))
+        mock_feed.market_metrics = {("ExchangeA", "HBOT-USDT"): perf}
         mock_app.get_current_balances = AsyncMock()
-        mock_perf.side_effect = [MagicMock(return_pct=Decimal("0.01"), total_pnl=Decimal("2")),
-                                 MagicMock(return_pct=Decimal("0.02"), total_pnl=Decimal("2"))]
         mock_sleep.side_effect = [None, asyncio.CancelledError()]
         with self.assertRaises(asyncio.CancelledError):
             self.async_run_with_timeout(start_trade_monitor(mock_result))
@@ -86,22 +97,27 @@ class InterfaceUtilsTest(unittest.TestCase):
         self.assertEqual('Trades: 0, Total P&L: 0.00, Return %: 0.00%', mock_result.log.call_args_list[0].args[0])
         self.assertEqual('Trades: 1, Total P&L: 2.00 USDT, Return %: 1.00%', mock_result.log.call_args_list[1].args[0])
         self.assertEqual('Trades: 1, Total P&L: 2.00 USDT, Return %: 2.00%', mock_result.log.call_args_list[2].args[0])
+        # The fills are loaded incrementally on each loop, and the running metrics updated instead of recreated
+        self.assertEqual(2, mock_feed.update.call_count)
+        self.assertEqual(2, perf.update_metrics.call_count)
 
     @patch("hummingbot.client.ui.interface_utils._sleep", new_callable=AsyncMock)
-    @patch("hummingbot.client.ui.interface_utils.PerformanceMetrics.create", new_callable=AsyncMock)
     @patch("hummingbot.client.hummingbot_application.HummingbotApplication")
-    def test_start_trade_monitor_multi_pairs_diff_quotes(self, mock_hb_app, mock_perf, mock_sleep):
+    def test_start_trade_monitor_multi_pairs_diff_quotes(self, mock_hb_app, mock_sleep):
         mock_result = MagicMock()
         mock_app = mock_hb_app.main_application()
         mock_app.strategy_task.done.return_value = False
         mock_app.markets.return_values = {"a": MagicMock(ready=True)}
-        mock_app._get_trades_from_session.return_value = [
+        mock_feed = mock_app.trade_fills_feed()
+        mock_feed.trades = [
             MagicMock(market="ExchangeA", symbol="HBOT-USDT"),
             MagicMock(market="ExchangeA", symbol="HBOT-BTC")
         ]
+        mock_feed.market_metrics = {
+            ("ExchangeA", "HBOT-USDT"): self._performance_metrics_mock((Decimal("0.01"), Decimal("2"))),
+            ("ExchangeA", "HBOT-BTC"): self._performance_metrics_mock((Decimal("0.02"), Decimal("3"))),
+        }
         mock_app.get_current_balances = AsyncMock()
-        mock_perf.side_effect = [MagicMock(return_pct=Decimal("0.01"), total_pnl=Decimal("2")),
-                                 MagicMock(return_pct=Decimal("0.02"), total_pnl=Decimal("3"))]
         mock_sleep.side_effect = asyncio.CancelledError()
         with self.assertRaises(asyncio.CancelledError):
             self.async_run_with_timeout(start_trade_monitor(mock_result))
@@ -110,20 +126,22 @@ class InterfaceUtilsTest(unittest.TestCase):
         self.assertEqual('Trades: 2, Total P&L: N/A, Return %: 1.50%', mock_result.log.call_args_list[1].args[0])
 
     @patch("hummingbot.client.ui.interface_utils._sleep", new_callable=AsyncMock)
-    @patch("hummingbot.client.ui.interface_utils.PerformanceMetrics.create", new_callable=AsyncMock)
     @patch("hummingbot.client.hummingbot_application.HummingbotApplication")
-    def test_start_trade_monitor_multi_pairs_same_quote(self, mock_hb_app, mock_perf, mock_sleep):
+    def test_start_trade_monitor_multi_pairs_same_quote(self, mock_hb_app, mock_sleep):
         mock_result = MagicMock()
         mock_app = mock_hb_app.main_application()
         mock_app.strategy_task.done.return_value = False
         mock_app.markets.return_values = {"a": MagicMock(ready=True)}
-        mock_app._get_trades_from_session.return_value = [
+        mock_feed = mock_app.trade_fills_feed()
+        mock_feed.trades = [
             MagicMock(market="ExchangeA", symbol="HBOT-USDT"),
             MagicMock(market="ExchangeA", symbol="BTC-USDT")
         ]
+        mock_feed.market_metrics = {
+            ("ExchangeA", "HBOT-USDT"): self._performance_metrics_mock((Decimal("0.01"), Decimal("2"))),
+            ("ExchangeA", "BTC-USDT"): self._performance_metrics_mock((Decimal("0.02"), Decimal("3"))),
+        }
         mock_app.get_current_balances = AsyncMock()
-        mock_perf.side_effect = [MagicMock(return_pct=Decimal("0.01"), total_pnl=Decimal("2")),
-                                 MagicMock(return_pct=Decimal("0.02"), total_pnl=Decimal("3"))]
         mock_sleep.side_effect = asyncio.CancelledError()
         with self.assertRaises(asyncio.CancelledError):
             self.async_run_with_timeout(start_trade_monitor(mock_result))
@@ -151,7 +169,7 @@ class InterfaceUtilsTest(unittest.TestCase):
         mock_app = mock_hb_app.main_application()
         mock_app.strategy_task.done.return_value = False
         mock_app.markets.return_values = {"a": MagicMock(ready=True)}
-        mock_app._get_trades_from_session.return_value = []
+        mock_app.trade_fills_feed().trades = []
         mock_sleep.side_effect = asyncio.CancelledError()
         with self.assertRaises(asyncio.CancelledError):
             self.async_run_with_timeout(start_trade_monitor(mock_result))
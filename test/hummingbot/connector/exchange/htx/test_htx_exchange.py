@@ -483,12 +483,26 @@ class HtxExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests):
         """
         :return: a list of all configured URLs for the cancelations
         """
-        all_urls = []
-        url = self.configure_successful_cancelation_response(order=successful_order, mock_api=mock_api)
-        all_urls.append(url)
-        url = self.configure_erroneous_cancelation_response(order=erroneous_order, mock_api=mock_api)
-        all_urls.append(url)
-        return all_urls
+        # Both orders are canceled with a single batch cancelation request
+        url = web_utils.private_rest_url(CONSTANTS.BATCH_CANCEL_URL)
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+        response = {
+            "status": "ok",
+            "data": {
+                "success": [successful_order.client_order_id],
+                "failed": [
+                    {
+                        "err-msg": "Incorrect order state",
+                        "order-state": 7,
+                        "order-id": "",
+                        "err-code": "order-orderstate-error",
+                        "client-order-id": erroneous_order.client_order_id,
+                    }
+                ],
+            },
+        }
+        mock_api.post(regex_url, body=json.dumps(response))
+        return [url]
 
     def configure_order_not_found_error_cancelation_response(
             self, order: InFlightOrder, mock_api: aioresponses,
@@ -913,3 +927,49 @@ class HtxExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests):
                 }
             ],
         }
+
+    @aioresponses()
+    def test_create_orders_in_batch(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        request_sent_event = asyncio.Event()
+        self.exchange._set_current_timestamp(1640780000)
+
+        # Orders created in the same event loop iteration are sent in a single batch request
+        buy_order_id = self.place_buy_order()
+        sell_order_id = self.place_sell_order(price=Decimal("11000"), order_type=OrderType.LIMIT_MAKER)
+
+        url = web_utils.private_rest_url(CONSTANTS.BATCH_PLACE_ORDERS_URL)
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+        response = {
+            "status": "ok",
+            "data": [
+                {
+                    "order-id": self.expected_exchange_order_id,
+                    "client-order-id": buy_order_id,
+                },
+                {
+                    "client-order-id": sell_order_id,
+                    "err-code": "account-frozen-balance-insufficient-error",
+                    "err-msg": "trade account balance is not enough",
+                },
+            ],
+        }
+        mock_api.post(regex_url, body=json.dumps(response), callback=lambda *args, **kwargs: request_sent_event.set())
+
+        self.async_run_with_timeout(request_sent_event.wait())
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        order_requests = self._all_executed_requests(mock_api, url)
+        self.assertEqual(1, len(order_requests))
+        self.validate_auth_credentials_present(order_requests[0])
+        request_data = json.loads(order_requests[0].kwargs["data"])
+        self.assertEqual([buy_order_id, sell_order_id], [order_data["client-order-id"] for order_data in request_data])
+        self.assertEqual(["buy-limit", "sell-limit-maker"], [order_data["type"] for order_data in request_data])
+
+        self.assertIn(buy_order_id, self.exchange.in_flight_orders)
+        self.assertEqual(str(self.expected_exchange_order_id),
+                         self.exchange.in_flight_orders[buy_order_id].exchange_order_id)
+        self.assertNotIn(sell_order_id, self.exchange.in_flight_orders)
+        self.assertEqual(1, len(self.buy_order_created_logger.event_log))
+        failure_event: MarketOrderFailureEvent = self.order_failure_logger.event_log[0]
+        self.assertEqual(sell_order_id, failure_event.order_id)
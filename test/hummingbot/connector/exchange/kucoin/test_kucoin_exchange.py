@@ -19,6 +19,7 @@ from hummingbot.connector.utils import get_new_client_order_id
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, TradeUpdate
+from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.trade_fee import TokenAmount, TradeFeeBase, TradeFeeSchema
 from hummingbot.core.event.event_logger import EventLogger
 from hummingbot.core.event.events import (
@@ -624,6 +625,134 @@ class KucoinExchangeTests(unittest.TestCase):
             )
         )
 
+    @aioresponses()
+    def test_create_orders_in_batch(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        request_sent_event = asyncio.Event()
+        self.exchange._set_current_timestamp(1640780000)
+        url = web_utils.private_rest_url(CONSTANTS.ORDERS_MULTI_PATH_URL)
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+
+        creation_response = {
+            "code": "200000",
+            "data": {
+                "data": [
+                    {
+                        "symbol": self.exchange_trading_pair,
+                        "side": "buy",
+                        "price": "10000",
+                        "size": "100",
+                        "id": "5bd6e9286d99522a52e458de",
+                        "status": "success",
+                        "failMsg": None,
+                        "clientOid": "OID1",
+                    },
+                    {
+                        "symbol": self.exchange_trading_pair,
+                        "side": "sell",
+                        "price": "11000",
+                        "size": "100",
+                        "status": "fail",
+                        "failMsg": "Balance insufficient!",
+                        "clientOid": "OID2",
+                    },
+                ]
+            }}
+
+        mock_api.post(regex_url,
+                      body=json.dumps(creation_response),
+                      callback=lambda *args, **kwargs: request_sent_event.set())
+
+        # Orders created in the same event loop iteration are sent in a single batch request
+        for order_id, trade_type, price in (("OID1", TradeType.BUY, Decimal("10000")),
+                                            ("OID2", TradeType.SELL, Decimal("11000"))):
+            asyncio.get_event_loop().create_task(
+                self.exchange._create_order(trade_type=trade_type,
+                                            order_id=order_id,
+                                            trading_pair=self.trading_pair,
+                                            amount=Decimal("100"),
+                                            order_type=OrderType.LIMIT_MAKER,
+                                            price=price))
+        self.async_run_with_timeout(request_sent_event.wait())
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        order_requests = [value for key, value in mock_api.requests.items() if key[1].human_repr().startswith(url)]
+        self.assertEqual(1, len(order_requests))
+        self._validate_auth_credentials_present(order_requests[0][0])
+        request_data = json.loads(order_requests[0][0].kwargs["data"])
+        self.assertEqual(self.exchange_trading_pair, request_data["symbol"])
+        self.assertEqual(["OID1", "OID2"], [order_data["clientOid"] for order_data in request_data["orderList"]])
+        self.assertEqual(["buy", "sell"], [order_data["side"] for order_data in request_data["orderList"]])
+        self.assertTrue(all(order_data["postOnly"] for order_data in request_data["orderList"]))
+
+        self.assertIn("OID1", self.exchange.in_flight_orders)
+        self.assertEqual("5bd6e9286d99522a52e458de", self.exchange.in_flight_orders["OID1"].exchange_order_id)
+        self.assertNotIn("OID2", self.exchange.in_flight_orders)
+        self.assertEqual(1, len(self.buy_order_created_logger.event_log))
+        failure_event: MarketOrderFailureEvent = self.order_failure_logger.event_log[0]
+        self.assertEqual("OID2", failure_event.order_id)
+
+    @aioresponses()
+    def test_batch_order_create_in_hf_account_maps_results_by_position(self, mock_api):
+        self.exchange = KucoinExchange(
+            client_config_map=self.client_config_map,
+            kucoin_api_key=self.api_key,
+            kucoin_passphrase=self.api_passphrase,
+            kucoin_secret_key=self.api_secret_key,
+            trading_pairs=[self.trading_pair],
+            domain="hft",
+        )
+        self.exchange._set_trading_pair_symbol_map(bidict({self.trading_pair: self.trading_pair}))
+        self._initialize_event_loggers()
+        self._simulate_trading_rules_initialized()
+        request_sent_event = asyncio.Event()
+        self.exchange._set_current_timestamp(1640780000)
+        url = web_utils.private_rest_url(CONSTANTS.ORDERS_MULTI_PATH_URL_HFT, domain="hft")
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+
+        # The HF endpoint results do not include the client order ids
+        creation_response = {
+            "code": "200000",
+            "data": [
+                {"orderId": "6710d8336afcdb0007319c27", "success": True},
+                {"success": False, "failMsg": "Balance insufficient!"},
+            ]}
+        mock_api.post(regex_url,
+                      body=json.dumps(creation_response),
+                      callback=lambda *args, **kwargs: request_sent_event.set())
+
+        orders = self.exchange.batch_order_create(
+            orders_to_create=[
+                LimitOrder(client_order_id="",
+                           trading_pair=self.trading_pair,
+                           is_buy=is_buy,
+                           base_currency=self.base_asset,
+                           quote_currency=self.quote_asset,
+                           price=price,
+                           quantity=Decimal("100"))
+                for is_buy, price in ((True, Decimal("10000")), (False, Decimal("11000")))
+            ],
+            limit_order_type=OrderType.LIMIT_MAKER,
+        )
+        self.async_run_with_timeout(request_sent_event.wait())
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        order_requests = [value for key, value in mock_api.requests.items() if key[1].human_repr().startswith(url)]
+        self.assertEqual(1, len(order_requests))
+        request_data = json.loads(order_requests[0][0].kwargs["data"])
+        self.assertEqual([order.client_order_id for order in orders],
+                         [order_data["clientOid"] for order_data in request_data["orderList"]])
+        self.assertTrue(all(order_data["postOnly"] for order_data in request_data["orderList"]))
+
+        buy_order, sell_order = orders
+        self.assertIn(buy_order.client_order_id, self.exchange.in_flight_orders)
+        self.assertEqual(OrderType.LIMIT_MAKER, self.exchange.in_flight_orders[buy_order.client_order_id].order_type)
+        self.assertEqual("6710d8336afcdb0007319c27",
+                         self.exchange.in_flight_orders[buy_order.client_order_id].exchange_order_id)
+        self.assertNotIn(sell_order.client_order_id, self.exchange.in_flight_orders)
+        failure_event: MarketOrderFailureEvent = self.order_failure_logger.event_log[0]
+        self.assertEqual(sell_order.client_order_id, failure_event.order_id)
+
     @aioresponses()
     @patch("hummingbot.connector.exchange.kucoin.kucoin_exchange.KucoinExchange.get_price")
     def test_create_order_with_wrong_params_raises_io_error(self, mock_api, get_price_mock):
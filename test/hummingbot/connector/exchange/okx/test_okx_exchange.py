@@ -3,7 +3,7 @@ import json
 import re
 from decimal import Decimal
 from typing import Any, Callable, List, Optional, Tuple
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 from aioresponses import aioresponses
 from aioresponses.core import RequestCall
@@ -17,7 +17,7 @@ from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
 from hummingbot.core.data_type.in_flight_order import InFlightOrder
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, TokenAmount, TradeFeeBase
-from hummingbot.core.event.events import OrderCancelledEvent, OrderType, TradeType
+from hummingbot.core.event.events import MarketOrderFailureEvent, OrderCancelledEvent, OrderType, TradeType
 
 
 class OkxExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests):
@@ -542,12 +542,28 @@ class OkxExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests):
         """
         :return: a list of all configured URLs for the cancelations
         """
-        all_urls = []
-        url = self.configure_successful_cancelation_response(order=successful_order, mock_api=mock_api)
-        all_urls.append(url)
-        url = self.configure_erroneous_cancelation_response(order=erroneous_order, mock_api=mock_api)
-        all_urls.append(url)
-        return all_urls
+        # Both orders are canceled with a single batch cancelation request
+        url = web_utils.private_rest_url(path_url=CONSTANTS.OKX_BATCH_ORDER_CANCEL_PATH)
+        response = {
+            "code": "2",
+            "msg": "",
+            "data": [
+                {
+                    "clOrdId": successful_order.client_order_id,
+                    "ordId": successful_order.exchange_order_id,
+                    "sCode": "0",
+                    "sMsg": ""
+                },
+                {
+                    "clOrdId": erroneous_order.client_order_id,
+                    "ordId": erroneous_order.exchange_order_id,
+                    "sCode": "1",
+                    "sMsg": "Error"
+                },
+            ]
+        }
+        mock_api.post(url, body=json.dumps(response))
+        return [url]
 
     def configure_order_not_found_error_cancelation_response(
             self, order: InFlightOrder, mock_api: aioresponses,
@@ -1182,3 +1198,73 @@ class OkxExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests):
             else:
                 self.assertIn(order.client_order_id, self.exchange.in_flight_orders)
                 self.assertTrue(order.is_pending_cancel_confirmation)
+
+    @aioresponses()
+    def test_create_orders_in_batch(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        request_sent_event = asyncio.Event()
+        self.exchange._set_current_timestamp(1640780000)
+
+        # Orders created in the same event loop iteration are sent in a single batch request
+        buy_order_id = self.place_buy_order(order_type=OrderType.LIMIT_MAKER)
+        sell_order_id = self.place_sell_order(price=Decimal("11000"))
+
+        url = web_utils.private_rest_url(path_url=CONSTANTS.OKX_BATCH_PLACE_ORDERS_PATH)
+        response = {
+            "code": "2",
+            "msg": "",
+            "data": [
+                {
+                    "clOrdId": buy_order_id,
+                    "ordId": self.expected_exchange_order_id,
+                    "sCode": "0",
+                    "sMsg": ""
+                },
+                {
+                    "clOrdId": sell_order_id,
+                    "ordId": "",
+                    "sCode": "51008",
+                    "sMsg": "Insufficient balance"
+                },
+            ]
+        }
+        mock_api.post(url, body=json.dumps(response), callback=lambda *args, **kwargs: request_sent_event.set())
+
+        self.async_run_with_timeout(request_sent_event.wait())
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        order_requests = self._all_executed_requests(mock_api, url)
+        self.assertEqual(1, len(order_requests))
+        self.validate_auth_credentials_present(order_requests[0])
+        request_data = json.loads(order_requests[0].kwargs["data"])
+        self.assertEqual([buy_order_id, sell_order_id], [order_data["clOrdId"] for order_data in request_data])
+        self.assertEqual(["post_only", "limit"], [order_data["ordType"] for order_data in request_data])
+        self.assertEqual(["buy", "sell"], [order_data["side"] for order_data in request_data])
+
+        self.assertIn(buy_order_id, self.exchange.in_flight_orders)
+        self.assertEqual(str(self.expected_exchange_order_id),
+                         self.exchange.in_flight_orders[buy_order_id].exchange_order_id)
+        self.assertNotIn(sell_order_id, self.exchange.in_flight_orders)
+        self.assertEqual(1, len(self.buy_order_created_logger.event_log))
+        failure_event: MarketOrderFailureEvent = self.order_failure_logger.event_log[0]
+        self.assertEqual(sell_order_id, failure_event.order_id)
+
+    def test_orders_with_extra_parameters_are_not_batched(self):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        place_order_mock = AsyncMock(side_effect=[("1", 1640780000.0), ("2", 1640780000.0)])
+        place_orders_batch_mock = AsyncMock()
+        self.exchange._place_order = place_order_mock
+        self.exchange._place_orders_batch = place_orders_batch_mock
+
+        buy_order_id = self.exchange.buy(trading_pair=self.trading_pair, amount=Decimal("100"),
+                                         order_type=OrderType.LIMIT, price=Decimal("10000"), extra_param="buy")
+        sell_order_id = self.exchange.sell(trading_pair=self.trading_pair, amount=Decimal("100"),
+                                           order_type=OrderType.LIMIT, price=Decimal("11000"), extra_param="sell")
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        place_orders_batch_mock.assert_not_called()
+        self.assertEqual(2, place_order_mock.call_count)
+        self.assertEqual([buy_order_id, sell_order_id],
+                         [call.kwargs["order_id"] for call in place_order_mock.call_args_list])
+        self.assertEqual(["buy", "sell"], [call.kwargs["extra_param"] for call in place_order_mock.call_args_list])
@@ -0,0 +1,116 @@
+import asyncio
+from decimal import Decimal
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from typing import List, Optional
+
+from hummingbot.connector.gateway.gateway_quote_cache import GatewayQuoteCache
+
+
+class GatewayQuoteCacheTest(IsolatedAsyncioWrapperTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.now = 1640000000.0
+        self.cache = GatewayQuoteCache(ttl=5.0, amount_significant_digits=4, time_func=lambda: self.now)
+        self.fetch_count = 0
+        self.prices: List[Optional[Decimal]] = [Decimal("100"), Decimal("101"), Decimal("102")]
+
+    async def _fetch(self) -> Optional[Decimal]:
+        self.fetch_count += 1
+        await asyncio.sleep(0)
+        return self.prices[self.fetch_count - 1]
+
+    def _key(self, trading_pair: str = "WETH-DAI", is_buy: bool = True, amount: Decimal = Decimal("1")):
+        return self.cache.key("uniswap", trading_pair, is_buy, amount)
+
+    def test_amount_bucket(self):
+        self.assertEqual(Decimal("1.235"), self.cache.amount_bucket(Decimal("1.23456")))
+        self.assertEqual(Decimal("1.235E+3"), self.cache.amount_bucket(Decimal("1234.56")))
+        self.assertEqual(self.cache.amount_bucket(Decimal("1")), self.cache.amount_bucket(Decimal("1.0000")))
+        self.assertEqual(Decimal("0"), self.cache.amount_bucket(Decimal("0")))
+
+    async def test_cached_quote_is_reused_until_expired(self):
+        self.assertEqual(Decimal("100"), await self.cache.get_or_fetch(self._key(), self._fetch))
+        self.assertEqual(Decimal("100"), await self.cache.get_or_fetch(self._key(), self._fetch))
+        self.assertEqual(1, self.fetch_count)
+
+        self.now += 6
+        self.assertEqual(Decimal("101"), await self.cache.get_or_fetch(self._key(), self._fetch))
+        self.assertEqual(2, self.fetch_count)
+
+    async def test_concurrent_requests_are_coalesced(self):
+        results = await asyncio.gather(*[self.cache.get_or_fetch(self._key(), self._fetch) for _ in range(5)])
+
+        self.assertEqual([Decimal("100")] * 5, results)
+        self.assertEqual(1, self.fetch_count)
+
+    async def test_different_sides_are_fetched_separately(self):
+        await self.cache.get_or_fetch(self._key(is_buy=True), self._fetch)
+        await self.cache.get_or_fetch(self._key(is_buy=False), self._fetch)
+
+        self.assertEqual(2, self.fetch_count)
+
+    async def test_failed_quote_is_not_cached(self):
+        self.prices = [None, Decimal("100")]
+
+        self.assertIsNone(await self.cache.get_or_fetch(self._key(), self._fetch))
+        self.assertEqual(Decimal("100"), await self.cache.get_or_fetch(self._key(), self._fetch))
+        self.assertEqual(2, self.fetch_count)
+
+    async def test_invalidate_trading_pair(self):
+        await self.cache.get_or_fetch(self._key(trading_pair="WETH-DAI_pool1"), self._fetch)
+        await self.cache.get_or_fetch(self._key(trading_pair="WETH-USDC"), self._fetch)
+
+        self.cache.invalidate("WETH-DAI")
+
+        self.assertIsNone(self.cache.get(self._key(trading_pair="WETH-DAI_pool1")))
+        self.assertEqual(Decimal("101"), self.cache.get(self._key(trading_pair="WETH-USDC")))
+
+    async def test_result_of_request_in_flight_during_invalidation_is_not_stored(self):
+        task = asyncio.ensure_future(self.cache.get_or_fetch(self._key(), self._fetch))
+        await asyncio.sleep(0)
+
+        self.cache.invalidate()
+
+        self.assertEqual(Decimal("100"), await task)
+        self.assertEqual(0, len(self.cache))
+
+    async def test_new_block_invalidates_cache(self):
+        self.cache.process_block_number(10)
+        await self.cache.get_or_fetch(self._key(), self._fetch)
+
+        self.cache.process_block_number(10)
+        self.assertEqual(1, len(self.cache))
+
+        self.cache.process_block_number(11)
+        self.assertEqual(0, len(self.cache))
+        self.assertEqual(11, self.cache.last_block_number)
+
+    async def test_get_or_fetch_many(self):
+        fetched_keys = []
+
+        async def fetch_many(keys):
+            fetched_keys.extend(keys)
+            return [Decimal(str(key.amount_bucket)) for key in keys]
+
+        await self.cache.get_or_fetch(self._key(amount=Decimal("2")), self._fetch)
+        keys = [self._key(amount=Decimal("1")), self._key(amount=Decimal("2")), self._key(amount=Decimal("3")),
+                self._key(amount=Decimal("1"))]
+
+        results = await self.cache.get_or_fetch_many(keys, fetch_many)
+
+        self.assertEqual([Decimal("1"), Decimal("100"), Decimal("3"), Decimal("1")], results)
+        self.assertEqual([self._key(amount=Decimal("1")), self._key(amount=Decimal("3"))], fetched_keys)
+        self.assertEqual(3, len(self.cache))
+
+    async def test_get_or_fetch_joins_batch_in_flight(self):
+        async def fetch_many(keys):
+            await asyncio.sleep(0)
+            return [Decimal("5")] * len(keys)
+
+        batch = asyncio.ensure_future(self.cache.get_or_fetch_many([self._key()], fetch_many))
+        await asyncio.sleep(0)
+        single = await self.cache.get_or_fetch(self._key(), self._fetch)
+
+        self.assertEqual([Decimal("5")], await batch)
+        self.assertEqual(Decimal("5"), single)
+        self.assertEqual(0, self.fetch_count)
@@ -11,6 +11,7 @@ from hummingbot.connector.in_flight_order_base import InFlightOrderBase
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+from hummingbot.core.event.events import MarketEvent
 
 
 class InFightOrderTest(InFlightOrderBase):
@@ -570,3 +571,95 @@ class ConnectorBaseUnitTest(unittest.TestCase):
                                 + (current_sell_order.executed_amount_quote)
                                 - (extra_fill_event.amount * extra_fill_event.price))
         self.assertEqual(expected_hbot_amount, estimated_hbot_balance)
+
+    def test_available_balance_is_cached_within_a_tick(self):
+        connector = MockTestConnector(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+        connector.real_time_balance_update = False
+        connector._account_available_balances = {"COINALPHA": Decimal("10"), "HBOT": Decimal("10000")}
+        snapshot_sell_order = InFlightOrder(
+            client_order_id="OID1",
+            exchange_order_id="1234",
+            trading_pair="COINALPHA-HBOT",
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.SELL,
+            price=Decimal("1000"),
+            amount=Decimal("1"),
+            creation_timestamp=1640000000
+        )
+        connector.in_flight_orders_snapshot = {snapshot_sell_order.client_order_id: snapshot_sell_order}
+        connector.in_flight_orders_snapshot_timestamp = 1640000000
+        connector._set_current_timestamp(1640000001)
+
+        with unittest.mock.patch.object(
+                connector, "in_flight_asset_balances", wraps=connector.in_flight_asset_balances) as balances_mock:
+            self.assertEqual(Decimal("11"), connector.get_available_balance("COINALPHA"))
+            self.assertEqual(Decimal("10000"), connector.get_available_balance("HBOT"))
+            self.assertEqual(Decimal("11"), connector.get_available_balance("COINALPHA"))
+            # The snapshot and the live in flight orders balances are computed once for all the assets
+            self.assertEqual(2, balances_mock.call_count)
+
+            buy_order = InFlightOrder(
+                client_order_id="OID2",
+                exchange_order_id="1235",
+                trading_pair="COINALPHA-HBOT",
+                order_type=OrderType.LIMIT,
+                trade_type=TradeType.BUY,
+                price=Decimal("900"),
+                amount=Decimal("1"),
+                creation_timestamp=1640000001
+            )
+            connector._in_flight_orders[buy_order.client_order_id] = buy_order
+            self.assertEqual(Decimal("9100"), connector.get_available_balance("HBOT"))
+
+            fill_event = OrderFilledEvent(
+                timestamp=1640000001,
+                order_id="OID99",
+                trading_pair="COINALPHA-HBOT",
+                trade_type=TradeType.BUY,
+                order_type=OrderType.LIMIT,
+                price=Decimal(1000),
+                amount=Decimal(1),
+                trade_fee=AddedToCostTradeFee(),
+            )
+            connector._event_logs.append(fill_event)
+            self.assertEqual(Decimal("9100"), connector.get_available_balance("HBOT"))
+            connector.trigger_event(MarketEvent.OrderFilled, fill_event)
+            self.assertEqual(Decimal("8100"), connector.get_available_balance("HBOT"))
+
+            # A new balance snapshot replaces the cached balances
+            connector._account_available_balances["HBOT"] = Decimal("8100")
+            connector.in_flight_orders_snapshot = {buy_order.client_order_id: buy_order}
+            connector.in_flight_orders_snapshot_timestamp = 1640000001
+            self.assertEqual(Decimal("8100"), connector.get_available_balance("HBOT"))
+
+            calls_count = balances_mock.call_count
+            connector._set_current_timestamp(1640000002)
+            self.assertEqual(Decimal("8100"), connector.get_available_balance("HBOT"))
+            self.assertEqual(calls_count + 2, balances_mock.call_count)
+
+    def test_available_balance_applies_the_balance_limits(self):
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        client_config_map.balance_asset_limit = {"MockTestConnector": {"HBOT": Decimal("500")}}
+        connector = MockTestConnector(client_config_map=client_config_map)
+        connector._account_available_balances = {"COINALPHA": Decimal("10"), "HBOT": Decimal("10000")}
+        connector._set_current_timestamp(1640000001)
+
+        self.assertEqual(Decimal("10"), connector.get_available_balance("COINALPHA"))
+        self.assertEqual(Decimal("500"), connector.get_available_balance("HBOT"))
+
+        buy_order = InFlightOrder(
+            client_order_id="OID1",
+            exchange_order_id="1234",
+            trading_pair="COINALPHA-HBOT",
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            price=Decimal("100"),
+            amount=Decimal("2"),
+            creation_timestamp=1640000001
+        )
+        connector._in_flight_orders[buy_order.client_order_id] = buy_order
+        self.assertEqual(Decimal("300"), connector.get_available_balance("HBOT"))
+
+        # Balances received from the real time updates are applied without an event
+        connector._account_available_balances["HBOT"] = Decimal("200")
+        self.assertEqual(Decimal("200"), connector.get_available_balance("HBOT"))
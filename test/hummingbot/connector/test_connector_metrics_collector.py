@@ -129,7 +129,7 @@ class TradeVolumeMetricCollectorTests(TestCase):
         self.dispatcher_mock.request.assert_not_called()
 
     def test_collect_metrics_for_single_event(self):
-        self.rate_oracle._prices = {"HBOT-USDT": Decimal("100")}
+        self.rate_oracle.set_price("HBOT-USDT", Decimal("100"))
 
         event = OrderFilledEvent(
             timestamp=1000,
@@ -197,10 +197,8 @@ class TradeVolumeMetricCollectorTests(TestCase):
         self.dispatcher_mock.request.assert_not_called()
 
     def test_collect_metrics_uses_event_amount_when_only_base_token_convertion_rate_found(self):
-        self.rate_oracle._prices = {
-            "HBOT-USDT": Decimal("100"),
-            "COINALPHA-USDT": Decimal("200"),
-        }
+        self.rate_oracle.set_price("HBOT-USDT", Decimal("100"))
+        self.rate_oracle.set_price("COINALPHA-USDT", Decimal("200"))
 
         event_1 = OrderFilledEvent(
             timestamp=1000,
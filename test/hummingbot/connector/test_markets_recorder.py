@@ -1,7 +1,9 @@
 import asyncio
+import json
 import time
 from decimal import Decimal
-from typing import Awaitable
+from types import SimpleNamespace
+from typing import Awaitable, Optional
 from unittest import TestCase
 from unittest.mock import MagicMock, PropertyMock, patch
 
@@ -22,11 +24,28 @@ from hummingbot.core.event.events import (
     SellOrderCreatedEvent,
 )
 from hummingbot.logger import HummingbotLogger
+from hummingbot.model.executors import Executors
 from hummingbot.model.market_data import MarketData
 from hummingbot.model.order import Order
 from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
 from hummingbot.model.trade_fill import TradeFill
 from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
+from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig
+from hummingbot.strategy_v2.models.base import RunnableStatus
+from hummingbot.strategy_v2.models.executors import CloseType
+from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
+
+
+class AttributeDict(dict):
+    """
+    Dict stored as a JSON column whose keys can also be read as attributes
+    """
+
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name)
 
 
 class MarketsRecorderTests(TestCase):
@@ -143,6 +162,108 @@ class MarketsRecorderTests(TestCase):
         self.assertEqual(1, len(trades))
         self.assertEqual(fill_id, trades[0].exchange_trade_id)
 
+    @staticmethod
+    def create_executor_mock(executor_id: str, is_active: bool, close_type: Optional[CloseType] = None,
+                             net_pnl_quote: Decimal = Decimal(0), filled_amount_quote: Decimal = Decimal(0)):
+        config = PositionExecutorConfig(id=executor_id, timestamp=1234, trading_pair="ETH-USDT",
+                                        connector_name="binance", side=TradeType.BUY, amount=Decimal(1),
+                                        entry_price=Decimal(100), controller_id="controller_1")
+        executor = MagicMock()
+        executor.config = config
+        executor.executor_info = ExecutorInfo(
+            id=executor_id, timestamp=1234, type="position_executor", close_type=close_type,
+            status=RunnableStatus.RUNNING if is_active else RunnableStatus.TERMINATED, config=config,
+            net_pnl_pct=Decimal(0), net_pnl_quote=net_pnl_quote, cum_fees_quote=Decimal(0),
+            filled_amount_quote=filled_amount_quote, is_active=is_active, is_trading=False, custom_info={},
+            controller_id="controller_1")
+        return executor
+
+    def test_controller_performance_is_updated_when_executors_are_stored(self):
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=False,
+                market_data_collection_interval=60,
+                market_data_collection_depth=20,
+            ),
+        )
+        # Executors stored before the controller performance existed are aggregated when it is first needed
+        with self.manager.get_new_session() as session:
+            with session.begin():
+                for executor in (self.create_executor_mock("E1", False, CloseType.TAKE_PROFIT, Decimal(5), Decimal(100)),
+                                 self.create_executor_mock("E2", False, CloseType.FAILED, Decimal(-1), Decimal(10))):
+                    session.add(Executors(**json.loads(executor.executor_info.json())))
+
+        recorder.store_or_update_executor(
+            self.create_executor_mock("E3", False, CloseType.STOP_LOSS, Decimal(-2), Decimal(50)))
+        performance = recorder.get_controller_performance("controller_1")
+        self.assertEqual(2, performance.executors_count)
+        self.assertEqual(3, performance.realized_pnl_quote)
+        self.assertEqual(150, performance.volume_traded)
+        self.assertEqual({str(CloseType.TAKE_PROFIT.value): 1, str(CloseType.STOP_LOSS.value): 1},
+                         performance.close_type_counts)
+
+        # Active executors are not aggregated, they are loaded by the reports
+        recorder.store_or_update_executor(self.create_executor_mock("E4", True, None, Decimal(1), Decimal(20)))
+        recorder.store_or_update_executor(
+            self.create_executor_mock("E5", False, CloseType.TAKE_PROFIT, Decimal(4), Decimal(80)))
+        performance = recorder.get_controller_performance("controller_1")
+        self.assertEqual(3, performance.executors_count)
+        self.assertEqual(7, performance.realized_pnl_quote)
+        self.assertEqual(230, performance.volume_traded)
+        self.assertEqual({str(CloseType.TAKE_PROFIT.value): 2, str(CloseType.STOP_LOSS.value): 1},
+                         performance.close_type_counts)
+        self.assertEqual(["E4"], [executor.id for executor in recorder.get_active_executors_by_controller("controller_1")])
+        self.assertEqual({"E5": (CloseType.TAKE_PROFIT.value, 4, 80)},
+                         recorder.get_performance_contributions(["E2", "E4", "E5", "unknown"]))
+
+        empty_performance = recorder.get_controller_performance("controller_2")
+        self.assertEqual(0, empty_performance.executors_count)
+        self.assertEqual({}, empty_performance.close_type_counts)
+
+    def test_controller_performance_updates_match_a_full_aggregation(self):
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=False,
+                market_data_collection_interval=60,
+                market_data_collection_depth=20,
+            ),
+        )
+        recorder.store_or_update_executor(self.create_executor_mock("E0", False, CloseType.TAKE_PROFIT))
+        recorder.get_controller_performance("controller_1")
+
+        # Values that are not exact in float, updated several times
+        for update in range(1, 6):
+            for index in range(1, 20):
+                executor = self.create_executor_mock(
+                    f"E{index}", False, CloseType.TAKE_PROFIT if index % 2 else CloseType.STOP_LOSS,
+                    net_pnl_quote=Decimal("0.1") * index * update - Decimal("1.3"),
+                    filled_amount_quote=Decimal("10.7") * index + Decimal("0.01") * update)
+                if update > 1:
+                    # The stored executor is updated with the attributes of the executor, here its stored values
+                    executor = SimpleNamespace(**json.loads(executor.executor_info.json()))
+                    executor.config = AttributeDict(executor.config)
+                recorder.store_or_update_executor(executor)
+
+        performance = recorder.get_controller_performance("controller_1")
+        with self.manager.get_new_session() as session:
+            aggregated_performance = recorder._aggregate_controller_performance(session, "controller_1")
+        self.assertEqual(aggregated_performance.executors_count, performance.executors_count)
+        self.assertEqual(aggregated_performance.realized_pnl_quote, performance.realized_pnl_quote)
+        self.assertEqual(aggregated_performance.volume_traded, performance.volume_traded)
+        self.assertEqual(aggregated_performance.close_type_counts, performance.close_type_counts)
+        self.assertEqual(sum(Decimal("0.5") * index - Decimal("1.3") for index in range(1, 20)),
+                         performance.realized_pnl_quote)
+        self.assertEqual(sum(Decimal("10.7") * index + Decimal("0.05") for index in range(1, 20)),
+                         performance.volume_traded)
+
     def test_buy_order_created_event_creates_order_record(self):
         recorder = MarketsRecorder(
             sql=self.manager,
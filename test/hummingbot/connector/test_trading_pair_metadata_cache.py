@@ -0,0 +1,53 @@
+import unittest
+from decimal import Decimal
+
+from bidict import bidict
+
+from hummingbot.connector.trading_pair_metadata_cache import TradingPairMetadataCache
+from hummingbot.connector.trading_rule import TradingRule
+
+
+class TradingPairMetadataCacheTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.cache = TradingPairMetadataCache()
+
+    def test_symbol_lookups_in_both_directions(self):
+        self.assertFalse(self.cache.symbols_ready)
+        self.assertIsNone(self.cache.trading_pair("COINALPHAHBOT"))
+
+        self.cache.update_symbol_map(bidict({"COINALPHAHBOT": "COINALPHA-HBOT", "WETHHBOT": "WETH-HBOT"}))
+
+        self.assertTrue(self.cache.symbols_ready)
+        self.assertEqual("COINALPHA-HBOT", self.cache.trading_pair("COINALPHAHBOT"))
+        self.assertEqual("WETHHBOT", self.cache.exchange_symbol("WETH-HBOT"))
+        self.assertIsNone(self.cache.exchange_symbol("BTC-HBOT"))
+        # Symbols received in the exchange messages resolve to the shared trading pair strings
+        symbol = "".join(["COINALPHA", "HBOT"])
+        self.assertIs(self.cache.trading_pair("COINALPHAHBOT"), self.cache.trading_pair(symbol))
+
+        self.cache.update_symbol_map({"WETHHBOT": "WETH-HBOT"})
+        self.assertIsNone(self.cache.trading_pair("COINALPHAHBOT"))
+
+        self.cache.update_symbol_map(None)
+        self.assertFalse(self.cache.symbols_ready)
+
+    def test_quanta_are_computed_once_per_trading_rule(self):
+        trading_rule = TradingRule(trading_pair="COINALPHA-HBOT",
+                                   min_price_increment=Decimal("0.01"),
+                                   min_base_amount_increment=Decimal("0.001"))
+        self.cache.update_trading_rules({"COINALPHA-HBOT": trading_rule})
+
+        quanta = self.cache.quanta(trading_rule)
+        self.assertIs(quanta, self.cache.quanta(trading_rule))
+        self.assertEqual(Decimal("0.01"), quanta.price_quantum)
+        self.assertEqual(Decimal("0.001"), quanta.size_quantum)
+        self.assertEqual(0.01, quanta.price_quantum_float)
+        self.assertEqual(0.001, quanta.size_quantum_float)
+
+        new_trading_rule = TradingRule(trading_pair="COINALPHA-HBOT",
+                                       min_price_increment=Decimal("0.1"),
+                                       min_base_amount_increment=Decimal("1"))
+        self.assertEqual(Decimal("0.1"), self.cache.quanta(new_trading_rule).price_quantum)
+        self.assertEqual(Decimal("1"), self.cache.quanta(new_trading_rule).size_quantum)
@@ -0,0 +1,165 @@
+import asyncio
+import os
+import tempfile
+from decimal import Decimal
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from bidict import bidict
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.exchange.binance.binance_exchange import BinanceExchange
+from hummingbot.connector.trading_rule import TradingRule
+from hummingbot.connector.warm_start_cache import WarmStartCache
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+
+
+class WarmStartCacheTest(IsolatedAsyncioWrapperTestCase):
+    trading_pair = "COINALPHA-HBOT"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.cache = WarmStartCache(connector_name="binance", cache_dir=self.temp_dir.name)
+
+    def _order_book(self, best_bid: float = 99, best_ask: float = 101, update_id: int = 10) -> OrderBook:
+        order_book = OrderBook()
+        order_book.apply_snapshot([OrderBookRow(best_bid, 1, update_id), OrderBookRow(best_bid - 1, 2, update_id)],
+                                  [OrderBookRow(best_ask, 3, update_id)],
+                                  update_id)
+        return order_book
+
+    def _save(self):
+        self.cache.save(
+            trading_pair_symbol_map=bidict({"COINALPHAHBOT": self.trading_pair}),
+            trading_rules={self.trading_pair: TradingRule(self.trading_pair, min_order_size=Decimal("0.01"))},
+            trading_fees={self.trading_pair: {"maker": "0.001"}},
+            order_books={self.trading_pair: self._order_book()},
+        )
+
+    def test_save_and_load(self):
+        self._save()
+
+        state = self.cache.load()
+
+        self.assertEqual({"COINALPHAHBOT": self.trading_pair}, state.trading_pair_symbol_map)
+        self.assertEqual(Decimal("0.01"), state.trading_rules[self.trading_pair].min_order_size)
+        self.assertEqual({"maker": "0.001"}, state.trading_fees[self.trading_pair])
+
+        order_book = OrderBook()
+        WarmStartCache.restore_order_book(order_book, state.order_book_snapshots[self.trading_pair])
+        self.assertEqual(99, order_book.get_price(False))
+        self.assertEqual(101, order_book.get_price(True))
+        self.assertEqual(10, order_book.snapshot_uid)
+
+    def test_saved_update_id_includes_the_applied_diffs(self):
+        order_book = self._order_book()
+        order_book.apply_diffs([OrderBookRow(99, 5, 15)], [], 15)
+        self.cache.save(trading_pair_symbol_map=bidict({"COINALPHAHBOT": self.trading_pair}),
+                        trading_rules={},
+                        trading_fees={},
+                        order_books={self.trading_pair: order_book})
+
+        restored_order_book = OrderBook()
+        WarmStartCache.restore_order_book(restored_order_book,
+                                          self.cache.load().order_book_snapshots[self.trading_pair])
+
+        self.assertEqual(15, restored_order_book.snapshot_uid)
+        self.assertEqual(5, next(restored_order_book.bid_entries()).amount)
+
+    def test_load_without_cache_file(self):
+        self.assertIsNone(self.cache.load())
+
+    def test_load_ignores_corrupted_cache_file(self):
+        with open(self.cache.file_path, "wb") as file:
+            file.write(b"not a pickle")
+
+        with patch.object(WarmStartCache, "logger"):
+            self.assertIsNone(self.cache.load())
+
+    def test_load_drops_outdated_data(self):
+        with patch("hummingbot.connector.warm_start_cache.time.time", return_value=1640000000):
+            self._save()
+
+        with patch("hummingbot.connector.warm_start_cache.time.time",
+                   return_value=1640000000 + WarmStartCache.ORDER_BOOK_MAX_AGE + 1):
+            state = self.cache.load()
+        self.assertEqual({}, state.order_book_snapshots)
+        self.assertEqual(1, len(state.trading_rules))
+
+        with patch("hummingbot.connector.warm_start_cache.time.time",
+                   return_value=1640000000 + WarmStartCache.METADATA_MAX_AGE + 1):
+            self.assertIsNone(self.cache.load())
+
+    def test_clear(self):
+        self._save()
+        self.cache.clear()
+
+        self.assertFalse(os.path.exists(self.cache.file_path))
+
+    async def test_order_book_tracker_is_ready_with_restored_order_books(self):
+        other_trading_pair = "COINBETA-HBOT"
+        snapshots_requested = asyncio.Event()
+        requested_trading_pairs = []
+
+        async def order_book_snapshot(trading_pair: str) -> OrderBookMessage:
+            requested_trading_pairs.append(trading_pair)
+            if len(requested_trading_pairs) == 2:
+                snapshots_requested.set()
+            # The snapshots are requested concurrently, each request waits for the other one
+            await snapshots_requested.wait()
+            return OrderBookMessage(
+                message_type=OrderBookMessageType.SNAPSHOT,
+                content={"trading_pair": trading_pair, "update_id": 20, "bids": [[98, 1]], "asks": [[100, 1]]},
+                timestamp=1640000000,
+            )
+
+        data_source = MagicMock()
+        data_source._order_book_snapshot = AsyncMock(side_effect=order_book_snapshot)
+        tracker = OrderBookTracker(data_source=data_source, trading_pairs=[self.trading_pair, other_trading_pair])
+        restored_order_book = self._order_book()
+        tracker.restore_order_books({self.trading_pair: restored_order_book, other_trading_pair: self._order_book()})
+
+        init_task = asyncio.ensure_future(tracker._init_order_books())
+        await asyncio.sleep(0)
+        self.assertTrue(tracker.ready)
+        self.assertIs(restored_order_book, tracker.order_books[self.trading_pair])
+        await asyncio.wait_for(init_task, timeout=1)
+        await asyncio.sleep(0)
+
+        self.assertEqual([self.trading_pair, other_trading_pair], requested_trading_pairs)
+        for order_book in tracker.order_books.values():
+            self.assertEqual(20, order_book.snapshot_uid)
+            self.assertEqual(98, order_book.get_price(False))
+        for task in tracker._tracking_tasks.values():
+            task.cancel()
+
+    async def test_exchange_restores_warm_start_state(self):
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        client_config_map.warm_start_cache_enabled = True
+        exchange = BinanceExchange(
+            client_config_map=client_config_map,
+            binance_api_key="testAPIKey",
+            binance_api_secret="testSecret",
+            trading_pairs=[self.trading_pair],
+        )
+        self.cache = WarmStartCache(connector_name=exchange.name, cache_dir=self.temp_dir.name)
+        self._save()
+        exchange._warm_start_cache = self.cache
+
+        exchange._restore_warm_start_state()
+
+        self.assertTrue(exchange.trading_pair_symbol_map_ready())
+        self.assertEqual(self.trading_pair, await exchange.trading_pair_associated_to_exchange_symbol("COINALPHAHBOT"))
+        self.assertIn(self.trading_pair, exchange.trading_rules)
+        self.assertIn(self.trading_pair, exchange.order_book_tracker._restored_order_books)
+
+        # Saving uses the current exchange state
+        exchange._trading_rules.clear()
+        await exchange._save_warm_start_state()
+        self.assertEqual({}, self.cache.load().trading_rules)
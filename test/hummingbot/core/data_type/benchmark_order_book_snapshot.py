@@ -0,0 +1,55 @@
+"""
+Benchmarks reading the top levels of an order book through the `snapshot` DataFrames (the previous path, building a
+row per level of the whole book) and through the array API of `OrderBook`.
+
+Run with: python -m test.hummingbot.core.data_type.benchmark_order_book_snapshot
+"""
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+
+ITERATIONS = 200
+BOOK_DEPTHS = (100, 1000, 5000)
+TOP_LEVELS = 20
+
+
+def _order_book(depth: int) -> OrderBook:
+    order_book = OrderBook()
+    bids = np.column_stack([100 - np.arange(1, depth + 1) * 0.01, np.ones(depth), np.ones(depth)])
+    asks = np.column_stack([100 + np.arange(1, depth + 1) * 0.01, np.ones(depth), np.ones(depth)])
+    order_book.apply_numpy_snapshot(bids, asks)
+    return order_book
+
+
+def _entries_snapshot(order_book: OrderBook):
+    # The snapshot implementation before the array API
+    bids_df = pd.DataFrame(data=list(order_book.bid_entries()), columns=OrderBookRow._fields, dtype="float64")
+    asks_df = pd.DataFrame(data=list(order_book.ask_entries()), columns=OrderBookRow._fields, dtype="float64")
+    return bids_df.head(TOP_LEVELS), asks_df.head(TOP_LEVELS)
+
+
+def _time_per_call(function, order_book: OrderBook) -> float:
+    return min(timeit.repeat(lambda: function(order_book), number=ITERATIONS, repeat=3)) / ITERATIONS
+
+
+def main():
+    print(f"Reading the top {TOP_LEVELS} levels of each side")
+    print(f"{'Book depth':<12}{'entries DataFrame (us)':>24}{'snapshot (us)':>16}{'get_top_levels (us)':>22}"
+          f"{'bucketed (us)':>16}")
+    for depth in BOOK_DEPTHS:
+        order_book = _order_book(depth)
+        entries_time = _time_per_call(_entries_snapshot, order_book)
+        snapshot_time = _time_per_call(lambda book: (book.snapshot[0].head(TOP_LEVELS),
+                                                     book.snapshot[1].head(TOP_LEVELS)), order_book)
+        top_levels_time = _time_per_call(lambda book: book.get_top_levels(TOP_LEVELS), order_book)
+        bucketed_time = _time_per_call(lambda book: book.get_top_levels(TOP_LEVELS, bucket_size=0.1), order_book)
+        print(f"{depth:<12}{entries_time * 1e6:>24.1f}{snapshot_time * 1e6:>16.1f}{top_levels_time * 1e6:>22.1f}"
+              f"{bucketed_time * 1e6:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,254 @@
+import asyncio
+import multiprocessing
+from decimal import Decimal
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.derivative.binance_perpetual.binance_perpetual_derivative import (
+    BinancePerpetualDerivative,
+)
+from hummingbot.connector.exchange.binance.binance_exchange import BinanceExchange
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.market_data_process import (
+    MarketDataProcessOrderBookTracker,
+    OrderBookPublisher,
+    OrderBookTradeForwarder,
+    notify_order_books_published,
+)
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.shared_memory_order_book import SharedMemoryOrderBook
+from hummingbot.core.data_type.shared_order_book_buffer import SharedOrderBookBuffer
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import OrderBookEvent, OrderBookTradeEvent
+
+
+class OrderBookPublisherTests(IsolatedAsyncioWrapperTestCase):
+    trading_pair = "COINALPHA-HBOT"
+
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.buffer = SharedOrderBookBuffer.create(depth=5)
+        self.publisher = OrderBookPublisher({self.trading_pair: self.buffer})
+
+    async def asyncTearDown(self) -> None:
+        self.buffer.close()
+        await super().asyncTearDown()
+
+    async def test_publishes_only_changed_order_books(self):
+        order_book = OrderBook()
+        order_book.apply_numpy_snapshot(np.array([[99.0, 1.0, 1]]), np.array([[101.0, 1.0, 1]]))
+
+        self.assertEqual(0, self.publisher.publish({}))
+        self.assertEqual(1, self.publisher.publish({self.trading_pair: order_book}))
+        self.assertEqual(0, self.publisher.publish({self.trading_pair: order_book}))
+        self.assertEqual(2, self.buffer.sequence)
+
+        order_book.last_trade_price = 100.0
+        self.assertEqual(1, self.publisher.publish({self.trading_pair: order_book}))
+        self.assertEqual(100.0, self.buffer.snapshot().last_trade_price)
+
+
+class OrderBookTradeForwarderTests(IsolatedAsyncioWrapperTestCase):
+    trading_pair = "COINALPHA-HBOT"
+
+    async def test_forwards_the_trades_of_the_new_order_books(self):
+        trade_reader, trade_writer = multiprocessing.Pipe(duplex=False)
+        forwarder = OrderBookTradeForwarder(trade_writer)
+        order_book = OrderBook()
+        trade_event = OrderBookTradeEvent(trading_pair=self.trading_pair,
+                                          timestamp=1640000000.0,
+                                          type=TradeType.BUY,
+                                          price=Decimal("100"),
+                                          amount=Decimal("1"))
+
+        forwarder.listen({self.trading_pair: order_book})
+        forwarder.listen({self.trading_pair: order_book})
+        order_book.apply_trade(trade_event)
+
+        self.assertEqual(trade_event, trade_reader.recv())
+        self.assertFalse(trade_reader.poll())
+        trade_reader.close()
+        trade_writer.close()
+
+
+class MarketDataProcessOrderBookTrackerTests(IsolatedAsyncioWrapperTestCase):
+    trading_pairs = ["COINALPHA-HBOT", "COINBETA-HBOT"]
+
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.tracker = MarketDataProcessOrderBookTracker(data_source=MagicMock(),
+                                                         trading_pairs=self.trading_pairs,
+                                                         connector_name="binance",
+                                                         client_config_map=ClientConfigMap(),
+                                                         depth=5)
+        self.notification_writers = []
+        self.trade_writers = []
+        self.start_process_patch = patch.object(MarketDataProcessOrderBookTracker,
+                                                "_start_process",
+                                                side_effect=self._start_fake_process)
+        self.start_process_mock = self.start_process_patch.start()
+
+    async def asyncTearDown(self) -> None:
+        self.tracker.stop()
+        self.start_process_patch.stop()
+        for writer in self.notification_writers + self.trade_writers:
+            writer.close()
+        await super().asyncTearDown()
+
+    def _start_fake_process(self):
+        notification_reader, notification_writer = multiprocessing.Pipe(duplex=False)
+        trade_reader, trade_writer = multiprocessing.Pipe(duplex=False)
+        self.notification_writers.append(notification_writer)
+        self.trade_writers.append(trade_writer)
+        self.tracker._listen_to_process(notification_reader, trade_reader)
+
+    def _publish(self, trading_pair: str, bid_price: float, last_trade_price: float = float("nan")):
+        self.tracker._buffers[trading_pair].publish(bids=np.array([[bid_price, 1.0, 1]]),
+                                                    asks=np.array([[bid_price + 2, 1.0, 1]]),
+                                                    update_id=1,
+                                                    last_trade_price=last_trade_price,
+                                                    timestamp=1640000000.0)
+        notify_order_books_published(self.notification_writers[-1])
+
+    async def test_order_books_are_views_of_the_shared_buffers(self):
+        self.tracker.start()
+        self.start_process_mock.assert_called_once()
+
+        self._publish(self.trading_pairs[0], bid_price=99.0, last_trade_price=100.0)
+        await asyncio.sleep(0.05)
+
+        self.assertFalse(self.tracker.ready)
+        order_book = self.tracker.order_books[self.trading_pairs[0]]
+        self.assertIsInstance(order_book, SharedMemoryOrderBook)
+        self.assertEqual(99.0, order_book.get_price(is_buy=False))
+        self.assertEqual(101.0, order_book.get_price(is_buy=True))
+        self.assertEqual(100.0, order_book.last_trade_price)
+        self.assertEqual(1, order_book.snapshot_uid)
+
+        self._publish(self.trading_pairs[1], bid_price=9.0)
+        self._publish(self.trading_pairs[0], bid_price=98.0)
+        await asyncio.sleep(0.05)
+
+        self.assertTrue(self.tracker.ready)
+        self.assertIs(order_book, self.tracker.order_books[self.trading_pairs[0]])
+        self.assertEqual([98.0], [row.price for row in order_book.bid_entries()])
+        self.assertEqual(100.0, order_book.last_trade_price)
+
+    async def test_best_price_updates_are_emitted_on_notification(self):
+        self.tracker.start()
+        self._publish(self.trading_pairs[0], bid_price=99.0)
+        await asyncio.sleep(0.05)
+        order_book = self.tracker.order_books[self.trading_pairs[0]]
+        event_logger = EventLogger()
+        order_book.add_listener(OrderBookEvent.BestPriceUpdateEvent, event_logger)
+
+        self._publish(self.trading_pairs[0], bid_price=98.0)
+        await asyncio.sleep(0.05)
+
+        self.assertEqual(1, len(event_logger.event_log))
+        self.assertEqual((98.0, 100.0), tuple(event_logger.event_log[0]))
+
+    async def test_forwarded_trades_are_applied_to_the_order_books(self):
+        self.tracker.start()
+        self._publish(self.trading_pairs[0], bid_price=99.0)
+        await asyncio.sleep(0.05)
+        order_book = self.tracker.order_books[self.trading_pairs[0]]
+        event_logger = EventLogger()
+        order_book.add_listener(OrderBookEvent.TradeEvent, event_logger)
+        trade_event = OrderBookTradeEvent(trading_pair=self.trading_pairs[0],
+                                          timestamp=1640000000.0,
+                                          type=TradeType.SELL,
+                                          price=Decimal("99"),
+                                          amount=Decimal("2"))
+
+        self.trade_writers[-1].send(trade_event)
+        await asyncio.sleep(0.05)
+
+        self.assertEqual([trade_event], event_logger.event_log)
+        self.assertEqual(99.0, order_book.last_trade_price)
+
+    async def test_stop_releases_the_shared_buffers(self):
+        self.tracker.start()
+        self._publish(self.trading_pairs[0], bid_price=99.0)
+        await asyncio.sleep(0.05)
+        order_book = self.tracker.order_books[self.trading_pairs[0]]
+
+        self.tracker.stop()
+
+        self.assertEqual({}, self.tracker.order_books)
+        self.assertEqual({}, self.tracker._buffers)
+        self.assertFalse(self.tracker.ready)
+        self.assertEqual([], list(order_book.bid_entries()))
+
+    async def test_order_books_are_not_tracked_without_notification(self):
+        self.tracker.start()
+
+        self.tracker._buffers[self.trading_pairs[0]].publish(bids=np.array([[99.0, 1.0, 1]]),
+                                                             asks=np.array([[101.0, 1.0, 1]]),
+                                                             update_id=1,
+                                                             last_trade_price=100.0,
+                                                             timestamp=1640000000.0)
+        await asyncio.sleep(0.05)
+
+        self.assertEqual({}, self.tracker.order_books)
+
+    async def test_dead_process_is_restarted(self):
+        self.tracker.start()
+
+        # The pipe reaches its end when the process exits
+        self.notification_writers[0].close()
+        await asyncio.sleep(0.05)
+
+        self.assertEqual(2, self.start_process_mock.call_count)
+        self._publish(self.trading_pairs[0], bid_price=99.0)
+        await asyncio.sleep(0.05)
+        self.assertEqual(99.0, self.tracker.order_books[self.trading_pairs[0]].get_price(is_buy=False))
+
+    async def test_stop_does_not_block_while_the_process_exits(self):
+        self.tracker.start()
+        process = MagicMock()
+        process.is_alive.side_effect = [True, True, False, False]
+        self.tracker._process = process
+        self.tracker._process_stop_event = MagicMock()
+
+        self.tracker.stop()
+
+        self.assertIsNone(self.tracker._process)
+        process.join.assert_not_called()
+        await asyncio.sleep(0.3)
+        process.terminate.assert_not_called()
+        self.assertEqual(4, process.is_alive.call_count)
+
+
+class MarketDataProcessConnectorTests(IsolatedAsyncioWrapperTestCase):
+    trading_pair = "COINALPHA-HBOT"
+
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.client_config_map = ClientConfigAdapter(ClientConfigMap())
+        self.client_config_map.market_data_process_enabled = True
+        self.client_config_map.order_book_ws_connections = 2
+
+    async def test_exchange_tracks_its_order_books_in_a_market_data_process(self):
+        exchange = BinanceExchange(client_config_map=self.client_config_map,
+                                   binance_api_key="testAPIKey",
+                                   binance_api_secret="testSecret",
+                                   trading_pairs=[self.trading_pair])
+
+        tracker = exchange.order_book_tracker
+        self.assertIsInstance(tracker, MarketDataProcessOrderBookTracker)
+        # The worker connector is created with the user configuration
+        self.assertIs(self.client_config_map.hb_config, tracker._client_config_map)
+        self.assertEqual(2, tracker._client_config_map.order_book_ws_connections)
+
+    async def test_perpetual_derivative_tracks_its_order_books_in_the_main_process(self):
+        derivative = BinancePerpetualDerivative(client_config_map=self.client_config_map,
+                                                binance_perpetual_api_key="testAPIKey",
+                                                binance_perpetual_api_secret="testSecret",
+                                                trading_pairs=[self.trading_pair])
+
+        self.assertNotIsInstance(derivative.order_book_tracker, MarketDataProcessOrderBookTracker)
@@ -58,3 +58,47 @@ def main():
 
 if __name__ == "__main__":
     main()
+
+    def test_to_numpy_copies_the_levels_best_price_first(self):
+        order_book = OrderBook()
+        bids_array = np.array([[1, 1, 1], [2, 2, 2], [3, 3, 3]], dtype=np.float64)
+        asks_array = np.array([[4, 1, 1], [5, 2, 2], [6, 3, 3], [7, 4, 4]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+
+        bids, asks = order_book.to_numpy()
+
+        np.testing.assert_array_equal(bids_array[::-1], bids)
+        np.testing.assert_array_equal(asks_array, asks)
+        bids_df, asks_df = order_book.snapshot
+        np.testing.assert_array_equal(bids, bids_df.to_numpy())
+        np.testing.assert_array_equal(asks, asks_df.to_numpy())
+
+        bids, asks = order_book.to_numpy(depth=2)
+
+        np.testing.assert_array_equal([[3, 3, 3], [2, 2, 2]], bids)
+        np.testing.assert_array_equal([[4, 1, 1], [5, 2, 2]], asks)
+
+        bids, asks = OrderBook().to_numpy(depth=2)
+
+        self.assertEqual((0, 3), bids.shape)
+        self.assertEqual((0, 3), asks.shape)
+
+    def test_get_top_levels_aggregated_by_price_bucket(self):
+        order_book = OrderBook()
+        bids_array = np.array([[0.25, 1, 1], [0.29, 2, 2], [0.3, 1, 3], [0.15, 4, 4]], dtype=np.float64)
+        asks_array = np.array([[0.31, 1, 5], [0.4, 2, 1], [0.45, 3, 2], [0.5, 4, 3], [0.61, 1, 3]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+
+        bids, asks = order_book.get_top_levels(2)
+
+        np.testing.assert_array_equal([[0.3, 1, 3], [0.29, 2, 2]], bids)
+        np.testing.assert_array_equal([[0.31, 1, 5], [0.4, 2, 1]], asks)
+
+        bids, asks = order_book.get_top_levels(2, bucket_size=0.1)
+
+        # The bids are rounded down and the asks up, 0.3 and 0.4 being bucket prices
+        np.testing.assert_allclose([[0.3, 1, 3], [0.2, 3, 2]], bids)
+        np.testing.assert_allclose([[0.4, 3, 5], [0.5, 7, 3]], asks)
+
+        with self.assertRaises(ValueError):
+            order_book.get_top_levels(2, bucket_size=-1)
@@ -0,0 +1,130 @@
+import asyncio
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from typing import List, Optional
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+
+
+class OrderBookTrackerSequenceValidationTests(IsolatedAsyncioWrapperTestCase):
+    trading_pair = "COINALPHA-HBOT"
+    other_trading_pair = "COINBETA-HBOT"
+
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.snapshots: List[OrderBookMessage] = []
+        self.data_source = MagicMock()
+        self.data_source.CONTIGUOUS_DIFF_UPDATE_IDS = True
+        self.data_source._order_book_snapshot = AsyncMock(side_effect=self._next_snapshot)
+        self.tracker = OrderBookTracker(data_source=self.data_source,
+                                        trading_pairs=[self.trading_pair, self.other_trading_pair])
+        self.tracker.RESYNC_MIN_INTERVAL = 0
+        self.order_book = OrderBook()
+        self.order_book.apply_snapshot([], [], 10)
+        self.tracker._order_books[self.trading_pair] = self.order_book
+        self.tracker._tracking_message_queues[self.trading_pair] = asyncio.Queue()
+        self.tracking_task = asyncio.ensure_future(self.tracker._track_single_book(self.trading_pair))
+
+    async def asyncTearDown(self) -> None:
+        self.tracker.stop()
+        self.tracking_task.cancel()
+        await super().asyncTearDown()
+
+    async def _next_snapshot(self, trading_pair: str) -> OrderBookMessage:
+        return self.snapshots.pop(0)
+
+    def _diff(self, first_update_id: int, update_id: int, bid_price: Optional[float] = None) -> OrderBookMessage:
+        bids = [[bid_price if bid_price is not None else 90 + update_id, 1]]
+        return OrderBookMessage(
+            message_type=OrderBookMessageType.DIFF,
+            content={"trading_pair": self.trading_pair, "first_update_id": first_update_id, "update_id": update_id,
+                     "bids": bids, "asks": []},
+            timestamp=1640000000,
+        )
+
+    def _snapshot(self, update_id: int, bid_price: float) -> OrderBookMessage:
+        return OrderBookMessage(
+            message_type=OrderBookMessageType.SNAPSHOT,
+            content={"trading_pair": self.trading_pair, "update_id": update_id, "bids": [[bid_price, 5]], "asks": []},
+            timestamp=1640000000,
+        )
+
+    async def _process(self, *messages: OrderBookMessage):
+        for message in messages:
+            await self.tracker._tracking_message_queues[self.trading_pair].put(message)
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+    async def test_contiguous_diffs_are_applied_and_stale_diffs_skipped(self):
+        await self._process(self._diff(5, 9), self._diff(8, 11), self._diff(12, 12), self._diff(12, 12))
+
+        self.assertEqual(12, self.tracker._last_update_ids[self.trading_pair])
+        self.assertEqual([102, 101], [row.price for row in self.order_book.bid_entries()])
+        metrics = self.tracker.sync_metrics[self.trading_pair]
+        self.assertEqual(0, metrics.gaps)
+        self.assertEqual(2, metrics.stale_diffs)
+        self.data_source._order_book_snapshot.assert_not_called()
+
+    async def test_gap_resynchronizes_only_the_affected_order_book(self):
+        self.snapshots.append(self._snapshot(update_id=14, bid_price=50))
+
+        await self._process(self._diff(11, 11), self._diff(13, 13), self._diff(14, 14), self._diff(15, 15))
+
+        self.data_source._order_book_snapshot.assert_called_once_with(trading_pair=self.trading_pair)
+        await self._process(self._diff(16, 16))
+
+        # The snapshot replaced the order book, and the diffs after it were replayed in order
+        self.assertEqual([106, 105, 50], [row.price for row in self.order_book.bid_entries()])
+        self.assertEqual(16, self.tracker._last_update_ids[self.trading_pair])
+        self.assertNotIn(self.trading_pair, self.tracker._resync_buffers)
+        metrics = self.tracker.sync_metrics[self.trading_pair]
+        self.assertEqual(1, metrics.gaps)
+        self.assertEqual(1, metrics.resyncs)
+        self.assertEqual(2, metrics.stale_diffs)
+        self.assertNotIn(self.other_trading_pair, self.tracker.sync_metrics)
+
+    async def test_resync_requests_a_new_snapshot_when_the_snapshot_is_too_old(self):
+        self.snapshots.append(self._snapshot(update_id=12, bid_price=50))
+        self.snapshots.append(self._snapshot(update_id=15, bid_price=60))
+
+        await self._process(self._diff(14, 14), self._diff(15, 15))
+        await self._process(self._diff(16, 16))
+
+        self.assertEqual(2, self.data_source._order_book_snapshot.call_count)
+        self.assertEqual([106, 60], [row.price for row in self.order_book.bid_entries()])
+        metrics = self.tracker.sync_metrics[self.trading_pair]
+        self.assertEqual(2, metrics.gaps)
+        self.assertEqual(2, metrics.resyncs)
+
+    async def test_snapshot_older_than_the_synchronized_order_book_is_ignored(self):
+        await self._process(self._diff(11, 11), self._diff(12, 12))
+
+        await self._process(self._snapshot(update_id=11, bid_price=50))
+
+        self.assertEqual([102, 101], [row.price for row in self.order_book.bid_entries()])
+
+        await self._process(self._snapshot(update_id=20, bid_price=50))
+
+        self.assertEqual([50], [row.price for row in self.order_book.bid_entries()])
+        self.assertEqual(20, self.tracker._last_update_ids[self.trading_pair])
+
+    async def test_resync_snapshot_requests_are_spaced(self):
+        self.tracker.RESYNC_MIN_INTERVAL = 5
+        self.tracker._last_resync_request_timestamps[self.trading_pair] = float("inf")
+        self.snapshots.append(self._snapshot(update_id=12, bid_price=50))
+
+        with patch.object(OrderBookTracker, "_sleep", AsyncMock()) as sleep_mock:
+            await self._process(self._diff(13, 13))
+
+        sleep_mock.assert_called_once()
+        self.data_source._order_book_snapshot.assert_called_once()
+
+    async def test_diffs_applied_without_validation_when_not_supported(self):
+        self.data_source.CONTIGUOUS_DIFF_UPDATE_IDS = False
+
+        await self._process(self._diff(15, 15), self._diff(30, 30))
+
+        self.assertEqual([120, 105], [row.price for row in self.order_book.bid_entries()])
+        self.data_source._order_book_snapshot.assert_not_called()
@@ -0,0 +1,157 @@
+import asyncio
+import json
+import unittest
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.data_type.order_book_tracker_data_source import (
+    OrderBookTrackerDataSource,
+    OrderBookWebsocketShard,
+)
+from hummingbot.core.mock_api.mock_web_socket_server import MockWebSocketServerFactory
+from hummingbot.core.web_assistant.connections.data_types import WSJSONRequest
+from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
+from hummingbot.core.web_assistant.ws_assistant import WSAssistant
+
+WS_URL = "wss://www.test-exchange.com/ws/"
+
+ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+
+
+class ShardedTestDataSource(OrderBookTrackerDataSource):
+    WS_SHARD_CONNECTION_STAGGER_SECONDS = 0.05
+
+    def __init__(self, trading_pairs: List[str]):
+        super().__init__(trading_pairs=trading_pairs)
+        self._api_factory = WebAssistantsFactory(throttler=AsyncThrottler(rate_limits=[]))
+        self.subscriptions: List[List[str]] = []
+
+    async def get_last_traded_prices(self, trading_pairs: List[str], domain: str = None) -> Dict[str, float]:
+        raise NotImplementedError
+
+    async def _connected_websocket_assistant(self) -> WSAssistant:
+        ws: WSAssistant = await self._api_factory.get_ws_assistant()
+        await ws.connect(ws_url=WS_URL)
+        return ws
+
+    async def _subscribe_channels(self, ws: WSAssistant):
+        await self._subscribe_channels_for_trading_pairs(ws=ws, trading_pairs=self._trading_pairs)
+
+    async def _subscribe_channels_for_trading_pairs(self, ws: WSAssistant, trading_pairs: List[str]):
+        self.subscriptions.append(trading_pairs)
+        await ws.send(WSJSONRequest(payload={"op": "subscribe", "args": trading_pairs}))
+
+    def _channel_originating_message(self, event_message: Dict[str, Any]) -> str:
+        return event_message.get("channel", "")
+
+
+class OrderBookTrackerDataSourceShardingTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.ws_server = MockWebSocketServerFactory.start_new_server(WS_URL)
+        cls._patcher = patch("aiohttp.client.ClientSession.ws_connect", autospec=True)
+        cls._mock = cls._patcher.start()
+        cls._mock.side_effect = MockWebSocketServerFactory.reroute_ws_connect
+        ev_loop.run_until_complete(asyncio.wait_for(cls.ws_server.wait_til_started(), 1))
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.ws_server.stop()
+        cls._patcher.stop()
+
+    def setUp(self) -> None:
+        self.ws_server.websockets.clear()
+        self.trading_pairs = ["A-USDT", "B-USDT", "C-USDT", "D-USDT", "E-USDT"]
+        self.data_source = ShardedTestDataSource(trading_pairs=self.trading_pairs)
+        self.listening_task = None
+
+    def tearDown(self) -> None:
+        if self.listening_task is not None:
+            self.listening_task.cancel()
+            ev_loop.run_until_complete(asyncio.gather(self.listening_task, return_exceptions=True))
+
+    def _server_call(self, coroutine):
+        return asyncio.run_coroutine_threadsafe(coroutine, self.ws_server.ev_loop).result(timeout=5)
+
+    def _open_server_websockets(self) -> List[Any]:
+        return [websocket for websocket in self.ws_server.websockets if not websocket.closed]
+
+    async def _wait_for(self, condition, timeout: float = 5):
+        async def wait():
+            while not condition():
+                await asyncio.sleep(0.01)
+        await asyncio.wait_for(wait(), timeout)
+
+    def test_single_connection_by_default(self):
+        self.listening_task = ev_loop.create_task(self.data_source.listen_for_subscriptions())
+        ev_loop.run_until_complete(self._wait_for(lambda: len(self.data_source.subscriptions) == 1))
+
+        self.assertEqual([self.trading_pairs], self.data_source.subscriptions)
+        self.assertEqual(1, len(self.ws_server.websockets))
+        self.assertEqual([], self.data_source.ws_shards)
+
+    def test_trading_pairs_sharded_across_connections(self):
+        self.data_source.ws_connections_count = 2
+        self.listening_task = ev_loop.create_task(self.data_source.listen_for_subscriptions())
+        ev_loop.run_until_complete(self._wait_for(
+            lambda: all(shard.connected for shard in self.data_source.ws_shards) and len(self.data_source.ws_shards) == 2
+        ))
+
+        self.assertEqual(2, len(self.ws_server.websockets))
+        self.assertEqual(
+            [["A-USDT", "C-USDT", "E-USDT"], ["B-USDT", "D-USDT"]],
+            [shard.trading_pairs for shard in self.data_source.ws_shards])
+        # The shards are connected one after the other
+        self.assertEqual([["A-USDT", "C-USDT", "E-USDT"], ["B-USDT", "D-USDT"]], self.data_source.subscriptions)
+
+        first_websocket, second_websocket = self.ws_server.websockets
+        diff_message = {"channel": self.data_source._diff_messages_queue_key, "data": {}}
+        trade_message = {"channel": self.data_source._trade_messages_queue_key, "data": {}}
+        for _ in range(3):
+            self._server_call(first_websocket.send_str(json.dumps(diff_message)))
+        self._server_call(second_websocket.send_str(json.dumps(trade_message)))
+
+        first_shard, second_shard = self.data_source.ws_shards
+        ev_loop.run_until_complete(self._wait_for(
+            lambda: first_shard.message_count == 3 and second_shard.message_count == 1))
+        self.assertEqual(3, self.data_source._message_queue[self.data_source._diff_messages_queue_key].qsize())
+        self.assertEqual(1, self.data_source._message_queue[self.data_source._trade_messages_queue_key].qsize())
+
+    def test_shards_reconnect_independently(self):
+        self.data_source.ws_connections_count = 3
+        self.listening_task = ev_loop.create_task(self.data_source.listen_for_subscriptions())
+        ev_loop.run_until_complete(self._wait_for(
+            lambda: len(self._open_server_websockets()) == 3 and len(self.data_source.subscriptions) == 3))
+        first_shard, second_shard, third_shard = self.data_source.ws_shards
+        second_shard_websocket = self.ws_server.websockets[1]
+
+        self._server_call(second_shard_websocket.close())
+        ev_loop.run_until_complete(self._wait_for(lambda: second_shard.reconnections_count == 1))
+        ev_loop.run_until_complete(self._wait_for(lambda: len(self._open_server_websockets()) == 3))
+
+        self.assertEqual(4, len(self.ws_server.websockets))
+        self.assertEqual(0, first_shard.reconnections_count)
+        self.assertEqual(0, third_shard.reconnections_count)
+        self.assertTrue(all(shard.connected for shard in self.data_source.ws_shards))
+        # Only the trading pairs of the dropped connection are subscribed again
+        self.assertEqual(second_shard.trading_pairs, self.data_source.subscriptions[-1])
+        self.assertEqual(4, len(self.data_source.subscriptions))
+
+    def test_shard_message_rate(self):
+        shard = OrderBookWebsocketShard(index=0, trading_pairs=self.trading_pairs)
+
+        shard.record_connection(timestamp=1000)
+        for timestamp in range(1001, 1011):
+            shard.record_message(timestamp=timestamp)
+        shard.record_message(timestamp=1011)
+
+        self.assertEqual(1.0, shard.message_rate)
+        self.assertEqual(11, shard.message_count)
+        self.assertEqual(1011, shard.to_dict()["last_message_timestamp"])
+
+        shard.record_disconnection()
+        shard.record_connection(timestamp=2000)
+
+        self.assertEqual(0.0, shard.message_rate)
+        self.assertEqual(1, shard.reconnections_count)
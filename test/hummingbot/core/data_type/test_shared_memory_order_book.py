@@ -0,0 +1,168 @@
+import math
+import multiprocessing
+import unittest
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.shared_memory_order_book import SharedMemoryOrderBook
+from hummingbot.core.data_type.shared_order_book_buffer import SharedOrderBookBuffer
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import OrderBookEvent
+
+
+def _publish_from_other_process(buffer_name: str, depth: int):
+    buffer = SharedOrderBookBuffer.attach(name=buffer_name, depth=depth)
+    buffer.publish(bids=np.array([[99.0, 1.0, 7]]),
+                   asks=np.array([[101.0, 2.0, 7]]),
+                   update_id=7,
+                   last_trade_price=100.0,
+                   timestamp=1640000000.0)
+    buffer.close()
+
+
+class SharedMemoryOrderBookTests(unittest.TestCase):
+    depth = 5
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.buffer = SharedOrderBookBuffer.create(depth=self.depth)
+        self.shared_order_book = SharedMemoryOrderBook(trading_pair="COINALPHA-HBOT", buffer=self.buffer)
+        self.order_book = OrderBook()
+        bids = np.array([[100.0 - i, 1.0 + i, 10] for i in range(8)], dtype=np.float64)
+        asks = np.array([[101.0 + i, 2.0 + i, 10] for i in range(8)], dtype=np.float64)
+        self.order_book.apply_numpy_snapshot(bids, asks)
+        self.order_book.last_trade_price = 100.5
+
+    def tearDown(self) -> None:
+        self.shared_order_book.release()
+        self.buffer.close()
+        super().tearDown()
+
+    def test_nothing_published(self):
+        self.assertEqual(0, self.buffer.sequence)
+        with self.assertRaises(EnvironmentError):
+            self.shared_order_book.get_price(is_buy=True)
+        self.assertFalse(self.shared_order_book.refresh())
+        self.assertTrue(math.isnan(self.shared_order_book.last_trade_price))
+
+    def test_publish_order_book_keeps_top_levels(self):
+        self.buffer.publish_order_book(self.order_book, timestamp=1640000000.0)
+        self.assertTrue(self.shared_order_book.refresh())
+
+        snapshot = self.buffer.snapshot()
+        self.assertEqual(2, self.buffer.sequence)
+        self.assertEqual([100, 99, 98, 97, 96], [row.price for row in self.shared_order_book.bid_entries()])
+        self.assertEqual([101, 102, 103, 104, 105], [row.price for row in self.shared_order_book.ask_entries()])
+        self.assertEqual(10, snapshot.update_id)
+        self.assertEqual(10, self.shared_order_book.snapshot_uid)
+        self.assertEqual(100.5, self.shared_order_book.last_trade_price)
+        self.assertEqual(1640000000.0, snapshot.timestamp)
+        bids_df, asks_df = self.shared_order_book.snapshot
+        self.assertEqual(self.depth, len(bids_df))
+        self.assertEqual(["price", "amount", "update_id"], list(asks_df.columns))
+
+    def test_queries_match_order_book_within_published_depth(self):
+        self.buffer.publish_order_book(self.order_book, timestamp=1640000000.0)
+
+        for is_buy in (True, False):
+            self.assertEqual(self.order_book.get_price(is_buy), self.shared_order_book.get_price(is_buy))
+            for volume in (0.5, 3, 7.5):
+                expected = self.order_book.get_price_for_volume(is_buy, volume)
+                result = self.shared_order_book.get_price_for_volume(is_buy, volume)
+                self.assertEqual(expected.result_price, result.result_price)
+                self.assertEqual(expected.result_volume, result.result_volume)
+                expected = self.order_book.get_vwap_for_volume(is_buy, volume)
+                result = self.shared_order_book.get_vwap_for_volume(is_buy, volume)
+                self.assertAlmostEqual(expected.result_price, result.result_price)
+                self.assertEqual(expected.result_volume, result.result_volume)
+
+        result = self.shared_order_book.get_price_for_volume(True, 1000)
+        self.assertTrue(math.isnan(result.result_price))
+        self.assertEqual(sum(2.0 + i for i in range(self.depth)), result.result_volume)
+
+    def test_vwap_for_zero_volume_is_undefined(self):
+        self.buffer.publish_order_book(self.order_book, timestamp=1640000000.0)
+
+        result = self.shared_order_book.get_vwap_for_volume(True, 0)
+
+        self.assertTrue(math.isnan(result.result_price))
+        self.assertEqual(0, result.result_volume)
+
+    def test_smaller_publication_replaces_previous_levels(self):
+        self.buffer.publish_order_book(self.order_book, timestamp=1640000000.0)
+        self.buffer.publish(bids=np.array([[50.0, 1.0, 11]]), asks=np.empty((0, 3)), update_id=11,
+                            last_trade_price=50.0, timestamp=1640000001.0)
+
+        self.assertEqual([50], [row.price for row in self.shared_order_book.bid_entries()])
+        self.assertEqual([], list(self.shared_order_book.ask_entries()))
+        self.shared_order_book.refresh()
+        self.assertEqual(11, self.shared_order_book.snapshot_uid)
+        with self.assertRaises(EnvironmentError):
+            self.shared_order_book.get_price(is_buy=True)
+
+    def test_read_retries_while_a_publication_is_in_progress(self):
+        self.buffer.publish_order_book(self.order_book, timestamp=1640000000.0)
+        calls = []
+
+        def read_and_publish(bids, asks, bids_count, asks_count):
+            calls.append(bids[0, 0])
+            if len(calls) == 1:
+                self.buffer.publish(bids=np.array([[50.0, 1.0, 11]]), asks=np.empty((0, 3)), update_id=11,
+                                    last_trade_price=50.0, timestamp=1640000001.0)
+            return bids[0, 0]
+
+        self.assertEqual(50.0, self.buffer.read(read_and_publish))
+        self.assertEqual([100.0, 50.0], calls)
+
+    def test_read_fails_when_the_writer_never_completes(self):
+        self.buffer._ints[0] = 1
+        self.buffer.MAX_READ_ATTEMPTS = 3
+
+        with self.assertRaises(BlockingIOError):
+            self.buffer.snapshot()
+        self.buffer._ints[0] = 0
+
+    def test_top_levels_match_order_book_within_published_depth(self):
+        self.buffer.publish_order_book(self.order_book, timestamp=1640000000.0)
+
+        for bucket_size in (0, 2):
+            expected_bids, expected_asks = self.order_book.get_top_levels(2, bucket_size=bucket_size)
+            bids, asks = self.shared_order_book.get_top_levels(2, bucket_size=bucket_size)
+            np.testing.assert_array_equal(expected_bids, bids)
+            np.testing.assert_array_equal(expected_asks, asks)
+        bids, asks = self.shared_order_book.to_numpy()
+        self.assertEqual((self.depth, 3), bids.shape)
+
+    def test_refresh_emits_best_price_updates(self):
+        event_logger = EventLogger()
+        self.shared_order_book.add_listener(OrderBookEvent.BestPriceUpdateEvent, event_logger)
+        self.buffer.publish_order_book(self.order_book, timestamp=1640000000.0)
+
+        self.assertTrue(self.shared_order_book.refresh())
+        self.assertFalse(self.shared_order_book.refresh())
+        self.buffer.publish_order_book(self.order_book, timestamp=1640000001.0)
+        self.assertTrue(self.shared_order_book.refresh())
+
+        self.assertEqual(1, len(event_logger.event_log))
+        self.assertEqual((100.0, 101.0), tuple(event_logger.event_log[0]))
+
+    def test_view_is_read_only(self):
+        with self.assertRaises(NotImplementedError):
+            self.shared_order_book.apply_snapshot([], [], 1)
+        with self.assertRaises(NotImplementedError):
+            self.shared_order_book.apply_diffs([], [], 1)
+        with self.assertRaises(NotImplementedError):
+            self.shared_order_book.apply_numpy_snapshot(np.empty((0, 3)), np.empty((0, 3)))
+
+    def test_publication_from_another_process(self):
+        process = multiprocessing.get_context("fork").Process(
+            target=_publish_from_other_process, args=(self.buffer.name, self.depth))
+        process.start()
+        process.join(timeout=10)
+
+        self.assertEqual(0, process.exitcode)
+        self.assertEqual(99.0, self.shared_order_book.get_price(is_buy=False))
+        self.assertEqual(101.0, self.shared_order_book.get_price(is_buy=True))
+        self.shared_order_book.refresh()
+        self.assertEqual(100.0, self.shared_order_book.last_trade_price)
@@ -0,0 +1,131 @@
+from decimal import Decimal
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+from aiohttp import ClientSession, web
+from aiohttp.test_utils import TestServer
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.core.event.events import TradeType
+from hummingbot.core.gateway.gateway_http_client import GatewayHttpClient, GatewayPriceRequest
+
+
+class GatewayHttpClientBatchPricesTest(IsolatedAsyncioWrapperTestCase):
+    """
+    Runs the price requests against a local mock Gateway server, with and without the batched amm/prices endpoint.
+    """
+
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.single_requests: List[Dict[str, Any]] = []
+        self.batch_requests: List[Dict[str, Any]] = []
+        self.session = ClientSession()
+        self.client = GatewayHttpClient(ClientConfigAdapter(ClientConfigMap()))
+        self.client._batch_price_supported = None
+        patcher = patch.object(GatewayHttpClient, "_http_client", return_value=self.session)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def asyncTearDown(self) -> None:
+        await self.server.close()
+        await self.session.close()
+        await super().asyncTearDown()
+
+    @staticmethod
+    def _price_response(payload: Dict[str, Any]) -> Dict[str, Any]:
+        if payload["base"] == "UNKNOWN":
+            return {"error": "Token not supported"}
+        price = Decimal(payload["amount"]) * (Decimal("2") if payload["side"] == "BUY" else Decimal("1"))
+        return {
+            "base": payload["base"],
+            "quote": payload["quote"],
+            "price": str(price),
+            "gasLimit": 100000,
+            "gasPrice": 1,
+            "gasCost": "0.0001",
+            "gasPriceToken": "ETH",
+        }
+
+    async def _start_server(self, batch_supported: bool, batch_error: bool = False):
+        async def single_price(request: web.Request) -> web.Response:
+            payload = await request.json()
+            self.single_requests.append(payload)
+            response = self._price_response(payload)
+            return web.json_response(response, status=500 if "error" in response else 200)
+
+        async def batch_prices(request: web.Request) -> web.Response:
+            payload = await request.json()
+            self.batch_requests.append(payload)
+            if batch_error:
+                return web.json_response({"error": "Internal server error", "statusCode": 500}, status=500)
+            return web.json_response({"prices": [self._price_response(p) for p in payload["requests"]]})
+
+        app = web.Application()
+        app.router.add_post("/amm/price", single_price)
+        if batch_supported:
+            app.router.add_post("/amm/prices", batch_prices)
+        self.server = TestServer(app)
+        await self.server.start_server()
+        self.client.base_url = str(self.server.make_url("")).rstrip("/")
+
+    def _price_requests(self) -> List[GatewayPriceRequest]:
+        return [
+            GatewayPriceRequest("WETH", "DAI", Decimal("3"), TradeType.BUY),
+            GatewayPriceRequest("UNKNOWN", "DAI", Decimal("1"), TradeType.BUY),
+            GatewayPriceRequest("WETH", "USDC", Decimal("1"), TradeType.SELL, pool_id="pool1"),
+        ]
+
+    async def test_get_prices_uses_batch_endpoint(self):
+        await self._start_server(batch_supported=True)
+
+        results = await self.client.get_prices("ethereum", "goerli", "uniswap", self._price_requests())
+
+        self.assertEqual(1, len(self.batch_requests))
+        self.assertEqual(0, len(self.single_requests))
+        self.assertEqual(3, len(self.batch_requests[0]["requests"]))
+        self.assertEqual("pool1", self.batch_requests[0]["requests"][2]["poolId"])
+        self.assertEqual(Decimal("6"), Decimal(results[0]["price"]))
+        self.assertIsInstance(results[1], ValueError)
+        self.assertEqual(Decimal("1"), Decimal(results[2]["price"]))
+        self.assertTrue(self.client._batch_price_supported)
+
+    async def test_get_prices_falls_back_to_single_requests(self):
+        await self._start_server(batch_supported=False)
+
+        results = await self.client.get_prices("ethereum", "goerli", "uniswap", self._price_requests())
+
+        self.assertEqual(3, len(self.single_requests))
+        self.assertEqual(Decimal("6"), Decimal(results[0]["price"]))
+        self.assertIsInstance(results[1], ValueError)
+        self.assertEqual(Decimal("1"), Decimal(results[2]["price"]))
+        self.assertFalse(self.client._batch_price_supported)
+
+        # The batch endpoint is not tried again
+        self.single_requests.clear()
+        with patch.object(self.client, "api_request", wraps=self.client.api_request) as api_request_mock:
+            await self.client.get_prices("ethereum", "goerli", "uniswap", self._price_requests()[:1])
+        self.assertEqual("amm/price", api_request_mock.call_args.args[1])
+        self.assertEqual(1, len(self.single_requests))
+
+    async def test_get_prices_with_no_requests(self):
+        await self._start_server(batch_supported=True)
+
+        self.assertEqual([], await self.client.get_prices("ethereum", "goerli", "uniswap", []))
+        self.assertEqual(0, len(self.batch_requests))
+
+    async def test_get_prices_falls_back_for_the_call_on_batch_errors(self):
+        await self._start_server(batch_supported=True, batch_error=True)
+
+        results = await self.client.get_prices("ethereum", "goerli", "uniswap", self._price_requests())
+
+        self.assertEqual(1, len(self.batch_requests))
+        self.assertEqual(3, len(self.single_requests))
+        self.assertEqual(Decimal("6"), Decimal(results[0]["price"]))
+        self.assertIsInstance(results[1], ValueError)
+        self.assertIsNone(self.client._batch_price_supported)
+
+        # The batch endpoint is tried again on the next call
+        await self.client.get_prices("ethereum", "goerli", "uniswap", self._price_requests()[:1])
+        self.assertEqual(2, len(self.batch_requests))
@@ -3,10 +3,12 @@ import json
 import unittest
 from decimal import Decimal
 from typing import Awaitable
+from unittest.mock import AsyncMock, patch
 
 from aioresponses import aioresponses
 
 from hummingbot.connector.exchange.binance import binance_constants as CONSTANTS, binance_web_utils as web_utils
+from hummingbot.connector.test_support.network_mocking_assistant import NetworkMockingAssistant
 from hummingbot.connector.utils import combine_to_hb_trading_pair
 from hummingbot.core.rate_oracle.sources.binance_rate_source import BinanceRateSource
 
@@ -79,3 +81,30 @@ class BinanceRateSourceTest(unittest.TestCase):
         self.assertEqual(expected_rate, prices[self.trading_pair])
         # self.assertIn(self.us_trading_pair, prices)
         self.assertNotIn(self.ignored_trading_pair, prices)
+
+    @aioresponses()
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_stream_binance_prices(self, mock_api, ws_connect_mock):
+        expected_rate = Decimal("10")
+        self.setup_binance_responses(mock_api=mock_api, expected_rate=expected_rate)
+        mocking_assistant = NetworkMockingAssistant()
+        ws_connect_mock.return_value = mocking_assistant.create_websocket_mock()
+        tickers = [
+            {"e": "24hrTicker", "s": self.binance_pair, "b": "9.9", "a": "10.1"},
+            {"e": "24hrTicker", "s": self.binance_ignored_pair, "b": "1", "a": "2"},
+        ]
+        mocking_assistant.add_websocket_aiohttp_message(websocket_mock=ws_connect_mock.return_value,
+                                                        message=json.dumps({"result": None, "id": 1}))
+        mocking_assistant.add_websocket_aiohttp_message(websocket_mock=ws_connect_mock.return_value,
+                                                        message=json.dumps(tickers))
+
+        rate_source = BinanceRateSource()
+        self.assertTrue(rate_source.supports_price_stream)
+        prices_stream = rate_source.stream_prices()
+        prices = self.async_run_with_timeout(prices_stream.__anext__())
+        self.async_run_with_timeout(prices_stream.aclose())
+
+        self.assertEqual({self.trading_pair: expected_rate}, prices)
+        sent_messages = mocking_assistant.json_messages_sent_through_websocket(ws_connect_mock.return_value)
+        self.assertEqual(
+            [{"method": "SUBSCRIBE", "params": [CONSTANTS.ALL_MARKET_TICKERS_STREAM], "id": 1}], sent_messages)
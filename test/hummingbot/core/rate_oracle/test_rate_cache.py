@@ -0,0 +1,77 @@
+import unittest
+from decimal import Decimal
+from os.path import join
+from tempfile import TemporaryDirectory
+
+from hummingbot.core.rate_oracle.rate_cache import RateCache
+
+
+class RateCacheTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.now = 1000.0
+        self.cache = RateCache(ttl=10, time_provider=lambda: self.now)
+
+    def test_rates_from_direct_and_reverse_prices(self):
+        self.cache.update({"HBOT-USDT": Decimal("100")})
+
+        self.assertEqual(Decimal("100"), self.cache.rate("HBOT-USDT"))
+        self.assertEqual(Decimal("0.01"), self.cache.rate("USDT-HBOT"))
+        self.assertEqual(Decimal("1"), self.cache.rate("WETH-ETH"))
+        self.assertIsNone(self.cache.rate("ZBOT-USDT"))
+
+    def test_rates_through_the_conversion_graph(self):
+        self.cache.update({"HBOT-USDT": Decimal("100"),
+                           "AAVE-USDT": Decimal("50"),
+                           "USDT-GBP": Decimal("0.75"),
+                           "GBP-JPY": Decimal("200")})
+
+        self.assertEqual(Decimal("2"), self.cache.rate("HBOT-AAVE"))
+        self.assertEqual(Decimal("0.5"), self.cache.rate("AAVE-HBOT"))
+        self.assertEqual(Decimal("75"), self.cache.rate("HBOT-GBP"))
+        # More conversions than the previous two-hop lookup supported
+        self.assertEqual(Decimal("7500"), self.cache.rate("AAVE-JPY"))
+        self.assertEqual(Decimal("15000"), self.cache.rate("HBOT-JPY"))
+        self.assertEqual(Decimal("100"), self.cache.rate("wHBOT-USDT"))
+
+        # The routes are kept when the prices change
+        self.cache.update({"HBOT-USDT": Decimal("120")})
+        self.assertEqual(Decimal("2.4"), self.cache.rate("HBOT-AAVE"))
+
+        # A new pair gives a shorter route
+        self.cache.update({"HBOT-JPY": Decimal("16000")})
+        self.assertEqual(Decimal("16000"), self.cache.rate("HBOT-JPY"))
+
+    def test_each_price_expires_after_its_own_update(self):
+        self.cache.update({"HBOT-USDT": Decimal("100"), "HBOT-DAI": Decimal("101"), "USDT-DAI": Decimal("1.01")})
+        self.now += 8
+        self.cache.update({"HBOT-DAI": Decimal("102"), "USDT-DAI": Decimal("1.02")})
+        self.now += 5
+
+        self.assertEqual({"HBOT-DAI": Decimal("102"), "USDT-DAI": Decimal("1.02")}, self.cache.prices)
+        # HBOT-USDT expired, the rate is computed through DAI
+        self.assertEqual(Decimal("102") / Decimal("1.02"), self.cache.rate("HBOT-USDT"))
+
+        self.now += 10
+        self.assertEqual({}, self.cache.prices)
+        self.assertIsNone(self.cache.rate("HBOT-USDT"))
+        self.assertIsNone(self.cache.rate("DAI-HBOT"))
+
+    def test_snapshot_restores_the_prices(self):
+        self.cache.update({"HBOT-USDT": Decimal("100"), "AAVE-USDT": Decimal("50")})
+
+        with TemporaryDirectory() as directory:
+            file_path = join(directory, "rate_oracle", "dummy_USDT.pickle")
+            self.cache.save(file_path)
+
+            self.now += 60
+            restored_cache = RateCache(ttl=10, time_provider=lambda: self.now)
+            self.assertEqual(2, restored_cache.load(file_path, max_age=120))
+            self.assertEqual(Decimal("2"), restored_cache.rate("HBOT-AAVE"))
+
+            self.now += 120
+            outdated_cache = RateCache(ttl=10, time_provider=lambda: self.now)
+            self.assertEqual(0, outdated_cache.load(file_path, max_age=120))
+            self.assertEqual(0, outdated_cache.load(join(directory, "missing.pickle"), max_age=120))
+            self.assertEqual({}, outdated_cache.prices)
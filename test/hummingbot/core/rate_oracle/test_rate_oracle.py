@@ -2,7 +2,10 @@ import asyncio
 import unittest
 from copy import deepcopy
 from decimal import Decimal
-from typing import Awaitable, Dict, Optional
+from os.path import join
+from tempfile import TemporaryDirectory
+from typing import AsyncIterable, Awaitable, Dict, Optional
+from unittest.mock import PropertyMock, patch
 
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
@@ -25,6 +28,20 @@ class DummyRateSource(RateSourceBase):
         return deepcopy(self._price_dict)
 
 
+class DummyStreamingRateSource(DummyRateSource):
+    def __init__(self, price_dict: Dict[str, Decimal]):
+        super().__init__(price_dict=price_dict)
+        self.pushed_prices: asyncio.Queue = asyncio.Queue()
+
+    @property
+    def supports_price_stream(self) -> bool:
+        return True
+
+    async def stream_prices(self, quote_token: Optional[str] = None) -> AsyncIterable[Dict[str, Decimal]]:
+        while True:
+            yield await self.pushed_prices.get()
+
+
 class RateOracleTest(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
@@ -67,6 +84,54 @@ class RateOracleTest(unittest.TestCase):
 
         self.assertEqual(0, len(rate_oracle.prices))
 
+    def test_rate_oracle_receives_pushed_prices(self):
+        source = DummyStreamingRateSource(price_dict={self.trading_pair: Decimal("10")})
+        rate_oracle = RateOracle(source=source)
+
+        self.async_run_with_timeout(rate_oracle.start_network())
+        self.async_run_with_timeout(rate_oracle.get_ready())
+        self.assertEqual(Decimal("10"), rate_oracle.get_pair_rate(self.trading_pair))
+
+        source.pushed_prices.put_nowait({self.trading_pair: Decimal("11"), "HBOT-USDT": Decimal("2")})
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        self.assertEqual(Decimal("11"), rate_oracle.get_pair_rate(self.trading_pair))
+        self.assertEqual(Decimal("22"), rate_oracle.get_pair_rate("COINALPHA-USDT"))
+
+        self.async_run_with_timeout(rate_oracle.stop_network())
+
+    def test_rate_oracle_restores_the_prices_snapshot_on_start(self):
+        rate_oracle = RateOracle(source=DummyRateSource(price_dict={self.trading_pair: Decimal("10")}))
+        rate_oracle.snapshot_enabled = True
+
+        with TemporaryDirectory() as directory, patch.object(
+                RateOracle, "snapshot_file_path", new_callable=PropertyMock) as snapshot_file_path_mock:
+            snapshot_file_path_mock.return_value = join(directory, "dummy.pickle")
+            self.async_run_with_timeout(rate_oracle.start_network())
+            self.async_run_with_timeout(rate_oracle.get_ready())
+            self.async_run_with_timeout(rate_oracle.stop_network())
+            self.assertEqual(0, len(rate_oracle.prices))
+
+            restarted_rate_oracle = RateOracle(source=DummyRateSource(price_dict={}))
+            restarted_rate_oracle.snapshot_enabled = True
+            self.async_run_with_timeout(restarted_rate_oracle.start_network())
+            self.async_run_with_timeout(restarted_rate_oracle.get_ready())
+
+            self.assertEqual(Decimal("10"), restarted_rate_oracle.get_pair_rate(self.trading_pair))
+            self.async_run_with_timeout(restarted_rate_oracle.stop_network())
+
+    def test_stored_or_live_rate_stores_the_fetched_prices(self):
+        source = DummyRateSource(price_dict={self.trading_pair: Decimal("10")})
+        rate_oracle = RateOracle(source=source)
+
+        rate = self.async_run_with_timeout(rate_oracle.stored_or_live_rate(self.trading_pair))
+        self.assertEqual(Decimal("10"), rate)
+
+        source._price_dict = {self.trading_pair: Decimal("11")}
+        self.assertEqual(Decimal("10"), rate_oracle.get_pair_rate(self.trading_pair))
+        self.assertEqual(Decimal("0.1"), self.async_run_with_timeout(
+            rate_oracle.stored_or_live_rate(f"{self.global_token}-{self.target_token}")))
+
     def test_find_rate(self):
         prices = {"HBOT-USDT": Decimal("100"), "AAVE-USDT": Decimal("50"), "USDT-GBP": Decimal("0.75")}
         rate = find_rate(prices, "HBOT-USDT")
@@ -96,7 +161,8 @@ class RateOracleTest(unittest.TestCase):
 
         self.assertEqual(0, len(rate_oracle.prices))
 
-        rate_oracle._prices = {"BTC-USD": Decimal("20000")}
+        rate_oracle.set_price("BTC-USD", Decimal("20000"))
+        self.assertEqual(1, len(rate_oracle.prices))
 
         config_map.global_token.global_token_name = "EUR"
 
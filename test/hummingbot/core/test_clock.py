@@ -7,6 +7,7 @@ from hummingbot.core.clock import (
     Clock,
     ClockMode
 )
+from hummingbot.core.py_time_iterator import PyTimeIterator
 from hummingbot.core.time_iterator import TimeIterator
 
 
@@ -124,3 +125,70 @@ class ClockUnitTest(unittest.TestCase):
         self.clock_backtest.backtest_til(self.backtest_start_timestamp + self.tick_size)
         self.assertGreater(self.clock_backtest.current_timestamp, self.clock_backtest.start_time)
         self.assertLess(self.clock_backtest.current_timestamp, self.backtest_end_timestamp)
+
+    def test_hybrid_clock_runs_early_ticks(self):
+        ticks = []
+
+        class RecordingTimeIterator(PyTimeIterator):
+            def tick(self, timestamp: float):
+                ticks.append(timestamp)
+
+        time_iterator = RecordingTimeIterator()
+        clock = Clock(ClockMode.HYBRID, tick_size=1.0, early_tick_price_threshold=0.001, min_early_tick_interval=0.05)
+        clock.add_iterator(time_iterator)
+
+        async def request_early_ticks():
+            await asyncio.sleep(0.1)
+            clock.request_early_tick(time_iterator)
+            # Debounced with the previous request
+            clock.request_early_tick(time_iterator)
+
+        with clock:
+            end_time = time.time() + 1.0
+            self.ev_loop.run_until_complete(asyncio.gather(clock.run_til(end_time), request_early_ticks()))
+
+        early_ticks = [t for t in ticks if t != int(t)]
+        self.assertEqual(1, len(early_ticks))
+        self.assertEqual(1, len(clock.early_tick_latencies))
+        # Well under the 1 second tick size, with some margin for slow test runners
+        self.assertLess(clock.early_tick_latencies[0], 0.5)
+
+    def test_early_ticks_run_the_dependencies_first_with_the_same_timestamp(self):
+        ticks = []
+
+        class RecordingTimeIterator(PyTimeIterator):
+            def __init__(self, name: str):
+                super().__init__()
+                self.name = name
+
+            def tick(self, timestamp: float):
+                ticks.append((self.name, timestamp))
+
+        market = RecordingTimeIterator("market")
+        other_market = RecordingTimeIterator("other_market")
+        strategy = RecordingTimeIterator("strategy")
+        clock = Clock(ClockMode.HYBRID, tick_size=1.0, early_tick_price_threshold=0.001, min_early_tick_interval=0.05)
+        for iterator in (market, other_market, strategy):
+            clock.add_iterator(iterator)
+
+        async def request_early_tick():
+            await asyncio.sleep(0.1)
+            clock.request_early_tick(strategy, dependencies=(market,))
+
+        with clock:
+            end_time = time.time() + 1.0
+            self.ev_loop.run_until_complete(asyncio.gather(clock.run_til(end_time), request_early_tick()))
+
+        early_ticks = [(name, timestamp) for name, timestamp in ticks if timestamp != int(timestamp)]
+        self.assertEqual(["market", "strategy"], [name for name, _ in early_ticks])
+        self.assertEqual(early_ticks[0][1], early_ticks[1][1])
+
+    def test_request_early_tick_ignored_outside_hybrid_mode(self):
+        time_iterator = TimeIterator()
+        self.clock_realtime.add_iterator(time_iterator)
+
+        with self.clock_realtime:
+            self.clock_realtime.request_early_tick(time_iterator)
+            self.ev_loop.run_until_complete(self.clock_realtime.run_til(time.time() + 0.1))
+
+        self.assertEqual(0, len(self.clock_realtime.early_tick_latencies))
@@ -0,0 +1,91 @@
+import unittest
+from decimal import Decimal
+from typing import Dict
+from unittest.mock import MagicMock
+
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+from hummingbot.core.early_tick_trigger import EarlyTickTrigger
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import MarketEvent, OrderBookEvent, OrderFilledEvent
+from hummingbot.core.pubsub import PubSub
+
+
+class MockMarket(PubSub):
+    def __init__(self):
+        super().__init__()
+        self.order_books: Dict[str, OrderBook] = {}
+
+
+class EarlyTickTriggerTest(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.order_book = OrderBook()
+        self.market = MockMarket()
+        self.market.order_books["COINALPHA-HBOT"] = self.order_book
+        self.iterator = MagicMock()
+        self.trigger = EarlyTickTrigger(self.iterator, price_threshold=0.01)
+
+    def _apply_best_prices(self, best_bid: float, best_ask: float, update_id: int):
+        self.order_book.apply_snapshot([OrderBookRow(best_bid, 1, update_id)],
+                                       [OrderBookRow(best_ask, 1, update_id)],
+                                       update_id)
+
+    def test_order_book_emits_best_price_updates(self):
+        event_logger = EventLogger()
+        self.order_book.add_listener(OrderBookEvent.BestPriceUpdateEvent, event_logger)
+
+        self._apply_best_prices(99, 101, 1)
+        self.order_book.apply_diffs([OrderBookRow(98, 1, 2)], [], 2)
+        self.order_book.apply_diffs([OrderBookRow(99.5, 1, 3)], [], 3)
+
+        self.assertEqual(2, len(event_logger.event_log))
+        self.assertEqual(99, event_logger.event_log[0].best_bid)
+        self.assertEqual(101, event_logger.event_log[0].best_ask)
+        self.assertEqual(99.5, event_logger.event_log[1].best_bid)
+
+    def test_best_price_move_above_threshold_requests_early_tick(self):
+        self.trigger.watch_markets([self.market])
+
+        # The first prices are only used as reference
+        self._apply_best_prices(100, 101, 1)
+        self.iterator.clock.request_early_tick.assert_not_called()
+
+        self._apply_best_prices(100.5, 101, 2)
+        self.iterator.clock.request_early_tick.assert_not_called()
+
+        self._apply_best_prices(98, 101, 3)
+        self.iterator.clock.request_early_tick.assert_called_once()
+        self.assertIs(self.iterator, self.iterator.clock.request_early_tick.call_args.args[0])
+        self.assertEqual((self.market,), self.iterator.clock.request_early_tick.call_args.args[2])
+
+    def test_order_filled_requests_early_tick(self):
+        self.trigger.watch_markets([self.market])
+
+        self.market.trigger_event(
+            MarketEvent.OrderFilled,
+            OrderFilledEvent(1640000000, "OID1", "COINALPHA-HBOT", TradeType.BUY, OrderType.LIMIT, Decimal("100"),
+                             Decimal("1"), AddedToCostTradeFee()))
+
+        self.iterator.clock.request_early_tick.assert_called_once()
+
+    def test_order_books_created_later_are_watched(self):
+        self.trigger.watch_markets([self.market])
+        new_order_book = OrderBook()
+        self.market.order_books["COINALPHA-USDT"] = new_order_book
+
+        self.trigger.update_order_books()
+
+        self.assertIn(new_order_book, self.trigger.order_books)
+
+    def test_stop(self):
+        self.trigger.watch_markets([self.market])
+        self.trigger.stop()
+
+        self._apply_best_prices(100, 101, 1)
+        self._apply_best_prices(50, 101, 2)
+
+        self.iterator.clock.request_early_tick.assert_not_called()
+        self.assertEqual(0, len(self.trigger.order_books))
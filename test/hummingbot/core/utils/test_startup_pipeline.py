@@ -0,0 +1,106 @@
+import asyncio
+import unittest
+from typing import Awaitable, List
+
+from hummingbot.core.utils.startup_pipeline import StartupPipeline, StartupStepStatus
+
+
+class StartupPipelineTests(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self._original_async_loop = asyncio.get_event_loop()
+        self.async_loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.async_loop)
+        self.events: List[str] = []
+
+    def tearDown(self) -> None:
+        self.async_loop.stop()
+        self.async_loop.close()
+        asyncio.set_event_loop(self._original_async_loop)
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        return self.async_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    def _step(self, name: str, delay: float = 0, fail: bool = False):
+        async def step():
+            self.events.append(f"{name} started")
+            await asyncio.sleep(delay)
+            if fail:
+                raise Exception(f"{name} failed")
+            self.events.append(f"{name} done")
+        return step
+
+    def test_independent_steps_run_concurrently(self):
+        pipeline = StartupPipeline()
+        pipeline.add_step("binance", self._step("binance", delay=0.1))
+        pipeline.add_step("kucoin", self._step("kucoin", delay=0.1))
+        pipeline.add_step("clock", self._step("clock"), depends_on=["binance", "kucoin"])
+
+        result = self.async_run_with_timeout(pipeline.run(), timeout=0.3)
+
+        self.assertTrue(result)
+        self.assertEqual(["binance started", "kucoin started"], sorted(self.events[:2]))
+        self.assertEqual(["clock started", "clock done"], self.events[-2:])
+        self.assertTrue(all(step.status == StartupStepStatus.DONE for step in pipeline.steps))
+        timings = pipeline.timings_df()
+        self.assertEqual(["binance", "kucoin", "clock"], list(timings["Step"]))
+        self.assertGreaterEqual(float(timings["Duration (s)"][0]), 0.1)
+        self.assertGreaterEqual(float(timings["Started (s)"][2]), 0.1)
+
+    def test_failed_step_skips_its_dependents(self):
+        pipeline = StartupPipeline()
+        pipeline.add_step("binance", self._step("binance", fail=True))
+        pipeline.add_step("kucoin", self._step("kucoin"))
+        pipeline.add_step("clock", self._step("clock"), depends_on=["binance", "kucoin"])
+
+        with self.assertLogs("hummingbot.core.utils.startup_pipeline", level="ERROR"):
+            result = self.async_run_with_timeout(pipeline.run())
+
+        self.assertFalse(result)
+        self.assertEqual([StartupStepStatus.FAILED, StartupStepStatus.DONE, StartupStepStatus.SKIPPED],
+                         [step.status for step in pipeline.steps])
+        self.assertNotIn("clock started", self.events)
+        self.assertEqual("", pipeline.timings_df()["Duration (s)"][2])
+
+    def test_deferred_steps_run_after_the_regular_steps(self):
+        pipeline = StartupPipeline()
+        pipeline.add_step("fetch pairs", self._step("fetch pairs"), deferred=True)
+        pipeline.add_step("binance", self._step("binance", delay=0.05))
+
+        self.async_run_with_timeout(pipeline.run())
+        self.async_run_with_timeout(pipeline.wait_for_deferred_steps())
+
+        self.assertEqual(["binance started", "binance done", "fetch pairs started", "fetch pairs done"], self.events)
+
+    def test_cancel_stops_the_pending_steps(self):
+        pipeline = StartupPipeline()
+        pipeline.add_step("binance", self._step("binance", delay=10))
+        pipeline.add_step("fetch pairs", self._step("fetch pairs"), deferred=True)
+
+        run_task = self.async_loop.create_task(pipeline.run())
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+        pipeline.cancel()
+        result = self.async_run_with_timeout(run_task)
+
+        self.assertFalse(result)
+        self.assertEqual(StartupStepStatus.CANCELLED, pipeline.steps[0].status)
+        self.assertEqual(["binance started"], self.events)
+
+    def test_invalid_dependencies_raise(self):
+        pipeline = StartupPipeline()
+        pipeline.add_step("a", self._step("a"), depends_on=["b"])
+        with self.assertRaises(ValueError):
+            pipeline.add_step("a", self._step("a"))
+        with self.assertRaises(ValueError):
+            self.async_run_with_timeout(pipeline.run())
+
+        pipeline.add_step("b", self._step("b"), depends_on=["a"])
+        with self.assertRaises(ValueError):
+            self.async_run_with_timeout(pipeline.run())
+
+        pipeline = StartupPipeline()
+        pipeline.add_step("a", self._step("a"), deferred=True)
+        pipeline.add_step("b", self._step("b"), depends_on=["a"])
+        with self.assertRaises(ValueError):
+            self.async_run_with_timeout(pipeline.run())
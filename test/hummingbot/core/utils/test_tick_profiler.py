@@ -0,0 +1,129 @@
+import asyncio
+import time
+import unittest
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import MarketEvent, OrderBookEvent
+from hummingbot.core.pubsub import PubSub
+from hummingbot.core.py_time_iterator import PyTimeIterator
+from hummingbot.core.utils.tick_profiler import LatencyHistogram, TickProfiler, event_name
+
+
+class SlowTimeIterator(PyTimeIterator):
+    def tick(self, timestamp: float):
+        time.sleep(0.01)
+
+
+class LatencyHistogramTest(unittest.TestCase):
+    def test_record(self):
+        histogram = LatencyHistogram()
+        for value in [0.0, 0.001, 0.001, 0.002, 0.1]:
+            histogram.record(value)
+
+        self.assertEqual(5, histogram.count)
+        self.assertAlmostEqual(0.104, histogram.total)
+        self.assertAlmostEqual(0.0208, histogram.mean)
+        self.assertEqual(0.1, histogram.max)
+
+    def test_percentiles_are_upper_estimates(self):
+        histogram = LatencyHistogram()
+        for _ in range(99):
+            histogram.record(0.001)
+        histogram.record(1.0)
+
+        self.assertGreaterEqual(histogram.percentile(50), 0.001)
+        self.assertLess(histogram.percentile(50), 0.002)
+        self.assertLess(histogram.percentile(99), 0.002)
+        self.assertEqual(1.0, histogram.percentile(100))
+
+    def test_reset(self):
+        histogram = LatencyHistogram()
+        histogram.record(0.5)
+        histogram.reset()
+
+        self.assertEqual(0, histogram.count)
+        self.assertEqual(0.0, histogram.percentile(50))
+        self.assertEqual({"count": 0, "mean": 0.0, "p50": 0.0, "p90": 0.0, "p99": 0.0, "max": 0.0},
+                         histogram.to_dict())
+
+
+class TickProfilerTest(IsolatedAsyncioWrapperTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.profiler = TickProfiler.get_instance()
+        self.profiler.reset()
+
+    def tearDown(self) -> None:
+        self.profiler.disable()
+        self.profiler.reset()
+        super().tearDown()
+
+    def test_event_name(self):
+        self.assertEqual("MarketEvent.OrderFilled", event_name(MarketEvent.OrderFilled.value))
+        self.assertEqual("OrderBookEvent.TradeEvent", event_name(OrderBookEvent.TradeEvent.value))
+        self.assertEqual("123456", event_name(123456))
+
+    def test_event_listener_time_is_recorded_only_when_enabled(self):
+        pubsub = PubSub()
+        event_logger = EventLogger()
+        pubsub.add_listener(MarketEvent.OrderFilled, event_logger)
+
+        pubsub.trigger_event(MarketEvent.OrderFilled, "fill")
+        self.assertEqual({}, self.profiler.snapshot()["event_durations"])
+
+        self.profiler.enable()
+        pubsub.trigger_event(MarketEvent.OrderFilled, "fill")
+        pubsub.trigger_event(MarketEvent.OrderFilled, "fill")
+        self.profiler.disable()
+        pubsub.trigger_event(MarketEvent.OrderFilled, "fill")
+
+        self.assertEqual(4, len(event_logger.event_log))
+        self.assertEqual(2, self.profiler.snapshot()["event_durations"]["MarketEvent.OrderFilled"]["count"])
+
+    async def test_clock_tick_durations_and_drift_are_recorded(self):
+        self.profiler.enable()
+        clock = Clock(ClockMode.REALTIME, tick_size=0.1)
+        clock.add_iterator(SlowTimeIterator())
+
+        with clock:
+            await clock.run_til(time.time() + 0.35)
+
+        snapshot = self.profiler.snapshot()
+        tick_durations = snapshot["tick_durations"]["SlowTimeIterator"]
+        self.assertGreaterEqual(tick_durations["count"], 3)
+        self.assertGreaterEqual(tick_durations["max"], 0.01)
+        self.assertEqual(tick_durations["count"], snapshot["tick_drift"]["count"])
+        self.assertGreater(snapshot["loop_lag"]["count"], 0)
+
+    async def test_clock_is_not_profiled_when_disabled(self):
+        clock = Clock(ClockMode.REALTIME, tick_size=0.1)
+        clock.add_iterator(SlowTimeIterator())
+
+        with clock:
+            await clock.run_til(time.time() + 0.25)
+
+        snapshot = self.profiler.snapshot()
+        self.assertFalse(snapshot["enabled"])
+        self.assertEqual({}, snapshot["tick_durations"])
+        self.assertEqual(0, snapshot["tick_drift"]["count"])
+
+    async def test_sample_stacks(self):
+        def busy_function():
+            end_time = time.perf_counter() + 0.02
+            while time.perf_counter() < end_time:
+                pass
+
+        async def busy_loop():
+            for _ in range(10):
+                busy_function()
+                await asyncio.sleep(0)
+
+        samples, _ = await asyncio.gather(self.profiler.sample_stacks(duration=0.2, interval=0.002), busy_loop())
+
+        self.assertGreater(len(samples), 0)
+        busy_samples = [sample for sample in samples if sample[0].startswith("busy_function ")]
+        self.assertEqual(1, len(busy_samples))
+        self.assertGreater(busy_samples[0][1], 0.5)
+        self.assertTrue(all(0 < self_share <= inclusive_share <= 1 for _, self_share, inclusive_share in samples))
@@ -125,6 +125,63 @@ class TestTradingPairFetcher(unittest.TestCase):
         self.assertEqual(2, len(trading_pairs))
         self.assertEqual({"binance": ["MOCK-HBOT"], "mock_paper_trade": ["MOCK-HBOT"]}, trading_pairs)
 
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._sf_shared_instance")
+    @patch("hummingbot.client.config.security.Security.wait_til_decryption_done")
+    def test_not_connected_exchanges_fetch_deferred_until_resumed(self, _, __, mock_connector_settings):
+        connected_connector = AsyncMock()
+        connected_connector.all_trading_pairs.return_value = ["MOCK-HBOT"]
+        other_connector = AsyncMock()
+        other_connector.all_trading_pairs.return_value = ["OTHER-HBOT"]
+        not_connected_setting = self.MockConnectorSetting(name="other", connector=other_connector)
+        not_connected_setting.connector_connected = MagicMock(return_value=False)
+        mock_connector_settings.return_value = {
+            "binance": self.MockConnectorSetting(name="binance", connector=connected_connector),
+            "other": not_connected_setting,
+        }
+
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        client_config_map.fetch_pairs_from_all_exchanges = True
+        trading_pair_fetcher = TradingPairFetcher(client_config_map)
+        trading_pair_fetcher.defer_optional_fetches()
+        self.async_run_with_timeout(self.wait_until_trading_pair_fetcher_ready(trading_pair_fetcher), 1.0)
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+
+        self.assertEqual({"binance": ["MOCK-HBOT"]}, trading_pair_fetcher.trading_pairs)
+        self.assertFalse(trading_pair_fetcher._fetch_task.done())
+
+        trading_pair_fetcher.resume_optional_fetches()
+        self.async_run_with_timeout(trading_pair_fetcher._fetch_task)
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+
+        self.assertEqual({"binance": ["MOCK-HBOT"], "other": ["OTHER-HBOT"]}, trading_pair_fetcher.trading_pairs)
+
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
+    @patch("hummingbot.client.config.security.Security.wait_til_decryption_done")
+    def test_not_connected_exchanges_fetch_deferred_from_creation(self, _, mock_connector_settings):
+        other_connector = AsyncMock()
+        other_connector.all_trading_pairs.return_value = ["OTHER-HBOT"]
+        not_connected_setting = self.MockConnectorSetting(name="other", connector=other_connector)
+        not_connected_setting.connector_connected = MagicMock(return_value=False)
+        mock_connector_settings.return_value = {"other": not_connected_setting}
+
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        client_config_map.fetch_pairs_from_all_exchanges = True
+        with patch.object(TradingPairFetcher, "_sf_shared_instance", None):
+            trading_pair_fetcher = TradingPairFetcher.get_instance(client_config_map, defer_optional_fetches=True)
+            # The instance created first is kept
+            self.assertIs(trading_pair_fetcher, TradingPairFetcher.get_instance(client_config_map))
+        self.async_run_with_timeout(self.wait_until_trading_pair_fetcher_ready(trading_pair_fetcher), 1.0)
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+
+        self.assertEqual({}, trading_pair_fetcher.trading_pairs)
+
+        trading_pair_fetcher.resume_optional_fetches()
+        self.async_run_with_timeout(trading_pair_fetcher._fetch_task)
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+
+        self.assertEqual({"other": ["OTHER-HBOT"]}, trading_pair_fetcher.trading_pairs)
+
     @aioresponses()
     @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
     @patch("hummingbot.core.gateway.gateway_http_client.GatewayHttpClient.get_perp_markets")
@@ -0,0 +1,62 @@
+"""
+Benchmarks the decoding time of the websocket payloads of each connector, comparing the standard library `json`
+module (the previous decoding path) with the default `JSONDecoder`.
+
+Run with: python -m test.hummingbot.core.web_assistant.benchmark_json_decoders
+"""
+from json import JSONDecodeError
+import timeit
+from typing import Callable, List
+
+import aiohttp
+
+from hummingbot.core.web_assistant.connections.data_types import WSResponse
+from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
+from hummingbot.core.web_assistant.json_decoders import JSONDecoder, orjson
+from test.hummingbot.core.web_assistant.fixture_ws_payloads import WS_PAYLOADS_BY_CONNECTOR
+
+ITERATIONS = 20000
+
+
+def _messages(payloads: List) -> List[aiohttp.WSMessage]:
+    return [
+        aiohttp.WSMessage(aiohttp.WSMsgType.BINARY if isinstance(payload, bytes) else aiohttp.WSMsgType.TEXT,
+                          payload,
+                          None)
+        for payload in payloads
+    ]
+
+
+def _stdlib_build_resp(msg: aiohttp.WSMessage) -> WSResponse:
+    # The decoding path before the introduction of the JSON decoders
+    if msg.type == aiohttp.WSMsgType.BINARY:
+        data = msg.data
+    else:
+        try:
+            data = msg.json()
+        except JSONDecodeError:
+            data = msg.data
+    return WSResponse(data)
+
+
+def _time_per_message(function: Callable, messages: List[aiohttp.WSMessage]) -> float:
+    def run():
+        for msg in messages:
+            function(msg)
+    return min(timeit.repeat(run, number=ITERATIONS, repeat=3)) / (ITERATIONS * len(messages))
+
+
+def main():
+    connection = WSConnection(aiohttp_client_session=None, json_decoder=JSONDecoder())
+    print(f"Decoder backend: {'orjson' if orjson is not None else 'json'}")
+    print(f"{'Connector':<12}{'stdlib json (us)':>18}{'JSONDecoder (us)':>18}{'Speedup':>10}")
+    for connector_name, payloads in WS_PAYLOADS_BY_CONNECTOR.items():
+        messages = _messages(payloads)
+        stdlib_time = _time_per_message(_stdlib_build_resp, messages)
+        decoder_time = _time_per_message(connection._build_resp, messages)
+        print(f"{connector_name:<12}{stdlib_time * 1e6:>18.2f}{decoder_time * 1e6:>18.2f}"
+              f"{stdlib_time / decoder_time:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,7 +2,7 @@ import asyncio
 import json
 import unittest
 from typing import Awaitable, List
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import aiohttp
 
@@ -121,6 +121,43 @@ class WSConnectionTest(unittest.TestCase):
         self.assertEqual(data, response.data)
         self.assertNotEqual(0, self.ws_connection.last_recv_time)
 
+    @patch("aiohttp.client.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_receive_non_json_text(self, ws_connect_mock):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        self.async_run_with_timeout(self.ws_connection.connect(self.ws_url))
+        self.mocking_assistant.add_websocket_aiohttp_message(ws_connect_mock.return_value, message="pong")
+
+        response = self.async_run_with_timeout(self.ws_connection.receive())
+
+        self.assertEqual("pong", response.data)
+
+    @patch("aiohttp.client.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_receive_passes_binary_payloads_through(self, ws_connect_mock):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        self.async_run_with_timeout(self.ws_connection.connect(self.ws_url))
+        payload = b'\x08\x96\x01{"not": "decoded"}'
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            ws_connect_mock.return_value, message=payload, message_type=aiohttp.WSMsgType.BINARY
+        )
+
+        response = self.async_run_with_timeout(self.ws_connection.receive())
+
+        self.assertEqual(payload, response.data)
+
+    @patch("aiohttp.client.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_receive_with_custom_json_decoder(self, ws_connect_mock):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        decoder = MagicMock()
+        decoder.decode.return_value = "decoded"
+        ws_connection = WSConnection(self.client_session, json_decoder=decoder)
+        self.async_run_with_timeout(ws_connection.connect(self.ws_url))
+        self.mocking_assistant.add_websocket_aiohttp_message(ws_connect_mock.return_value, message='{"one": 1}')
+
+        response = self.async_run_with_timeout(ws_connection.receive())
+
+        self.assertEqual("decoded", response.data)
+        decoder.decode.assert_called_once_with('{"one": 1}')
+
     @patch("aiohttp.client.ClientSession.ws_connect", new_callable=AsyncMock)
     def test_receive_disconnects_and_raises_on_aiohttp_closed(self, ws_connect_mock):
         ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
@@ -0,0 +1,76 @@
+"""
+Public websocket messages in the format sent by each exchange (order book diff and trade), used to benchmark the
+decoding of the payloads. The order book diffs are trimmed to a few price levels.
+"""
+
+BINANCE = [
+    '{"stream":"btcusdt@depth@100ms","data":{"e":"depthUpdate","E":1700000000100,"s":"BTCUSDT","U":40012345001,'
+    '"u":40012345019,"b":[["37001.12000000","0.35200000"],["37001.10000000","0.00000000"],'
+    '["37000.95000000","1.20400000"],["37000.50000000","0.01500000"],["36999.99000000","2.00000000"]],'
+    '"a":[["37001.13000000","0.12000000"],["37001.50000000","0.00000000"],["37002.00000000","0.54000000"],'
+    '["37002.47000000","3.01000000"],["37003.00000000","0.00100000"]]}}',
+    '{"stream":"btcusdt@trade","data":{"e":"trade","E":1700000000105,"s":"BTCUSDT","t":3300012345,'
+    '"p":"37001.12000000","q":"0.00300000","b":23000012345,"a":23000012340,"T":1700000000104,"m":true,"M":true}}',
+]
+
+OKX = [
+    '{"arg":{"channel":"books","instId":"BTC-USDT"},"action":"update","data":[{"asks":[["37001.3","0.35","0","3"],'
+    '["37001.9","0","0","0"],["37002.4","1.2","0","5"],["37003","0.012","0","1"]],"bids":[["37001.2","0.64","0","4"],'
+    '["37000.8","0","0","0"],["37000.1","2.1","0","7"],["36999.5","0.5","0","1"]],"ts":"1700000000100",'
+    '"checksum":-1208731547,"seqId":12345678902,"prevSeqId":12345678901}]}',
+    '{"arg":{"channel":"trades","instId":"BTC-USDT"},"data":[{"instId":"BTC-USDT","tradeId":"450012345",'
+    '"px":"37001.2","sz":"0.0031","side":"sell","ts":"1700000000104","count":"1"}]}',
+]
+
+KUCOIN = [
+    '{"type":"message","topic":"/market/level2:BTC-USDT","subject":"trade.l2update","data":{"changes":{"asks":'
+    '[["37001.3","0.35","16679012345"],["37001.9","0","16679012346"]],"bids":[["37001.2","0.64","16679012347"],'
+    '["37000.8","0","16679012348"],["37000.1","2.1","16679012349"]]},"sequenceEnd":16679012349,'
+    '"sequenceStart":16679012345,"symbol":"BTC-USDT","time":1700000000100}}',
+    '{"type":"message","topic":"/market/match:BTC-USDT","subject":"trade.l3match","data":{"makerOrderId":'
+    '"6551a1b2c3d4e5f601234567","price":"37001.2","sequence":"16679012350","side":"sell","size":"0.0031",'
+    '"symbol":"BTC-USDT","takerOrderId":"6551a1b2c3d4e5f601234568","time":"1700000000104000000",'
+    '"tradeId":"6551a1b2c3d4e5f601234569","type":"match"}}',
+]
+
+GATE_IO = [
+    '{"time":1700000000,"time_ms":1700000000100,"channel":"spot.order_book_update","event":"update","result":'
+    '{"t":1700000000100,"e":"depthUpdate","E":1700000000,"s":"BTC_USDT","U":15208542001,"u":15208542006,'
+    '"b":[["37001.2","0.64"],["37000.8","0"],["37000.1","2.1"]],"a":[["37001.3","0.35"],["37001.9","0"],'
+    '["37002.4","1.2"]]}}',
+    '{"time":1700000000,"time_ms":1700000000104,"channel":"spot.trades","event":"update","result":{"id":6012345678,'
+    '"create_time":1700000000,"create_time_ms":"1700000000104.000","side":"sell","currency_pair":"BTC_USDT",'
+    '"amount":"0.0031","price":"37001.2","range":"6012345678-6012345678"}}',
+]
+
+KRAKEN = [
+    '[336,{"a":[["37001.30000","0.35000000","1700000000.100123"],["37001.90000","0.00000000","1700000000.100125"]],'
+    '"c":"2871309021"},{"b":[["37001.20000","0.64000000","1700000000.100200"],'
+    '["37000.80000","0.00000000","1700000000.100210"],["37000.10000","2.10000000","1700000000.100220"]],'
+    '"c":"2871309021"},"book-25","XBT/USDT"]',
+    '[337,[["37001.20000","0.00310000","1700000000.104512","s","l",""]],"trade","XBT/USDT"]',
+]
+
+BYBIT = [
+    '{"topic":"orderbook.50.BTCUSDT","type":"delta","ts":1700000000100,"data":{"s":"BTCUSDT",'
+    '"b":[["37001.20","0.640"],["37000.80","0"],["37000.10","2.100"]],"a":[["37001.30","0.350"],["37001.90","0"],'
+    '["37002.40","1.200"]],"u":8012345,"seq":45012345678},"cts":1700000000098}',
+    '{"topic":"publicTrade.BTCUSDT","type":"snapshot","ts":1700000000104,"data":[{"T":1700000000104,"s":"BTCUSDT",'
+    '"S":"Sell","v":"0.0031","p":"37001.20","L":"MinusTick","i":"2290000000012345678","BT":false}]}',
+]
+
+# Cube sends protobuf encoded binary frames, which are passed through without decoding
+CUBE = [
+    b'\x0a\x2b\x08\xc9\x01\x12\x08\x08\x90\x4e\x10\x01\x18\x02\x12\x08\x08\x8f\x4e\x10\x05\x18\x01\x1a\x10\x08'
+    b'\xe4\xa9\xbf\x8c\x8d\x31\x10\xa0\x8d\x06\x20\x01',
+]
+
+WS_PAYLOADS_BY_CONNECTOR = {
+    "binance": BINANCE,
+    "okx": OKX,
+    "kucoin": KUCOIN,
+    "gate_io": GATE_IO,
+    "kraken": KRAKEN,
+    "bybit": BYBIT,
+    "cube": CUBE,
+}
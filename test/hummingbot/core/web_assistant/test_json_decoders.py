@@ -0,0 +1,77 @@
+import json
+import unittest
+from dataclasses import dataclass
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+from hummingbot.core.web_assistant import json_decoders
+from hummingbot.core.web_assistant.json_decoders import JSONDecoder, StructJSONDecoder
+
+
+@dataclass
+class DepthUpdate:
+    e: str
+    s: str
+    b: List[List[str]]
+    a: List[List[str]]
+    u: int = 0
+
+
+class JSONDecoderTests(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.decoder = JSONDecoder()
+        self.message: Dict[str, Any] = {
+            "e": "depthUpdate",
+            "s": "COINALPHAHBOT",
+            "u": 157,
+            "b": [["0.0024", "10"]],
+            "a": [["0.0026", "100"]],
+        }
+
+    def test_decode_text_and_bytes(self):
+        payload = json.dumps(self.message)
+
+        self.assertEqual(self.message, self.decoder.decode(payload))
+        self.assertEqual(self.message, self.decoder.decode(payload.encode()))
+
+    def test_decode_values_not_supported_by_orjson(self):
+        payload = '{"price": NaN, "id": 123456789012345678901234567890}'
+
+        decoded = self.decoder.decode(payload)
+
+        self.assertNotEqual(decoded["price"], decoded["price"])
+        self.assertEqual(123456789012345678901234567890, decoded["id"])
+
+    def test_decode_invalid_json_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            self.decoder.decode("pong")
+
+    def test_decode_without_orjson(self):
+        with patch.object(json_decoders, "orjson", None):
+            self.assertEqual(self.message, self.decoder.decode(json.dumps(self.message)))
+            with self.assertRaises(ValueError):
+                self.decoder.decode("pong")
+
+
+class StructJSONDecoderTests(unittest.TestCase):
+    def test_decode_known_shape_into_dataclass(self):
+        decoder = StructJSONDecoder(DepthUpdate)
+        payload = json.dumps({"e": "depthUpdate", "E": 123456789, "s": "COINALPHAHBOT", "b": [], "a": [["1", "2"]]})
+
+        decoded = decoder.decode(payload)
+
+        self.assertEqual(DepthUpdate(e="depthUpdate", s="COINALPHAHBOT", b=[], a=[["1", "2"]]), decoded)
+
+    def test_decode_other_shapes_as_generic_json(self):
+        decoder = StructJSONDecoder(DepthUpdate)
+
+        self.assertEqual({"result": None, "id": 1}, decoder.decode('{"result": null, "id": 1}'))
+        self.assertEqual([1, 2], decoder.decode("[1, 2]"))
+        with self.assertRaises(ValueError):
+            decoder.decode("pong")
+
+    def test_unsupported_struct_type_without_msgspec_raises(self):
+        with patch.object(json_decoders, "msgspec", None):
+            with self.assertRaises(ValueError):
+                StructJSONDecoder(dict)
@@ -0,0 +1,101 @@
+import unittest
+from collections import deque
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.data_feed.candles_feed.resampled_candles import ResampledCandles
+
+
+class ResampledCandlesTests(unittest.TestCase):
+    start_timestamp = 1700000100000  # 1700000100 is a multiple of 300
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.source = MagicMock(interval="1m", ready=True, max_records=100)
+        self.source.name = "binance_BTC-USDT"
+        self.source._candles = deque(maxlen=100)
+
+    def _candle(self, index: int, close: float = None) -> np.ndarray:
+        close = close if close is not None else 100 + index
+        return np.array([self.start_timestamp + index * 60000, 100 + index, 110 + index, 90 + index, close,
+                         1, 100, 10, 0.5, 50], dtype=float)
+
+    def _expected_candles(self, candles, interval: str) -> pd.DataFrame:
+        df = pd.DataFrame(list(candles), columns=CandlesBase.columns, dtype=float)
+        df["bucket"] = (df["timestamp"] // (CandlesBase.interval_to_seconds[interval] * 1000)) * (
+            CandlesBase.interval_to_seconds[interval] * 1000)
+        aggregated = df.groupby("bucket").agg({
+            "open": "first", "high": "max", "low": "min", "close": "last", "volume": "sum",
+            "quote_asset_volume": "sum", "n_trades": "sum", "taker_buy_base_volume": "sum",
+            "taker_buy_quote_volume": "sum",
+        }).reset_index().rename(columns={"bucket": "timestamp"})
+        return aggregated[CandlesBase.columns]
+
+    def test_can_resample(self):
+        self.assertTrue(ResampledCandles.can_resample("1m", "5m"))
+        self.assertTrue(ResampledCandles.can_resample("1m", "1d"))
+        self.assertTrue(ResampledCandles.can_resample("15m", "1h"))
+        self.assertFalse(ResampledCandles.can_resample("5m", "1m"))
+        self.assertFalse(ResampledCandles.can_resample("5m", "5m"))
+        self.assertFalse(ResampledCandles.can_resample("3m", "5m"))
+        self.assertFalse(ResampledCandles.can_resample("1d", "1w"))
+        self.assertFalse(ResampledCandles.can_resample("1m", "2d"))
+        self.assertEqual(605, ResampledCandles.required_source_records("1m", "5m", 120))
+
+    def test_invalid_interval_raises(self):
+        with self.assertRaises(ValueError):
+            ResampledCandles(source=self.source, interval="1m", max_records=10)
+
+    def test_candles_are_aggregated_from_the_source(self):
+        self.source._candles.extend(self._candle(i) for i in range(-2, 23))
+        candles = ResampledCandles(source=self.source, interval="5m", max_records=10)
+
+        result = candles.candles_df
+
+        # The first bucket is incomplete, as the source starts 2 minutes after its beginning
+        expected = self._expected_candles([self._candle(i) for i in range(0, 23)], "5m")
+        pd.testing.assert_frame_equal(expected, result)
+        self.assertEqual(5, len(result))
+        self.assertFalse(candles.ready)
+        self.assertEqual("binance_BTC-USDT_5m", candles.name)
+
+    def test_incremental_updates_match_a_full_resampling(self):
+        self.source._candles.extend(self._candle(i) for i in range(0, 12))
+        candles = ResampledCandles(source=self.source, interval="5m", max_records=3)
+        candles.candles_df
+
+        # The last source candle is updated, and new ones are added
+        self.source._candles.pop()
+        self.source._candles.extend([self._candle(11, close=50), self._candle(12), self._candle(13)])
+        self.source._candles.extend(self._candle(i) for i in range(14, 21))
+
+        result = candles.candles_df
+
+        expected = self._expected_candles([self._candle(i) for i in range(0, 11)]
+                                          + [self._candle(11, close=50)]
+                                          + [self._candle(i) for i in range(12, 21)], "5m")
+        pd.testing.assert_frame_equal(expected.iloc[-3:].reset_index(drop=True), result)
+        self.assertTrue(candles.ready)
+
+    def test_backfilled_source_history_rebuilds_the_candles(self):
+        self.source._candles.append(self._candle(10))
+        candles = ResampledCandles(source=self.source, interval="5m", max_records=10)
+        self.assertEqual(1, len(candles.candles_df))
+
+        self.source._candles.extendleft(self._candle(i) for i in range(9, -1, -1))
+
+        expected = self._expected_candles([self._candle(i) for i in range(0, 11)], "5m")
+        pd.testing.assert_frame_equal(expected, candles.candles_df)
+
+        self.source._candles.clear()
+        self.assertEqual(0, len(candles.candles_df))
+
+    def test_not_ready_while_the_source_is_not_ready(self):
+        self.source._candles.extend(self._candle(i) for i in range(0, 20))
+        candles = ResampledCandles(source=self.source, interval="5m", max_records=2)
+        self.source.ready = False
+
+        self.assertFalse(candles.ready)
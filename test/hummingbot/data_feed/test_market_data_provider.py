@@ -7,6 +7,7 @@ from hummingbot.core.data_type.common import PriceType
 from hummingbot.core.data_type.order_book_query_result import OrderBookQueryResult
 from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
 from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
+from hummingbot.data_feed.candles_feed.resampled_candles import ResampledCandles
 from hummingbot.strategy.strategy_v2_base import MarketDataProvider
 
 
@@ -118,3 +119,94 @@ class TestMarketDataProvider(unittest.TestCase):
         self.mock_connector.ready = True
         mock_candles_feed.ready = False
         self.assertFalse(self.provider.ready)
+
+    def _mock_candles_feed(self, config: CandlesConfig):
+        return MagicMock(interval=config.interval, max_records=config.max_records)
+
+    def test_coarser_candles_derived_from_finer_feed(self):
+        with patch("hummingbot.data_feed.candles_feed.candles_factory.CandlesFactory.get_candle",
+                   side_effect=self._mock_candles_feed) as get_candle_mock:
+            fine_config = CandlesConfig(connector="binance", trading_pair="BTC-USDT", interval="1m", max_records=1000)
+            coarse_config = CandlesConfig(connector="binance", trading_pair="BTC-USDT", interval="5m", max_records=100)
+            long_config = CandlesConfig(connector="binance", trading_pair="BTC-USDT", interval="1h", max_records=100)
+            self.provider.initialize_candles_feed(fine_config)
+            self.provider.initialize_candles_feed(coarse_config)
+            self.provider.initialize_candles_feed(long_config)
+
+        self.assertEqual(2, get_candle_mock.call_count)
+        fine_feed = self.provider.candles_feeds["binance_BTC-USDT_1m"]
+        coarse_feed = self.provider.candles_feeds["binance_BTC-USDT_5m"]
+        self.assertIsInstance(coarse_feed, ResampledCandles)
+        self.assertIs(fine_feed, coarse_feed.source)
+        # One thousand 1m candles are not enough to derive one hundred 1h candles
+        self.assertNotIsInstance(self.provider.candles_feeds["binance_BTC-USDT_1h"], ResampledCandles)
+
+    def test_finest_feed_keeps_the_history_of_the_derived_candles(self):
+        with patch("hummingbot.data_feed.candles_feed.candles_factory.CandlesFactory.get_candle",
+                   side_effect=self._mock_candles_feed) as get_candle_mock:
+            fine_config = CandlesConfig(connector="binance", trading_pair="BTC-USDT", interval="1m", max_records=100)
+            coarse_config = CandlesConfig(connector="binance", trading_pair="BTC-USDT", interval="5m", max_records=100)
+            self.provider.initialize_candles_feed(fine_config)
+            first_fine_feed = self.provider.candles_feeds["binance_BTC-USDT_1m"]
+            self.provider.initialize_candles_feed(coarse_config)
+
+        # The 1m feed is restarted with the history of one hundred 5m candles
+        self.assertEqual(2, get_candle_mock.call_count)
+        first_fine_feed.stop.assert_called_once()
+        fine_feed = self.provider.candles_feeds["binance_BTC-USDT_1m"]
+        self.assertEqual(505, fine_feed.max_records)
+        self.assertIs(fine_feed, self.provider.candles_feeds["binance_BTC-USDT_5m"].source)
+
+    def test_finer_feed_becomes_the_source_of_the_derived_candles(self):
+        with patch("hummingbot.data_feed.candles_feed.candles_factory.CandlesFactory.get_candle",
+                   side_effect=self._mock_candles_feed) as get_candle_mock:
+            configs = [CandlesConfig(connector="binance", trading_pair="BTC-USDT", interval=interval, max_records=50)
+                       for interval in ("5m", "15m", "1m")]
+            for config in configs:
+                self.provider.initialize_candles_feed(config)
+
+        # The 5m feed is restarted with the history of the 15m candles, then replaced by the 1m feed
+        self.assertEqual(3, get_candle_mock.call_count)
+        fine_feed = self.provider.candles_feeds["binance_BTC-USDT_1m"]
+        # The feed of 50 1m candles keeps the history of 50 15m candles
+        self.assertEqual(765, fine_feed.max_records)
+        for interval in ("5m", "15m"):
+            derived_feed = self.provider.candles_feeds[f"binance_BTC-USDT_{interval}"]
+            self.assertIsInstance(derived_feed, ResampledCandles)
+            self.assertIs(fine_feed, derived_feed.source)
+
+    def test_finer_feed_replaces_covered_coarser_feed(self):
+        with patch("hummingbot.data_feed.candles_feed.candles_factory.CandlesFactory.get_candle",
+                   side_effect=self._mock_candles_feed):
+            coarse_config = CandlesConfig(connector="binance", trading_pair="BTC-USDT", interval="15m", max_records=50)
+            fine_config = CandlesConfig(connector="binance", trading_pair="BTC-USDT", interval="5m", max_records=500)
+            self.provider.initialize_candles_feed(coarse_config)
+            coarse_feed = self.provider.candles_feeds["binance_BTC-USDT_15m"]
+            self.provider.initialize_candles_feed(fine_config)
+
+        coarse_feed.stop.assert_called_once()
+        derived_feed = self.provider.candles_feeds["binance_BTC-USDT_15m"]
+        self.assertIsInstance(derived_feed, ResampledCandles)
+        self.assertIs(self.provider.candles_feeds["binance_BTC-USDT_5m"], derived_feed.source)
+
+    def test_candle_feeds_stopped_when_no_consumer_remains(self):
+        with patch("hummingbot.data_feed.candles_feed.candles_factory.CandlesFactory.get_candle",
+                   side_effect=self._mock_candles_feed):
+            fine_config = CandlesConfig(connector="binance", trading_pair="BTC-USDT", interval="1m", max_records=1000)
+            coarse_config = CandlesConfig(connector="binance", trading_pair="BTC-USDT", interval="5m", max_records=100)
+            self.provider.initialize_candles_feed(fine_config)
+            self.provider.initialize_candles_feed(fine_config)
+            self.provider.initialize_candles_feed(coarse_config)
+        fine_feed = self.provider.candles_feeds["binance_BTC-USDT_1m"]
+
+        self.provider.stop_candle_feed(fine_config)
+        self.provider.stop_candle_feed(fine_config)
+
+        # The coarser candles are still derived from the feed
+        fine_feed.stop.assert_not_called()
+        self.assertIn("binance_BTC-USDT_1m", self.provider.candles_feeds)
+
+        self.provider.stop_candle_feed(coarse_config)
+
+        fine_feed.stop.assert_called_once()
+        self.assertEqual({}, self.provider.candles_feeds)
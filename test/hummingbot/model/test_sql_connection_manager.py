@@ -0,0 +1,32 @@
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+from sqlalchemy import create_engine, inspect
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.model.executors import Executors
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
+
+
+class SQLConnectionManagerTests(TestCase):
+
+    def test_indexes_added_to_existing_tables_are_created(self):
+        with tempfile.TemporaryDirectory() as directory:
+            db_path = str(Path(directory) / "test.sqlite")
+            engine = create_engine(f"sqlite:///{db_path}")
+            # A database created before the controller index was added to the executors table
+            Executors.__table__.create(engine)
+            with engine.begin() as connection:
+                connection.execute("DROP INDEX ex_controller_active_timestamp")
+            engine.dispose()
+
+            manager = SQLConnectionManager(
+                ClientConfigAdapter(ClientConfigMap()), SQLConnectionType.TRADE_FILLS, db_path=db_path
+            )
+
+            index_names = {index["name"] for index in inspect(manager.engine).get_indexes("Executors")}
+            self.assertIn("ex_controller_active_timestamp", index_names)
+            self.assertIn("ex_type_status", index_names)
+            manager.engine.dispose()
@@ -0,0 +1,83 @@
+"""
+Benchmarks the round trip latency between the strategy process and a PMM script process: a tick is sent to a child
+process echoing its mid price back, through multiprocessing queues polled at the default queue check interval, and
+through the shared memory channels.
+
+Run with: python -m test.hummingbot.pmm_script.benchmark_pmm_script_channel
+"""
+import asyncio
+import statistics
+import time
+from decimal import Decimal
+from multiprocessing import Process, Queue
+
+from hummingbot.pmm_script.pmm_script_channel import PMMScriptChannel
+from hummingbot.pmm_script.pmm_script_interface import CallLog, OnTick, PMMParameters
+
+ROUND_TRIPS = 200
+QUEUE_CHECK_INTERVAL = 0.01
+
+
+def _tick(mid_price: Decimal) -> OnTick:
+    return OnTick(mid_price, PMMParameters(), {"binance": {"HBOT": Decimal("10")}}, {"binance": {"HBOT": Decimal("5")}})
+
+
+async def _echo(parent_queue, child_queue, wait):
+    while True:
+        if parent_queue.empty():
+            await wait(parent_queue)
+            continue
+        item = parent_queue.get()
+        if item is None:
+            return
+        child_queue.put(CallLog(str(item.mid_price)))
+
+
+async def _wait_queue(queue):
+    await asyncio.sleep(QUEUE_CHECK_INTERVAL)
+
+
+async def _wait_channel(channel):
+    await channel.wait()
+
+
+def _echo_queue(parent_queue, child_queue):
+    asyncio.run(_echo(parent_queue, child_queue, _wait_queue))
+
+
+def _echo_channel(parent_queue, child_queue):
+    asyncio.run(_echo(parent_queue, child_queue, _wait_channel))
+
+
+async def _round_trips(parent_queue, child_queue, wait):
+    latencies = []
+    for index in range(ROUND_TRIPS):
+        start = time.perf_counter()
+        parent_queue.put(_tick(Decimal(index)))
+        while child_queue.empty():
+            await wait(child_queue)
+        child_queue.get()
+        latencies.append(time.perf_counter() - start)
+    parent_queue.put(None)
+    return latencies
+
+
+def _run(name: str, parent_queue, child_queue, echo, wait):
+    process = Process(target=echo, args=(parent_queue, child_queue))
+    process.start()
+    latencies = asyncio.run(_round_trips(parent_queue, child_queue, wait))
+    process.join()
+    print(f"{name:<45} median {statistics.median(latencies) * 1e6:>10.0f} us   "
+          f"max {max(latencies) * 1e6:>10.0f} us")
+
+
+def main():
+    _run(f"multiprocessing.Queue, polled every {QUEUE_CHECK_INTERVAL}s", Queue(), Queue(), _echo_queue, _wait_queue)
+    parent_channel, child_channel = PMMScriptChannel.create(), PMMScriptChannel.create()
+    _run("PMMScriptChannel", parent_channel, child_channel, _echo_channel, _wait_channel)
+    parent_channel.close()
+    child_channel.close()
+
+
+if __name__ == "__main__":
+    main()
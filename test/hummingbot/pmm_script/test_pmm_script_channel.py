@@ -0,0 +1,158 @@
+import asyncio
+import multiprocessing
+import pickle
+import unittest
+from decimal import Decimal
+from queue import Empty
+
+from hummingbot.core.data_type.common import OrderType
+from hummingbot.core.event.events import BuyOrderCompletedEvent
+from hummingbot.pmm_script.pmm_script_channel import PMMScriptChannel, SharedMemoryRingBuffer
+from hummingbot.pmm_script.pmm_script_interface import CallLog, OnTick, PMMParameters
+
+
+def echo_messages(parent_channel: PMMScriptChannel, child_channel: PMMScriptChannel):
+    async def echo():
+        while True:
+            await parent_channel.wait()
+            while not parent_channel.empty():
+                item = parent_channel.get()
+                if item is None:
+                    return
+                child_channel.put(CallLog(str(item.mid_price)))
+
+    asyncio.run(echo())
+
+
+class SharedMemoryRingBufferTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.ring_buffer = SharedMemoryRingBuffer.create(capacity=64)
+
+    def tearDown(self) -> None:
+        self.ring_buffer.close()
+        super().tearDown()
+
+    def test_records_are_read_in_order_across_the_end_of_the_buffer(self):
+        for index in range(20):
+            payload = bytes([index]) * (index % 7 + 1)
+            self.assertTrue(self.ring_buffer.write(1, payload))
+            self.assertTrue(self.ring_buffer.write(2, b"x" * 20))
+            self.assertEqual((1, payload), self.ring_buffer.read())
+            self.assertEqual((2, b"x" * 20), self.ring_buffer.read())
+            self.assertIsNone(self.ring_buffer.read())
+            self.assertTrue(self.ring_buffer.empty())
+
+    def test_write_fails_when_the_buffer_is_full(self):
+        self.assertTrue(self.ring_buffer.write(1, b"a" * 20))
+        self.assertTrue(self.ring_buffer.write(1, b"b" * 20))
+        self.assertFalse(self.ring_buffer.write(1, b"c" * 20))
+        self.assertEqual((1, b"a" * 20), self.ring_buffer.read())
+        self.assertTrue(self.ring_buffer.write(1, b"c" * 20))
+        self.assertEqual((1, b"b" * 20), self.ring_buffer.read())
+        self.assertEqual((1, b"c" * 20), self.ring_buffer.read())
+        with self.assertRaises(ValueError):
+            self.ring_buffer.write(1, b"d" * 30)
+
+
+class PMMScriptChannelTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.channel = PMMScriptChannel.create(capacity=4096)
+
+    def tearDown(self) -> None:
+        self.channel.close()
+        super().tearDown()
+
+    @staticmethod
+    def _tick(mid_price: Decimal, bid_spread: Decimal = Decimal("0.01")) -> OnTick:
+        pmm_parameters = PMMParameters()
+        pmm_parameters._bid_spread = bid_spread
+        return OnTick(mid_price,
+                      pmm_parameters,
+                      {"binance": {"HBOT": Decimal("10")}},
+                      {"binance": {"HBOT": Decimal("5")}})
+
+    def test_ticks_with_unchanged_parameters_are_sent_as_fixed_layout_records(self):
+        self.channel.put(self._tick(Decimal("100.5")))
+        self.channel.put(self._tick(Decimal("-100.25")))
+        self.channel.put(self._tick(Decimal("101"), bid_spread=Decimal("0.02")))
+        self.channel.put(self._tick(Decimal("1E+30"), bid_spread=Decimal("0.02")))
+        self.channel.put(self._tick(Decimal("1" * 25), bid_spread=Decimal("0.02")))
+        self.channel.put(self._tick(Decimal("NaN"), bid_spread=Decimal("0.02")))
+
+        kinds = []
+        ticks = []
+        while not self.channel.empty():
+            record = self.channel._ring_buffer.read()
+            kinds.append(record[0])
+            ticks.append(self.channel._decode(*record))
+            self.channel.flush()
+
+        self.assertEqual([PMMScriptChannel.PICKLED_MESSAGE, PMMScriptChannel.TICK_MESSAGE,
+                          PMMScriptChannel.PICKLED_MESSAGE, PMMScriptChannel.TICK_MESSAGE,
+                          PMMScriptChannel.PICKLED_MESSAGE, PMMScriptChannel.PICKLED_MESSAGE], kinds)
+        self.assertEqual(Decimal("-100.25"), ticks[1].mid_price)
+        self.assertEqual("-100.25", str(ticks[1].mid_price))
+        self.assertEqual(Decimal("0.01"), ticks[1].pmm_parameters.bid_spread)
+        self.assertIsNot(ticks[0].pmm_parameters, ticks[1].pmm_parameters)
+        self.assertEqual({"binance": {"HBOT": Decimal("5")}}, ticks[1].all_available_balances)
+        self.assertEqual(Decimal("0.02"), ticks[2].pmm_parameters.bid_spread)
+        self.assertEqual(Decimal("1E+30"), ticks[3].mid_price)
+        self.assertEqual(Decimal("1" * 25), ticks[4].mid_price)
+        self.assertTrue(ticks[5].mid_price.is_nan())
+
+    def test_messages_not_fitting_in_the_buffer_are_written_later(self):
+        event = BuyOrderCompletedEvent(1, "OID1", "HBOT", "USDT", Decimal(1), Decimal(100), OrderType.LIMIT)
+        messages_count = 4096 // len(pickle.dumps(event)) + 5
+        for _ in range(messages_count):
+            self.channel.put(event)
+        self.assertFalse(self.channel.flush())
+
+        received_count = 0
+        while not self.channel.empty():
+            self.assertEqual(event.order_id, self.channel.get().order_id)
+            received_count += 1
+            self.channel.flush()
+        self.assertEqual(messages_count, received_count)
+        with self.assertRaises(Empty):
+            self.channel.get()
+
+    def test_wait_returns_when_a_message_is_written(self):
+        async def wait_and_get():
+            loop = asyncio.get_event_loop()
+            loop.call_later(0.05, self.channel.put, None)
+            await self.channel.wait(timeout=5)
+            return self.channel.get()
+
+        loop = asyncio.new_event_loop()
+        try:
+            self.assertIsNone(loop.run_until_complete(asyncio.wait_for(wait_and_get(), 1)))
+            self.channel.close()
+        finally:
+            loop.close()
+        self.channel = PMMScriptChannel.create(capacity=4096)
+
+    def test_messages_are_exchanged_with_another_process(self):
+        child_channel = PMMScriptChannel.create()
+        spawn_context = multiprocessing.get_context("spawn")
+        process = spawn_context.Process(target=echo_messages, args=(self.channel, child_channel))
+        process.start()
+
+        async def exchange():
+            for mid_price in ("1.5", "1.25"):
+                self.channel.put(self._tick(Decimal(mid_price)))
+                await child_channel.wait(timeout=10)
+                self.assertEqual(mid_price, child_channel.get().msg)
+            self.channel.put(None)
+
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(asyncio.wait_for(exchange(), 30))
+            process.join(10)
+            self.assertEqual(0, process.exitcode)
+            child_channel.close()
+        finally:
+            loop.close()
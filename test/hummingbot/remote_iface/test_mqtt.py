@@ -42,6 +42,7 @@ class RemoteIfaceMQTTTests(TestCase):
             'balance/limit',
             'balance/paper',
             'command_shortcuts',
+            'profile',
         ]
         cls.START_URI = 'hbot/$instance_id/start'
         cls.STOP_URI = 'hbot/$instance_id/stop'
@@ -52,6 +53,7 @@ class RemoteIfaceMQTTTests(TestCase):
         cls.BALANCE_LIMIT_URI = 'hbot/$instance_id/balance/limit'
         cls.BALANCE_PAPER_URI = 'hbot/$instance_id/balance/paper'
         cls.COMMAND_SHORTCUT_URI = 'hbot/$instance_id/command_shortcuts'
+        cls.PROFILE_URI = 'hbot/$instance_id/profile'
         cls.fake_mqtt_broker = FakeMQTTBroker()
 
     def setUp(self) -> None:
@@ -426,6 +428,30 @@ class RemoteIfaceMQTTTests(TestCase):
         self.async_run_with_timeout(self.wait_for_rcv(topic, msg, msg_key='data'), timeout=10)
         self.assertTrue(self.is_msg_received(topic, msg, msg_key='data'))
 
+    @patch("hummingbot.core.utils.tick_profiler.TickProfiler.snapshot")
+    def test_mqtt_command_profile(self, snapshot_mock: MagicMock):
+        snapshot_mock.return_value = {"enabled": True, "tick_durations": {}}
+        self.start_mqtt()
+
+        topic = self.get_topic_for(self.PROFILE_URI)
+        self.fake_mqtt_broker.publish_to_subscription(topic, {"action": "show"})
+
+        reply_topic = f"test_reply/hbot/{self.instance_id}/profile"
+        reply_data = {'status': 200, 'msg': '', 'data': {"enabled": True, "tick_durations": {}}}
+        self.async_run_with_timeout(self.wait_for_rcv(reply_topic, reply_data, msg_key='data'), timeout=10)
+        self.assertTrue(self.is_msg_received(reply_topic, reply_data, msg_key='data'))
+
+    def test_mqtt_command_profile_invalid_action(self):
+        self.start_mqtt()
+
+        topic = self.get_topic_for(self.PROFILE_URI)
+        self.fake_mqtt_broker.publish_to_subscription(topic, {"action": "explode"})
+
+        reply_topic = f"test_reply/hbot/{self.instance_id}/profile"
+        reply_data = {'status': 400, 'msg': 'Invalid profile action: explode', 'data': {}}
+        self.async_run_with_timeout(self.wait_for_rcv(reply_topic, reply_data, msg_key='data'), timeout=10)
+        self.assertTrue(self.is_msg_received(reply_topic, reply_data, msg_key='data'))
+
     def test_mqtt_command_config(self):
         self.start_mqtt()
 
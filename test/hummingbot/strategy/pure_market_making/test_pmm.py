@@ -11,7 +11,7 @@ from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import QuantizationParams
 from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
 from hummingbot.core.clock import Clock, ClockMode
-from hummingbot.core.data_type.common import PriceType, TradeType
+from hummingbot.core.data_type.common import OrderType, PriceType, TradeType
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_row import OrderBookRow
@@ -43,6 +43,25 @@ def simulate_order_book_widening(order_book: OrderBook, top_bid: float, top_ask:
     order_book.apply_diffs(bid_diffs, ask_diffs, update_id)
 
 
+class BatchOrdersRecordingExchange(MockPaperExchange):
+    """
+    Paper exchange recording the batch order creations and cancelations it receives
+    """
+
+    def __init__(self, client_config_map: ClientConfigAdapter):
+        super().__init__(client_config_map=client_config_map)
+        self.created_batches = []
+        self.canceled_batches = []
+
+    def batch_order_create(self, orders_to_create, limit_order_type=OrderType.LIMIT):
+        self.created_batches.append((orders_to_create, limit_order_type))
+        return super().batch_order_create(orders_to_create, limit_order_type=limit_order_type)
+
+    def batch_order_cancel(self, orders_to_cancel):
+        self.canceled_batches.append(orders_to_cancel)
+        super().batch_order_cancel(orders_to_cancel)
+
+
 class PMMUnitTest(unittest.TestCase):
     start: pd.Timestamp = pd.Timestamp("2019-01-01", tz="UTC")
     end: pd.Timestamp = pd.Timestamp("2019-01-01 01:00:00", tz="UTC")
@@ -360,6 +379,78 @@ class PMMUnitTest(unittest.TestCase):
         self.assertEqual(3, len(strategy.active_buys))
         self.assertEqual(3, len(strategy.active_sells))
 
+    def test_proposal_orders_created_and_canceled_in_batches(self):
+        market = BatchOrdersRecordingExchange(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+        market.set_balanced_order_book(self.trading_pair,
+                                       mid_price=self.mid_price,
+                                       min_price=1,
+                                       max_price=200,
+                                       price_step_size=1,
+                                       volume_step_size=10)
+        market.set_balance("HBOT", 500)
+        market.set_balance("ETH", 5000)
+        market.set_quantization_param(QuantizationParams(self.trading_pair, 6, 6, 6, 6))
+        self.clock.add_iterator(market)
+        strategy = PureMarketMakingStrategy()
+        strategy.init_params(
+            MarketTradingPairTuple(market, self.trading_pair, self.base_asset, self.quote_asset),
+            bid_spread=Decimal("0.01"),
+            ask_spread=Decimal("0.01"),
+            order_amount=Decimal("1"),
+            order_refresh_time=5.0,
+            filled_order_delay=5.0,
+            order_refresh_tolerance_pct=-1,
+            order_levels=3,
+            order_level_spread=Decimal("0.01"),
+            order_level_amount=Decimal("1"),
+            minimum_spread=-1,
+        )
+        self.clock.add_iterator(strategy)
+        self.clock.backtest_til(self.start_timestamp + self.clock_tick_size)
+
+        self.assertEqual(1, len(market.created_batches))
+        orders_to_create, limit_order_type = market.created_batches[0]
+        self.assertEqual(market.get_maker_order_type(), limit_order_type)
+        self.assertEqual([True] * 3 + [False] * 3, [order.is_buy for order in orders_to_create])
+        self.assertEqual([Decimal("99"), Decimal("98"), Decimal("97"), Decimal("101"), Decimal("102"), Decimal("103")],
+                         [order.price for order in orders_to_create])
+        active_orders = strategy.active_orders
+        self.assertEqual(6, len(active_orders))
+
+        # After order_refresh_time, all the orders are canceled together and a new set is created in a single batch
+        self.clock.backtest_til(self.start_timestamp + 7)
+        self.assertEqual(1, len(market.canceled_batches))
+        self.assertEqual(sorted(order.client_order_id for order in active_orders),
+                         sorted(order.client_order_id for order in market.canceled_batches[0]))
+        self.assertEqual(2, len(market.created_batches))
+        self.assertEqual(3, len(strategy.active_buys))
+        self.assertEqual(3, len(strategy.active_sells))
+
+    def test_each_level_quantized_with_its_own_price_quantum(self):
+        # 3 significant digits: the quantum is 1 above 100 and 0.1 below
+        self.market.set_quantization_param(QuantizationParams(self.trading_pair, 3, 6, 6, 6))
+        strategy = PureMarketMakingStrategy()
+        strategy.init_params(
+            self.market_info,
+            bid_spread=Decimal("0.01"),
+            ask_spread=Decimal("0.01"),
+            order_amount=Decimal("1"),
+            order_refresh_time=5.0,
+            filled_order_delay=5.0,
+            order_refresh_tolerance_pct=-1,
+            order_levels=2,
+            order_level_spread=Decimal("0.01"),
+            order_level_amount=Decimal("1"),
+            minimum_spread=-1,
+            asset_price_delegate=MockAssetPriceDelegate(self.market, mock_price=Decimal("100.5")),
+            price_type="custom",
+        )
+        self.clock.add_iterator(strategy)
+        self.clock.backtest_til(self.start_timestamp + self.clock_tick_size)
+
+        self.assertEqual([Decimal("99.4"), Decimal("98.4")], [order.price for order in strategy.active_buys])
+        self.assertEqual([Decimal("101"), Decimal("102")], [order.price for order in strategy.active_sells])
+
     def test_apply_budget_constraint_to_proposal(self):
         strategy = self.multi_levels_strategy
         self.clock.add_iterator(strategy)
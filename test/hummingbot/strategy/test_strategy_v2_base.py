@@ -1,4 +1,6 @@
 import asyncio
+import os
+import tempfile
 from decimal import Decimal
 from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
 from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
@@ -57,6 +59,75 @@ class TestStrategyV2Base(IsolatedAsyncioWrapperTestCase):
         self.assertIn(self.connector_name, StrategyV2Base.markets)
         self.assertIn(self.trading_pair, StrategyV2Base.markets[self.connector_name])
 
+    def test_update_controllers_configs_only_reloads_changed_files(self):
+        with tempfile.TemporaryDirectory() as directory:
+            for config_file in ["controller_1.yml", "controller_2.yml"]:
+                with open(os.path.join(directory, config_file), "w") as file:
+                    file.write(f"id: {config_file}\n")
+            self.strategy.config.controllers_config = ["controller_1.yml", "controller_2.yml"]
+            controller_configs = {"controller_1.yml": MagicMock(id="controller_1"),
+                                  "controller_2.yml": MagicMock(id="controller_2")}
+            controller_1, controller_2 = self.strategy.controllers.values()
+            controller_1.get_config_updates.return_value = {"total_amount_quote": Decimal("200")}
+            with patch.object(StrategyV2ConfigBase, "controller_config_full_path",
+                              side_effect=lambda config_path: os.path.join(directory, config_path)), \
+                    patch.object(StrategyV2ConfigBase, "load_controller_config",
+                                 side_effect=lambda config_path: controller_configs[config_path]) as load_mock, \
+                    patch.object(StrategyV2Base, "current_timestamp", new_callable=PropertyMock,
+                                 return_value=self.start_timestamp):
+                self.strategy._last_config_update_ts = 0
+                self.strategy.update_controllers_configs()
+                self.assertEqual(2, load_mock.call_count)
+                controller_1.update_config.assert_called_once_with(controller_configs["controller_1.yml"])
+                controller_2.update_config.assert_not_called()
+
+                self.strategy._last_config_update_ts = 0
+                self.strategy.update_controllers_configs()
+                self.assertEqual(2, load_mock.call_count)
+
+                with open(os.path.join(directory, "controller_2.yml"), "w") as file:
+                    file.write("id: controller_2\ntotal_amount_quote: 200\n")
+                self.strategy._last_config_update_ts = 0
+                self.strategy.update_controllers_configs()
+                load_mock.assert_called_with("controller_2.yml")
+                self.assertEqual(3, load_mock.call_count)
+
+    def test_update_controllers_configs_loads_the_other_files_when_one_fails(self):
+        with tempfile.TemporaryDirectory() as directory:
+            for config_file in ["controller_1.yml", "controller_2.yml"]:
+                with open(os.path.join(directory, config_file), "w") as file:
+                    file.write(f"id: {config_file}\n")
+            self.strategy.config.controllers_config = ["controller_1.yml", "controller_2.yml"]
+            controller_2_config = MagicMock(id="controller_2")
+            load_results = {"controller_1.yml": [ValueError("Invalid config"), MagicMock(id="controller_1")],
+                            "controller_2.yml": [controller_2_config]}
+
+            def load_controller_config(config_path: str):
+                result = load_results[config_path].pop(0)
+                if isinstance(result, Exception):
+                    raise result
+                return result
+
+            controller_1, controller_2 = self.strategy.controllers.values()
+            controller_1.get_config_updates.return_value = {}
+            controller_2.get_config_updates.return_value = {"total_amount_quote": Decimal("200")}
+            with patch.object(StrategyV2ConfigBase, "controller_config_full_path",
+                              side_effect=lambda config_path: os.path.join(directory, config_path)), \
+                    patch.object(StrategyV2ConfigBase, "load_controller_config",
+                                 side_effect=load_controller_config) as load_mock, \
+                    patch.object(StrategyV2Base, "current_timestamp", new_callable=PropertyMock,
+                                 return_value=self.start_timestamp):
+                self.strategy._last_config_update_ts = 0
+                self.strategy.update_controllers_configs()
+                self.assertEqual(2, load_mock.call_count)
+                controller_2.update_config.assert_called_once_with(controller_2_config)
+
+                # The file that failed is loaded again, even though it didn't change
+                self.strategy._last_config_update_ts = 0
+                self.strategy.update_controllers_configs()
+                self.assertEqual(3, load_mock.call_count)
+                load_mock.assert_called_with("controller_1.yml")
+
     def test_store_actions_proposal(self):
         # Setup test executors with all required fields
         executor_1 = ExecutorInfo(
@@ -40,6 +40,18 @@ class TestControllerBase(IsolatedAsyncioWrapperTestCase):
         self.controller.initialize_candles()
         self.mock_market_data_provider.initialize_candles_feed.assert_called()
 
+    def test_stop_releases_the_candles_feeds(self):
+        self.controller.initialize_candles()
+        self.controller.initialize_candles()
+        self.mock_market_data_provider.initialize_candles_feed.assert_called_once_with(
+            self.mock_controller_config.candles_config[0])
+
+        self.controller.stop()
+        self.controller.stop()
+
+        self.mock_market_data_provider.stop_candle_feed.assert_called_once_with(
+            self.mock_controller_config.candles_config[0])
+
     def test_update_config(self):
         # Test the update_config method
         new_config = ControllerConfigBase(
@@ -61,6 +73,16 @@ class TestControllerBase(IsolatedAsyncioWrapperTestCase):
         # Candles config is updatable
         self.assertEqual(self.controller.config.candles_config[0].interval, "3m")
 
+    def test_get_config_updates(self):
+        new_config = self.controller.config.copy(deep=True)
+        new_config.controller_name = "new_test_controller"
+        # Controller name is not updatable
+        self.assertEqual({}, self.controller.get_config_updates(new_config))
+
+        new_config.candles_config[0].interval = "3m"
+        self.assertEqual({"candles_config": new_config.candles_config},
+                         self.controller.get_config_updates(new_config))
+
     async def test_control_task_market_data_privder_not_ready(self):
         type(self.controller.market_data_provider).ready = PropertyMock(return_value=False)
         self.controller.executors_update_event.set()
@@ -62,6 +62,22 @@ class TestMarketMakingControllerBase(IsolatedAsyncioWrapperTestCase):
         for action in actions:
             self.assertIsInstance(action, ExecutorAction)
 
+    async def test_get_price_and_amount(self):
+        type(self.mock_market_data_provider).get_price_by_type = MagicMock(return_value=Decimal("100"))
+        await self.controller.update_processed_data()
+
+        # Same exact Decimal results as computing the level alone
+        buy_price = Decimal("100") * (1 - Decimal(0.01))
+        self.assertEqual((buy_price, Decimal(25) / buy_price), self.controller.get_price_and_amount("buy_0"))
+        sell_price = Decimal("100") * (1 + Decimal(0.02))
+        self.assertEqual((sell_price, Decimal(25) / sell_price), self.controller.get_price_and_amount("sell_1"))
+        order_levels = self.controller.get_order_levels()
+        self.assertIs(order_levels, self.controller.get_order_levels())
+
+        self.controller.processed_data["spread_multiplier"] = Decimal("2")
+        self.assertIsNot(order_levels, self.controller.get_order_levels())
+        self.assertEqual(Decimal("100") * (1 - Decimal(0.01) * 2), self.controller.get_price_and_amount("buy_0")[0])
+
     def test_stop_actions_proposal(self):
         stop_actions = self.controller.stop_actions_proposal()
         self.assertIsInstance(stop_actions, list)
@@ -6,12 +6,14 @@ from hummingbot.connector.exchange_py_base import ExchangePyBase
 from hummingbot.connector.markets_recorder import MarketsRecorder
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.core.data_type.common import TradeType
+from hummingbot.model.controller_performance import ControllerPerformance
 from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
 from hummingbot.strategy_v2.executors.arbitrage_executor.arbitrage_executor import ArbitrageExecutor
 from hummingbot.strategy_v2.executors.arbitrage_executor.data_types import ArbitrageExecutorConfig
-from hummingbot.strategy_v2.executors.data_types import ConnectorPair
+from hummingbot.strategy_v2.executors.data_types import ConnectorPair, ExecutorConfigBase
 from hummingbot.strategy_v2.executors.dca_executor.data_types import DCAExecutorConfig
 from hummingbot.strategy_v2.executors.dca_executor.dca_executor import DCAExecutor
+from hummingbot.strategy_v2.executors.executor_base import ExecutorBase
 from hummingbot.strategy_v2.executors.executor_orchestrator import ExecutorOrchestrator
 from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig
 from hummingbot.strategy_v2.executors.position_executor.position_executor import PositionExecutor
@@ -23,6 +25,26 @@ from hummingbot.strategy_v2.models.executors import CloseType
 from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
 
 
+class ReportCountingExecutor(ExecutorBase):
+    def __init__(self, strategy: ScriptStrategyBase, executor_id: str):
+        super().__init__(strategy=strategy, connectors=["binance"],
+                         config=ExecutorConfigBase(id=executor_id, type="test", timestamp=1234))
+        self.info_builds = 0
+
+    def get_custom_info(self):
+        self.info_builds += 1
+        return {}
+
+    def get_net_pnl_quote(self) -> Decimal:
+        return Decimal(0)
+
+    def get_net_pnl_pct(self) -> Decimal:
+        return Decimal(0)
+
+    def get_cum_fees_quote(self) -> Decimal:
+        return Decimal(0)
+
+
 class TestExecutorOrchestrator(unittest.TestCase):
 
     def setUp(self):
@@ -45,6 +67,18 @@ class TestExecutorOrchestrator(unittest.TestCase):
         }
         return strategy
 
+    @staticmethod
+    def create_markets_recorder_mock(stored_performance: ControllerPerformance = None,
+                                     stored_active_executors=None,
+                                     in_memory_contributions=None):
+        markets_recorder = MagicMock(spec=MarketsRecorder)
+        markets_recorder.get_controller_performance.return_value = stored_performance or ControllerPerformance(
+            controller_id="test", timestamp=1234, executors_count=0, realized_pnl_quote=0.0, volume_traded=0.0,
+            close_type_counts={})
+        markets_recorder.get_active_executors_by_controller.return_value = stored_active_executors or []
+        markets_recorder.get_performance_contributions.return_value = in_memory_contributions or {}
+        return markets_recorder
+
     @patch.object(PositionExecutor, "start")
     @patch.object(DCAExecutor, "start")
     @patch.object(ArbitrageExecutor, "start")
@@ -104,10 +138,7 @@ class TestExecutorOrchestrator(unittest.TestCase):
 
     @patch('hummingbot.connector.markets_recorder.MarketsRecorder.get_instance')
     def test_generate_performance_report(self, mock_get_instance):
-        # Create a mock for MarketsRecorder and its get_executors_by_controller method
-        mock_markets_recorder = MagicMock(spec=MarketsRecorder)
-        mock_markets_recorder.get_executors_by_controller.return_value = []
-        mock_get_instance.return_value = mock_markets_recorder
+        mock_get_instance.return_value = self.create_markets_recorder_mock()
         config_mock = PositionExecutorConfig(
             timestamp=1234, trading_pair="ETH-USDT", connector_name="binance",
             side=TradeType.BUY, amount=Decimal(10), entry_price=Decimal(100),
@@ -148,12 +179,49 @@ class TestExecutorOrchestrator(unittest.TestCase):
         self.assertEqual(report.realized_pnl_quote, Decimal(10))
         self.assertEqual(report.unrealized_pnl_quote, Decimal(10))
 
+    @patch('hummingbot.connector.markets_recorder.MarketsRecorder.get_instance')
+    def test_generate_performance_report_with_stored_executors(self, mock_get_instance):
+        config = PositionExecutorConfig(
+            timestamp=1234, trading_pair="ETH-USDT", connector_name="binance",
+            side=TradeType.BUY, amount=Decimal(10), entry_price=Decimal(100),
+        )
+
+        def executor_info(executor_id: str, is_active: bool, close_type=None) -> ExecutorInfo:
+            return ExecutorInfo(
+                id=executor_id, timestamp=1234, type="position_executor",
+                status=RunnableStatus.RUNNING if is_active else RunnableStatus.TERMINATED, config=config,
+                close_type=close_type, filled_amount_quote=Decimal(100), net_pnl_quote=Decimal(5),
+                net_pnl_pct=Decimal(5), cum_fees_quote=Decimal(1), is_trading=is_active, is_active=is_active,
+                custom_info={"side": TradeType.BUY})
+
+        stored_performance = ControllerPerformance(
+            controller_id="test", timestamp=1234, executors_count=3, realized_pnl_quote=30.0, volume_traded=300.0,
+            close_type_counts={str(CloseType.TAKE_PROFIT.value): 2, str(CloseType.STOP_LOSS.value): 1})
+        # The stopped in-memory executor was already stored, it is counted once
+        stopped_executor = MagicMock(spec=PositionExecutor)
+        stopped_executor.executor_info = executor_info("stopped", is_active=False, close_type=CloseType.STOP_LOSS)
+        running_executor = MagicMock(spec=PositionExecutor)
+        running_executor.executor_info = executor_info("running", is_active=True)
+        self.orchestrator.executors["test"] = [stopped_executor, running_executor]
+        markets_recorder = self.create_markets_recorder_mock(
+            stored_performance=stored_performance,
+            stored_active_executors=[executor_info("stored_active", is_active=True),
+                                     executor_info("running", is_active=True)],
+            in_memory_contributions={"stopped": (CloseType.STOP_LOSS.value, 5.0, 100.0)})
+        mock_get_instance.return_value = markets_recorder
+
+        report = self.orchestrator.generate_performance_report(controller_id="test")
+
+        markets_recorder.get_performance_contributions.assert_called_once_with(["stopped", "running"])
+        self.assertEqual(Decimal(30), report.realized_pnl_quote)
+        self.assertEqual(Decimal(10), report.unrealized_pnl_quote)
+        self.assertEqual(Decimal(500), report.volume_traded)
+        self.assertEqual(Decimal(1800), report.open_order_volume)
+        self.assertEqual({CloseType.TAKE_PROFIT: 2, CloseType.STOP_LOSS: 1}, report.close_type_counts)
+
     @patch('hummingbot.connector.markets_recorder.MarketsRecorder.get_instance')
     def test_generate_global_performance_report(self, mock_get_instance):
-        # Mock MarketsRecorder and its get_executors_by_controller method
-        mock_markets_recorder = MagicMock(spec=MarketsRecorder)
-        mock_markets_recorder.get_executors_by_controller.return_value = []
-        mock_get_instance.return_value = mock_markets_recorder
+        mock_get_instance.return_value = self.create_markets_recorder_mock()
 
         # Set up mock executors for two different controllers
         config_mock_pe = PositionExecutorConfig(
@@ -199,3 +267,35 @@ class TestExecutorOrchestrator(unittest.TestCase):
         self.assertAlmostEqual(global_report.global_pnl_quote, expected_total_realized_pnl)
         self.assertAlmostEqual(global_report.global_pnl_pct,
                                (expected_total_realized_pnl / expected_total_volume_traded) * 100)
+
+    @patch.object(MarketsRecorder, "get_instance")
+    def test_executors_report_only_rebuilds_changed_executors(self, _: MagicMock):
+        executors = [ReportCountingExecutor(self.mock_strategy, executor_id=f"{i}") for i in range(3)]
+        self.orchestrator.executors["test"] = list(executors)
+
+        self.mock_strategy.current_timestamp = 1
+        report = self.orchestrator.get_executors_report()
+        self.assertEqual(["0", "1", "2"], [executor_info.id for executor_info in report["test"]])
+        self.assertEqual([1, 1, 1], [executor.info_builds for executor in executors])
+
+        # Within the same tick only the executors that changed are rebuilt
+        self.orchestrator.get_executors_report()
+        self.assertEqual([1, 1, 1], [executor.info_builds for executor in executors])
+        executors[1]._fill_order_forwarder(MagicMock())
+        executors[2].stop()
+        report = self.orchestrator.get_executors_report()
+        self.assertEqual([1, 2, 2], [executor.info_builds for executor in executors])
+        self.assertEqual(RunnableStatus.TERMINATED, report["test"][2].status)
+
+        # Active executors are rebuilt on each tick, the terminated ones are kept as they are
+        self.mock_strategy.current_timestamp = 2
+        report = self.orchestrator.get_executors_report()
+        self.assertEqual([2, 3, 2], [executor.info_builds for executor in executors])
+        self.assertEqual(3, len(report["test"]))
+
+        self.orchestrator.execute_action(StoreExecutorAction(executor_id="2", controller_id="test"))
+        new_executor = ReportCountingExecutor(self.mock_strategy, executor_id="3")
+        self.orchestrator.executors["test"].append(new_executor)
+        report = self.orchestrator.get_executors_report()
+        self.assertEqual(["0", "1", "3"], [executor_info.id for executor_info in report["test"]])
+        self.assertEqual([2, 3, 2, 1], [executor.info_builds for executor in executors + [new_executor]])
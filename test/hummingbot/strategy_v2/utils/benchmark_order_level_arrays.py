@@ -0,0 +1,56 @@
+"""
+Benchmarks the computation of the prices and amounts of a grid of order levels on both sides, quantized to the
+trading rule increments: one Decimal computation per level against the vectorized builder, including the conversion
+of the results to Decimal.
+
+Run with: python -m test.hummingbot.strategy_v2.utils.benchmark_order_level_arrays
+"""
+import timeit
+from decimal import Decimal
+
+from hummingbot.strategy_v2.utils.order_level_arrays import OrderLevelArrayBuilder
+
+ITERATIONS = 1000
+LEVELS = (10, 50, 200)
+PRICE_QUANTUM = Decimal("0.01")
+AMOUNT_QUANTUM = Decimal("0.001")
+
+
+def _decimal_levels(reference_price: Decimal, spreads, amounts):
+    levels = []
+    for side_multiplier in (Decimal("-1"), Decimal("1")):
+        for spread, amount in zip(spreads, amounts):
+            price = reference_price * (1 + side_multiplier * spread)
+            price = (price // PRICE_QUANTUM) * PRICE_QUANTUM
+            levels.append((price, (amount // AMOUNT_QUANTUM) * AMOUNT_QUANTUM))
+    return levels
+
+
+def _vectorized_levels(builder: OrderLevelArrayBuilder, reference_price: Decimal, spreads, amounts):
+    buy_levels, sell_levels = builder.build(reference_price, reference_price, spreads, spreads, amounts, amounts)
+    return buy_levels.to_decimals() + sell_levels.to_decimals()
+
+
+def main():
+    builder = OrderLevelArrayBuilder(price_quantum=PRICE_QUANTUM, amount_quantum=AMOUNT_QUANTUM)
+    reference_price = Decimal("64123.45")
+    for levels_count in LEVELS:
+        spreads = [Decimal("0.001") * (level + 1) for level in range(levels_count)]
+        amounts = [Decimal("0.01") + Decimal("0.005") * level for level in range(levels_count)]
+        float_spreads = [float(spread) for spread in spreads]
+        float_amounts = [float(amount) for amount in amounts]
+        timings = [
+            ("Decimal per level", lambda: _decimal_levels(reference_price, spreads, amounts)),
+            ("vectorized, to Decimal",
+             lambda: _vectorized_levels(builder, reference_price, float_spreads, float_amounts)),
+            ("vectorized, arrays only",
+             lambda: builder.build(reference_price, reference_price, float_spreads, float_spreads,
+                                   float_amounts, float_amounts)),
+        ]
+        for name, function in timings:
+            elapsed = min(timeit.repeat(function, number=ITERATIONS, repeat=3)) / ITERATIONS
+            print(f"{levels_count:>4} levels per side, {name:<25} {elapsed * 1e6:>10.1f} us")
+
+
+if __name__ == "__main__":
+    main()
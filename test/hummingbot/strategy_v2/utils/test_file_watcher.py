@@ -0,0 +1,44 @@
+import os
+import tempfile
+import unittest
+
+from hummingbot.strategy_v2.utils.file_watcher import FileWatcher
+
+
+class FileWatcherTests(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "controller.yml")
+        self._write("id: controller_1\n")
+        self.watcher = FileWatcher()
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+        super().tearDown()
+
+    def _write(self, content: str, mtime_ns: int = 1_000_000_000):
+        with open(self.path, "w") as file:
+            file.write(content)
+        os.utime(self.path, ns=(mtime_ns, mtime_ns))
+
+    def test_only_changed_files_are_reported(self):
+        self.assertEqual([self.path], self.watcher.changed_files([self.path]))
+        self.assertEqual([], self.watcher.changed_files([self.path]))
+
+        # Saved again with the same content
+        self._write("id: controller_1\n", mtime_ns=2_000_000_000)
+        self.assertEqual([], self.watcher.changed_files([self.path]))
+
+        self._write("id: controller_2\n", mtime_ns=3_000_000_000)
+        self.assertEqual([self.path], self.watcher.changed_files([self.path]))
+        self.assertEqual([], self.watcher.changed_files([self.path]))
+
+    def test_forgotten_and_missing_files_are_reported(self):
+        self.watcher.changed_files([self.path])
+        self.watcher.forget(self.path)
+        self.assertEqual([self.path], self.watcher.changed_files([self.path]))
+
+        missing_path = os.path.join(self.directory.name, "missing.yml")
+        self.assertEqual([missing_path], self.watcher.changed_files([missing_path]))
+        self.assertEqual([missing_path], self.watcher.changed_files([missing_path]))
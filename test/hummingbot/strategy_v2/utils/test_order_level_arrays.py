@@ -0,0 +1,88 @@
+import unittest
+from decimal import Decimal
+
+import numpy as np
+
+from hummingbot.connector.trading_rule import TradingRule
+from hummingbot.strategy_v2.utils.order_level_arrays import OrderLevelArrayBuilder
+
+
+class OrderLevelArrayBuilderTests(unittest.TestCase):
+
+    def test_levels_match_the_decimal_computation_quantized_like_the_connectors(self):
+        trading_rule = TradingRule(trading_pair="COINALPHA-HBOT",
+                                   min_price_increment=Decimal("0.01"),
+                                   min_base_amount_increment=Decimal("0.001"))
+        builder = OrderLevelArrayBuilder.from_trading_rule(trading_rule)
+        reference_price = Decimal("100")
+        spreads = [Decimal("0.01") + Decimal("0.005") * level for level in range(60)]
+        amounts = [Decimal("1") + Decimal("0.1") * level for level in range(60)]
+
+        buy_levels, sell_levels = builder.build(buy_reference_price=reference_price,
+                                                sell_reference_price=reference_price,
+                                                buy_spreads=spreads,
+                                                sell_spreads=spreads,
+                                                buy_amounts=amounts,
+                                                sell_amounts=amounts)
+
+        price_quantum = trading_rule.min_price_increment
+        amount_quantum = trading_rule.min_base_amount_increment
+        expected_buys = [((reference_price * (1 - spread)) // price_quantum * price_quantum,
+                          amount // amount_quantum * amount_quantum) for spread, amount in zip(spreads, amounts)]
+        expected_sells = [((reference_price * (1 + spread)) // price_quantum * price_quantum,
+                           amount // amount_quantum * amount_quantum) for spread, amount in zip(spreads, amounts)]
+        self.assertEqual(expected_buys, buy_levels.to_decimals())
+        self.assertEqual(expected_sells, sell_levels.to_decimals())
+        # Prices on a step are not moved one step down by the float rounding
+        self.assertEqual(Decimal("99.00"), buy_levels.price_at(0))
+        self.assertEqual("99.00", str(buy_levels.price_at(0)))
+
+    def test_amounts_in_quote_are_converted_at_the_price_of_their_level(self):
+        buy_amounts, sell_amounts = OrderLevelArrayBuilder.budget_amounts(buy_weights=[1, 3],
+                                                                          sell_weights=[2, 2],
+                                                                          total_amount_quote=800)
+        np.testing.assert_allclose([100, 300], buy_amounts)
+        np.testing.assert_allclose([200, 200], sell_amounts)
+
+        buy_levels, sell_levels = OrderLevelArrayBuilder().build(buy_reference_price=Decimal("100"),
+                                                                 sell_reference_price=Decimal("100"),
+                                                                 buy_spreads=[0.5, 0.75],
+                                                                 sell_spreads=[1, 3],
+                                                                 buy_amounts=buy_amounts,
+                                                                 sell_amounts=sell_amounts,
+                                                                 amounts_in_quote=True)
+
+        self.assertEqual([(Decimal("50.0"), Decimal("2.0")), (Decimal("25.0"), Decimal("12.0"))],
+                         buy_levels.to_decimals())
+        self.assertEqual([(Decimal("200.0"), Decimal("1.0")), (Decimal("400.0"), Decimal("0.5"))],
+                         sell_levels.to_decimals())
+
+    def test_sides_without_levels(self):
+        builder = OrderLevelArrayBuilder(price_quantum=Decimal("0.1"), amount_quantum=Decimal("1"))
+        buy_levels, sell_levels = builder.build(buy_reference_price=Decimal("NaN"),
+                                                sell_reference_price=Decimal("10"),
+                                                buy_spreads=[],
+                                                sell_spreads=[0.1],
+                                                buy_amounts=[],
+                                                sell_amounts=[2.5])
+
+        self.assertEqual(0, buy_levels.levels_count)
+        self.assertEqual([(Decimal("11.0"), Decimal("2"))], sell_levels.to_decimals())
+
+        with self.assertRaises(ValueError):
+            builder.build(buy_reference_price=Decimal("10"),
+                          sell_reference_price=Decimal("10"),
+                          buy_spreads=[0.1, 0.2],
+                          sell_spreads=[],
+                          buy_amounts=[1],
+                          sell_amounts=[])
+
+    def test_quantize_values_with_the_quantum_of_each_value(self):
+        def quantum_for(value: Decimal) -> Decimal:
+            return Decimal("1") if value >= 100 else Decimal("0.1")
+
+        # 99.99999999999999 is 100 rounded down by the float computation, it gets the quantum of 100
+        values = np.array([100 * (1 - 0.005), 100 * (1 + 0.005), 99.99999999999999])
+
+        self.assertEqual([Decimal("99.5"), Decimal("100"), Decimal("100")],
+                         OrderLevelArrayBuilder.quantize_values(values, quantum_for))